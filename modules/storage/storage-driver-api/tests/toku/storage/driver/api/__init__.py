@@ -8,11 +8,21 @@ Classes:
     - StubStorageDriver (stub_storage_driver.py): Stub storage driver for testing purpose
     - PathSanitizerTests (path_sanitizer_tests.py): Path sanitizier tests for PathSanitizer
     - PathSanitizerStorageDriverDecoratorTests (path_sanitizer_storage_driver_decorator_tests.py): Path sanitizier storage driver decorator tests for PathSanitizerStorageDriverDecorator
+    - CachingStorageDriverDecoratorTests (caching_storage_driver_decorator_tests.py): Caching storage driver decorator tests for CachingStorageDriverDecorator
+    - DiskCacheStorageDriverDecoratorTests (disk_cache_storage_driver_decorator_tests.py): Disk cache storage driver decorator tests for DiskCacheStorageDriverDecorator
+    - TransferEngineTests (transfer_engine_tests.py): Transfer engine tests for TransferEngine
+    - FileSliceIOTests (file_slice_io_tests.py): File slice tests for FileSliceIO
     - StorageDriverTest (storage_driver_test.py): The contract for storage driver api testing
     - AbstractStorageDriverTest (abstract_storage_driver_test.py): Abstract storage driver tests for AbstractStorageDriver
+    - AbstractAsyncStorageDriverTest (abstract_async_storage_driver_test.py): Abstract asynchronous storage driver tests for AbstractAsyncStorageDriver
 """
 from .stub_storage_driver import StubStorageDriver as StubStorageDriver
 from .path_sanitizer_tests import PathSanitizerTests as PathSanitizerTests
 from .path_sanitizer_storage_driver_decorator_tests import PathSanitizerStorageDriverDecoratorTests as PathSanitizerStorageDriverDecoratorTests
+from .caching_storage_driver_decorator_tests import CachingStorageDriverDecoratorTests as CachingStorageDriverDecoratorTests
+from .disk_cache_storage_driver_decorator_tests import DiskCacheStorageDriverDecoratorTests as DiskCacheStorageDriverDecoratorTests
+from .transfer_engine_tests import TransferEngineTests as TransferEngineTests
+from .file_slice_io_tests import FileSliceIOTests as FileSliceIOTests
 from .storage_driver_test import StorageDriverTest as StorageDriverTest
 from .abstract_storage_driver_test import AbstractStorageDriverTest as AbstractStorageDriverTest
+from .abstract_async_storage_driver_test import AbstractAsyncStorageDriverTest as AbstractAsyncStorageDriverTest
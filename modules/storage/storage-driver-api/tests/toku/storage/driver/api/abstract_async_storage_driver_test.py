@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa: E501
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=empty-docstring
+# pylint: disable=line-too-long
+# pylint: disable=attribute-defined-outside-init
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: abstract_async_storage_driver_test.py
+Author: Toku
+"""
+import asyncio
+from abc import ABC, abstractmethod
+from io import BufferedReader, BytesIO
+import os
+import tempfile
+from typing import Any, AsyncIterator, Coroutine, Generator, Generic, Optional, TypeVar, final
+from overrides import EnforceOverrides
+import pytest
+from faker import Faker
+from toku.storage.driver.api import Metadata
+from toku.storage.driver.api import PathSanitizer
+from toku.storage.driver.api import AbstractAsyncStorageDriver
+
+T = TypeVar("T", bound=AbstractAsyncStorageDriver)
+R = TypeVar("R")
+
+
+class AbstractAsyncStorageDriverTest(ABC, EnforceOverrides, Generic[T]):
+    """
+    Provides the default implementation for test cases for any kind AbstractAsyncStorageDriver class.
+
+    The test cases don't depend on an asynchronous test runner, every coroutine
+    is executed with `asyncio.run`.
+    """
+
+    @abstractmethod
+    def _initialize_test(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def _teardown_test(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def _create_storage_driver(self) -> T:
+        """
+        Provides the storage driver instance
+
+        Returns:
+            T: The storage driver instance for testing.
+        """
+
+    @final
+    def _run(self, coroutine: Coroutine[Any, Any, R]) -> R:
+        """
+        Runs the `coroutine` until it's completed.
+
+        Args:
+            coroutine (Coroutine[Any, Any, R]): The coroutine.
+
+        Returns:
+            R: The result of the coroutine.
+        """
+        return asyncio.run(coroutine)
+
+    @final
+    def _create_byte_array(self) -> bytes:
+        """
+        Create a byte array from a random sentence.
+
+        Returns:
+            bytes: The byte array.
+        """
+        return bytes(self._faker.sentence(20), "utf-8")
+
+    @final
+    async def _collect(self, chunks: Optional[AsyncIterator[bytes]]) -> Optional[list[bytes]]:
+        """
+        Collects all the `chunks`.
+
+        Args:
+            chunks (Optional[AsyncIterator[bytes]]): The chunks.
+
+        Returns:
+            Optional[list[bytes]]: The chunks or None if `chunks` is None.
+        """
+        return None if chunks is None else [chunk async for chunk in chunks]
+
+    @final
+    @pytest.fixture(autouse=True)
+    def setup_test(self) -> Generator[None, None, None]:
+        """
+        Start the temporary directory
+
+        Start the setup process (sub-class).
+
+        Initialize the `storage_driver` by opening, the `sanitizer` and the `faker`.
+
+        Return the control to the test.
+
+        Cleanup the temporary directory.
+
+        Close the `storage_driver`.
+
+        Start the teardown process (sub-class).
+
+        Yields:
+            Generator[None, None, None]: To return the control to the test and after that finishing the test
+        """
+        # setup
+        self._tempdir = tempfile.TemporaryDirectory()
+        self._initialize_test()
+        self._storage_driver: T = self._create_storage_driver()
+        self._run(self._storage_driver.open())
+        self._sanitizer: PathSanitizer = PathSanitizer(self._storage_driver.get_separator())
+        self._faker = Faker()
+
+        # return control to the test
+        yield
+
+        # teardown
+        self._tempdir.cleanup()
+        self._run(self._storage_driver.close())
+        self._teardown_test()
+
+    @final
+    def test_context_manager__open_and_close__then_return_storage_driver(self) -> None:
+        async def execute() -> bool:
+            async with self._create_storage_driver() as storage_driver:
+                return await storage_driver.exists("file-not-exists.txt")
+
+        assert not self._run(execute())
+
+    @final
+    def test_get__file_not_exists__then_return_optional_none(self) -> None:
+        assert self._run(self._storage_driver.get("file-not-exists.txt")) is None
+
+    @final
+    def test_get__file_is_directory__then_return_optional_none(self) -> None:
+        assert self._run(self._storage_driver.make_directory("directory"))
+        assert self._run(self._storage_driver.get("directory")) is None
+
+    @final
+    def test_get__file_in_directory__then_return_optional_byte_array(self) -> None:
+        content: bytes = self._create_byte_array()
+        assert self._run(self._storage_driver.put_file_as(content, "directory/file.txt"))
+        assert self._run(self._storage_driver.exists("directory/file.txt"))
+        assert self._run(self._storage_driver.get("directory/file.txt")) == content
+
+    @final
+    def test_iter_chunks__file_not_exists__then_return_optional_none(self) -> None:
+        assert self._run(self._storage_driver.iter_chunks("file-not-exists.txt")) is None
+
+    @final
+    def test_iter_chunks__chunk_size_smaller_than_file__then_return_chunks(self) -> None:
+        content: bytes = self._create_byte_array()
+        assert self._run(self._storage_driver.put_file_as(content, "file.txt"))
+
+        async def execute() -> Optional[list[bytes]]:
+            return await self._collect(await self._storage_driver.iter_chunks("file.txt", 10))
+
+        chunks: Optional[list[bytes]] = self._run(execute())
+        assert chunks is not None
+        assert all(len(chunk) == 10 for chunk in chunks[:-1])
+        assert 0 < len(chunks[-1]) <= 10
+        assert b"".join(chunks) == content
+
+    @final
+    def test_iter_chunks__empty_file__then_return_no_chunks(self) -> None:
+        assert self._run(self._storage_driver.put_file_as(BufferedReader(BytesIO(b"")), "file.txt"))  # type: ignore[arg-type]
+
+        async def execute() -> Optional[list[bytes]]:
+            return await self._collect(await self._storage_driver.iter_chunks("file.txt"))
+
+        assert self._run(execute()) == []
+
+    @final
+    def test_put_file_as__path_as_string__file_in_directory__then_return_true(self) -> None:
+        content: bytes = self._create_byte_array()
+        local_file: str = os.path.join(self._tempdir.name, "file.txt")
+        with open(local_file, "wb") as file:
+            file.write(content)
+        assert self._run(self._storage_driver.put_file_as(local_file, "directory/file.txt"))
+        assert self._run(self._storage_driver.get("directory/file.txt")) == content
+
+    @final
+    def test_put_file_as__file_is_directory__then_return_false(self) -> None:
+        assert self._run(self._storage_driver.make_directory("directory"))
+        assert not self._run(self._storage_driver.put_file_as(self._create_byte_array(), "directory"))
+
+    @final
+    def test_put_file_as__file_without_name__then_return_false(self) -> None:
+        assert not self._run(self._storage_driver.put_file_as(self._create_byte_array(), ""))
+
+    @final
+    def test_delete__file_exists__then_return_true(self) -> None:
+        assert self._run(self._storage_driver.put_file_as(self._create_byte_array(), "file.txt"))
+        assert self._run(self._storage_driver.delete("file.txt"))
+        assert not self._run(self._storage_driver.exists("file.txt"))
+
+    @final
+    def test_delete__file_not_exists__then_return_false(self) -> None:
+        assert not self._run(self._storage_driver.delete("file-not-exists.txt"))
+
+    @final
+    def test_files_and_directories__directory_with_content__then_return_list(self) -> None:
+        assert self._run(self._storage_driver.put_file_as(self._create_byte_array(), "directory/file-1.txt"))
+        assert self._run(self._storage_driver.put_file_as(self._create_byte_array(), "directory/sub/file-2.txt"))
+        assert self._run(self._storage_driver.files("directory")) == [self._sanitizer.sanitize("directory/file-1.txt")]
+        assert sorted(self._run(self._storage_driver.all_files("directory"))) == sorted([
+            self._sanitizer.sanitize("directory/file-1.txt"),
+            self._sanitizer.sanitize("directory/sub/file-2.txt")
+        ])
+        assert self._run(self._storage_driver.directories("directory")) == [self._sanitizer.sanitize("directory/sub")]
+        assert self._run(self._storage_driver.all_directories("")) == sorted([
+            self._sanitizer.sanitize("directory"),
+            self._sanitizer.sanitize("directory/sub")
+        ])
+
+    @final
+    def test_files__directory_not_exists__then_return_empty_list(self) -> None:
+        assert self._run(self._storage_driver.files("directory-not-exists")) == []
+
+    @final
+    def test_delete_directory__directory_with_content__then_return_true(self) -> None:
+        assert self._run(self._storage_driver.put_file_as(self._create_byte_array(), "directory/file.txt"))
+        assert self._run(self._storage_driver.delete_directory("directory"))
+        assert not self._run(self._storage_driver.exists_directory("directory"))
+
+    @final
+    def test_delete_directory__directory_is_root__then_return_false(self) -> None:
+        assert not self._run(self._storage_driver.delete_directory(""))
+
+    @final
+    def test_make_directory__directory_exists__then_return_false(self) -> None:
+        assert self._run(self._storage_driver.make_directory("directory"))
+        assert not self._run(self._storage_driver.make_directory("directory"))
+
+    @final
+    def test_get_metadata__file_exists__then_return_optional_metadata(self) -> None:
+        content: bytes = self._create_byte_array()
+        assert self._run(self._storage_driver.put_file_as(content, "file.txt"))
+        metadata: Optional[Metadata] = self._run(self._storage_driver.get_metadata("file.txt"))
+        assert metadata is not None
+        assert metadata.size.length == len(content)
+
+    @final
+    def test_get_metadata__path_not_exists__then_return_optional_none(self) -> None:
+        assert self._run(self._storage_driver.get_metadata("path-not-exists")) is None
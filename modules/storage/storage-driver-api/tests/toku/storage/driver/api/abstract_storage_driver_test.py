@@ -23,14 +23,21 @@ from abc import ABC, abstractmethod
 from io import BufferedReader, BytesIO
 import os
 import tempfile
-from typing import Generator, Generic, Optional, TypeVar, final
+from typing import Generator, Generic, Iterator, Optional, TypeVar, final
 from dataclasses import dataclass
 import humanize
 from overrides import EnforceOverrides, override
 import pytest
 from faker import Faker
+from flexmock import flexmock
 from tests.toku.storage.driver.api import StorageDriverTest
 from toku.storage.driver.api import Metadata
+from toku.storage.driver.api import BulkResult
+from toku.storage.driver.api import Page
+from toku.storage.driver.api import PathType
+from toku.storage.driver.api import Stat
+from toku.storage.driver.api import Checksum
+from toku.storage.driver.api import TransferResult
 from toku.storage.driver.api import PathSanitizer
 from toku.storage.driver.api import AbstractStorageDriver
 from toku.storage.driver.api import StorageDriverException
@@ -115,6 +122,25 @@ class AbstractStorageDriverTest(StorageDriverTest[T], ABC, EnforceOverrides, Gen
 
         return FileCreatorData(temp_file, content)
 
+    @final
+    def _get_paths_from_pages(self, pages: Iterator[Page], page_size: int) -> list[str]:
+        """
+        Gets the paths of all the `pages`, checking that every page has at most
+        `page_size` paths and only the last one hasn't a next page token.
+
+        Args:
+            pages (Iterator[Page]): The pages.
+            page_size (int): The maximum number of paths of a page.
+
+        Returns:
+            list[str]: The paths.
+        """
+        pages_as_list: list[Page] = list(pages)
+        assert all(len(page.items) <= page_size for page in pages_as_list)
+        assert all(page.next_page_token is not None for page in pages_as_list[:-1])
+        assert not pages_as_list or pages_as_list[-1].next_page_token is None
+        return [path for page in pages_as_list for path in page.items]
+
     @final
     def _create_file_in_storage_driver(
             self,
@@ -300,6 +326,90 @@ class AbstractStorageDriverTest(StorageDriverTest[T], ABC, EnforceOverrides, Gen
             with is_:
                 assert is_.read() == file_creator_data.content
 
+    @final
+    @override
+    def test_get_range__file_not_exists__then_return_optional_none(self) -> None:
+        assert not self._storage_driver.exists("file.txt")
+        assert self._storage_driver.get_range("file.txt", 0, 10) is None
+
+    @final
+    @override
+    def test_get_range__file_is_directory__then_return_optional_none(self) -> None:
+        assert self._storage_driver.make_directory("directory")
+        assert self._storage_driver.get_range("directory", 0, 10) is None
+
+    @final
+    @override
+    def test_get_range__invalid_range__then_return_optional_none(self) -> None:
+        file_creator_data: FileCreatorData = self._create_file_in_storage_driver("directory", "file.txt")
+        assert self._storage_driver.get_range(file_creator_data.path, -1, 10) is None
+        assert self._storage_driver.get_range(file_creator_data.path, 0, -1) is None
+
+    @final
+    @override
+    def test_get_range__offset_and_length__then_return_optional_byte_array(self) -> None:
+        file_creator_data: FileCreatorData = self._create_file_in_storage_driver("directory", "file.txt")
+        assert self._storage_driver.get_range(file_creator_data.path, 0, 5) == file_creator_data.content[0:5]
+        assert self._storage_driver.get_range(file_creator_data.path, 3, 7) == file_creator_data.content[3:10]
+        assert self._storage_driver.get_range(file_creator_data.path, 3, 0) == b""
+
+    @final
+    @override
+    def test_get_range__without_length__then_return_optional_byte_array(self) -> None:
+        file_creator_data: FileCreatorData = self._create_file_in_storage_driver(None, "file.txt")
+        assert self._storage_driver.get_range(file_creator_data.path, 0) == file_creator_data.content
+        assert self._storage_driver.get_range(file_creator_data.path, 4) == file_creator_data.content[4:]
+
+    @final
+    @override
+    def test_get_range__range_exceeds_file__then_return_optional_byte_array(self) -> None:
+        file_creator_data: FileCreatorData = self._create_file_in_storage_driver(None, "file.txt")
+        size: int = len(file_creator_data.content)
+        assert self._storage_driver.get_range(file_creator_data.path, size - 3, 100) == file_creator_data.content[-3:]
+        assert self._storage_driver.get_range(file_creator_data.path, size + 10, 100) == b""
+        assert self._storage_driver.get_range(file_creator_data.path, size + 10) == b""
+
+    @final
+    @override
+    def test_get_range_as_input_stream__file_not_exists__then_return_optional_none(self) -> None:
+        assert not self._storage_driver.exists("file.txt")
+        assert self._storage_driver.get_range_as_input_stream("file.txt", 0, 10) is None
+
+    @final
+    @override
+    def test_get_range_as_input_stream__invalid_range__then_return_optional_none(self) -> None:
+        file_creator_data: FileCreatorData = self._create_file_in_storage_driver(None, "file.txt")
+        assert self._storage_driver.get_range_as_input_stream(file_creator_data.path, -1) is None
+        assert self._storage_driver.get_range_as_input_stream(file_creator_data.path, 0, -1) is None
+
+    @final
+    @override
+    def test_get_range_as_input_stream__offset_and_length__then_return_optional_input_stream(self) -> None:
+        file_creator_data: FileCreatorData = self._create_file_in_storage_driver("directory", "file.txt")
+        is_: Optional[BufferedReader] = self._storage_driver.get_range_as_input_stream(file_creator_data.path, 2, 8)
+        assert is_
+        with is_:
+            assert is_.read(3) == file_creator_data.content[2:5]
+            assert is_.read() == file_creator_data.content[5:10]
+            assert is_.read() == b""
+
+    @final
+    @override
+    def test_get_range_as_input_stream__without_length__then_return_optional_input_stream(self) -> None:
+        file_creator_data: FileCreatorData = self._create_file_in_storage_driver("directory", "file.txt")
+        is_: Optional[BufferedReader] = self._storage_driver.get_range_as_input_stream(file_creator_data.path, 6)
+        assert is_
+        with is_:
+            assert is_.read() == file_creator_data.content[6:]
+
+    @final
+    @override
+    def test_get_local_path__file_not_exists__then_return_optional_none(self) -> None:
+        assert not self._storage_driver.exists("file.txt")
+        assert self._storage_driver.get_local_path("file.txt") is None
+        assert self._storage_driver.make_directory("directory")
+        assert self._storage_driver.get_local_path("directory") is None
+
     @final
     @override
     def test_exists__file_not_exists__then_return_false(self) -> None:
@@ -769,6 +879,23 @@ class AbstractStorageDriverTest(StorageDriverTest[T], ABC, EnforceOverrides, Gen
         assert self._storage_driver.append(append.encode("UTF-8"), file)
         assert self._storage_driver.get(file) == bytes(f"{original}{append}", "utf-8")
 
+    @final
+    @override
+    def test_flush__appended_file__then_return_void(self) -> None:
+        file: str = self._sanitizer.concat("directory", "file.txt")
+        original: str = self._create_string()
+        appends: list[str] = [self._create_string() for _ in range(3)]
+
+        assert self._storage_driver.put_file_as(original.encode("UTF-8"), file)
+
+        for append in appends:
+            assert self._storage_driver.append(append.encode("UTF-8"), file)
+
+        self._storage_driver.flush()
+        assert self._storage_driver.get(file) == bytes(original + "".join(appends), "utf-8")
+        self._storage_driver.flush()  # nothing to flush
+        assert self._storage_driver.get(file) == bytes(original + "".join(appends), "utf-8")
+
     @final
     @override
     def test_copy__source_not_exists__then_return_false(self) -> None:
@@ -959,6 +1086,31 @@ class AbstractStorageDriverTest(StorageDriverTest[T], ABC, EnforceOverrides, Gen
             assert target_storage_driver.get(self._sanitizer.concat(directory, copy_file)) == content1
             assert target_storage_driver.get(copy_file) == content1
 
+    @final
+    @override
+    def test_copy__skip_unchanged__target_unchanged__then_return_true_without_copying(self) -> None:
+        content: bytes = self._create_byte_array()
+
+        assert self._storage_driver.put_file_as(content, "directory/file.txt")
+        assert self._storage_driver.put_file_as(content, "copy.txt")
+        flexmock(self._storage_driver).should_call("_transfer_file").never()
+        assert self._storage_driver.copy("directory/file.txt", "copy.txt", skip_unchanged=True)
+        assert self._storage_driver.get("copy.txt") == content
+
+    @final
+    @override
+    def test_copy__skip_unchanged__target_changed__then_return_true(self) -> None:
+        content1: bytes = self._create_byte_array()
+        content2: bytes = self._create_byte_array()
+
+        assert self._storage_driver.put_file_as(content1, "directory/file.txt")
+        assert self._storage_driver.put_file_as(content2, "copy.txt")
+        flexmock(self._storage_driver).should_call("_transfer_file").twice()
+        assert self._storage_driver.copy("directory/file.txt", "copy.txt", skip_unchanged=True)
+        assert self._storage_driver.copy("directory/file.txt", "other.txt", skip_unchanged=True)
+        assert self._storage_driver.get("copy.txt") == content1
+        assert self._storage_driver.get("other.txt") == content1
+
     @final
     @override
     def test_move__source_not_exists__then_return_false(self) -> None:
@@ -1478,6 +1630,85 @@ class AbstractStorageDriverTest(StorageDriverTest[T], ABC, EnforceOverrides, Gen
         assert len(self._storage_driver.all_directories("    ")) == 5
         assert set(self._storage_driver.all_directories("    ")) == {self._sanitizer.sanitize(directory1), self._sanitizer.sanitize(directory1_1), self._sanitizer.sanitize(directory1_2), self._sanitizer.sanitize(directory1_3), self._sanitizer.sanitize(directory1_3_1)}
 
+    @final
+    @override
+    def test_iter_files__directory_not_exists__then_return_iterator_empty(self) -> None:
+        assert not self._storage_driver.exists_directory("directory")
+        assert not list(self._storage_driver.iter_files("directory"))
+
+    @final
+    @override
+    def test_iter_files__page_size_not_positive__then_return_iterator_empty(self) -> None:
+        self._create_file_in_storage_driver("directory", "1.txt")
+        assert not list(self._storage_driver.iter_files("directory", 0))
+        assert not list(self._storage_driver.iter_files("directory", -1))
+
+    @final
+    @override
+    def test_iter_files__get__then_return_iterator_page(self) -> None:
+        files: list[str] = [self._create_file_in_storage_driver("directory", f"{index}.txt").path for index in range(5)]
+        self._create_file_in_storage_driver("directory/sub-directory", "1.txt")
+
+        assert sorted(self._get_paths_from_pages(self._storage_driver.iter_files("directory", 2), 2)) == sorted(files)
+        assert sorted(self._get_paths_from_pages(self._storage_driver.iter_files("directory"), AbstractStorageDriver.DEFAULT_PAGE_SIZE)) == sorted(files)
+
+    @final
+    @override
+    def test_iter_files__page_token__then_return_iterator_page_after_token(self) -> None:
+        files: list[str] = [self._create_file_in_storage_driver("directory", f"{index}.txt").path for index in range(5)]
+
+        first_page: Page = next(self._storage_driver.iter_files("directory", 2))
+        assert len(first_page.items) <= 2
+        assert first_page.next_page_token is not None
+        next_files: list[str] = self._get_paths_from_pages(self._storage_driver.iter_files("directory", 2, first_page.next_page_token), 2)
+        assert sorted(first_page.items + next_files) == sorted(files)
+
+    @final
+    @override
+    def test_iter_all_files__directory_is_file__then_return_iterator_empty(self) -> None:
+        file_creator_data: FileCreatorData = self._create_file_in_storage_driver("directory", "file.txt")
+        assert not list(self._storage_driver.iter_all_files(file_creator_data.path))
+
+    @final
+    @override
+    def test_iter_all_files__get__then_return_iterator_page(self) -> None:
+        files: list[str] = [
+            self._create_file_in_storage_driver("directory", "1.txt").path,
+            self._create_file_in_storage_driver("directory", "2.txt").path,
+            self._create_file_in_storage_driver("directory/sub-directory-1", "1.txt").path,
+            self._create_file_in_storage_driver("directory/sub-directory-2", "1.txt").path,
+            self._create_file_in_storage_driver("directory/sub-directory-2/sub-directory", "1.txt").path
+        ]
+        self._create_file_in_storage_driver("", "root.txt")
+
+        assert sorted(self._get_paths_from_pages(self._storage_driver.iter_all_files("directory", 2), 2)) == sorted(files)
+
+    @final
+    @override
+    def test_iter_directories__get__then_return_iterator_page(self) -> None:
+        directories: list[str] = [self._sanitizer.concat("directory", f"sub-directory-{index}") for index in range(5)]
+        for directory in directories:
+            assert self._storage_driver.make_directory(directory)
+        assert self._storage_driver.make_directory(self._sanitizer.concat(directories[0], "sub-directory"))
+        self._create_file_in_storage_driver("directory", "1.txt")
+
+        assert sorted(self._get_paths_from_pages(self._storage_driver.iter_directories("directory", 2), 2)) == sorted(directories)
+
+    @final
+    @override
+    def test_iter_all_directories__get__then_return_iterator_page(self) -> None:
+        directories: list[str] = [
+            self._sanitizer.sanitize("directory"),
+            self._sanitizer.concat("directory", "sub-directory-1"),
+            self._sanitizer.concat("directory", "sub-directory-2"),
+            self._sanitizer.concat("directory/sub-directory-2", "sub-directory")
+        ]
+        for directory in directories:
+            assert self._storage_driver.make_directory(directory)
+        self._create_file_in_storage_driver("directory", "1.txt")
+
+        assert sorted(self._get_paths_from_pages(self._storage_driver.iter_all_directories("", 3), 3)) == sorted(directories)
+
     @final
     @override
     def test_exists_directory__directory_not_exists__then_return_false(self) -> None:
@@ -2456,6 +2687,89 @@ class AbstractStorageDriverTest(StorageDriverTest[T], ABC, EnforceOverrides, Gen
             assert target_storage_driver.exists_directory(self._sanitizer.concat(directory2, "1", "2"))
             assert target_storage_driver.get(self._sanitizer.concat(directory2_1_1, file1)) == content1.encode("UTF-8")
 
+    @final
+    @override
+    def test_transfer_directory__source_not_exists__then_return_optional_none(self) -> None:
+        assert self._storage_driver.make_directory("target")
+        assert self._storage_driver.transfer_directory("directory", "target") is None
+        assert self._storage_driver.transfer_directory("directory", "target", True) is None
+
+    @final
+    @override
+    def test_transfer_directory__copy__then_return_optional_transfer_result(self) -> None:
+        files: list[str] = [self._sanitizer.concat("source", "file1.txt"), self._sanitizer.concat("source", "1", "file2.txt")]
+        for file in files:
+            assert self._storage_driver.put_file_as(b"content", file)
+        assert self._storage_driver.make_directory("target")
+        result: Optional[TransferResult] = self._storage_driver.transfer_directory("source", "target")
+
+        assert result is not None
+        assert result.succeeded
+        assert not result.failures
+        assert sorted(bulk_result.path for bulk_result in result.results) == sorted(files)
+        assert result.transferred_bytes == 2 * len(b"content")
+        assert sorted(self._storage_driver.all_files("target")) == sorted(self._sanitizer.concat("target", file) for file in files)
+        assert sorted(self._storage_driver.all_files("source")) == sorted(files)
+
+    @final
+    @override
+    def test_transfer_directory__move__then_return_optional_transfer_result(self) -> None:
+        files: list[str] = [self._sanitizer.concat("source", "file1.txt"), self._sanitizer.concat("source", "1", "file2.txt")]
+        for file in files:
+            assert self._storage_driver.put_file_as(b"content", file)
+        assert self._storage_driver.make_directory("target")
+        result: Optional[TransferResult] = self._storage_driver.transfer_directory("source", "target", True)
+
+        assert result is not None
+        assert result.succeeded
+        assert result.transferred_bytes == 2 * len(b"content")
+        assert sorted(self._storage_driver.all_files("target")) == sorted(self._sanitizer.concat("target", file) for file in files)
+        assert not self._storage_driver.exists_directory("source")
+
+    @final
+    @override
+    def test_transfer_directory__another_storage_driver__then_return_optional_transfer_result(self) -> None:
+        with self._create_storage_driver_secondary() as target_storage_driver:
+            files: list[str] = [self._sanitizer.concat("source", f"file{i}.txt") for i in range(20)]
+            for file in files:
+                assert self._storage_driver.put_file_as(file.encode("UTF-8"), file)
+            assert target_storage_driver.make_directory("target")
+            result: Optional[TransferResult] = self._storage_driver.transfer_directory("source", "target", True, target_storage_driver)
+
+            assert result is not None
+            assert result.succeeded
+            assert len(result.results) == len(files)
+            assert not self._storage_driver.exists_directory("source")
+            for file in files:
+                assert target_storage_driver.get(self._sanitizer.concat("target", file)) == file.encode("UTF-8")
+
+    @final
+    @override
+    def test_copy_directory__skip_unchanged__then_copy_changed_files(self) -> None:
+        assert self._storage_driver.put_file_as(b"content1", self._sanitizer.concat("source", "file1.txt"))
+        assert self._storage_driver.put_file_as(b"content2", self._sanitizer.concat("source", "1", "file2.txt"))
+        assert self._storage_driver.put_file_as(b"content3", self._sanitizer.concat("source", "file3.txt"))
+        assert self._storage_driver.put_file_as(b"content1", self._sanitizer.concat("target", "source", "file1.txt"))
+        assert self._storage_driver.put_file_as(b"changed", self._sanitizer.concat("target", "source", "1", "file2.txt"))
+        flexmock(self._storage_driver).should_call("_transfer_file").twice()
+        assert self._storage_driver.copy_directory("source", "target", skip_unchanged=True)
+        assert self._storage_driver.get(self._sanitizer.concat("target", "source", "file1.txt")) == b"content1"
+        assert self._storage_driver.get(self._sanitizer.concat("target", "source", "1", "file2.txt")) == b"content2"
+        assert self._storage_driver.get(self._sanitizer.concat("target", "source", "file3.txt")) == b"content3"
+        assert len(self._storage_driver.all_files("source")) == 3
+
+    @final
+    @override
+    def test_move_directory__skip_unchanged__then_remove_source(self) -> None:
+        assert self._storage_driver.put_file_as(b"content1", self._sanitizer.concat("source", "file1.txt"))
+        assert self._storage_driver.put_file_as(b"content2", self._sanitizer.concat("source", "file2.txt"))
+        assert self._storage_driver.put_file_as(b"content1", self._sanitizer.concat("target", "source", "file1.txt"))
+        flexmock(self._storage_driver).should_call("_transfer_file").once()
+        assert self._storage_driver.move_directory("source", "target", skip_unchanged=True)
+        assert self._storage_driver.get(self._sanitizer.concat("target", "source", "file1.txt")) == b"content1"
+        assert self._storage_driver.get(self._sanitizer.concat("target", "source", "file2.txt")) == b"content2"
+        assert not self._storage_driver.exists_directory("source")
+
     @final
     @override
     def test_make_directory__directory_not_exists__then_return_true(self) -> None:
@@ -2707,6 +3021,21 @@ class AbstractStorageDriverTest(StorageDriverTest[T], ABC, EnforceOverrides, Gen
         assert not metadata.is_file
         assert not metadata.is_symbolic_link
 
+    @final
+    @override
+    def test_get_metadata__from_empty_folder__then_return_optional_metadata(self) -> None:
+        assert self._storage_driver.make_directory("directory")
+        metadata: Optional[Metadata] = self._storage_driver.get_metadata("directory")
+
+        assert metadata
+        assert metadata.creation_time > 0
+        assert metadata.last_modified > 0
+        assert metadata.media_type == ""
+        assert metadata.size.length == 0
+        assert metadata.is_directory
+        assert not metadata.is_file
+        assert not metadata.is_symbolic_link
+
     @final
     @override
     def test_get_metadata__from_root__then_return_optional_metadata(self) -> None:
@@ -2734,3 +3063,196 @@ class AbstractStorageDriverTest(StorageDriverTest[T], ABC, EnforceOverrides, Gen
         assert not metadata.is_symbolic_link
         # ensure that the root is the original
         assert self._sanitizer.sanitize(self._storage_driver.get_root()) == self._sanitizer.sanitize(root)
+
+    @final
+    @override
+    def test_stat__path_not_exists__then_return_stat_missing(self) -> None:
+        assert self._storage_driver.stat("file.txt") == Stat(PathType.MISSING)
+        assert self._storage_driver.stat("directory") == Stat(PathType.MISSING)
+
+    @final
+    @override
+    def test_stat__from_file__then_return_stat_file(self) -> None:
+        content: bytes = self._create_string(1000).encode("UTF-8")
+        assert self._storage_driver.put_file_as(content, "directory/file.txt")
+        stat: Stat = self._storage_driver.stat("directory/file.txt")
+
+        assert stat.type == PathType.FILE
+        assert stat.metadata is None or \
+            (stat.metadata.is_file and stat.metadata.size.length == len(content))
+
+    @final
+    @override
+    def test_stat__from_folder__then_return_stat_directory(self) -> None:
+        assert self._storage_driver.put_file_as(b"content", "directory/file.txt")
+        assert self._storage_driver.make_directory("empty-directory")
+
+        assert self._storage_driver.stat("directory").type == PathType.DIRECTORY
+        assert self._storage_driver.stat("empty-directory").type == PathType.DIRECTORY
+
+    @final
+    @override
+    def test_stat__from_root__then_return_stat_directory(self) -> None:
+        assert self._storage_driver.stat("").type == PathType.DIRECTORY
+
+    @final
+    @override
+    def test_checksum__file_not_exists__then_return_optional_none(self) -> None:
+        assert self._storage_driver.checksum("file.txt") is None
+
+    @final
+    @override
+    def test_checksum__from_folder__then_return_optional_none(self) -> None:
+        assert self._storage_driver.put_file_as(b"content", "directory/file.txt")
+        assert self._storage_driver.checksum("directory") is None
+
+    @final
+    @override
+    def test_checksum__from_file__then_return_optional_checksum(self) -> None:
+        content: bytes = self._create_string(1000).encode("UTF-8")
+        assert self._storage_driver.put_file_as(content, "file1.txt")
+        assert self._storage_driver.put_file_as(content, "directory/file2.txt")
+        assert self._storage_driver.put_file_as(content + b"changed", "file3.txt")
+        checksum1: Optional[Checksum] = self._storage_driver.checksum("file1.txt")
+        checksum2: Optional[Checksum] = self._storage_driver.checksum("directory/file2.txt")
+        checksum3: Optional[Checksum] = self._storage_driver.checksum("file3.txt")
+
+        assert checksum1 is not None and checksum2 is not None and checksum3 is not None
+        assert checksum1.size == len(content)
+        assert checksum1.matches(checksum2)
+        assert not checksum1.matches(checksum3)
+
+    @final
+    @override
+    def test_list_with_metadata__directory_not_exists__then_return_collection_empty(self) -> None:
+        assert not self._storage_driver.exists_directory("directory")
+        assert self._storage_driver.list_with_metadata("directory") == []
+        assert self._storage_driver.list_with_metadata("directory", True) == []
+
+    @final
+    @override
+    def test_list_with_metadata__directory_is_file__then_return_collection_empty(self) -> None:
+        file_creator_data: FileCreatorData = self._create_file_in_storage_driver("directory", "file.txt")
+        assert self._storage_driver.list_with_metadata(file_creator_data.path) == []
+        assert self._storage_driver.list_with_metadata(file_creator_data.path, True) == []
+
+    @final
+    @override
+    def test_list_with_metadata__not_recursive__then_return_collection_tuple(self) -> None:
+        file_creator_data_1: FileCreatorData = self._create_file_in_storage_driver("directory", "1.txt")
+        file_creator_data_2: FileCreatorData = self._create_file_in_storage_driver("directory", "2.json")
+        self._create_file_in_storage_driver("directory/sub-directory", "3.txt")
+
+        files: list[tuple[str, Metadata]] = sorted(self._storage_driver.list_with_metadata("directory"), key=lambda file: file[0])
+
+        assert [file for file, _ in files] == sorted([file_creator_data_1.path, file_creator_data_2.path])
+        for file, metadata in files:
+            expected_metadata: Optional[Metadata] = self._storage_driver.get_metadata(file)
+            assert expected_metadata
+            assert metadata.size == expected_metadata.size
+            assert metadata.creation_time == expected_metadata.creation_time
+            assert metadata.last_modified == expected_metadata.last_modified
+            assert metadata.media_type == expected_metadata.media_type
+            assert metadata.is_file
+            assert not metadata.is_directory
+
+    @final
+    @override
+    def test_list_with_metadata__recursive__then_return_collection_tuple(self) -> None:
+        file_creator_data_list: list[FileCreatorData] = [
+            self._create_file_in_storage_driver("", "root.txt"),
+            self._create_file_in_storage_driver("directory", "1.txt"),
+            self._create_file_in_storage_driver("directory/sub-directory", "2.txt")
+        ]
+
+        files: list[tuple[str, Metadata]] = self._storage_driver.list_with_metadata("", True)
+
+        assert sorted(file for file, _ in files) == sorted(file_creator_data.path for file_creator_data in file_creator_data_list)
+        for file_creator_data in file_creator_data_list:
+            metadata: Metadata = dict(files)[file_creator_data.path]
+            assert metadata.size.length == len(file_creator_data.content)
+            assert metadata.is_file
+
+    @final
+    @override
+    def test_exists_many__empty_collection__then_return_empty_collection(self) -> None:
+        assert self._storage_driver.exists_many([]) == []
+
+    @final
+    @override
+    def test_exists_many__files_exist_and_not_exist__then_return_collection_bulk_result(self) -> None:
+        file1: FileCreatorData = self._create_file_in_storage_driver("directory", "file1.txt")
+        file2: FileCreatorData = self._create_file_in_storage_driver(None, "file2.txt")
+        results: list[BulkResult[bool]] = self._storage_driver.exists_many([file1.path, "file-not-exists.txt", file2.path, "directory"])
+
+        assert [result.path for result in results] == [file1.path, "file-not-exists.txt", file2.path, "directory"]
+        assert [result.value for result in results] == [True, False, True, False]
+        assert all(result.succeeded for result in results)
+
+    @final
+    @override
+    def test_get_many__files_exist_and_not_exist__then_return_collection_bulk_result(self) -> None:
+        file1: FileCreatorData = self._create_file_in_storage_driver("directory", "file1.txt")
+        file2: FileCreatorData = self._create_file_in_storage_driver(None, "file2.txt")
+        results: list[BulkResult[Optional[bytes]]] = self._storage_driver.get_many([file1.path, "file-not-exists.txt", file2.path])
+
+        assert [result.path for result in results] == [file1.path, "file-not-exists.txt", file2.path]
+        assert [result.value for result in results] == [file1.content, None, file2.content]
+        assert all(result.succeeded for result in results)
+
+    @final
+    @override
+    def test_put_many__files_in_same_directory__then_return_collection_bulk_result(self) -> None:
+        file_in_local: FileCreatorData = self._create_file_in_local("", "file-in-local.txt")
+        sources: dict[str, bytes | str | BufferedReader] = {
+            self._sanitizer.concat("directory/sub", f"file{i}.txt"): self._create_byte_array()
+            for i in range(10)
+        }
+        sources[self._sanitizer.concat("directory/sub", "file-from-local.txt")] = file_in_local.path
+        results: list[BulkResult[bool]] = self._storage_driver.put_many(sources)
+
+        assert [result.path for result in results] == list(sources)
+        assert all(result.succeeded and result.value for result in results)
+        assert len(self._storage_driver.files("directory/sub")) == 11
+
+        for file, source in sources.items():
+            assert self._storage_driver.get(file) == (file_in_local.content if isinstance(source, str) else source)
+
+    @final
+    @override
+    def test_put_many__file_is_directory__then_return_collection_bulk_result_with_false(self) -> None:
+        directory: str = self._create_directory_in_storage_driver("directory")
+        results: list[BulkResult[bool]] = self._storage_driver.put_many({
+            directory: self._create_byte_array(),
+            "file.txt": self._create_byte_array()
+        })
+
+        assert [result.value for result in results] == [False, True]
+        assert self._storage_driver.exists_directory(directory)
+        assert self._storage_driver.exists("file.txt")
+
+    @final
+    @override
+    def test_delete_many__files_exist_and_not_exist__then_return_collection_bulk_result(self) -> None:
+        file1: FileCreatorData = self._create_file_in_storage_driver("directory", "file1.txt")
+        file2: FileCreatorData = self._create_file_in_storage_driver("directory", "file2.txt")
+        results: list[BulkResult[bool]] = self._storage_driver.delete_many([file1.path, "file-not-exists.txt", file2.path, "directory"])
+
+        assert [result.path for result in results] == [file1.path, "file-not-exists.txt", file2.path, "directory"]
+        assert [result.value for result in results] == [True, False, True, False]
+        assert not self._storage_driver.exists(file1.path)
+        assert not self._storage_driver.exists(file2.path)
+        assert self._storage_driver.exists_directory("directory")
+
+    @final
+    @override
+    def test_get_metadata_many__file_directory_and_not_exists__then_return_collection_bulk_result(self) -> None:
+        file: FileCreatorData = self._create_file_in_storage_driver("directory", "file.txt")
+        results: list[BulkResult[Optional[Metadata]]] = self._storage_driver.get_metadata_many([file.path, "directory", "path-not-exists"])
+
+        assert [result.path for result in results] == [file.path, "directory", "path-not-exists"]
+        assert results[0].value and results[0].value.is_file
+        assert results[0].value.size.length == len(file.content)
+        assert results[1].value and results[1].value.is_directory
+        assert results[1].value.size.length == len(file.content)
+        assert results[2].value is None
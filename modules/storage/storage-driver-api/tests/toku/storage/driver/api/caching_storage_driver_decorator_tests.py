@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa: E501
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=empty-docstring
+# pylint: disable=line-too-long
+# pylint: disable=attribute-defined-outside-init
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: caching_storage_driver_decorator_tests.py
+Author: Toku
+"""
+import pytest
+from flexmock import flexmock
+from toku.storage.driver.api import BulkResult
+from toku.storage.driver.api import Metadata
+from toku.storage.driver.api import Size
+from toku.storage.driver.api import PathType
+from toku.storage.driver.api import Stat
+from toku.storage.driver.api import Checksum
+from toku.storage.driver.api import CachingStorageDriverDecorator
+from tests.toku.storage.driver.api.stub_storage_driver import StubStorageDriver
+
+
+class CachingStorageDriverDecoratorTests:
+    """
+    Provides test cases for CachingStorageDriverDecorator class.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup_test(self) -> None:
+        """
+        Initialize the storage_driver and the storage_driver_decorator.
+        """
+        self._storage_driver: StubStorageDriver = StubStorageDriver()
+        self._storage_driver_decorator: CachingStorageDriverDecorator = CachingStorageDriverDecorator(self._storage_driver)
+
+    def test_exists__invoked_twice__then_return_cached_boolean(self) -> None:
+        flexmock(self._storage_driver).should_receive("exists").with_args("directory/file.txt").and_return(True).once()
+
+        assert self._storage_driver_decorator.exists("directory/file.txt")
+        assert self._storage_driver_decorator.exists("/directory/file.txt/")
+
+    def test_exists__path_not_exists__then_return_cached_false(self) -> None:
+        flexmock(self._storage_driver).should_receive("exists").with_args("file.txt").and_return(False).once()
+
+        assert not self._storage_driver_decorator.exists("file.txt")
+        assert not self._storage_driver_decorator.exists("file.txt")
+
+    def test_exists_directory__invoked_twice__then_return_cached_boolean(self) -> None:
+        flexmock(self._storage_driver).should_receive("exists_directory").with_args("directory").and_return(True).once()
+
+        assert self._storage_driver_decorator.exists_directory("directory")
+        assert self._storage_driver_decorator.exists_directory("directory")
+
+    def test_get_metadata__invoked_twice__then_return_cached_optional_metadata(self) -> None:
+        metadata = Metadata(Size(100), 100, 100, 100, True, False, False, "text/plain")
+        flexmock(self._storage_driver).should_receive("get_metadata").with_args("file.txt").and_return(metadata).once()
+        flexmock(self._storage_driver).should_receive("get_metadata").with_args("file-not-exists.txt").and_return(None).once()
+
+        assert self._storage_driver_decorator.get_metadata("file.txt") == metadata
+        assert self._storage_driver_decorator.get_metadata("file.txt") == metadata
+        assert self._storage_driver_decorator.get_metadata("file-not-exists.txt") is None
+        assert self._storage_driver_decorator.get_metadata("file-not-exists.txt") is None
+
+    def test_stat__invoked_twice__then_return_cached_stat(self) -> None:
+        flexmock(self._storage_driver).should_receive("stat").with_args("directory").and_return(Stat(PathType.DIRECTORY)).once()
+
+        assert self._storage_driver_decorator.stat("directory") == Stat(PathType.DIRECTORY)
+        assert self._storage_driver_decorator.stat("directory") == Stat(PathType.DIRECTORY)
+
+    def test_checksum__invoked_twice__then_return_cached_optional_checksum(self) -> None:
+        flexmock(self._storage_driver).should_receive("checksum").with_args("file.txt").and_return(Checksum(100, md5="md5")).once()
+
+        assert self._storage_driver_decorator.checksum("file.txt") == Checksum(100, md5="md5")
+        assert self._storage_driver_decorator.checksum("file.txt") == Checksum(100, md5="md5")
+
+    def test_copy__cached_checksum_of_target__then_invalidate_it(self) -> None:
+        flexmock(self._storage_driver).should_receive("copy").with_args("source.txt", "target.txt", skip_unchanged=True).and_return(True).once()
+        flexmock(self._storage_driver).should_receive("checksum").with_args("target.txt").and_return(None).and_return(Checksum(100, md5="md5")).twice()
+
+        assert self._storage_driver_decorator.checksum("target.txt") is None
+        assert self._storage_driver_decorator.copy("source.txt", "target.txt", skip_unchanged=True)
+        assert self._storage_driver_decorator.checksum("target.txt") == Checksum(100, md5="md5")
+
+    def test_exists__entry_expired__then_return_loaded_boolean(self) -> None:
+        self._storage_driver_decorator = CachingStorageDriverDecorator(self._storage_driver, ttl=0)
+        flexmock(self._storage_driver).should_receive("exists").with_args("file.txt").and_return(True).twice()
+
+        assert self._storage_driver_decorator.exists("file.txt")
+        assert self._storage_driver_decorator.exists("file.txt")
+
+    def test_exists__cache_is_full__then_evict_least_recently_used(self) -> None:
+        self._storage_driver_decorator = CachingStorageDriverDecorator(self._storage_driver, max_size=2)
+        flexmock(self._storage_driver).should_receive("exists").with_args("1.txt").and_return(True).twice()
+        flexmock(self._storage_driver).should_receive("exists").with_args("2.txt").and_return(True).once()
+        flexmock(self._storage_driver).should_receive("exists").with_args("3.txt").and_return(True).once()
+
+        assert self._storage_driver_decorator.exists("1.txt")
+        assert self._storage_driver_decorator.exists("2.txt")
+        assert self._storage_driver_decorator.exists("2.txt")  # 1.txt is the least recently used
+        assert self._storage_driver_decorator.exists("3.txt")  # 1.txt is evicted
+        assert self._storage_driver_decorator.exists("2.txt")
+        assert self._storage_driver_decorator.exists("1.txt")
+
+    def test_put_file_as__cached_file_and_parents__then_invalidate_them(self) -> None:
+        flexmock(self._storage_driver).should_receive("put_file_as").with_args(b"content", "directory/sub-directory/file.txt").and_return(True).once()
+        flexmock(self._storage_driver).should_receive("exists").with_args("directory/sub-directory/file.txt").and_return(False).and_return(True).twice()
+        flexmock(self._storage_driver).should_receive("exists_directory").with_args("directory").and_return(False).and_return(True).twice()
+        flexmock(self._storage_driver).should_receive("get_metadata").with_args("").and_return(None).twice()
+        flexmock(self._storage_driver).should_receive("exists").with_args("other.txt").and_return(True).once()
+
+        assert not self._storage_driver_decorator.exists("directory/sub-directory/file.txt")
+        assert not self._storage_driver_decorator.exists_directory("directory")
+        assert self._storage_driver_decorator.get_metadata("") is None
+        assert self._storage_driver_decorator.exists("other.txt")
+        assert self._storage_driver_decorator.put_file_as(b"content", "directory/sub-directory/file.txt")
+        assert self._storage_driver_decorator.exists("directory/sub-directory/file.txt")
+        assert self._storage_driver_decorator.exists_directory("directory")
+        assert self._storage_driver_decorator.get_metadata("") is None
+        assert self._storage_driver_decorator.exists("other.txt")
+
+    def test_delete_directory__cached_sub_paths__then_invalidate_them(self) -> None:
+        flexmock(self._storage_driver).should_receive("delete_directory").with_args("directory").and_return(True).once()
+        flexmock(self._storage_driver).should_receive("exists").with_args("directory/sub-directory/file.txt").and_return(True).and_return(False).twice()
+        flexmock(self._storage_driver).should_receive("exists").with_args("directory-other/file.txt").and_return(True).once()
+
+        assert self._storage_driver_decorator.exists("directory/sub-directory/file.txt")
+        assert self._storage_driver_decorator.exists("directory-other/file.txt")
+        assert self._storage_driver_decorator.delete_directory("directory")
+        assert not self._storage_driver_decorator.exists("directory/sub-directory/file.txt")
+        assert self._storage_driver_decorator.exists("directory-other/file.txt")
+
+    def test_exists_many__some_paths_cached__then_load_only_paths_not_cached(self) -> None:
+        flexmock(self._storage_driver).should_receive("exists").with_args("1.txt").and_return(True).once()
+        flexmock(self._storage_driver).should_receive("exists_many").with_args(["2.txt", "3.txt"]).and_return([BulkResult("2.txt", False), BulkResult("3.txt", error=Exception("error"))]).once()
+        flexmock(self._storage_driver).should_receive("exists_many").with_args(["3.txt"]).and_return([BulkResult("3.txt", True)]).once()
+
+        assert self._storage_driver_decorator.exists("1.txt")
+        results: list[BulkResult[bool]] = self._storage_driver_decorator.exists_many(["1.txt", "2.txt", "3.txt"])
+        assert [(result.path, result.value, result.succeeded) for result in results] == [("1.txt", True, True), ("2.txt", False, True), ("3.txt", None, False)]
+        results = self._storage_driver_decorator.exists_many(["1.txt", "2.txt", "3.txt"])
+        assert [(result.path, result.value) for result in results] == [("1.txt", True), ("2.txt", False), ("3.txt", True)]
+
+    def test_close__cached_paths__then_clear_cache(self) -> None:
+        flexmock(self._storage_driver).should_receive("exists").with_args("file.txt").and_return(True).twice()
+
+        assert self._storage_driver_decorator.exists("file.txt")
+        self._storage_driver_decorator.close()
+        assert self._storage_driver_decorator.exists("file.txt")
+
+    def test_flush__cached_paths__then_clear_cache(self) -> None:
+        flexmock(self._storage_driver).should_receive("flush").once()
+        flexmock(self._storage_driver).should_receive("get_metadata").with_args("file.txt").and_return(None).twice()
+
+        assert self._storage_driver_decorator.get_metadata("file.txt") is None
+        self._storage_driver_decorator.flush()
+        assert self._storage_driver_decorator.get_metadata("file.txt") is None
+
+    def test_put_file__cached_directory__then_invalidate_generated_file_and_parents(self) -> None:
+        flexmock(self._storage_driver).should_receive("put_file").with_args(b"x", "reports").and_return("generated.txt").once()
+        flexmock(self._storage_driver).should_receive("exists_directory").with_args("reports").and_return(False).and_return(True).twice()
+        flexmock(self._storage_driver).should_receive("exists").with_args("reports/generated.txt").and_return(False).and_return(True).twice()
+
+        assert not self._storage_driver_decorator.exists_directory("reports")
+        assert not self._storage_driver_decorator.exists("reports/generated.txt")
+        assert self._storage_driver_decorator.put_file(b"x", "reports") == "generated.txt"
+        assert self._storage_driver_decorator.exists_directory("reports")
+        assert self._storage_driver_decorator.exists("reports/generated.txt")
+
+    def test_exists__write_while_loading__then_return_loaded_boolean_without_caching_it(self) -> None:
+        def exists(file: str) -> bool:
+            self._storage_driver_decorator.put_file_as(b"content", file)  # a concurrent write
+            return False
+
+        flexmock(self._storage_driver).should_receive("put_file_as").and_return(True).once()
+        flexmock(self._storage_driver).should_receive("exists").with_args("file.txt").replace_with(exists).once()
+
+        assert not self._storage_driver_decorator.exists("file.txt")
+        flexmock(self._storage_driver).should_receive("exists").with_args("file.txt").and_return(True).once()
+        assert self._storage_driver_decorator.exists("file.txt")
+
+    def test_delete_many__many_cached_paths__then_invalidate_only_deleted_paths_and_parents(self) -> None:
+        flexmock(self._storage_driver).should_receive("delete_many").and_return([]).once()
+        flexmock(self._storage_driver).should_receive("exists").replace_with(lambda file: True)
+        files: list[str] = [f"directory-{i % 10}/file-{i}.txt" for i in range(1000)]
+
+        for file in files:
+            assert self._storage_driver_decorator.exists(file)
+
+        self._storage_driver_decorator.delete_many(files[:500])
+
+        flexmock(self._storage_driver).should_receive("exists").never()
+        for file in files[500:]:
+            assert self._storage_driver_decorator.exists(file)
+
+    def test_exists__entries_evicted_and_invalidated__then_remove_them_from_index(self) -> None:
+        self._storage_driver_decorator = CachingStorageDriverDecorator(self._storage_driver, max_size=1)
+        flexmock(self._storage_driver).should_receive("exists").and_return(True)
+        flexmock(self._storage_driver).should_receive("delete").and_return(True)
+
+        assert self._storage_driver_decorator.exists("a/b/1.txt")
+        assert self._storage_driver_decorator.exists("c/2.txt")  # a/b/1.txt is evicted
+        assert self._storage_driver_decorator._children == {"": {"c"}, "c": {"c/2.txt"}}  # pylint: disable=protected-access
+        assert self._storage_driver_decorator.delete("c/2.txt")
+        assert self._storage_driver_decorator._children == {}  # pylint: disable=protected-access
+        assert self._storage_driver_decorator._kinds == {}  # pylint: disable=protected-access
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa: E501
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=empty-docstring
+# pylint: disable=line-too-long
+# pylint: disable=attribute-defined-outside-init
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: disk_cache_storage_driver_decorator_tests.py
+Author: Toku
+"""
+import base64
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+from io import BufferedReader, BytesIO
+import os
+import tempfile
+import time
+from typing import Generator
+import pytest
+from flexmock import flexmock
+from toku.storage.driver.api import Checksum
+from toku.storage.driver.api import DiskCacheStorageDriverDecorator
+from tests.toku.storage.driver.api.stub_storage_driver import StubStorageDriver
+
+
+class DiskCacheStorageDriverDecoratorTests:
+    """
+    Provides test cases for DiskCacheStorageDriverDecorator class.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup_test(self) -> Generator[None, None, None]:
+        """
+        Initialize the storage_driver, the cache directory and the storage_driver_decorator.
+        """
+        self._tempdir = tempfile.TemporaryDirectory()
+        self._cache_directory: str = os.path.join(self._tempdir.name, "cache")
+        self._storage_driver: StubStorageDriver = StubStorageDriver()
+        self._storage_driver_decorator: DiskCacheStorageDriverDecorator = DiskCacheStorageDriverDecorator(self._storage_driver, self._cache_directory)
+        self._storage_driver_decorator.open()
+        yield
+        self._tempdir.cleanup()
+
+    def _mock_file(self, file: str, content: bytes) -> None:
+        checksum = Checksum(len(content), md5=base64.b64encode(hashlib.md5(content).digest()).decode("utf-8"))
+        flexmock(self._storage_driver).should_receive("checksum").with_args(file).and_return(checksum)
+        flexmock(self._storage_driver).should_receive("get_as_input_stream").with_args(file).replace_with(lambda _: BufferedReader(BytesIO(content)))  # type: ignore[arg-type]
+
+    def _get_cached_files(self) -> list[str]:
+        return os.listdir(self._cache_directory)
+
+    def test_get__invoked_twice__then_return_cached_optional_bytes(self) -> None:
+        self._mock_file("directory/file.txt", b"content")
+        flexmock(self._storage_driver).should_receive("get_as_input_stream").with_args("directory/file.txt").replace_with(lambda _: BufferedReader(BytesIO(b"content"))).once()  # type: ignore[arg-type]
+
+        assert self._storage_driver_decorator.get("directory/file.txt") == b"content"
+        assert self._storage_driver_decorator.get("directory/file.txt") == b"content"
+        assert len(self._get_cached_files()) == 1
+
+    def test_get__file_not_exists__then_return_optional_none(self) -> None:
+        flexmock(self._storage_driver).should_receive("checksum").with_args("file.txt").and_return(None)
+        flexmock(self._storage_driver).should_receive("get").with_args("file.txt").and_return(None).once()
+        flexmock(self._storage_driver).should_receive("get_as_input_stream").never()
+
+        assert self._storage_driver_decorator.get("file.txt") is None
+        assert self._get_cached_files() == []
+
+    def test_get__file_changed__then_return_downloaded_optional_bytes(self) -> None:
+        self._mock_file("file.txt", b"content")
+        assert self._storage_driver_decorator.get("file.txt") == b"content"
+
+        self._mock_file("file.txt", b"changed")
+        assert self._storage_driver_decorator.get("file.txt") == b"changed"
+        assert len(self._get_cached_files()) == 1
+
+    def test_get__file_changed_while_downloading__then_return_downloaded_bytes_without_caching(self) -> None:
+        self._mock_file("file.txt", b"content")
+        flexmock(self._storage_driver).should_receive("get_as_input_stream").with_args("file.txt").replace_with(lambda _: BufferedReader(BytesIO(b"changed"))).once()  # type: ignore[arg-type]
+        flexmock(self._storage_driver).should_receive("get").with_args("file.txt").and_return(b"changed").once()
+
+        assert self._storage_driver_decorator.get("file.txt") == b"changed"
+        assert self._get_cached_files() == []
+
+    def test_get__local_file__then_return_bytes_of_storage_driver_without_caching(self) -> None:
+        flexmock(self._storage_driver).should_receive("get_local_path").with_args("file.txt").and_return("/root/file.txt")
+        flexmock(self._storage_driver).should_receive("checksum").never()
+        flexmock(self._storage_driver).should_receive("get").with_args("file.txt").and_return(b"content").twice()
+
+        assert self._storage_driver_decorator.get("file.txt") == b"content"
+        assert self._storage_driver_decorator.get("file.txt") == b"content"
+        assert self._get_cached_files() == []
+
+    def test_get__checksum_without_hashes__then_return_bytes_of_storage_driver_without_caching(self) -> None:
+        flexmock(self._storage_driver).should_receive("checksum").with_args("file.txt").and_return(Checksum(7))
+        flexmock(self._storage_driver).should_receive("get_as_input_stream").never()
+        flexmock(self._storage_driver).should_receive("get").with_args("file.txt").and_return(b"content").once()
+
+        assert self._storage_driver_decorator.get("file.txt") == b"content"
+        assert self._get_cached_files() == []
+
+    def test_get__file_bigger_than_max_bytes__then_return_not_cached_optional_bytes(self) -> None:
+        self._storage_driver_decorator = DiskCacheStorageDriverDecorator(self._storage_driver, self._cache_directory, 5)
+        self._mock_file("file.txt", b"content")
+        flexmock(self._storage_driver).should_receive("get").with_args("file.txt").and_return(b"content").once()
+        flexmock(self._storage_driver).should_receive("get_as_input_stream").never()
+
+        assert self._storage_driver_decorator.get("file.txt") == b"content"
+        assert self._get_cached_files() == []
+
+    def test_get__max_bytes_exceeded__then_evict_least_recently_used(self) -> None:
+        self._storage_driver_decorator = DiskCacheStorageDriverDecorator(self._storage_driver, self._cache_directory, 20)
+        self._mock_file("1.txt", b"content-1")
+        self._mock_file("2.txt", b"content-2")
+        self._mock_file("3.txt", b"content-3")
+        flexmock(self._storage_driver).should_receive("get_as_input_stream").with_args("1.txt").replace_with(lambda _: BufferedReader(BytesIO(b"content-1"))).once()  # type: ignore[arg-type]
+        flexmock(self._storage_driver).should_receive("get_as_input_stream").with_args("2.txt").replace_with(lambda _: BufferedReader(BytesIO(b"content-2"))).twice()  # type: ignore[arg-type]
+
+        assert self._storage_driver_decorator.get("1.txt") == b"content-1"
+        assert self._storage_driver_decorator.get("2.txt") == b"content-2"
+        assert self._storage_driver_decorator.get("1.txt") == b"content-1"  # 2.txt is the least recently used
+        assert self._storage_driver_decorator.get("3.txt") == b"content-3"  # 2.txt is evicted
+        assert self._storage_driver_decorator.get("1.txt") == b"content-1"
+        assert self._storage_driver_decorator.get("2.txt") == b"content-2"
+        assert len(self._get_cached_files()) == 2
+
+    def test_get__concurrent_readers__then_download_once(self) -> None:
+        def get_as_input_stream(_: str) -> BufferedReader:
+            time.sleep(0.1)
+            return BufferedReader(BytesIO(b"content"))  # type: ignore[arg-type]
+
+        self._mock_file("file.txt", b"content")
+        flexmock(self._storage_driver).should_receive("get_as_input_stream").with_args("file.txt").replace_with(get_as_input_stream).once()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: self._storage_driver_decorator.get("file.txt"), range(4)))
+
+        assert results == [b"content"] * 4
+        assert len(self._get_cached_files()) == 1
+
+    def test_get_range_as_input_stream__cached_file__then_return_optional_buffered_reader(self) -> None:
+        self._mock_file("file.txt", b"0123456789")
+        flexmock(self._storage_driver).should_receive("get_as_input_stream").with_args("file.txt").replace_with(lambda _: BufferedReader(BytesIO(b"0123456789"))).once()  # type: ignore[arg-type]
+        flexmock(self._storage_driver).should_receive("get_range").never()
+        flexmock(self._storage_driver).should_receive("get_range_as_input_stream").never()
+
+        assert self._storage_driver_decorator.get("file.txt") == b"0123456789"
+        assert self._storage_driver_decorator.get_range("file.txt", 2, 3) == b"234"
+        input_stream = self._storage_driver_decorator.get_range_as_input_stream("file.txt", 5, 2)
+        assert input_stream is not None
+        with input_stream:
+            assert input_stream.read() == b"56"
+        input_stream = self._storage_driver_decorator.get_range_as_input_stream("file.txt", 7)
+        assert input_stream is not None
+        with input_stream:
+            assert input_stream.read() == b"789"
+
+    def test_get_range__file_not_cached__then_return_range_of_storage_driver_without_caching(self) -> None:
+        self._mock_file("file.txt", b"0123456789")
+        flexmock(self._storage_driver).should_receive("get_as_input_stream").never()
+        flexmock(self._storage_driver).should_receive("get_range").with_args("file.txt", 2, 3).and_return(b"234").once()
+        flexmock(self._storage_driver).should_receive("get_range_as_input_stream").with_args("file.txt", 5, 2).replace_with(lambda *_: BufferedReader(BytesIO(b"56"))).once()  # type: ignore[arg-type]
+
+        assert self._storage_driver_decorator.get_range("file.txt", 2, 3) == b"234"
+        input_stream = self._storage_driver_decorator.get_range_as_input_stream("file.txt", 5, 2)
+        assert input_stream is not None
+        with input_stream:
+            assert input_stream.read() == b"56"
+        assert self._get_cached_files() == []
+
+    def test_get__download_failed__then_remove_temporary_file(self) -> None:
+        class FailingReader(BytesIO):
+            def read(self, *args, **kwargs) -> bytes:  # type: ignore[no-untyped-def]
+                raise OSError("connection reset")
+
+        self._mock_file("file.txt", b"content")
+        flexmock(self._storage_driver).should_receive("get_as_input_stream").with_args("file.txt").replace_with(lambda _: FailingReader())
+
+        with pytest.raises(OSError):
+            self._storage_driver_decorator.get("file.txt")
+        assert self._get_cached_files() == []
+
+    def test_put_file_as__cached_file__then_invalidate_it(self) -> None:
+        self._mock_file("directory/file.txt", b"content")
+        flexmock(self._storage_driver).should_receive("get_as_input_stream").with_args("directory/file.txt").replace_with(lambda _: BufferedReader(BytesIO(b"content"))).twice()  # type: ignore[arg-type]
+        flexmock(self._storage_driver).should_receive("put_file_as").with_args(b"content", "directory/file.txt").and_return(True).once()
+
+        assert self._storage_driver_decorator.get("directory/file.txt") == b"content"
+        assert self._storage_driver_decorator.put_file_as(b"content", "directory/file.txt")
+        assert self._get_cached_files() == []
+        assert self._storage_driver_decorator.get("directory/file.txt") == b"content"
+
+    def test_delete_directory__cached_sub_paths__then_invalidate_them(self) -> None:
+        self._mock_file("directory/file.txt", b"content")
+        self._mock_file("directory-other/file.txt", b"content")
+        flexmock(self._storage_driver).should_receive("delete_directory").with_args("directory").and_return(True).once()
+
+        assert self._storage_driver_decorator.get("directory/file.txt") == b"content"
+        assert self._storage_driver_decorator.get("directory-other/file.txt") == b"content"
+        assert self._storage_driver_decorator.delete_directory("directory")
+        assert len(self._get_cached_files()) == 1
+
+    def test_open__shared_cache_directory__then_keep_copies_of_other_instance(self) -> None:
+        self._mock_file("file.txt", b"content")
+        flexmock(self._storage_driver).should_receive("get_as_input_stream").with_args("file.txt").replace_with(lambda _: BufferedReader(BytesIO(b"content"))).twice()  # type: ignore[arg-type]
+        other_storage_driver_decorator = DiskCacheStorageDriverDecorator(self._storage_driver, self._cache_directory)
+
+        assert self._storage_driver_decorator.get("file.txt") == b"content"
+        other_storage_driver_decorator.open()
+        assert other_storage_driver_decorator.get("file.txt") == b"content"
+        assert len(self._get_cached_files()) == 2
+        other_storage_driver_decorator.close()
+        assert self._storage_driver_decorator.get("file.txt") == b"content"
+        assert len(self._get_cached_files()) == 1
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa: E501
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=empty-docstring
+# pylint: disable=line-too-long
+# pylint: disable=attribute-defined-outside-init
+# pylint: disable=consider-using-with
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: file_slice_io_tests.py
+Author: Toku
+"""
+import os
+import tempfile
+from io import BufferedReader
+from typing import Generator
+import pytest
+from toku.storage.driver.api import FileSliceIO
+
+
+class FileSliceIOTests:
+    """
+    Provides test cases for FileSliceIO class.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup_test(self) -> Generator[None, None, None]:
+        # setup
+        self._tempdir = tempfile.TemporaryDirectory()
+        self._file: str = os.path.join(self._tempdir.name, "file.txt")
+
+        with open(self._file, "wb") as f:
+            f.write(bytes(range(250)))
+
+        # return control to the test
+        yield
+
+        # teardown
+        self._tempdir.cleanup()
+
+    def test_read__slice__then_return_bytes_of_slice_from_position_zero(self) -> None:
+        with FileSliceIO(open(self._file, "rb"), 100, 50) as input_stream:
+            assert input_stream.tell() == 0
+            assert input_stream.read(10) == bytes(range(100, 110))
+            assert input_stream.tell() == 10
+            assert input_stream.read() == bytes(range(110, 150))
+            assert input_stream.read() == b""
+
+    def test_read__slice_after_end_of_file__then_return_bytes_until_end(self) -> None:
+        with BufferedReader(FileSliceIO(open(self._file, "rb"), 200, 100)) as input_stream:
+            assert input_stream.read() == bytes(range(200, 250))
+
+    def test_seek__positions_relative_to_slice__then_read_from_position(self) -> None:
+        with FileSliceIO(open(self._file, "rb"), 100, 50) as input_stream:
+            assert input_stream.seek(0, os.SEEK_END) == 50
+            assert input_stream.read() == b""
+            assert input_stream.seek(-5, os.SEEK_END) == 45
+            assert input_stream.read() == bytes(range(145, 150))
+            assert input_stream.seek(5) == 5
+            assert input_stream.seek(5, os.SEEK_CUR) == 10
+            assert input_stream.read(5) == bytes(range(110, 115))
+            with pytest.raises(ValueError):
+                input_stream.seek(-1)
+
+    def test_read__slice_without_length__then_return_bytes_until_end(self) -> None:
+        with FileSliceIO(open(self._file, "rb"), 240) as input_stream:
+            assert input_stream.read() == bytes(range(240, 250))
@@ -28,7 +28,7 @@ from toku.storage.driver.api import DirectorySeparator
 from toku.storage.driver.api import PathSanitizer
 from toku.storage.driver.api import StorageDriver
 from toku.storage.driver.api import PathSanitizerStorageDriverDecorator
-from toku.storage.driver.api.storage_driver import Metadata, Size
+from toku.storage.driver.api.storage_driver import BulkResult, Checksum, Metadata, Page, PathType, Size, Stat, TransferResult
 from tests.toku.storage.driver.api.stub_storage_driver import StubStorageDriver
 
 
@@ -155,6 +155,16 @@ class PathSanitizerStorageDriverDecoratorTests:
         # prepare
         self._storage_driver_decorator.close()
 
+    def test_flush__verify_method_invocation__then_return_void(
+            self
+    ) -> None:
+        # assert
+        flexmock(self._storage_driver_decorator).should_call("flush").once()
+        flexmock(self._storage_driver).should_call("flush").once()
+
+        # prepare
+        self._storage_driver_decorator.flush()
+
     def test_get__verify_method_invocation__then_return_optional_array_byte(self) -> None:
         # prepare
         file: PathHelper = self._create_path("/get/file.txt/")
@@ -183,6 +193,48 @@ class PathSanitizerStorageDriverDecoratorTests:
         # assert
         assert result.read() if result else BytesIO() == result_to_return.read()
 
+    def test_get_range__verify_method_invocation__then_return_optional_byte_array(self) -> None:
+        # prepare
+        file: PathHelper = self._create_path("/get_range/file.txt/")
+        result_to_return: bytes = self._create_byte_array()
+        flexmock(self._storage_driver_decorator).should_call("get_range").with_args(file.path_to_sanitize, 10, 20).and_return(result_to_return).once()
+        flexmock(self._storage_driver).should_receive("get_range").with_args(file.path_sanitized, 10, 20).and_return(result_to_return).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(file.path_to_sanitize, True).and_return(file.path_sanitized).once()
+
+        # logic process
+        result: bytes | None = self._storage_driver_decorator.get_range(file.path_to_sanitize, 10, 20)
+
+        # assert
+        assert result == result_to_return
+
+    def test_get_range_as_input_stream__verify_method_invocation__then_return_optional_input_stream(self) -> None:
+        # prepare
+        file: PathHelper = self._create_path("/get_range_as_input_stream/file.txt/")
+        result_to_return: BufferedReader = self._create_input_stream()
+        flexmock(self._storage_driver_decorator).should_call("get_range_as_input_stream").with_args(file.path_to_sanitize, 10, None).and_return(result_to_return).once()
+        flexmock(self._storage_driver).should_receive("get_range_as_input_stream").with_args(file.path_sanitized, 10, None).and_return(result_to_return).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(file.path_to_sanitize, True).and_return(file.path_sanitized).once()
+
+        # logic process
+        result: BufferedReader | None = self._storage_driver_decorator.get_range_as_input_stream(file.path_to_sanitize, 10, None)
+
+        # assert
+        assert result is result_to_return
+
+    def test_get_local_path__verify_method_invocation__then_return_optional_string(self) -> None:
+        # prepare
+        file: PathHelper = self._create_path("/get_local_path/file.txt/")
+        result_to_return = "/local/get_local_path/file.txt"
+        flexmock(self._storage_driver_decorator).should_call("get_local_path").with_args(file.path_to_sanitize).and_return(result_to_return).once()
+        flexmock(self._storage_driver).should_receive("get_local_path").with_args(file.path_sanitized).and_return(result_to_return).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(file.path_to_sanitize, True).and_return(file.path_sanitized).once()
+
+        # logic process
+        result: str | None = self._storage_driver_decorator.get_local_path(file.path_to_sanitize)
+
+        # assert
+        assert result == result_to_return
+
     def test_exists__verify_method_invocation__then_return_boolean(self) -> None:
         # prepare
         file: PathHelper = self._create_path("/exists/file.txt/")
@@ -310,7 +362,7 @@ class PathSanitizerStorageDriverDecoratorTests:
         target: PathHelper = self._create_path("/copy/target.txt/")
         result_to_return = True
         flexmock(self._storage_driver_decorator).should_call("copy").with_args(source.path_to_sanitize, target.path_to_sanitize).and_return(result_to_return).once()
-        flexmock(self._storage_driver).should_receive("copy").with_args(source.path_sanitized, target.path_sanitized).and_return(result_to_return).once()
+        flexmock(self._storage_driver).should_receive("copy").with_args(source.path_sanitized, target.path_sanitized, skip_unchanged=False).and_return(result_to_return).once()
         flexmock(self._sanitizer).should_call("sanitize").with_args(source.path_to_sanitize, True).and_return(source.path_sanitized).once()
         flexmock(self._sanitizer).should_call("sanitize").with_args(target.path_to_sanitize, True).and_return(target.path_sanitized).once()
 
@@ -327,7 +379,7 @@ class PathSanitizerStorageDriverDecoratorTests:
         target: PathHelper = self._create_path("/copy/target.txt/")
         result_to_return = True
         flexmock(self._storage_driver_decorator).should_call("copy").with_args(source.path_to_sanitize, target.path_to_sanitize, another_storage_driver).and_return(result_to_return).once()
-        flexmock(self._storage_driver).should_receive("copy").with_args(source.path_sanitized, target.path_sanitized, another_storage_driver).and_return(result_to_return).once()
+        flexmock(self._storage_driver).should_receive("copy").with_args(source.path_sanitized, target.path_sanitized, another_storage_driver, skip_unchanged=False).and_return(result_to_return).once()
         flexmock(self._sanitizer).should_call("sanitize").with_args(source.path_to_sanitize, True).and_return(source.path_sanitized).once()
         flexmock(self._sanitizer).should_call("sanitize").with_args(target.path_to_sanitize, True).and_return(target.path_sanitized).once()
 
@@ -337,6 +389,22 @@ class PathSanitizerStorageDriverDecoratorTests:
         # assert
         assert result == result_to_return
 
+    def test_copy__skip_unchanged__verify_method_invocation__then_return_boolean(self) -> None:
+        # prepare
+        source: PathHelper = self._create_path("/copy/source.txt/")
+        target: PathHelper = self._create_path("/copy/target.txt/")
+        result_to_return = True
+        flexmock(self._storage_driver_decorator).should_call("copy").with_args(source.path_to_sanitize, target.path_to_sanitize, skip_unchanged=True).and_return(result_to_return).once()
+        flexmock(self._storage_driver).should_receive("copy").with_args(source.path_sanitized, target.path_sanitized, skip_unchanged=True).and_return(result_to_return).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(source.path_to_sanitize, True).and_return(source.path_sanitized).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(target.path_to_sanitize, True).and_return(target.path_sanitized).once()
+
+        # logic process
+        result: bool = self._storage_driver_decorator.copy(source.path_to_sanitize, target.path_to_sanitize, skip_unchanged=True)
+
+        # assert
+        assert result == result_to_return
+
     def test_move__verify_method_invocation__then_return_boolean(self) -> None:
         # prepare
         source: PathHelper = self._create_path("/move/source.txt/")
@@ -496,6 +564,70 @@ class PathSanitizerStorageDriverDecoratorTests:
         assert paths[3] == directory4.path_sanitized
         assert paths[4] == directory5.path_sanitized
 
+    def test_iter_files__verify_method_invocation__then_return_iterator_page(self) -> None:
+        # prepare
+        directory: PathHelper = self._create_path("/iter-files/")
+        path1: PathHelper = self._create_path("/iter-files/1/")
+        path2: PathHelper = self._create_path("/iter-files/2/")
+        flexmock(self._storage_driver).should_receive("iter_files").with_args(directory.path_sanitized, 1, "token").and_return(iter([Page([path1.path_to_sanitize], "next-token"), Page([path2.path_to_sanitize])])).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(directory.path_to_sanitize, True).and_return(directory.path_sanitized).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(path1.path_to_sanitize, True).and_return(path1.path_sanitized).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(path2.path_to_sanitize, True).and_return(path2.path_sanitized).once()
+
+        # logic process
+        pages: list[Page] = list(self._storage_driver_decorator.iter_files(directory.path_to_sanitize, 1, "token"))
+
+        # assert
+        assert pages == [Page([path1.path_sanitized], "next-token"), Page([path2.path_sanitized])]
+
+    def test_iter_all_files__verify_method_invocation__then_return_iterator_page(self) -> None:
+        # prepare
+        directory: PathHelper = self._create_path("/iter-all-files/")
+        path1: PathHelper = self._create_path("/iter-all-files/1/")
+        path2: PathHelper = self._create_path("/iter-all-files/2/")
+        flexmock(self._storage_driver).should_receive("iter_all_files").with_args(directory.path_sanitized, 1, "token").and_return(iter([Page([path1.path_to_sanitize], "next-token"), Page([path2.path_to_sanitize])])).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(directory.path_to_sanitize, True).and_return(directory.path_sanitized).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(path1.path_to_sanitize, True).and_return(path1.path_sanitized).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(path2.path_to_sanitize, True).and_return(path2.path_sanitized).once()
+
+        # logic process
+        pages: list[Page] = list(self._storage_driver_decorator.iter_all_files(directory.path_to_sanitize, 1, "token"))
+
+        # assert
+        assert pages == [Page([path1.path_sanitized], "next-token"), Page([path2.path_sanitized])]
+
+    def test_iter_directories__verify_method_invocation__then_return_iterator_page(self) -> None:
+        # prepare
+        directory: PathHelper = self._create_path("/iter-directories/")
+        path1: PathHelper = self._create_path("/iter-directories/1/")
+        path2: PathHelper = self._create_path("/iter-directories/2/")
+        flexmock(self._storage_driver).should_receive("iter_directories").with_args(directory.path_sanitized, 1, "token").and_return(iter([Page([path1.path_to_sanitize], "next-token"), Page([path2.path_to_sanitize])])).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(directory.path_to_sanitize, True).and_return(directory.path_sanitized).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(path1.path_to_sanitize, True).and_return(path1.path_sanitized).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(path2.path_to_sanitize, True).and_return(path2.path_sanitized).once()
+
+        # logic process
+        pages: list[Page] = list(self._storage_driver_decorator.iter_directories(directory.path_to_sanitize, 1, "token"))
+
+        # assert
+        assert pages == [Page([path1.path_sanitized], "next-token"), Page([path2.path_sanitized])]
+
+    def test_iter_all_directories__verify_method_invocation__then_return_iterator_page(self) -> None:
+        # prepare
+        directory: PathHelper = self._create_path("/iter-all-directories/")
+        path1: PathHelper = self._create_path("/iter-all-directories/1/")
+        path2: PathHelper = self._create_path("/iter-all-directories/2/")
+        flexmock(self._storage_driver).should_receive("iter_all_directories").with_args(directory.path_sanitized, 1, "token").and_return(iter([Page([path1.path_to_sanitize], "next-token"), Page([path2.path_to_sanitize])])).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(directory.path_to_sanitize, True).and_return(directory.path_sanitized).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(path1.path_to_sanitize, True).and_return(path1.path_sanitized).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(path2.path_to_sanitize, True).and_return(path2.path_sanitized).once()
+
+        # logic process
+        pages: list[Page] = list(self._storage_driver_decorator.iter_all_directories(directory.path_to_sanitize, 1, "token"))
+
+        # assert
+        assert pages == [Page([path1.path_sanitized], "next-token"), Page([path2.path_sanitized])]
+
     def test_exists_directory__verify_method_invocation__then_return_boolean(self) -> None:
         # prepare
         directory: PathHelper = self._create_path("/exists-directory/")
@@ -516,7 +648,7 @@ class PathSanitizerStorageDriverDecoratorTests:
         target: PathHelper = self._create_path("/copy-directory/target/")
         result_to_return = True
         flexmock(self._storage_driver_decorator).should_call("copy_directory").with_args(source.path_to_sanitize, target.path_to_sanitize).and_return(result_to_return).once()
-        flexmock(self._storage_driver).should_receive("copy_directory").with_args(source.path_sanitized, target.path_sanitized).and_return(result_to_return).once()
+        flexmock(self._storage_driver).should_receive("copy_directory").with_args(source.path_sanitized, target.path_sanitized, skip_unchanged=False).and_return(result_to_return).once()
         flexmock(self._sanitizer).should_call("sanitize").with_args(source.path_to_sanitize, True).and_return(source.path_sanitized).once()
         flexmock(self._sanitizer).should_call("sanitize").with_args(target.path_to_sanitize, True).and_return(target.path_sanitized).once()
 
@@ -533,7 +665,7 @@ class PathSanitizerStorageDriverDecoratorTests:
         target: PathHelper = self._create_path("/copy-directory/target/")
         result_to_return = True
         flexmock(self._storage_driver_decorator).should_call("copy_directory").with_args(source.path_to_sanitize, target.path_to_sanitize, another_storage_driver).and_return(result_to_return).once()
-        flexmock(self._storage_driver).should_receive("copy_directory").with_args(source.path_sanitized, target.path_sanitized, another_storage_driver).and_return(result_to_return).once()
+        flexmock(self._storage_driver).should_receive("copy_directory").with_args(source.path_sanitized, target.path_sanitized, another_storage_driver, skip_unchanged=False).and_return(result_to_return).once()
         flexmock(self._sanitizer).should_call("sanitize").with_args(source.path_to_sanitize, True).and_return(source.path_sanitized).once()
         flexmock(self._sanitizer).should_call("sanitize").with_args(target.path_to_sanitize, True).and_return(target.path_sanitized).once()
 
@@ -549,7 +681,7 @@ class PathSanitizerStorageDriverDecoratorTests:
         target: PathHelper = self._create_path("/move-directory/target/")
         result_to_return = True
         flexmock(self._storage_driver_decorator).should_call("move_directory").with_args(source.path_to_sanitize, target.path_to_sanitize).and_return(result_to_return).once()
-        flexmock(self._storage_driver).should_receive("move_directory").with_args(source.path_sanitized, target.path_sanitized).and_return(result_to_return).once()
+        flexmock(self._storage_driver).should_receive("move_directory").with_args(source.path_sanitized, target.path_sanitized, skip_unchanged=False).and_return(result_to_return).once()
         flexmock(self._sanitizer).should_call("sanitize").with_args(source.path_to_sanitize, True).and_return(source.path_sanitized).once()
         flexmock(self._sanitizer).should_call("sanitize").with_args(target.path_to_sanitize, True).and_return(target.path_sanitized).once()
 
@@ -566,7 +698,7 @@ class PathSanitizerStorageDriverDecoratorTests:
         target: PathHelper = self._create_path("/move-directory/target/")
         result_to_return = True
         flexmock(self._storage_driver_decorator).should_call("move_directory").with_args(source.path_to_sanitize, target.path_to_sanitize, another_storage_driver).and_return(result_to_return).once()
-        flexmock(self._storage_driver).should_receive("move_directory").with_args(source.path_sanitized, target.path_sanitized, another_storage_driver).and_return(result_to_return).once()
+        flexmock(self._storage_driver).should_receive("move_directory").with_args(source.path_sanitized, target.path_sanitized, another_storage_driver, skip_unchanged=False).and_return(result_to_return).once()
         flexmock(self._sanitizer).should_call("sanitize").with_args(source.path_to_sanitize, True).and_return(source.path_sanitized).once()
         flexmock(self._sanitizer).should_call("sanitize").with_args(target.path_to_sanitize, True).and_return(target.path_sanitized).once()
 
@@ -576,6 +708,23 @@ class PathSanitizerStorageDriverDecoratorTests:
         # assert
         assert result == result_to_return
 
+    def test_transfer_directory__verify_method_invocation__then_return_optional_transfer_result(self) -> None:
+        # prepare
+        another_storage_driver = StubStorageDriver()
+        source: PathHelper = self._create_path("/transfer-directory/source/")
+        target: PathHelper = self._create_path("/transfer-directory/target/")
+        result_to_return = TransferResult([BulkResult(source.path_sanitized, True)], 100)
+        flexmock(self._storage_driver_decorator).should_call("transfer_directory").with_args(source.path_to_sanitize, target.path_to_sanitize, True, another_storage_driver).and_return(result_to_return).once()
+        flexmock(self._storage_driver).should_receive("transfer_directory").with_args(source.path_sanitized, target.path_sanitized, True, another_storage_driver, skip_unchanged=False).and_return(result_to_return).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(source.path_to_sanitize, True).and_return(source.path_sanitized).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(target.path_to_sanitize, True).and_return(target.path_sanitized).once()
+
+        # logic process
+        result: TransferResult | None = self._storage_driver_decorator.transfer_directory(source.path_to_sanitize, target.path_to_sanitize, True, another_storage_driver)
+
+        # assert
+        assert result == result_to_return
+
     def test_make_directory__verify_method_invocation__then_return_boolean(self) -> None:
         # prepare
         directory: PathHelper = self._create_path("/make-directory/")
@@ -635,6 +784,126 @@ class PathSanitizerStorageDriverDecoratorTests:
         # assert
         assert result == result_to_return
 
+    def test_stat__verify_method_invocation__then_return_stat(self) -> None:
+        # prepare
+        path: PathHelper = self._create_path("/stat/path/")
+        result_to_return = Stat(PathType.DIRECTORY)
+        flexmock(self._storage_driver_decorator).should_call("stat").with_args(path.path_to_sanitize).and_return(result_to_return).once()
+        flexmock(self._storage_driver).should_receive("stat").with_args(path.path_sanitized).and_return(result_to_return).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(path.path_to_sanitize, True).and_return(path.path_sanitized).once()
+
+        # logic process
+        result: Stat = self._storage_driver_decorator.stat(path.path_to_sanitize)
+
+        # assert
+        assert result == result_to_return
+
+    def test_checksum__verify_method_invocation__then_return_optional_checksum(self) -> None:
+        # prepare
+        file: PathHelper = self._create_path("/checksum/file.txt/")
+        result_to_return = Checksum(100, md5="md5")
+        flexmock(self._storage_driver_decorator).should_call("checksum").with_args(file.path_to_sanitize).and_return(result_to_return).once()
+        flexmock(self._storage_driver).should_receive("checksum").with_args(file.path_sanitized).and_return(result_to_return).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(file.path_to_sanitize, True).and_return(file.path_sanitized).once()
+
+        # logic process
+        result: Checksum | None = self._storage_driver_decorator.checksum(file.path_to_sanitize)
+
+        # assert
+        assert result == result_to_return
+
+    def test_list_with_metadata__verify_method_invocation__then_return_collection_tuple(self) -> None:
+        # prepare
+        directory: PathHelper = self._create_path("/list-with-metadata/")
+        file: PathHelper = self._create_path("/list-with-metadata/1.txt/")
+        metadata = Metadata(Size(100), 100, 100, 100, True, False, False, "text/plain")
+        flexmock(self._storage_driver).should_receive("list_with_metadata").with_args(directory.path_sanitized, True).and_return([(file.path_to_sanitize, metadata)]).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(directory.path_to_sanitize, True).and_return(directory.path_sanitized).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(file.path_to_sanitize, True).and_return(file.path_sanitized).once()
+
+        # logic process
+        result: list[tuple[str, Metadata]] = self._storage_driver_decorator.list_with_metadata(directory.path_to_sanitize, True)
+
+        # assert
+        assert result == [(file.path_sanitized, metadata)]
+
+    def test_exists_many__verify_method_invocation__then_return_collection_bulk_result(self) -> None:
+        # prepare
+        file1: PathHelper = self._create_path("/exists-many/1.txt/")
+        file2: PathHelper = self._create_path("/exists-many/2.txt/")
+        result_to_return = [BulkResult(file1.path_sanitized, True), BulkResult(file2.path_sanitized, False)]
+        flexmock(self._storage_driver_decorator).should_call("exists_many").with_args([file1.path_to_sanitize, file2.path_to_sanitize]).and_return(result_to_return).once()
+        flexmock(self._storage_driver).should_receive("exists_many").with_args([file1.path_sanitized, file2.path_sanitized]).and_return(result_to_return).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(file1.path_to_sanitize, True).and_return(file1.path_sanitized).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(file2.path_to_sanitize, True).and_return(file2.path_sanitized).once()
+
+        # logic process
+        result: list[BulkResult[bool]] = self._storage_driver_decorator.exists_many([file1.path_to_sanitize, file2.path_to_sanitize])
+
+        # assert
+        assert result == result_to_return
+
+    def test_get_many__verify_method_invocation__then_return_collection_bulk_result(self) -> None:
+        # prepare
+        file: PathHelper = self._create_path("/get-many/file.txt/")
+        result_to_return = [BulkResult(file.path_sanitized, self._create_byte_array())]
+        flexmock(self._storage_driver_decorator).should_call("get_many").with_args([file.path_to_sanitize]).and_return(result_to_return).once()
+        flexmock(self._storage_driver).should_receive("get_many").with_args([file.path_sanitized]).and_return(result_to_return).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(file.path_to_sanitize, True).and_return(file.path_sanitized).once()
+
+        # logic process
+        result: list[BulkResult[bytes | None]] = self._storage_driver_decorator.get_many([file.path_to_sanitize])
+
+        # assert
+        assert result == result_to_return
+
+    def test_put_many__verify_method_invocation__then_return_collection_bulk_result(self) -> None:
+        # prepare
+        source1: bytes = self._create_byte_array()
+        source2: PathHelper = self._create_path("/put-many/source.txt/")
+        file1: PathHelper = self._create_path("/put-many/1.txt/")
+        file2: PathHelper = self._create_path("/put-many/2.txt/")
+        result_to_return = [BulkResult(file1.path_sanitized, True), BulkResult(file2.path_sanitized, True)]
+        flexmock(self._storage_driver_decorator).should_call("put_many").with_args({file1.path_to_sanitize: source1, file2.path_to_sanitize: source2.path_to_sanitize}).and_return(result_to_return).once()
+        flexmock(self._storage_driver).should_receive("put_many").with_args({file1.path_sanitized: source1, file2.path_sanitized: source2.path_sanitized}).and_return(result_to_return).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(file1.path_to_sanitize, True).and_return(file1.path_sanitized).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(file2.path_to_sanitize, True).and_return(file2.path_sanitized).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(source2.path_to_sanitize, True).and_return(source2.path_sanitized).once()
+
+        # logic process
+        result: list[BulkResult[bool]] = self._storage_driver_decorator.put_many({file1.path_to_sanitize: source1, file2.path_to_sanitize: source2.path_to_sanitize})
+
+        # assert
+        assert result == result_to_return
+
+    def test_delete_many__verify_method_invocation__then_return_collection_bulk_result(self) -> None:
+        # prepare
+        file: PathHelper = self._create_path("/delete-many/file.txt/")
+        result_to_return = [BulkResult(file.path_sanitized, True)]
+        flexmock(self._storage_driver_decorator).should_call("delete_many").with_args([file.path_to_sanitize]).and_return(result_to_return).once()
+        flexmock(self._storage_driver).should_receive("delete_many").with_args([file.path_sanitized]).and_return(result_to_return).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(file.path_to_sanitize, True).and_return(file.path_sanitized).once()
+
+        # logic process
+        result: list[BulkResult[bool]] = self._storage_driver_decorator.delete_many([file.path_to_sanitize])
+
+        # assert
+        assert result == result_to_return
+
+    def test_get_metadata_many__verify_method_invocation__then_return_collection_bulk_result(self) -> None:
+        # prepare
+        path: PathHelper = self._create_path("/metadata-many/path/")
+        result_to_return = [BulkResult(path.path_sanitized, Metadata(Size(100), 100, 100, 100, False, False, False, ""))]
+        flexmock(self._storage_driver_decorator).should_call("get_metadata_many").with_args([path.path_to_sanitize]).and_return(result_to_return).once()
+        flexmock(self._storage_driver).should_receive("get_metadata_many").with_args([path.path_sanitized]).and_return(result_to_return).once()
+        flexmock(self._sanitizer).should_call("sanitize").with_args(path.path_to_sanitize, True).and_return(path.path_sanitized).once()
+
+        # logic process
+        result: list[BulkResult[Metadata | None]] = self._storage_driver_decorator.get_metadata_many([path.path_to_sanitize])
+
+        # assert
+        assert result == result_to_return
+
     def test_get_root__verify_method_invocation__then_return_string(self) -> None:
         # prepare
         result_to_return = "/root"
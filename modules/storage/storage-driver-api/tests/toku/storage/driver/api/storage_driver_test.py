@@ -107,6 +107,61 @@ class StorageDriverTest(ABC, EnforceOverrides, Generic[T]):
         """
         """
 
+    @abstractmethod
+    def test_get_range__file_not_exists__then_return_optional_none(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_get_range__file_is_directory__then_return_optional_none(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_get_range__invalid_range__then_return_optional_none(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_get_range__offset_and_length__then_return_optional_byte_array(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_get_range__without_length__then_return_optional_byte_array(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_get_range__range_exceeds_file__then_return_optional_byte_array(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_get_range_as_input_stream__file_not_exists__then_return_optional_none(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_get_range_as_input_stream__invalid_range__then_return_optional_none(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_get_range_as_input_stream__offset_and_length__then_return_optional_input_stream(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_get_range_as_input_stream__without_length__then_return_optional_input_stream(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_get_local_path__file_not_exists__then_return_optional_none(self) -> None:
+        """
+        """
+
     @abstractmethod
     def test_exists__file_not_exists__then_return_false(self) -> None:
         """
@@ -262,6 +317,11 @@ class StorageDriverTest(ABC, EnforceOverrides, Generic[T]):
         """
         """
 
+    @abstractmethod
+    def test_flush__appended_file__then_return_void(self) -> None:
+        """
+        """
+
     @abstractmethod
     def test_copy__source_not_exists__then_return_false(self) -> None:
         """
@@ -327,6 +387,16 @@ class StorageDriverTest(ABC, EnforceOverrides, Generic[T]):
         """
         """
 
+    @abstractmethod
+    def test_copy__skip_unchanged__target_unchanged__then_return_true_without_copying(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_copy__skip_unchanged__target_changed__then_return_true(self) -> None:
+        """
+        """
+
     @abstractmethod
     def test_move__source_not_exists__then_return_false(self) -> None:
         """
@@ -512,6 +582,46 @@ class StorageDriverTest(ABC, EnforceOverrides, Generic[T]):
         """
         """
 
+    @abstractmethod
+    def test_iter_files__directory_not_exists__then_return_iterator_empty(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_iter_files__page_size_not_positive__then_return_iterator_empty(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_iter_files__get__then_return_iterator_page(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_iter_files__page_token__then_return_iterator_page_after_token(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_iter_all_files__directory_is_file__then_return_iterator_empty(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_iter_all_files__get__then_return_iterator_page(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_iter_directories__get__then_return_iterator_page(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_iter_all_directories__get__then_return_iterator_page(self) -> None:
+        """
+        """
+
     @abstractmethod
     def test_exists_directory__directory_not_exists__then_return_false(self) -> None:
         """
@@ -707,6 +817,36 @@ class StorageDriverTest(ABC, EnforceOverrides, Generic[T]):
         """
         """
 
+    @abstractmethod
+    def test_transfer_directory__source_not_exists__then_return_optional_none(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_transfer_directory__copy__then_return_optional_transfer_result(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_transfer_directory__move__then_return_optional_transfer_result(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_transfer_directory__another_storage_driver__then_return_optional_transfer_result(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_copy_directory__skip_unchanged__then_copy_changed_files(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_move_directory__skip_unchanged__then_remove_source(self) -> None:
+        """
+        """
+
     @abstractmethod
     def test_make_directory__directory_not_exists__then_return_true(self) -> None:
         """
@@ -807,7 +947,102 @@ class StorageDriverTest(ABC, EnforceOverrides, Generic[T]):
         """
         """
 
+    @abstractmethod
+    def test_get_metadata__from_empty_folder__then_return_optional_metadata(self) -> None:
+        """
+        """
+
     @abstractmethod
     def test_get_metadata__from_root__then_return_optional_metadata(self) -> None:
         """
         """
+
+    @abstractmethod
+    def test_stat__path_not_exists__then_return_stat_missing(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_stat__from_file__then_return_stat_file(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_stat__from_folder__then_return_stat_directory(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_stat__from_root__then_return_stat_directory(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_checksum__file_not_exists__then_return_optional_none(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_checksum__from_folder__then_return_optional_none(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_checksum__from_file__then_return_optional_checksum(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_list_with_metadata__directory_not_exists__then_return_collection_empty(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_list_with_metadata__directory_is_file__then_return_collection_empty(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_list_with_metadata__not_recursive__then_return_collection_tuple(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_list_with_metadata__recursive__then_return_collection_tuple(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_exists_many__empty_collection__then_return_empty_collection(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_exists_many__files_exist_and_not_exist__then_return_collection_bulk_result(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_get_many__files_exist_and_not_exist__then_return_collection_bulk_result(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_put_many__files_in_same_directory__then_return_collection_bulk_result(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_put_many__file_is_directory__then_return_collection_bulk_result_with_false(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_delete_many__files_exist_and_not_exist__then_return_collection_bulk_result(self) -> None:
+        """
+        """
+
+    @abstractmethod
+    def test_get_metadata_many__file_directory_and_not_exists__then_return_collection_bulk_result(self) -> None:
+        """
+        """
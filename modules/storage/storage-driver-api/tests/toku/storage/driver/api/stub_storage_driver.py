@@ -14,9 +14,17 @@ Module: stub_storage_driver.py
 Author: Toku
 """
 from io import BufferedReader
-from typing import Optional
+from typing import Iterator, Optional
 from overrides import override
-from toku.storage.driver.api import StorageDriver, DirectorySeparator, Metadata
+from toku.storage.driver.api import StorageDriver
+from toku.storage.driver.api import DirectorySeparator
+from toku.storage.driver.api import Metadata
+from toku.storage.driver.api import BulkResult
+from toku.storage.driver.api import Page
+from toku.storage.driver.api import PathType
+from toku.storage.driver.api import Stat
+from toku.storage.driver.api import Checksum
+from toku.storage.driver.api import TransferResult
 
 
 class StubStorageDriver(StorageDriver):
@@ -37,6 +45,10 @@ class StubStorageDriver(StorageDriver):
     def close(self) -> None:
         pass  # logic not needed
 
+    @override
+    def flush(self) -> None:
+        pass  # logic not needed
+
     @override
     def open(self) -> None:
         pass  # logic not needed
@@ -49,6 +61,23 @@ class StubStorageDriver(StorageDriver):
     def get_as_input_stream(self, file: str) -> Optional[BufferedReader]:
         return None
 
+    @override
+    def get_range(self, file: str, offset: int, length: Optional[int] = None) -> Optional[bytes]:
+        return None
+
+    @override
+    def get_range_as_input_stream(
+        self,
+        file: str,
+        offset: int,
+        length: Optional[int] = None
+    ) -> Optional[BufferedReader]:
+        return None
+
+    @override
+    def get_local_path(self, file: str) -> Optional[str]:
+        return None
+
     @override
     def exists(self, file: str) -> bool:
         return False
@@ -70,7 +99,9 @@ class StubStorageDriver(StorageDriver):
         self,
         source: str,
         target: str,
-        target_storage_driver: Optional[StorageDriver] = None
+        target_storage_driver: Optional[StorageDriver] = None,
+        *,
+        skip_unchanged: bool = False
     ) -> bool:
         return False
 
@@ -107,6 +138,42 @@ class StubStorageDriver(StorageDriver):
     def all_directories(self, directory: str) -> list[str]:
         return []
 
+    @override
+    def iter_files(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        return iter([])
+
+    @override
+    def iter_all_files(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        return iter([])
+
+    @override
+    def iter_directories(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        return iter([])
+
+    @override
+    def iter_all_directories(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        return iter([])
+
     @override
     def exists_directory(self, directory: str) -> bool:
         return False
@@ -116,7 +183,9 @@ class StubStorageDriver(StorageDriver):
         self,
         source: str,
         target: str,
-        target_storage_driver: Optional[StorageDriver] = None
+        target_storage_driver: Optional[StorageDriver] = None,
+        *,
+        skip_unchanged: bool = False
     ) -> bool:
         return False
 
@@ -125,10 +194,24 @@ class StubStorageDriver(StorageDriver):
         self,
         source: str,
         target: str,
-        target_storage_driver: Optional['StorageDriver'] = None
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
     ) -> bool:
         return False
 
+    @override
+    def transfer_directory(
+        self,
+        source: str,
+        target: str,
+        remove_source: bool = False,
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
+    ) -> Optional[TransferResult]:
+        return None
+
     @override
     def make_directory(self, directory: str) -> bool:
         return False
@@ -145,6 +228,42 @@ class StubStorageDriver(StorageDriver):
     def get_metadata(self, path: str) -> Optional[Metadata]:
         return None
 
+    @override
+    def stat(self, path: str) -> Stat:
+        return Stat(PathType.MISSING)
+
+    @override
+    def checksum(self, file: str) -> Optional[Checksum]:
+        return None
+
+    @override
+    def list_with_metadata(
+            self,
+            directory: str,
+            recursive: bool = False
+    ) -> list[tuple[str, Metadata]]:
+        return []
+
+    @override
+    def exists_many(self, files: list[str]) -> list[BulkResult[bool]]:
+        return []
+
+    @override
+    def get_many(self, files: list[str]) -> list[BulkResult[Optional[bytes]]]:
+        return []
+
+    @override
+    def put_many(self, sources: dict[str, bytes | str | BufferedReader]) -> list[BulkResult[bool]]:
+        return []
+
+    @override
+    def delete_many(self, files: list[str]) -> list[BulkResult[bool]]:
+        return []
+
+    @override
+    def get_metadata_many(self, paths: list[str]) -> list[BulkResult[Optional[Metadata]]]:
+        return []
+
     @override
     def get_root(self) -> str:
         return ""
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa: E501
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=empty-docstring
+# pylint: disable=line-too-long
+# pylint: disable=attribute-defined-outside-init
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: transfer_engine_tests.py
+Author: Toku
+"""
+import logging
+import threading
+import time
+from flexmock import flexmock
+import pytest
+from toku.storage.driver.api import TransferEngine
+from toku.storage.driver.api import TransferResult
+from tests.toku.storage.driver.api.stub_storage_driver import StubStorageDriver
+
+
+class TransferEngineTests:
+    """
+    Provides test cases for TransferEngine class.
+    """
+
+    def test_transfer__empty_files__then_return_empty_transfer_result(self) -> None:
+        result: TransferResult = TransferEngine().transfer([], lambda source, target: True)
+
+        assert result.results == []
+        assert result.transferred_bytes == 0
+        assert result.succeeded
+
+    def test_transfer__every_file_transferred__then_return_transfer_result(self) -> None:
+        transferred: list[tuple[str, str]] = []
+        deleted: list[str] = []
+
+        def transfer_file(source: str, target: str) -> bool:
+            transferred.append((source, target))
+            return True
+
+        def delete_source(source: str) -> bool:
+            deleted.append(source)
+            return True
+
+        files = [(f"source/{i}.txt", f"target/{i}.txt", 10) for i in range(10)]
+        result: TransferResult = TransferEngine(4).transfer(files, transfer_file, delete_source)
+
+        assert result.succeeded
+        assert [bulk_result.path for bulk_result in result.results] == [source for source, _, _ in files]
+        assert result.transferred_bytes == 100
+        assert sorted(transferred) == sorted((source, target) for source, target, _ in files)
+        assert sorted(deleted) == sorted(source for source, _, _ in files)
+
+    def test_transfer__some_files_failed__then_return_transfer_result_with_failures(self) -> None:
+        deleted: list[str] = []
+
+        def transfer_file(source: str, _: str) -> bool:
+            if source == "error.txt":
+                raise ValueError("error")
+            return source != "false.txt"
+
+        def delete_source(source: str) -> bool:
+            deleted.append(source)
+            return True
+
+        files = [("ok.txt", "target/ok.txt", 10), ("false.txt", "target/false.txt", 20), ("error.txt", "target/error.txt", 30)]
+        result: TransferResult = TransferEngine().transfer(files, transfer_file, delete_source)
+
+        assert not result.succeeded
+        assert [(bulk_result.path, bulk_result.value) for bulk_result in result.failures] == [("false.txt", False), ("error.txt", None)]
+        assert isinstance(result.failures[1].error, ValueError)
+        assert result.transferred_bytes == 10
+        assert deleted == ["ok.txt"]
+
+    def test_transfer__max_in_flight_bytes__then_limit_concurrent_transfers(self) -> None:
+        lock = threading.Lock()
+        in_flight: list[int] = [0, 0]  # current and maximum
+
+        def transfer_file(_: str, __: str) -> bool:
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight[1], in_flight[0])
+            time.sleep(0.02)
+            with lock:
+                in_flight[0] -= 1
+            return True
+
+        files = [(f"{i}.txt", f"target/{i}.txt", 6) for i in range(6)] + [("big.txt", "target/big.txt", 100)]
+        result: TransferResult = TransferEngine(8, 12).transfer(files, transfer_file)
+
+        assert result.succeeded
+        assert result.transferred_bytes == 136
+        assert in_flight[1] == 2
+
+    def test_make_parent_directories__files_with_same_parent__then_create_each_parent_once(self) -> None:
+        storage_driver = StubStorageDriver()
+        flexmock(storage_driver).should_receive("make_directory").with_args("directory1").and_return(True).once()
+        flexmock(storage_driver).should_receive("make_directory").with_args("directory1/directory2").and_return(False).once()
+
+        TransferEngine.make_parent_directories(
+            storage_driver,
+            ["file.txt", "directory1/1.txt", "directory1/2.txt", "directory1/directory2/3.txt"]
+        )
+
+    def test_make_parent_directories__failed_parent__then_log_error_and_create_the_rest(
+        self,
+        caplog: pytest.LogCaptureFixture
+    ) -> None:
+        storage_driver = StubStorageDriver()
+        flexmock(storage_driver).should_receive("make_directory").with_args("directory1").and_raise(OSError, "permission denied").once()
+        flexmock(storage_driver).should_receive("make_directory").with_args("directory2").and_return(True).once()
+
+        with caplog.at_level(logging.ERROR):
+            TransferEngine.make_parent_directories(storage_driver, ["directory1/1.txt", "directory2/2.txt"])
+
+        assert "failed to create the parent directory directory1" in caplog.text
+        assert "permission denied" in caplog.text
@@ -9,22 +9,50 @@ Classes:
     - DirectorySeparator (storage_driver.py): The kinds of directory separator
     - Size (storage_driver.py): The size of a path
     - Metadata (storage_driver.py): The metadata of a path
+    - BulkResult (storage_driver.py): The result of a path in a bulk operation
+    - Page (storage_driver.py): The page of paths of a listing
+    - PathType (storage_driver.py): The possible types of a path
+    - Stat (storage_driver.py): The type of a path with its optional metadata
+    - Checksum (storage_driver.py): The checksum of a file content
+    - TransferResult (storage_driver.py): The summary of a directory transfer
     - PathSanitizer (path_sanitizer.py): The path sanitizer
     - StorageDriverException (storage_driver_exception.py): The storage driver exception
+    - FileSliceIO (file_slice_io.py): The raw stream to read a slice of a file
+    - TransferEngine (transfer_engine.py): The concurrent engine to transfer files
     - StorageDriver (storage_driver.py): The contract for storage driver process
     - AbstractStorageDriver (abstract_storage_driver.py): The default implementation for storage driver process
     - StorageDriverDecorator (storage_driver_decorator.py): The base for any storage driver decorator
     - PathSanitizerStorageDriverDecorator (path_sanitizer_storage_driver_decorator.py): The decorator for storage driver path sanitizier
     - OpenCloseStatusCheckerStorageDriverDecorator (open_close_status_checker_storage_driver_decorator.py): The decorator for storage driver open / close checker
+    - CachingStorageDriverDecorator (caching_storage_driver_decorator.py): The decorator for storage driver existence and metadata cache
+    - DiskCacheStorageDriverDecorator (disk_cache_storage_driver_decorator.py): The decorator for storage driver local disk read-through cache
+    - AsyncStorageDriver (async_storage_driver.py): The contract for asynchronous storage driver process
+    - AbstractAsyncStorageDriver (abstract_async_storage_driver.py): The default implementation for asynchronous storage driver process
+    - SyncResult (storage_driver_synchronizer.py): The summary of a directory sync
+    - StorageDriverSynchronizer (storage_driver_synchronizer.py): The incremental and resumable directory sync between storage drivers
 """
 from .storage_driver import Status as Status
 from .storage_driver import DirectorySeparator as DirectorySeparator
 from .storage_driver import Size as Size
 from .storage_driver import Metadata as Metadata
+from .storage_driver import BulkResult as BulkResult
+from .storage_driver import Page as Page
+from .storage_driver import PathType as PathType
+from .storage_driver import Stat as Stat
+from .storage_driver import Checksum as Checksum
+from .storage_driver import TransferResult as TransferResult
 from .path_sanitizer import PathSanitizer as PathSanitizer
 from .storage_driver_exception import StorageDriverException as StorageDriverException
+from .file_slice_io import FileSliceIO as FileSliceIO
 from .storage_driver import StorageDriver as StorageDriver
+from .transfer_engine import TransferEngine as TransferEngine
 from .abstract_storage_driver import AbstractStorageDriver as AbstractStorageDriver
 from .storage_driver_decorator import StorageDriverDecorator as StorageDriverDecorator
 from .path_sanitizer_storage_driver_decorator import PathSanitizerStorageDriverDecorator as PathSanitizerStorageDriverDecorator
 from .open_close_status_checker_storage_driver_decorator import OpenCloseStatusCheckerStorageDriverDecorator as OpenCloseStatusCheckerStorageDriverDecorator
+from .caching_storage_driver_decorator import CachingStorageDriverDecorator as CachingStorageDriverDecorator
+from .disk_cache_storage_driver_decorator import DiskCacheStorageDriverDecorator as DiskCacheStorageDriverDecorator
+from .async_storage_driver import AsyncStorageDriver as AsyncStorageDriver
+from .abstract_async_storage_driver import AbstractAsyncStorageDriver as AbstractAsyncStorageDriver
+from .storage_driver_synchronizer import SyncResult as SyncResult
+from .storage_driver_synchronizer import StorageDriverSynchronizer as StorageDriverSynchronizer
@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: abstract_async_storage_driver.py
+Author: Toku
+"""
+import asyncio
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from functools import partial
+from io import BytesIO, BufferedReader
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TypeVar
+from overrides import override
+from toku.storage.driver.api import Metadata
+from toku.storage.driver.api import PathSanitizer
+from toku.storage.driver.api import DirectorySeparator
+from toku.storage.driver.api import AsyncStorageDriver
+
+R = TypeVar("R")
+
+
+class AbstractAsyncStorageDriver(AsyncStorageDriver, ABC):
+    """
+    The `AbstractAsyncStorageDriver` class provides a base for working with
+    asynchronous storage drivers, it applies the same validations as
+    `AbstractStorageDriver`.
+
+    All methods using the pattern `_{method}` that have another with the same
+    name but public provide the specific logic to execute the final action of
+    similar processes.
+    """
+
+    def __init__(
+            self,
+            root: str,
+            separator: DirectorySeparator,
+            executor: Optional[Executor] = None
+    ) -> None:
+        """
+        Initializes a new abstract asynchronous storage driver.
+
+        Args:
+            root (str): The working directory.
+            separator (DirectorySeparator): The separator of the directories.
+            executor (Optional[Executor]): The executor to run the blocking
+                                           processes. Defaults to None, which
+                                           means the default executor of the
+                                           event loop.
+        """
+        self._sanitizer: PathSanitizer = PathSanitizer(separator)
+        self._root: str = self._sanitizer.sanitize(root)
+        self._separator: DirectorySeparator = separator
+        self._executor: Optional[Executor] = executor
+
+    @override
+    async def get(self, file: str) -> Optional[bytes]:
+        chunks: Optional[AsyncIterator[bytes]] = await self.iter_chunks(file)
+
+        if chunks is None:
+            return None
+
+        return b"".join([chunk async for chunk in chunks])
+
+    @override
+    async def iter_chunks(
+        self,
+        file: str,
+        chunk_size: int = AsyncStorageDriver.DEFAULT_CHUNK_SIZE
+    ) -> Optional[AsyncIterator[bytes]]:
+        return self._iter_chunks(file, chunk_size) if await self.exists(file) else None
+
+    @abstractmethod
+    def _iter_chunks(self, file: str, chunk_size: int) -> AsyncIterator[bytes]:
+        """
+        Provides the process to iterate the content of a file in chunks.
+
+        Args:
+            file (str): Full file path.
+            chunk_size (int): The maximum size of each chunk in bytes.
+
+        Returns:
+            AsyncIterator[bytes]: The chunks of the file.
+        """
+
+    @override
+    async def put_file_as(self, source: bytes | str | BufferedReader, file: str) -> bool:
+        if not source:  # source is None
+            return False
+
+        if not file or not file.strip():  # file is empty
+            return False
+
+        if await self.exists_directory(file):  # file is directory
+            return False
+
+        if await self.exists(self._sanitizer.get_parent(file)):  # file parent folder is a file
+            return False
+
+        parent: str = self._sanitizer.get_parent(file)
+
+        # create parent if not exists and not root
+        if parent and \
+           parent.strip() and \
+           not await self.exists_directory(parent) and \
+           not await self.make_directory(parent):
+            return False
+
+        # put the file
+        if isinstance(source, str):
+            input_file: BufferedReader = await self._run(open, source, "rb")
+            try:
+                return await self._put_file_as(input_file, file)
+            finally:
+                await self._run(input_file.close)
+
+        input_stream: BufferedReader
+
+        if isinstance(source, bytes):
+            bytes_handle = BytesIO(source)
+            input_stream = BufferedReader(bytes_handle)  # type: ignore[arg-type]
+        else:
+            input_stream = source
+
+        return await self._put_file_as(input_stream, file)
+
+    @abstractmethod
+    async def _put_file_as(self, source: BufferedReader, file: str) -> bool:
+        """
+        Provides the process to put the content from source into a file.
+
+        Args:
+            source (BufferedReader): The content to be put into the file.
+            file (str): Full file path.
+
+        Returns:
+            bool: True if the action could be executed, False otherwise.
+        """
+
+    @override
+    async def delete(self, file: str) -> bool:
+        if not await self.exists(file):  # file doesn't exist
+            return False
+
+        if await self.exists_directory(file):  # file is directory
+            return False
+
+        return await self._delete(file)
+
+    @abstractmethod
+    async def _delete(self, file: str) -> bool:
+        """
+        Provides the process to delete a file.
+
+        Args:
+            file (str): Full file path.
+
+        Returns:
+            bool: True if the action could be executed, False otherwise.
+        """
+
+    @override
+    async def files(self, directory: str) -> list[str]:
+        return await self._files_or_directories(directory, self._files)
+
+    @abstractmethod
+    async def _files(self, directory: str) -> list[str]:
+        """
+        Provides the process to get the files in the specified directory.
+
+        Args:
+            directory (str): The directory to get files from.
+
+        Returns:
+            list[str]: List of files in the directory.
+        """
+
+    @override
+    async def all_files(self, directory: str) -> list[str]:
+        return await self._files_or_directories(directory, self._all_files)
+
+    @abstractmethod
+    async def _all_files(self, directory: str) -> list[str]:
+        """
+        Provides the process to get all files, recursively, in the specified directory.
+
+        Args:
+            directory (str): The directory to get files from.
+
+        Returns:
+            list[str]: List of all files in the directory and its subdirectories.
+        """
+
+    @override
+    async def directories(self, directory: str) -> list[str]:
+        return await self._files_or_directories(directory, self._directories)
+
+    @abstractmethod
+    async def _directories(self, directory: str) -> list[str]:
+        """
+        Provides the process to get the directories in the specified directory.
+
+        Args:
+            directory (str): The directory to get subdirectories from.
+
+        Returns:
+            list[str]: List of subdirectories in the directory.
+        """
+
+    @override
+    async def all_directories(self, directory: str) -> list[str]:
+        return await self._files_or_directories(directory, self._all_directories)
+
+    @abstractmethod
+    async def _all_directories(self, directory: str) -> list[str]:
+        """
+        Provides the process to get all directories, recursively, in the specified directory.
+
+        Args:
+            directory (str): The directory to get subdirectories from.
+
+        Returns:
+            list[str]: List of all subdirectories in the directory and its subdirectories.
+        """
+
+    async def _files_or_directories(
+        self,
+        directory: str,
+        get_resources: Callable[[str], Awaitable[list[str]]]
+    ) -> list[str]:
+        """
+        Provides the standard process to get files or directories from a directory,
+        the process to get the resources is provided by the get_resources function.
+
+        Args:
+            directory (str): Directory to search for files or directories.
+            get_resources (Callable[[str], Awaitable[list[str]]]): The process to get the
+                                                                   files or directories.
+
+        Returns:
+            list[str]: A list of file or directory paths.
+        """
+        if not await self.exists_directory(directory):  # directory doesn't exist
+            return []
+
+        if await self.exists(directory):  # directory is file
+            return []
+
+        return await get_resources(directory)
+
+    @override
+    async def make_directory(self, directory: str) -> bool:
+        if not directory or not directory.strip():  # directory is root
+            return False
+
+        if await self.exists_directory(directory):  # directory exists
+            return False
+
+        if await self.exists(directory):  # directory is file
+            return False
+
+        return await self._make_directory(directory)
+
+    @abstractmethod
+    async def _make_directory(self, directory: str) -> bool:
+        """
+        Provides the process to create a directory.
+
+        Args:
+            directory (str): Full directory path.
+
+        Returns:
+            bool: True if the action could be executed, False otherwise.
+        """
+
+    @override
+    async def delete_directory(self, directory: str) -> bool:
+        if not directory or not directory.strip():  # directory is root
+            return False
+
+        if not await self.exists_directory(directory):  # directory doesn't exist
+            return False
+
+        if await self.exists(directory):  # directory is file
+            return False
+
+        return await self._delete_directory(directory)
+
+    @abstractmethod
+    async def _delete_directory(self, directory: str) -> bool:
+        """
+        Provides the process to delete a directory.
+
+        Args:
+            directory (str): Full directory path.
+
+        Returns:
+            bool: True if the action could be executed, False otherwise.
+        """
+
+    @override
+    async def get_metadata(self, path: str) -> Optional[Metadata]:
+        if await self.exists(path):
+            return await self._get_metadata_from_file(path)
+
+        if await self.exists_directory(path):
+            return await self._get_metadata_from_directory(path)
+
+        return None
+
+    @abstractmethod
+    async def _get_metadata_from_file(self, file: str) -> Metadata:
+        """
+        Get metadata from a file.
+
+        Args:
+            file (str): The full file path.
+
+        Returns:
+            Metadata: The metadata for the file.
+        """
+
+    @abstractmethod
+    async def _get_metadata_from_directory(self, directory: str) -> Metadata:
+        """
+        Get metadata from a directory.
+
+        Args:
+            directory (str): The full directory path.
+
+        Returns:
+            Metadata: The metadata for the directory.
+        """
+
+    @override
+    def get_root(self) -> str:
+        return self._root
+
+    @override
+    def get_separator(self) -> DirectorySeparator:
+        return self._separator
+
+    async def _run(self, function: Callable[..., R], *args: Any) -> R:
+        """
+        Runs the blocking `function` with `args` in the executor, so the event
+        loop is free while the function is executing.
+
+        Args:
+            function (Callable[..., R]): The blocking function.
+            args (Any): The arguments of the function.
+
+        Returns:
+            R: The result of the function.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            partial(function, *args)
+        )
+
+    @override
+    def __eq__(self, obj: object) -> bool:
+        return isinstance(obj, type(self)) and self._root == obj._root
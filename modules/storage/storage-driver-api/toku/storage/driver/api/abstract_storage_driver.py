@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+# pylint: disable=too-many-lines
 """
 Private License - For Internal Use Only
 
@@ -12,16 +13,29 @@ prior written permission from Toku.
 Module: abstract_storage_driver.py
 Author: Toku
 """
+import base64
+import bisect
+import hashlib
 import uuid
-from typing import Callable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Optional, TypeVar
 from io import BytesIO, BufferedReader
 from abc import ABC, abstractmethod
 from overrides import override
 from toku.storage.driver.api import Metadata
+from toku.storage.driver.api import BulkResult
+from toku.storage.driver.api import Page
+from toku.storage.driver.api import PathType
+from toku.storage.driver.api import Stat
+from toku.storage.driver.api import Checksum
+from toku.storage.driver.api import TransferResult
+from toku.storage.driver.api import TransferEngine
 from toku.storage.driver.api import PathSanitizer
 from toku.storage.driver.api import DirectorySeparator
 from toku.storage.driver.api import StorageDriver
 
+V = TypeVar("V")
+
 
 class AbstractStorageDriver(StorageDriver, ABC):
     """
@@ -31,19 +45,59 @@ class AbstractStorageDriver(StorageDriver, ABC):
     All methods using the pattern `_{method}` that have another with the same
     name but public provide the specific logic to execute the final action of
     similar processes.
+
+    The bulk operations (`{method}_many`) execute the single operation for each
+    path in a thread pool with up to `max_workers` threads.
+
+    The paginated listings (`iter_{method}`) page the result of the listing
+    in memory by default, a storage driver able to page natively should
+    override the `_iter_{method}` methods.
+
+    The validations get the type of each path once with `stat`, a storage
+    driver able to get it with a single request should override it.
+
+    The directory transfers (`copy_directory`, `move_directory` and
+    `transfer_directory`) transfer the files with a `TransferEngine` of up to
+    `max_workers` threads and `max_in_flight_bytes` bytes at the same time.
+
+    The checksum of a file is calculated by reading its content by default, a
+    storage driver able to get it without reading the content should override
+    `_checksum`.
     """
 
-    def __init__(self, root: str, separator: DirectorySeparator) -> None:
+    DEFAULT_MAX_WORKERS: int = 16  # the default number of threads for bulk operations
+    DEFAULT_PAGE_SIZE: int = 1000  # the default number of paths of a page
+    CHECKSUM_CHUNK_SIZE: int = 1024 * 1024  # 1 MB read at a time to calculate a checksum
+
+    def __init__(
+            self,
+            root: str,
+            separator: DirectorySeparator,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            max_in_flight_bytes: int = TransferEngine.DEFAULT_MAX_IN_FLIGHT_BYTES
+    ) -> None:
         """
         Initializes a new abstract storage driver.
 
         Args:
             root (str): The working directory.
             separator (DirectorySeparator): The separator of the directories.
+            max_workers (int): The maximum number of threads for bulk operations
+                               and directory transfers.
+                               Defaults to DEFAULT_MAX_WORKERS.
+            max_in_flight_bytes (int): The maximum number of bytes being transferred
+                                       at the same time by a directory transfer.
+                                       Defaults to TransferEngine.DEFAULT_MAX_IN_FLIGHT_BYTES.
         """
         self._sanitizer: PathSanitizer = PathSanitizer(separator)
         self._root: str = self._sanitizer.sanitize(root)
         self._separator: DirectorySeparator = separator
+        self._max_workers: int = max_workers
+        self._transfer_engine: TransferEngine = TransferEngine(max_workers, max_in_flight_bytes)
+
+    @override
+    def flush(self) -> None:
+        pass  # there isn't a buffer by default
 
     @override
     def get(self, file: str) -> Optional[bytes]:
@@ -71,6 +125,66 @@ class AbstractStorageDriver(StorageDriver, ABC):
             BufferedReader: The input stream internal.
         """
 
+    @override
+    def get_range(self, file: str, offset: int, length: Optional[int] = None) -> Optional[bytes]:
+        if offset < 0 or (length is not None and length < 0):  # range is invalid
+            return None
+
+        return self._get_range(file, offset, length) if self.exists(file) else None
+
+    def _get_range(self, file: str, offset: int, length: Optional[int]) -> bytes:
+        """
+        Provides the process to get a range of a file as a byte array, by default
+        it reads the input stream of the range.
+
+        Args:
+            file (str): Full file path.
+            offset (int): The position of the first byte.
+            length (Optional[int]): The number of bytes, None means until the end.
+
+        Returns:
+            bytes: The content of the range.
+        """
+        with self._get_range_as_input_stream(file, offset, length) as input_stream:
+            return input_stream.read()
+
+    @override
+    def get_range_as_input_stream(
+        self,
+        file: str,
+        offset: int,
+        length: Optional[int] = None
+    ) -> Optional[BufferedReader]:
+        if offset < 0 or (length is not None and length < 0):  # range is invalid
+            return None
+
+        return self._get_range_as_input_stream(file, offset, length) if self.exists(file) else None
+
+    @abstractmethod
+    def _get_range_as_input_stream(
+        self,
+        file: str,
+        offset: int,
+        length: Optional[int]
+    ) -> BufferedReader:
+        """
+        Provides the process to get a BufferedReader object as an input stream from
+        a range of a file.
+
+        Args:
+            file (str): Full file path.
+            offset (int): The position of the first byte.
+            length (Optional[int]): The number of bytes, None means until the end.
+
+        Returns:
+            BufferedReader: The input stream internal.
+        """
+
+    @override
+    def get_local_path(self, file: str) -> Optional[str]:
+        # by default the files are not in the local file system
+        return None
+
     @override
     def put_file(self, source: bytes | str | BufferedReader, directory: str) -> Optional[str]:
         file_name: str = str(uuid.uuid4()).lower()
@@ -88,28 +202,12 @@ class AbstractStorageDriver(StorageDriver, ABC):
         if not source:  # source is None
             return False
 
-        if not file or not file.strip():  # file is empty
-            return False
-
-        if self.exists_directory(file):  # file is directory
-            return False
-
-        if self.exists(self._sanitizer.get_parent(file)):  # file parent folder is a file
-            return False
-
-        parent: str = self._sanitizer.get_parent(file)
-
-        # create parent if not exists and not root
-        if parent and \
-           parent.strip() and \
-           not self.exists_directory(parent) and \
-           not self.make_directory(parent):
+        if not self._prepare_put_file(file):
             return False
 
         # put the file
         if isinstance(source, str):
-            with open(source, "rb") as f:
-                return self._put_file_as(f, file)
+            return self._put_file_as_from_path(source, file)
 
         input_stream: BufferedReader
 
@@ -121,6 +219,37 @@ class AbstractStorageDriver(StorageDriver, ABC):
 
         return self._put_file_as(input_stream, file)
 
+    def _prepare_put_file(self, file: str) -> bool:
+        """
+        Validates that `file` can be put (it's not empty, a directory or inside
+        a file) and creates its parent directory if it doesn't exist.
+
+        Args:
+            file (str): Full file path.
+
+        Returns:
+            bool: True if `file` can be put, False otherwise.
+        """
+        if not file or not file.strip():  # file is empty
+            return False
+
+        if self.stat(file).type == PathType.DIRECTORY:  # file is directory
+            return False
+
+        parent: str = self._sanitizer.get_parent(file)
+
+        if parent and parent.strip():  # parent is not root
+            parent_type: PathType = self.stat(parent).type
+
+            if parent_type == PathType.FILE:  # file parent folder is a file
+                return False
+
+            # create parent if not exists
+            if parent_type == PathType.MISSING and not self._make_directory(parent):
+                return False
+
+        return True
+
     @abstractmethod
     def _put_file_as(self, source: BufferedReader, file: str) -> bool:
         """
@@ -134,6 +263,22 @@ class AbstractStorageDriver(StorageDriver, ABC):
             bool: True if the action could be executed, False otherwise.
         """
 
+    def _put_file_as_from_path(self, source: str, file: str) -> bool:
+        """
+        Provides the process to put the content of a local file into a file,
+        by default it opens `source` and calls `_put_file_as`, a storage driver
+        can override it to upload the local file directly.
+
+        Args:
+            source (str): The path to the local file.
+            file (str): Full file path.
+
+        Returns:
+            bool: True if the action could be executed, False otherwise.
+        """
+        with open(source, "rb") as f:
+            return self._put_file_as(f, file)
+
     @override
     def append(self, source: bytes, file: str) -> bool:
         if not source:  # source is None
@@ -162,31 +307,29 @@ class AbstractStorageDriver(StorageDriver, ABC):
         self,
         source: str,
         target: str,
-        target_storage_driver: Optional['StorageDriver'] = None
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
     ) -> bool:
         target_storage_driver = self if not target_storage_driver else target_storage_driver
 
-        if not source or not source.strip() or self.exists_directory(source):  # source is directory
+        if not source or not source.strip():  # source is root
             return False
 
-        if not self.exists(source):  # source doesn't exist
+        if self.stat(source).type != PathType.FILE:  # source doesn't exist or is directory
             return False
 
-        if not target or \
-           not target.strip() or \
-           target_storage_driver.exists_directory(target):  # target is a directory
+        if not target or not target.strip():  # target is root
             return False
 
         if self == target_storage_driver and \
            source == target:  # source equals to target in the same driver
             return False
 
-        if target_storage_driver.exists(target) and \
-           not target_storage_driver.delete(target):  # delete if exists
-            return False
+        if skip_unchanged and self._is_unchanged(source, target, target_storage_driver):
+            return True
 
-        with self._get_as_input_stream(source) as input_stream:
-            return target_storage_driver.put_file_as(input_stream, target)
+        return self._transfer_file(source, target, target_storage_driver)
 
     @override
     def move(
@@ -202,10 +345,7 @@ class AbstractStorageDriver(StorageDriver, ABC):
 
     @override
     def delete(self, file: str) -> bool:
-        if not self.exists(file):  # file doesn't exist
-            return False
-
-        if self.exists_directory(file):  # file is directory
+        if self.stat(file).type != PathType.FILE:  # file doesn't exist or is directory
             return False
 
         return self._delete(file)
@@ -224,21 +364,19 @@ class AbstractStorageDriver(StorageDriver, ABC):
 
     @override
     def rename(self, source: str, target: str) -> bool:
-        if not self.exists(source):  # source doesn't exist
+        if not source or not source.strip():  # source is root
             return False
 
-        if not source or not source.strip() or self.exists_directory(source):  # source is directory
+        if not target or not target.strip():  # target is root
             return False
 
-        if self.exists(target):  # target exists
+        if source == target:  # source equals to target
             return False
 
-        if not target or \
-           not target.strip() or \
-           self.exists_directory(target):  # target is a directory
+        if self.stat(source).type != PathType.FILE:  # source doesn't exist or is directory
             return False
 
-        if source == target:  # source equals to target
+        if self.stat(target).type != PathType.MISSING:  # target exists
             return False
 
         return self._rename(source, target)
@@ -336,116 +474,323 @@ class AbstractStorageDriver(StorageDriver, ABC):
         Returns:
             list[str]: A list of file or directory paths.
         """
-        if not self.exists_directory(directory):  # directory doesn't exist
-            return []
-
-        if self.exists(directory):  # directory is file
+        if self.stat(directory).type != PathType.DIRECTORY:  # directory doesn't exist or is file
             return []
 
         return get_resources(directory)
 
+    @override
+    def iter_files(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        return self._iter_files_or_directories(
+            directory,
+            page_size,
+            page_token,
+            self._iter_files
+        )
+
+    def _iter_files(
+            self,
+            directory: str,
+            page_size: int,
+            page_token: Optional[str]
+    ) -> Iterator[Page]:
+        """
+        Provides the process to get the pages of files in the specified directory.
+
+        By default the files are obtained with `_files` and paged in memory.
+
+        Args:
+            directory (str): The directory to get files from.
+            page_size (int): The maximum number of paths of a page.
+            page_token (Optional[str]): The token to resume the listing.
+
+        Returns:
+            Iterator[Page]: The pages of files.
+        """
+        return self._paginate(self._files(directory), page_size, page_token)
+
+    @override
+    def iter_all_files(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        return self._iter_files_or_directories(
+            directory,
+            page_size,
+            page_token,
+            self._iter_all_files
+        )
+
+    def _iter_all_files(
+            self,
+            directory: str,
+            page_size: int,
+            page_token: Optional[str]
+    ) -> Iterator[Page]:
+        """
+        Provides the process to get the pages of all files, recursively, in the specified directory.
+
+        By default the files are obtained with `_all_files` and paged in memory.
+
+        Args:
+            directory (str): The directory to get files from.
+            page_size (int): The maximum number of paths of a page.
+            page_token (Optional[str]): The token to resume the listing.
+
+        Returns:
+            Iterator[Page]: The pages of files.
+        """
+        return self._paginate(self._all_files(directory), page_size, page_token)
+
+    @override
+    def iter_directories(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        return self._iter_files_or_directories(
+            directory,
+            page_size,
+            page_token,
+            self._iter_directories
+        )
+
+    def _iter_directories(
+            self,
+            directory: str,
+            page_size: int,
+            page_token: Optional[str]
+    ) -> Iterator[Page]:
+        """
+        Provides the process to get the pages of directories in the specified directory.
+
+        By default the directories are obtained with `_directories` and paged in memory.
+
+        Args:
+            directory (str): The directory to get directories from.
+            page_size (int): The maximum number of paths of a page.
+            page_token (Optional[str]): The token to resume the listing.
+
+        Returns:
+            Iterator[Page]: The pages of directories.
+        """
+        return self._paginate(self._directories(directory), page_size, page_token)
+
+    @override
+    def iter_all_directories(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        return self._iter_files_or_directories(
+            directory,
+            page_size,
+            page_token,
+            self._iter_all_directories
+        )
+
+    def _iter_all_directories(
+            self,
+            directory: str,
+            page_size: int,
+            page_token: Optional[str]
+    ) -> Iterator[Page]:
+        """
+        Provides the process to get the pages of all directories, recursively, in the
+        specified directory.
+
+        By default the directories are obtained with `_all_directories` and paged in memory.
+
+        Args:
+            directory (str): The directory to get directories from.
+            page_size (int): The maximum number of paths of a page.
+            page_token (Optional[str]): The token to resume the listing.
+
+        Returns:
+            Iterator[Page]: The pages of directories.
+        """
+        return self._paginate(self._all_directories(directory), page_size, page_token)
+
+    def _iter_files_or_directories(
+        self,
+        directory: str,
+        page_size: Optional[int],
+        page_token: Optional[str],
+        get_pages: Callable[[str, int, Optional[str]], Iterator[Page]]
+    ) -> Iterator[Page]:
+        """
+        Provides the standard process to get pages of files or directories from
+        a directory, the process to get the pages is provided by the get_pages function.
+
+        Args:
+            directory (str): Directory to search for files or directories.
+            page_size (Optional[int]): The maximum number of paths of a page.
+            page_token (Optional[str]): The token to resume the listing.
+            get_pages (Callable[[str, int, Optional[str]], Iterator[Page]]): The process to get
+                                                                             the pages.
+
+        Returns:
+            Iterator[Page]: The pages of file or directory paths.
+        """
+        if page_size is None:
+            page_size = AbstractStorageDriver.DEFAULT_PAGE_SIZE
+
+        if page_size <= 0:  # page size is not valid
+            return iter([])
+
+        if self.stat(directory).type != PathType.DIRECTORY:  # directory doesn't exist or is file
+            return iter([])
+
+        return get_pages(directory, page_size, page_token)
+
+    def _paginate(
+        self,
+        paths: list[str],
+        page_size: int,
+        page_token: Optional[str]
+    ) -> Iterator[Page]:
+        """
+        Pages the `paths` in memory.
+
+        The paths are sorted and the token of a page is its last path, on that
+        way a listing can be resumed even if paths were added or deleted before
+        the token.
+
+        Args:
+            paths (list[str]): The paths.
+            page_size (int): The maximum number of paths of a page.
+            page_token (Optional[str]): The token to resume the listing.
+
+        Yields:
+            Iterator[Page]: The pages of the paths.
+        """
+        paths = sorted(paths)
+        start: int = 0 if page_token is None else bisect.bisect_right(paths, page_token)
+
+        while start < len(paths):
+            items: list[str] = paths[start:start + page_size]
+            start += len(items)
+            yield Page(items, items[-1] if start < len(paths) else None)
+
     @override
     def copy_directory(
         self,
         source: str,
         target: str,
-        target_storage_driver: Optional['StorageDriver'] = None
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
     ) -> bool:
-        return self._copy_or_move_directory(source, target, False, target_storage_driver)
+        result: Optional[TransferResult] = self.transfer_directory(
+            source,
+            target,
+            False,
+            target_storage_driver,
+            skip_unchanged=skip_unchanged
+        )
+        return result is not None and result.succeeded
 
     @override
     def move_directory(
         self,
         source: str,
         target: str,
-        target_storage_driver: Optional['StorageDriver'] = None
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
     ) -> bool:
-        return self._copy_or_move_directory(source, target, True, target_storage_driver)
+        result: Optional[TransferResult] = self.transfer_directory(
+            source,
+            target,
+            True,
+            target_storage_driver,
+            skip_unchanged=skip_unchanged
+        )
+        return result is not None and result.succeeded
 
-    def _copy_or_move_directory(
+    @override
+    def transfer_directory(
         self,
         source: str,
         target: str,
-        remove_source: bool,
-        target_storage_driver: Optional['StorageDriver'] = None
-    ) -> bool:
-        """
-        Provides the process to copy or move each file in `source` to `target`
-        including its subdirectories.
-
-        If `target_storage_driver` is None then the same storage driver is used.
-
-        Args:
-            source (str): Full file path.
-            target (str): Full file path.
-            remove_source (bool): Removes the folder / file after finishing the action
-            target_storage_driver (Optional['StorageDriver']): Storage driver to use
-                                                               in the target. Defaults to None.
-
-        Returns:
-            bool: True if the action could be executed, False otherwise.
-        """
+        remove_source: bool = False,
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
+    ) -> Optional[TransferResult]:
         target_storage_driver = self if not target_storage_driver else target_storage_driver
 
         if not source or not source.strip():  # source is root
-            return False
-
-        if not self.exists_directory(source):  # source doesn't exist
-            return False
-
-        if self.exists(source):  # source is file
-            return False
+            return None
 
         if self._sanitizer.get_parent(source) == target:  # source parent directory is target
-            return False
+            return None
 
         if self._sanitizer.add_directory_separator(target) \
             .startswith(
                 self._sanitizer.add_directory_separator(source)
                 ):  # source is part of parent in target
-            return False
+            return None
 
-        if not target_storage_driver.exists_directory(target):  # target not exists
-            return False
+        if self.stat(source).type != PathType.DIRECTORY:  # source doesn't exist or is file
+            return None
 
-        if target_storage_driver.exists(target):  # target is file
-            return False
+        target_type: PathType = target_storage_driver.stat(target).type
+
+        if target_type != PathType.DIRECTORY:  # target doesn't exist or is file
+            return None
 
         return self._transfer_files(
             source,
             target,
             remove_source,
-            target_storage_driver
+            target_storage_driver,
+            skip_unchanged
         )
 
-    def _transfer_files(
+    def _transfer_files(  # pylint: disable=too-many-arguments
         self,
         source: str,
         target: str,
         remove_source: bool,
-        target_storage_driver: StorageDriver
-    ) -> bool:
+        target_storage_driver: StorageDriver,
+        skip_unchanged: bool = False
+    ) -> TransferResult:
         """
-        Transfer all the files from `source` to `target` removing each file and the
-        `source` folder itself if `remove_source` is True.
+        Transfer all the files from `source` to `target` with the transfer engine,
+        removing each file and the `source` folder itself if `remove_source` is
+        True, the `source` folder is removed only if every file was transferred.
 
         `target_storage_driver` is the target storage driver where each file will
-        be copied or moved.
+        be copied or moved, a file unchanged in the target isn't copied if
+        `skip_unchanged` is True.
 
         Args:
             source (str): Full file path.
             target (str): Full file path.
             remove_source (bool): Removes the folder / file after finishing the action
             target_storage_driver (StoragaDriver): Storage driver to use in the target.
+            skip_unchanged (bool): Whether to skip the unchanged files. Defaults to False.
 
         Returns:
-            bool: True if the action could be executed, False otherwise.
+            TransferResult: The result of each file.
         """
         # get source parent
         source_parent: str = self._sanitizer.get_parent(source)
 
-        # copy files of the directory
-        for file in self._all_files(source):
+        # the files are listed with their size for the in-flight bytes limit
+        files: list[tuple[str, str, int]] = []
+
+        for file, metadata in self._list_with_metadata(source, True):
             file_path: str = self._sanitizer.sanitize(
                 self._sanitizer.sanitize(file).replace(source_parent, ""),
                 True
@@ -454,28 +799,88 @@ class AbstractStorageDriver(StorageDriver, ABC):
                 file_path \
                 if not target or not target.strip() \
                 else self._sanitizer.concat(target, file_path)
+            files.append((file, target_path, metadata.size.length))
 
-            with self._get_as_input_stream(file) as input_stream:
-                if not target_storage_driver.put_file_as(input_stream, target_path):
-                    return False
-                if remove_source and not self.delete(file):
-                    return False
+        TransferEngine.make_parent_directories(
+            target_storage_driver,
+            (file for _, file, _ in files)
+        )
+
+        result: TransferResult = self._transfer_engine.transfer(
+            files,
+            lambda source_file, target_file: (
+                skip_unchanged and
+                self._is_unchanged(source_file, target_file, target_storage_driver)
+            ) or self._transfer_file(
+                source_file,
+                target_file,
+                target_storage_driver
+            ),
+            self._delete if remove_source else None
+        )
 
         # if remove_source is true then delete the folder
-        if remove_source:
-            return self._delete_directory(source)
+        if remove_source and result.succeeded and not self._delete_directory(source):
+            result.results.append(BulkResult(source, False))
 
-        return True
+        return result
+
+    def _transfer_file(
+        self,
+        source: str,
+        target: str,
+        target_storage_driver: StorageDriver
+    ) -> bool:
+        """
+        Provides the process to transfer the file `source` to `target` in
+        `target_storage_driver`, it's used by `copy`, `move` and the directory
+        transfers, by default the content of `source` is put in `target` as an
+        input stream (`put_file_as` validates that target is not a directory and
+        overwrites it if it exists).
+
+        Args:
+            source (str): Full file path of the source.
+            target (str): Full file path of the target.
+            target_storage_driver (StorageDriver): Storage driver to use in the target.
+
+        Returns:
+            bool: True if the action could be executed, False otherwise.
+        """
+        with self._get_as_input_stream(source) as input_stream:
+            return target_storage_driver.put_file_as(input_stream, target)
+
+    def _is_unchanged(
+        self,
+        source: str,
+        target: str,
+        target_storage_driver: StorageDriver
+    ) -> bool:
+        """
+        Checks if the file `target` in `target_storage_driver` has the same
+        content as the file `source`, the checksum of `source` is only got if
+        `target` exists.
+
+        Args:
+            source (str): Full file path of the source.
+            target (str): Full file path of the target.
+            target_storage_driver (StorageDriver): Storage driver to use in the target.
+
+        Returns:
+            bool: True if the checksums match, False otherwise.
+        """
+        target_checksum: Optional[Checksum] = target_storage_driver.checksum(target)
+
+        if target_checksum is None:  # target doesn't exist or is directory
+            return False
+
+        return self._checksum(source).matches(target_checksum)
 
     @override
     def make_directory(self, directory: str) -> bool:
         if not directory or not directory.strip():  # directory is root
             return False
 
-        if self.exists_directory(directory):  # directory exists
-            return False
-
-        if self.exists(directory):  # directory is file
+        if self.stat(directory).type != PathType.MISSING:  # directory exists or is file
             return False
 
         return self._make_directory(directory)
@@ -497,10 +902,7 @@ class AbstractStorageDriver(StorageDriver, ABC):
         if not directory or not directory.strip():  # directory is root
             return False
 
-        if not self.exists_directory(directory):  # directory doesn't exist
-            return False
-
-        if self.exists(directory):  # directory is file
+        if self.stat(directory).type != PathType.DIRECTORY:  # directory doesn't exist or is file
             return False
 
         return self._delete_directory(directory)
@@ -522,22 +924,16 @@ class AbstractStorageDriver(StorageDriver, ABC):
         if not source or not source.strip():  # source is root
             return False
 
-        if not self.exists_directory(source):  # source doesn't exist
-            return False
-
-        if self.exists(source):  # source is file
-            return False
-
         if not target or not target.strip():  # target is root
             return False
 
-        if self.exists_directory(target):  # target is a directory
+        if source == target:  # source equals to target
             return False
 
-        if self.exists(target):  # target is file
+        if self.stat(source).type != PathType.DIRECTORY:  # source doesn't exist or is file
             return False
 
-        if source == target:  # source equals to target
+        if self.stat(target).type != PathType.MISSING:  # target exists
             return False
 
         return self._rename_directory(source, target)
@@ -557,14 +953,59 @@ class AbstractStorageDriver(StorageDriver, ABC):
 
     @override
     def get_metadata(self, path: str) -> Optional[Metadata]:
-        if self.exists(path):
+        path_stat: Stat = self.stat(path)
+
+        if path_stat.metadata is not None:  # metadata was obtained by stat
+            return path_stat.metadata
+
+        if path_stat.type == PathType.FILE:
             return self._get_metadata_from_file(path)
 
-        if self.exists_directory(path):
+        if path_stat.type == PathType.DIRECTORY:
             return self._get_metadata_from_directory(path)
 
         return None
 
+    @override
+    def stat(self, path: str) -> Stat:
+        # by default the type is obtained with `exists` and `exists_directory`
+        if self.exists(path):
+            return Stat(PathType.FILE)
+
+        if self.exists_directory(path):
+            return Stat(PathType.DIRECTORY)
+
+        return Stat(PathType.MISSING)
+
+    @override
+    def checksum(self, file: str) -> Optional[Checksum]:
+        if self.stat(file).type != PathType.FILE:  # file doesn't exist or is directory
+            return None
+
+        return self._checksum(file)
+
+    def _checksum(self, file: str) -> Checksum:
+        """
+        Provides the process to get the checksum of `file`, by default the MD5
+        hash is calculated reading the content of `file`.
+
+        Args:
+            file (str): Full file path.
+
+        Returns:
+            Checksum: The checksum of the file.
+        """
+        md5 = hashlib.md5(usedforsecurity=False)
+        chunk_size: int = AbstractStorageDriver.CHECKSUM_CHUNK_SIZE
+        size: int = 0
+
+        with self._get_as_input_stream(file) as input_stream:
+            for chunk in iter(lambda: input_stream.read(chunk_size), b""):
+                md5.update(chunk)
+                size += len(chunk)
+
+        return Checksum(size, md5=base64.b64encode(md5.digest()).decode("utf-8"))
+
     @abstractmethod
     def _get_metadata_from_file(self, file: str) -> Metadata:
         """
@@ -589,6 +1030,84 @@ class AbstractStorageDriver(StorageDriver, ABC):
             Metadata: The metadata for the directory.
         """
 
+    @override
+    def list_with_metadata(
+            self,
+            directory: str,
+            recursive: bool = False
+    ) -> list[tuple[str, Metadata]]:
+        if self.stat(directory).type != PathType.DIRECTORY:  # directory doesn't exist or is file
+            return []
+
+        return self._list_with_metadata(directory, recursive)
+
+    def _list_with_metadata(self, directory: str, recursive: bool) -> list[tuple[str, Metadata]]:
+        """
+        Provides the process to get the files in the specified directory with
+        their metadata.
+
+        By default the files are obtained with `_files` or `_all_files` and
+        the metadata of each one with `_get_metadata_from_file`.
+
+        Args:
+            directory (str): The directory to get files from.
+            recursive (bool): Whether to include the files of the sub-directories.
+
+        Returns:
+            list[tuple[str, Metadata]]: The path and the metadata of each file.
+        """
+        files: list[str] = self._all_files(directory) if recursive else self._files(directory)
+        return [(file, self._get_metadata_from_file(file)) for file in files]
+
+    @override
+    def exists_many(self, files: list[str]) -> list[BulkResult[bool]]:
+        return self._bulk(files, self.exists)
+
+    @override
+    def get_many(self, files: list[str]) -> list[BulkResult[Optional[bytes]]]:
+        return self._bulk(files, self.get)
+
+    @override
+    def put_many(self, sources: dict[str, bytes | str | BufferedReader]) -> list[BulkResult[bool]]:
+        TransferEngine.make_parent_directories(self, sources)
+
+        return self._bulk(list(sources), lambda file: self.put_file_as(sources[file], file))
+
+    @override
+    def delete_many(self, files: list[str]) -> list[BulkResult[bool]]:
+        return self._bulk(files, self.delete)
+
+    @override
+    def get_metadata_many(self, paths: list[str]) -> list[BulkResult[Optional[Metadata]]]:
+        return self._bulk(paths, self.get_metadata)
+
+    def _bulk(self, paths: list[str], process: Callable[[str], V]) -> list[BulkResult[V]]:
+        """
+        Provides the standard process to execute `process` for each path in
+        `paths` with a thread pool of `self._max_workers` threads.
+
+        An exception raised by `process` for a path is kept in its result
+        instead of being propagated.
+
+        Args:
+            paths (list[str]): The paths.
+            process (Callable[[str], V]): The process to execute for each path.
+
+        Returns:
+            list[BulkResult[V]]: The result for each path with the same order as `paths`.
+        """
+        if not paths:
+            return []
+
+        def execute(path: str) -> BulkResult[V]:
+            try:
+                return BulkResult(path, process(path))
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                return BulkResult(path, error=e)
+
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(paths))) as executor:
+            return list(executor.map(execute, paths))
+
     @override
     def get_root(self) -> str:
         return self._root
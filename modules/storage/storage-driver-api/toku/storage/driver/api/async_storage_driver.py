@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: async_storage_driver.py
+Author: Toku
+"""
+from abc import ABC, abstractmethod
+from io import BufferedReader
+from typing import Any, AsyncIterator, Literal, Optional, Self, final
+from overrides import EnforceOverrides
+from toku.storage.driver.api import DirectorySeparator
+from toku.storage.driver.api import Metadata
+
+
+class AsyncStorageDriver(ABC, EnforceOverrides):
+    """
+    Provides the contract to define the abstraction to use the storage driver
+    from asynchronous code, every method that accesses the storage is awaitable
+    and must not block the event loop.
+
+    It follows the same specification of `StorageDriver`, check it for the
+    details of each method.
+    """
+
+    DEFAULT_CHUNK_SIZE: int = 64 * 1024  # the default size of the chunks to iterate a file
+
+    @abstractmethod
+    async def open(self) -> None:
+        """
+        Allows storage driver initialization.
+        """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """
+        Closes the storage driver and releases its resources.
+        """
+
+    @abstractmethod
+    async def get(self, file: str) -> Optional[bytes]:
+        """
+        Gets `file` as a byte array.
+
+        If `file` doesn't exist, return None.
+
+        Args:
+            file (str): Full file path.
+
+        Returns:
+            Optional[bytes]: Byte array or None.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs.
+        """
+
+    @abstractmethod
+    async def iter_chunks(
+        self,
+        file: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Optional[AsyncIterator[bytes]]:
+        """
+        Gets `file` as an asynchronous iterator of chunks of `chunk_size` bytes,
+        the last chunk can be smaller.
+
+        If `file` doesn't exist, return None.
+
+        Args:
+            file (str): Full file path.
+            chunk_size (int): The maximum size of each chunk in bytes.
+                              Defaults to DEFAULT_CHUNK_SIZE.
+
+        Returns:
+            Optional[AsyncIterator[bytes]]: The chunks or None.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs.
+        """
+
+    @abstractmethod
+    async def exists(self, file: str) -> bool:
+        """
+        Checks if `file` exists.
+
+        Args:
+            file (str): Full file path.
+
+        Returns:
+            bool: True if the file exists, False otherwise.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs.
+        """
+
+    @abstractmethod
+    async def put_file_as(self, source: bytes | str | BufferedReader, file: str) -> bool:
+        """
+        Stores the `source` into `file`.
+
+        If `source` is None, the process is finished.
+        If `file` is empty, None, or a directory, or the parent folder is a file,
+        the process is finished.
+        If `file` exists, it'll be replaced.
+        If the parent directory doesn't exist, it'll be created, and if it can't
+        be created, the process is finished.
+
+        Args:
+            source (bytes | str | BufferedReader): Content, a str is a full file path
+                                                   in the local machine.
+            file (str): Full file path.
+
+        Returns:
+            bool: True if the action could be executed, False otherwise.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs.
+        """
+
+    @abstractmethod
+    async def delete(self, file: str) -> bool:
+        """
+        Deletes `file`.
+
+        If `file` doesn't exist or is a directory, return False.
+
+        Args:
+            file (str): Full file path.
+
+        Returns:
+            bool: True if the action could be executed, False otherwise.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs.
+        """
+
+    @abstractmethod
+    async def files(self, directory: str) -> list[str]:
+        """
+        Returns a collection with all the files inside the root of the `directory`.
+
+        If `directory` doesn't exist or is a file, return an empty list.
+        If `directory` is empty or None, use the root as a directory.
+
+        Args:
+            directory (str): Full directory path.
+
+        Returns:
+            list[str]: List of file paths.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs.
+        """
+
+    @abstractmethod
+    async def all_files(self, directory: str) -> list[str]:
+        """
+        Returns a collection with all the files inside the root and sub-directories
+        of the `directory`, where each file has the full path without the root.
+
+        If `directory` doesn't exist or is a file, return an empty collection.
+        If `directory` is empty or None, use the root as a directory.
+
+        Args:
+            directory (str): Directory to use to get the files.
+
+        Returns:
+            list[str]: All the files inside the root and sub-directories of the directory.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs.
+        """
+
+    @abstractmethod
+    async def directories(self, directory: str) -> list[str]:
+        """
+        Returns a collection with all the directories inside the root of the `directory`.
+
+        If `directory` doesn't exist or is a file, return an empty list.
+        If `directory` is empty or None, use the root as a directory.
+
+        Args:
+            directory (str): Full directory path.
+
+        Returns:
+            list[str]: List of directory paths.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs.
+        """
+
+    @abstractmethod
+    async def all_directories(self, directory: str) -> list[str]:
+        """
+        Returns a collection with all the directories inside the root and
+        sub-directories of the `directory`, where each directory has the full path
+        without the root.
+
+        If `directory` doesn't exist or is a file, return an empty collection.
+        If `directory` is empty or None, use the root as a directory.
+
+        Args:
+            directory (str): Directory to use to get the directories.
+
+        Returns:
+            list[str]: All the directories inside the root and sub-directories of the
+            directory.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs.
+        """
+
+    @abstractmethod
+    async def exists_directory(self, directory: str) -> bool:
+        """
+        Checks if `directory` exists.
+
+        Args:
+            directory (str): Full directory path.
+
+        Returns:
+            bool: True if the directory exists, False otherwise.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs.
+        """
+
+    @abstractmethod
+    async def make_directory(self, directory: str) -> bool:
+        """
+        Creates a `directory`.
+
+        If `directory` is empty, None, or exists, the process is finished.
+
+        Args:
+            directory (str): Full directory path.
+
+        Returns:
+            bool: True if the action could be executed, False otherwise.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs.
+        """
+
+    @abstractmethod
+    async def delete_directory(self, directory: str) -> bool:
+        """
+        Deletes `directory`.
+
+        If `directory` doesn't exist, return False.
+        If `directory` is a file or is the root, the process is finished.
+
+        Args:
+            directory (str): Full directory path.
+
+        Returns:
+            bool: True if the action could be executed, False otherwise.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs.
+        """
+
+    @abstractmethod
+    async def get_metadata(self, path: str) -> Optional[Metadata]:
+        """
+        Gets the metadata of `path`.
+
+        If `path` doesn't exist, return None.
+
+        Args:
+            path (str): Full file or directory path.
+
+        Returns:
+            Optional[Metadata]: Metadata or None.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs.
+        """
+
+    @abstractmethod
+    def get_root(self) -> str:
+        """
+        Returns the root directory of the storage driver.
+
+        Returns:
+            str: Root directory path.
+        """
+
+    @abstractmethod
+    def get_separator(self) -> DirectorySeparator:
+        """
+        Returns the directory separator used by the storage driver.
+
+        Returns:
+            DirectorySeparator: Directory separator.
+        """
+
+    @final
+    async def __aenter__(self) -> Self:
+        await self.open()
+        return self
+
+    @final
+    async def __aexit__(self, exc_type_: Any, exc_value_: Any, traceback_: Any) -> Literal[False]:
+        await self.close()
+        return False  # indicates that exceptions should be propagated
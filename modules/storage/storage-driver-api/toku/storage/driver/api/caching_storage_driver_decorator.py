@@ -0,0 +1,689 @@
+# -*- coding: utf-8 -*-
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: caching_storage_driver_decorator.py
+Author: Toku
+"""
+from collections import OrderedDict
+from io import BufferedReader
+import threading
+import time
+from typing import Any, Callable, Iterator, Optional, TypeVar, final
+from overrides import override
+from toku.storage.driver.api import PathSanitizer
+from toku.storage.driver.api import DirectorySeparator
+from toku.storage.driver.api import Metadata
+from toku.storage.driver.api import Stat
+from toku.storage.driver.api import Checksum
+from toku.storage.driver.api import TransferResult
+from toku.storage.driver.api import BulkResult
+from toku.storage.driver.api import Page
+from toku.storage.driver.api import StorageDriver
+from toku.storage.driver.api import StorageDriverDecorator
+
+V = TypeVar("V")
+
+
+@final
+class CachingStorageDriverDecorator(StorageDriverDecorator):
+    """
+    Provides a decorator to cache the results of `exists`, `exists_directory`,
+    `get_metadata`, `stat` and `checksum`, including the negative ones (a path
+    that doesn't exist).
+
+    The cache keeps up to `max_size` entries, the least recently used entry is
+    evicted when it's full, and every entry expires after `ttl` seconds.
+
+    Every write executed through the decorator invalidates the entries of the
+    affected paths, their sub-paths and their parent directories, so the cache
+    is consistent for a single process using the decorator, but a change made
+    by another process is only visible after the entry expires. The cached
+    paths are indexed by their parent directory, so an invalidation only
+    visits the entries of the written paths, their sub-paths and parents. A
+    value loaded while a write invalidated the cache is returned but not
+    cached, because it can be older than the write.
+    """
+
+    DEFAULT_MAX_SIZE: int = 10000  # the default maximum number of entries
+    DEFAULT_TTL: float = 60  # the default time to live of an entry in seconds
+
+    EXISTS: str = "exists"  # the kind of entry for `exists`
+    EXISTS_DIRECTORY: str = "exists_directory"  # the kind of entry for `exists_directory`
+    METADATA: str = "metadata"  # the kind of entry for `get_metadata`
+    STAT: str = "stat"  # the kind of entry for `stat`
+    CHECKSUM: str = "checksum"  # the kind of entry for `checksum`
+
+    def __init__(
+            self,
+            storage_driver: StorageDriver,
+            max_size: int = DEFAULT_MAX_SIZE,
+            ttl: float = DEFAULT_TTL
+    ) -> None:
+        """
+        Initializes a new CachingStorageDriverDecorator.
+
+        Args:
+            storage_driver (StorageDriver): The storage driver to decorate.
+            max_size (int): The maximum number of entries.
+                            Defaults to DEFAULT_MAX_SIZE.
+            ttl (float): The time to live of an entry in seconds.
+                         Defaults to DEFAULT_TTL.
+        """
+        super().__init__(storage_driver)
+        self._sanitizer: PathSanitizer = PathSanitizer(storage_driver.get_separator())
+        self._max_size: int = max_size
+        self._ttl: float = ttl
+        self._entries: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+        self._kinds: dict[str, set[str]] = {}  # the kinds of entry cached for each path
+        self._children: dict[str, set[str]] = {}  # the indexed paths of each parent directory
+        self._generation: int = 0  # the number of invalidations
+        self._lock: threading.Lock = threading.Lock()
+
+    @override
+    def open(self) -> None:
+        self.clear_cache()
+        self._storage_driver.open()
+
+    @override
+    def close(self) -> None:
+        self.clear_cache()
+        self._storage_driver.close()
+
+    @override
+    def flush(self) -> None:
+        try:
+            self._storage_driver.flush()
+        finally:
+            self.clear_cache()  # any cached file can have flushed content
+
+    @override
+    def get(self, file: str) -> Optional[bytes]:
+        return self._storage_driver.get(file)
+
+    @override
+    def get_as_input_stream(self, file: str) -> Optional[BufferedReader]:
+        return self._storage_driver.get_as_input_stream(file)
+
+    @override
+    def get_range(self, file: str, offset: int, length: Optional[int] = None) -> Optional[bytes]:
+        return self._storage_driver.get_range(file, offset, length)
+
+    @override
+    def get_range_as_input_stream(
+        self,
+        file: str,
+        offset: int,
+        length: Optional[int] = None
+    ) -> Optional[BufferedReader]:
+        return self._storage_driver.get_range_as_input_stream(file, offset, length)
+
+    @override
+    def get_local_path(self, file: str) -> Optional[str]:
+        return self._storage_driver.get_local_path(file)
+
+    @override
+    def exists(self, file: str) -> bool:
+        return self._get_or_load(
+            CachingStorageDriverDecorator.EXISTS,
+            file,
+            self._storage_driver.exists
+        )
+
+    @override
+    def put_file(self, source: bytes | str | BufferedReader, directory: str) -> Optional[str]:
+        file: Optional[str] = self._storage_driver.put_file(source, directory)
+        self._invalidate(directory if file is None else self._sanitizer.concat(directory, file))
+        return file
+
+    @override
+    def put_file_as(self, source: bytes | str | BufferedReader, file: str) -> bool:
+        try:
+            return self._storage_driver.put_file_as(source, file)
+        finally:
+            self._invalidate(file)
+
+    @override
+    def append(self, source: bytes, file: str) -> bool:
+        try:
+            return self._storage_driver.append(source, file)
+        finally:
+            self._invalidate(file)
+
+    @override
+    def copy(
+        self,
+        source: str,
+        target: str,
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
+    ) -> bool:
+        try:
+            if not target_storage_driver:
+                return self._storage_driver.copy(source, target, skip_unchanged=skip_unchanged)
+
+            return self._storage_driver.copy(
+                source,
+                target,
+                target_storage_driver,
+                skip_unchanged=skip_unchanged
+            )
+        finally:
+            self._invalidate(target)
+
+    @override
+    def move(
+        self,
+        source: str,
+        target: str,
+        target_storage_driver: Optional['StorageDriver'] = None
+    ) -> bool:
+        try:
+            if not target_storage_driver:
+                return self._storage_driver.move(source, target)
+
+            return self._storage_driver.move(source, target, target_storage_driver)
+        finally:
+            self._invalidate(source, target)
+
+    @override
+    def delete(self, file: str) -> bool:
+        try:
+            return self._storage_driver.delete(file)
+        finally:
+            self._invalidate(file)
+
+    @override
+    def rename(self, source: str, target: str) -> bool:
+        try:
+            return self._storage_driver.rename(source, target)
+        finally:
+            self._invalidate(source, target)
+
+    @override
+    def files(self, directory: str) -> list[str]:
+        return self._storage_driver.files(directory)
+
+    @override
+    def all_files(self, directory: str) -> list[str]:
+        return self._storage_driver.all_files(directory)
+
+    @override
+    def directories(self, directory: str) -> list[str]:
+        return self._storage_driver.directories(directory)
+
+    @override
+    def all_directories(self, directory: str) -> list[str]:
+        return self._storage_driver.all_directories(directory)
+
+    @override
+    def iter_files(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        return self._storage_driver.iter_files(directory, page_size, page_token)
+
+    @override
+    def iter_all_files(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        return self._storage_driver.iter_all_files(directory, page_size, page_token)
+
+    @override
+    def iter_directories(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        return self._storage_driver.iter_directories(directory, page_size, page_token)
+
+    @override
+    def iter_all_directories(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        return self._storage_driver.iter_all_directories(directory, page_size, page_token)
+
+    @override
+    def exists_directory(self, directory: str) -> bool:
+        return self._get_or_load(
+            CachingStorageDriverDecorator.EXISTS_DIRECTORY,
+            directory,
+            self._storage_driver.exists_directory
+        )
+
+    @override
+    def copy_directory(
+        self,
+        source: str,
+        target: str,
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
+    ) -> bool:
+        try:
+            if not target_storage_driver:
+                return self._storage_driver.copy_directory(
+                    source,
+                    target,
+                    skip_unchanged=skip_unchanged
+                )
+
+            return self._storage_driver.copy_directory(
+                source,
+                target,
+                target_storage_driver,
+                skip_unchanged=skip_unchanged
+            )
+        finally:
+            self._invalidate(target)
+
+    @override
+    def move_directory(
+        self,
+        source: str,
+        target: str,
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
+    ) -> bool:
+        try:
+            if not target_storage_driver:
+                return self._storage_driver.move_directory(
+                    source,
+                    target,
+                    skip_unchanged=skip_unchanged
+                )
+
+            return self._storage_driver.move_directory(
+                source,
+                target,
+                target_storage_driver,
+                skip_unchanged=skip_unchanged
+            )
+        finally:
+            self._invalidate(source, target)
+
+    @override
+    def transfer_directory(
+        self,
+        source: str,
+        target: str,
+        remove_source: bool = False,
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
+    ) -> Optional[TransferResult]:
+        try:
+            return self._storage_driver.transfer_directory(
+                source,
+                target,
+                remove_source,
+                target_storage_driver,
+                skip_unchanged=skip_unchanged
+            )
+        finally:
+            if remove_source:
+                self._invalidate(source, target)
+            else:
+                self._invalidate(target)
+
+    @override
+    def make_directory(self, directory: str) -> bool:
+        try:
+            return self._storage_driver.make_directory(directory)
+        finally:
+            self._invalidate(directory)
+
+    @override
+    def delete_directory(self, directory: str) -> bool:
+        try:
+            return self._storage_driver.delete_directory(directory)
+        finally:
+            self._invalidate(directory)
+
+    @override
+    def rename_directory(self, source: str, target: str) -> bool:
+        try:
+            return self._storage_driver.rename_directory(source, target)
+        finally:
+            self._invalidate(source, target)
+
+    @override
+    def get_metadata(self, path: str) -> Optional[Metadata]:
+        return self._get_or_load(
+            CachingStorageDriverDecorator.METADATA,
+            path,
+            self._storage_driver.get_metadata
+        )
+
+    @override
+    def stat(self, path: str) -> Stat:
+        return self._get_or_load(
+            CachingStorageDriverDecorator.STAT,
+            path,
+            self._storage_driver.stat
+        )
+
+    @override
+    def checksum(self, file: str) -> Optional[Checksum]:
+        return self._get_or_load(
+            CachingStorageDriverDecorator.CHECKSUM,
+            file,
+            self._storage_driver.checksum
+        )
+
+    @override
+    def list_with_metadata(
+            self,
+            directory: str,
+            recursive: bool = False
+    ) -> list[tuple[str, Metadata]]:
+        return self._storage_driver.list_with_metadata(directory, recursive)
+
+    @override
+    def exists_many(self, files: list[str]) -> list[BulkResult[bool]]:
+        return self._get_or_load_many(
+            CachingStorageDriverDecorator.EXISTS,
+            files,
+            self._storage_driver.exists_many
+        )
+
+    @override
+    def get_many(self, files: list[str]) -> list[BulkResult[Optional[bytes]]]:
+        return self._storage_driver.get_many(files)
+
+    @override
+    def put_many(self, sources: dict[str, bytes | str | BufferedReader]) -> list[BulkResult[bool]]:
+        try:
+            return self._storage_driver.put_many(sources)
+        finally:
+            self._invalidate(*sources.keys())
+
+    @override
+    def delete_many(self, files: list[str]) -> list[BulkResult[bool]]:
+        try:
+            return self._storage_driver.delete_many(files)
+        finally:
+            self._invalidate(*files)
+
+    @override
+    def get_metadata_many(self, paths: list[str]) -> list[BulkResult[Optional[Metadata]]]:
+        return self._get_or_load_many(
+            CachingStorageDriverDecorator.METADATA,
+            paths,
+            self._storage_driver.get_metadata_many
+        )
+
+    @override
+    def get_root(self) -> str:
+        return self._storage_driver.get_root()
+
+    @override
+    def get_separator(self) -> DirectorySeparator:
+        return self._storage_driver.get_separator()
+
+    def clear_cache(self) -> None:
+        """
+        Removes all the entries of the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._kinds.clear()
+            self._children.clear()
+            self._generation += 1
+
+    def _get_or_load(self, kind: str, path: str, load: Callable[[str], V]) -> V:
+        """
+        Gets the value of the `kind` of entry for `path` from the cache, or
+        loads it with `load` and caches it if it isn't cached or it's expired,
+        unless the cache was invalidated while it was loaded.
+
+        Args:
+            kind (str): The kind of entry.
+            path (str): The path.
+            load (Callable[[str], V]): The process to load the value.
+
+        Returns:
+            V: The value.
+        """
+        key: tuple[str, str] = (kind, self._sanitizer.sanitize(path, True))
+        found, value = self._get_from_cache(key)
+
+        if found:
+            return value  # type: ignore[no-any-return]
+
+        generation: int = self._generation
+        value = load(path)
+        self._put_in_cache(key, value, generation)
+        return value  # type: ignore[no-any-return]
+
+    def _get_or_load_many(
+            self,
+            kind: str,
+            paths: list[str],
+            load: Callable[[list[str]], list[BulkResult[V]]]
+    ) -> list[BulkResult[V]]:
+        """
+        Gets the value of the `kind` of entry for each path in `paths` from the
+        cache, the paths that aren't cached are loaded with a single call to
+        `load` and the successful results are cached, unless the cache was
+        invalidated while they were loaded.
+
+        Args:
+            kind (str): The kind of entry.
+            paths (list[str]): The paths.
+            load (Callable[[list[str]], list[BulkResult[V]]]): The process to load
+                                                               the values.
+
+        Returns:
+            list[BulkResult[V]]: The result for each path, in the same order as `paths`.
+        """
+        results: list[Optional[BulkResult[V]]] = []
+        paths_to_load: list[str] = []
+
+        for path in paths:
+            found, value = self._get_from_cache((kind, self._sanitizer.sanitize(path, True)))
+            results.append(BulkResult(path, value) if found else None)
+
+            if not found:
+                paths_to_load.append(path)
+
+        generation: int = self._generation
+        loaded_results: Iterator[BulkResult[V]] = iter(load(paths_to_load) if paths_to_load else [])
+
+        for index, result in enumerate(results):
+            if result is None:
+                loaded_result: BulkResult[V] = next(loaded_results)
+                results[index] = loaded_result
+
+                if loaded_result.succeeded:
+                    self._put_in_cache(
+                        (kind, self._sanitizer.sanitize(loaded_result.path, True)),
+                        loaded_result.value,
+                        generation
+                    )
+
+        return [result for result in results if result is not None]
+
+    def _get_from_cache(self, key: tuple[str, str]) -> tuple[bool, Any]:
+        """
+        Gets the value of `key` and marks it as the most recently used, an
+        expired entry is removed.
+
+        Args:
+            key (tuple[str, str]): The kind of entry and the sanitized path.
+
+        Returns:
+            tuple[bool, Any]: Whether the entry was found and its value.
+        """
+        with self._lock:
+            entry: Optional[tuple[float, Any]] = self._entries.get(key)
+
+            if entry is None:  # entry doesn't exist
+                return False, None
+
+            if entry[0] <= time.monotonic():  # entry is expired
+                self._remove_entry(key)
+                return False, None
+
+            self._entries.move_to_end(key)
+            return True, entry[1]
+
+    def _put_in_cache(self, key: tuple[str, str], value: Any, generation: int) -> None:
+        """
+        Puts the `value` of `key` as the most recently used entry, if the cache
+        is full the least recently used entry is evicted.
+
+        If the cache was invalidated after `generation` the value isn't cached,
+        it was loaded before a write that could change it.
+
+        Args:
+            key (tuple[str, str]): The kind of entry and the sanitized path.
+            value (Any): The value.
+            generation (int): The number of invalidations before loading the value.
+        """
+        with self._lock:
+            if generation != self._generation:  # invalidated while it was loaded
+                return
+
+            if key not in self._entries:
+                self._kinds.setdefault(key[1], set()).add(key[0])
+                self._index(key[1])
+
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._remove_entry(next(iter(self._entries)))
+
+    def _invalidate(self, *paths: str) -> None:
+        """
+        Removes the entries of each path in `paths`, its sub-paths and its
+        parent directories (the root included), a write can change the
+        existence of the parent directories and their size.
+
+        The sub-paths are found with the index of the cached paths by parent
+        directory, so the cost doesn't depend on the number of cached entries.
+
+        Args:
+            paths (str): The written paths.
+        """
+        sanitized_paths: list[str] = [self._sanitizer.sanitize(path, True) for path in paths]
+
+        with self._lock:
+            self._generation += 1
+
+            if "" in sanitized_paths:  # the root contains every path
+                self._entries.clear()
+                self._kinds.clear()
+                self._children.clear()
+                return
+
+            parents: set[str] = set()
+
+            for path in sanitized_paths:
+                self._remove_entries(self._get_indexed_paths(path))
+
+                while path:
+                    path = self._sanitizer.get_parent(path)
+
+                    if path in parents:  # the next parents are already invalidated
+                        break
+
+                    parents.add(path)
+                    self._remove_entries([path])
+
+    def _index(self, path: str) -> None:
+        """
+        Adds `path` and its parent directories to the index of the cached paths
+        by parent directory, up to the first one already indexed.
+
+        Args:
+            path (str): The sanitized path.
+        """
+        while path:
+            parent: str = self._sanitizer.get_parent(path)
+            children: set[str] = self._children.setdefault(parent, set())
+
+            if path in children:  # the next parents are already indexed
+                return
+
+            children.add(path)
+            path = parent
+
+    def _get_indexed_paths(self, path: str) -> list[str]:
+        """
+        Gets `path` and its indexed sub-paths.
+
+        Args:
+            path (str): The sanitized path.
+
+        Returns:
+            list[str]: The path and its sub-paths.
+        """
+        paths: list[str] = [path]
+        index: int = 0
+
+        while index < len(paths):
+            paths.extend(self._children.get(paths[index], ()))
+            index += 1
+
+        return paths
+
+    def _remove_entries(self, paths: list[str]) -> None:
+        """
+        Removes every kind of entry of each path in `paths`.
+
+        Args:
+            paths (list[str]): The sanitized paths.
+        """
+        for path in paths:
+            for kind in list(self._kinds.get(path, ())):
+                self._remove_entry((kind, path))
+
+    def _remove_entry(self, key: tuple[str, str]) -> None:
+        """
+        Removes the entry of `key`, a path without entries and without indexed
+        sub-paths is removed from the index, as well as its parent directories
+        in the same situation.
+
+        Args:
+            key (tuple[str, str]): The kind of entry and the sanitized path.
+        """
+        del self._entries[key]
+        kind, path = key
+        kinds: set[str] = self._kinds[path]
+        kinds.discard(kind)
+
+        if kinds:  # the path has other kinds of entry
+            return
+
+        del self._kinds[path]
+
+        while path and path not in self._kinds and path not in self._children:
+            parent: str = self._sanitizer.get_parent(path)
+            children: set[str] = self._children[parent]
+            children.discard(path)
+
+            if children:  # the parent has other indexed paths
+                return
+
+            del self._children[parent]
+            path = parent
@@ -0,0 +1,694 @@
+# -*- coding: utf-8 -*-
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: disk_cache_storage_driver_decorator.py
+Author: Toku
+"""
+import base64
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+from io import BufferedReader
+import os
+import tempfile
+import threading
+import uuid
+from typing import Iterator, Optional, final
+from overrides import override
+from toku.storage.driver.api import PathSanitizer
+from toku.storage.driver.api import DirectorySeparator
+from toku.storage.driver.api import Metadata
+from toku.storage.driver.api import Stat
+from toku.storage.driver.api import Checksum
+from toku.storage.driver.api import TransferResult
+from toku.storage.driver.api import BulkResult
+from toku.storage.driver.api import Page
+from toku.storage.driver.api import FileSliceIO
+from toku.storage.driver.api import StorageDriver
+from toku.storage.driver.api import StorageDriverDecorator
+
+
+@dataclass
+class DiskCacheEntry:
+    """
+    Provides the information of a file kept in the disk cache.
+    """
+
+    path: str  # the full path of the copy in the cache directory
+    checksum: Checksum  # the checksum of the file when it was copied
+
+    @property
+    def size(self) -> int:
+        """
+        Gets the size of the copy.
+
+        Returns:
+            int: The size in bytes.
+        """
+        return self.checksum.size
+
+
+@final
+class DiskCacheStorageDriverDecorator(StorageDriverDecorator):
+    """
+    Provides a decorator to keep a copy of the files read with `get` and
+    `get_as_input_stream` in a local directory, so a file read again is read
+    from the local disk instead of downloading it. `get_range` and
+    `get_range_as_input_stream` read the range from the copy if the file is
+    cached, otherwise the range is read from the storage driver without
+    downloading the whole file.
+
+    Before using a copy, it's validated against the checksum of the file
+    (see `Checksum.matches`), so a file changed by another process is
+    downloaded again even if its size and last modified second are the same.
+    A file without any hash in its checksum can't be validated, and a file
+    that already has a local path (see `get_local_path`) doesn't need a copy,
+    so both of them are always read from the storage driver. The copies use
+    up to `max_bytes` bytes, the least recently used copies are removed when
+    the limit is exceeded, and a file bigger than `max_bytes` is never copied.
+
+    A file is downloaded to a temporary file and then moved to its final name,
+    so a reader never sees a partial copy (a temporary file of a failed
+    download is removed), and only one thread downloads the
+    same file at the same time, the rest of them wait to use its copy.
+
+    Every write executed through the decorator removes the copies of the
+    affected paths and their sub-paths.
+
+    The names of the copies start with an identifier of the instance, so
+    several instances can share the cache directory, each one only removes
+    its own copies (the copies of a killed process are left in the directory).
+    """
+
+    DEFAULT_MAX_BYTES: int = 1024 * 1024 * 1024  # 1 GB
+    CACHE_FILE_SUFFIX: str = ".cache"  # the suffix of the copies in the cache directory
+    CHUNK_SIZE: int = 1024 * 1024  # 1 MB copied at a time while downloading a file
+
+    def __init__(
+            self,
+            storage_driver: StorageDriver,
+            cache_directory: str,
+            max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        """
+        Initializes a new DiskCacheStorageDriverDecorator.
+
+        Args:
+            storage_driver (StorageDriver): The storage driver to decorate.
+            cache_directory (str): The local directory to keep the copies,
+                                   it's created if it doesn't exist and it
+                                   can be shared by several instances.
+            max_bytes (int): The maximum number of bytes of the copies.
+                             Defaults to DEFAULT_MAX_BYTES.
+        """
+        super().__init__(storage_driver)
+        self._sanitizer: PathSanitizer = PathSanitizer(storage_driver.get_separator())
+        self._cache_directory: str = cache_directory
+        self._prefix: str = f"{uuid.uuid4().hex}-"  # the prefix of the copies of the instance
+        self._max_bytes: int = max_bytes
+        self._entries: OrderedDict[str, DiskCacheEntry] = OrderedDict()
+        self._size: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self._fill_locks: dict[str, threading.Lock] = {}
+
+    @override
+    def open(self) -> None:
+        self._storage_driver.open()
+        os.makedirs(self._cache_directory, exist_ok=True)
+        self.clear_cache()
+
+    @override
+    def close(self) -> None:
+        try:
+            self.clear_cache()
+        finally:
+            self._storage_driver.close()
+
+    @override
+    def flush(self) -> None:
+        # a copy is validated with the checksum, so a flushed file isn't served stale
+        self._storage_driver.flush()
+
+    @override
+    def get(self, file: str) -> Optional[bytes]:
+        cached_file: Optional[BufferedReader] = self._open_copy(file)
+
+        if cached_file is None:
+            return self._storage_driver.get(file)
+
+        with cached_file:
+            return cached_file.read()
+
+    @override
+    def get_as_input_stream(self, file: str) -> Optional[BufferedReader]:
+        cached_file: Optional[BufferedReader] = self._open_copy(file)
+        if cached_file is None:
+            return self._storage_driver.get_as_input_stream(file)
+
+        return cached_file
+
+    @override
+    def get_range(self, file: str, offset: int, length: Optional[int] = None) -> Optional[bytes]:
+        if offset < 0 or (length is not None and length < 0):  # range is not valid
+            return self._storage_driver.get_range(file, offset, length)
+
+        cached_file: Optional[BufferedReader] = self._open_copy(file, False)
+
+        if cached_file is None:
+            return self._storage_driver.get_range(file, offset, length)
+
+        with cached_file:
+            cached_file.seek(offset)
+            return cached_file.read(-1 if length is None else length)
+
+    @override
+    def get_range_as_input_stream(
+        self,
+        file: str,
+        offset: int,
+        length: Optional[int] = None
+    ) -> Optional[BufferedReader]:
+        if offset < 0 or (length is not None and length < 0):  # range is not valid
+            return self._storage_driver.get_range_as_input_stream(file, offset, length)
+
+        cached_file: Optional[BufferedReader] = self._open_copy(file, False)
+
+        if cached_file is None:
+            return self._storage_driver.get_range_as_input_stream(file, offset, length)
+
+        return BufferedReader(FileSliceIO(cached_file, offset, length))
+
+    @override
+    def get_local_path(self, file: str) -> Optional[str]:
+        return self._storage_driver.get_local_path(file)
+
+    @override
+    def exists(self, file: str) -> bool:
+        return self._storage_driver.exists(file)
+
+    @override
+    def put_file(self, source: bytes | str | BufferedReader, directory: str) -> Optional[str]:
+        return self._storage_driver.put_file(source, directory)
+
+    @override
+    def put_file_as(self, source: bytes | str | BufferedReader, file: str) -> bool:
+        try:
+            return self._storage_driver.put_file_as(source, file)
+        finally:
+            self._invalidate(file)
+
+    @override
+    def append(self, source: bytes, file: str) -> bool:
+        try:
+            return self._storage_driver.append(source, file)
+        finally:
+            self._invalidate(file)
+
+    @override
+    def copy(
+        self,
+        source: str,
+        target: str,
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
+    ) -> bool:
+        try:
+            if not target_storage_driver:
+                return self._storage_driver.copy(source, target, skip_unchanged=skip_unchanged)
+
+            return self._storage_driver.copy(
+                source,
+                target,
+                target_storage_driver,
+                skip_unchanged=skip_unchanged
+            )
+        finally:
+            self._invalidate(target)
+
+    @override
+    def move(
+        self,
+        source: str,
+        target: str,
+        target_storage_driver: Optional['StorageDriver'] = None
+    ) -> bool:
+        try:
+            if not target_storage_driver:
+                return self._storage_driver.move(source, target)
+
+            return self._storage_driver.move(source, target, target_storage_driver)
+        finally:
+            self._invalidate(source, target)
+
+    @override
+    def delete(self, file: str) -> bool:
+        try:
+            return self._storage_driver.delete(file)
+        finally:
+            self._invalidate(file)
+
+    @override
+    def rename(self, source: str, target: str) -> bool:
+        try:
+            return self._storage_driver.rename(source, target)
+        finally:
+            self._invalidate(source, target)
+
+    @override
+    def files(self, directory: str) -> list[str]:
+        return self._storage_driver.files(directory)
+
+    @override
+    def all_files(self, directory: str) -> list[str]:
+        return self._storage_driver.all_files(directory)
+
+    @override
+    def directories(self, directory: str) -> list[str]:
+        return self._storage_driver.directories(directory)
+
+    @override
+    def all_directories(self, directory: str) -> list[str]:
+        return self._storage_driver.all_directories(directory)
+
+    @override
+    def iter_files(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        return self._storage_driver.iter_files(directory, page_size, page_token)
+
+    @override
+    def iter_all_files(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        return self._storage_driver.iter_all_files(directory, page_size, page_token)
+
+    @override
+    def iter_directories(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        return self._storage_driver.iter_directories(directory, page_size, page_token)
+
+    @override
+    def iter_all_directories(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        return self._storage_driver.iter_all_directories(directory, page_size, page_token)
+
+    @override
+    def exists_directory(self, directory: str) -> bool:
+        return self._storage_driver.exists_directory(directory)
+
+    @override
+    def copy_directory(
+        self,
+        source: str,
+        target: str,
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
+    ) -> bool:
+        try:
+            if not target_storage_driver:
+                return self._storage_driver.copy_directory(
+                    source,
+                    target,
+                    skip_unchanged=skip_unchanged
+                )
+
+            return self._storage_driver.copy_directory(
+                source,
+                target,
+                target_storage_driver,
+                skip_unchanged=skip_unchanged
+            )
+        finally:
+            self._invalidate(target)
+
+    @override
+    def move_directory(
+        self,
+        source: str,
+        target: str,
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
+    ) -> bool:
+        try:
+            if not target_storage_driver:
+                return self._storage_driver.move_directory(
+                    source,
+                    target,
+                    skip_unchanged=skip_unchanged
+                )
+
+            return self._storage_driver.move_directory(
+                source,
+                target,
+                target_storage_driver,
+                skip_unchanged=skip_unchanged
+            )
+        finally:
+            self._invalidate(source, target)
+
+    @override
+    def transfer_directory(
+        self,
+        source: str,
+        target: str,
+        remove_source: bool = False,
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
+    ) -> Optional[TransferResult]:
+        try:
+            return self._storage_driver.transfer_directory(
+                source,
+                target,
+                remove_source,
+                target_storage_driver,
+                skip_unchanged=skip_unchanged
+            )
+        finally:
+            if remove_source:
+                self._invalidate(source, target)
+            else:
+                self._invalidate(target)
+
+    @override
+    def make_directory(self, directory: str) -> bool:
+        return self._storage_driver.make_directory(directory)
+
+    @override
+    def delete_directory(self, directory: str) -> bool:
+        try:
+            return self._storage_driver.delete_directory(directory)
+        finally:
+            self._invalidate(directory)
+
+    @override
+    def rename_directory(self, source: str, target: str) -> bool:
+        try:
+            return self._storage_driver.rename_directory(source, target)
+        finally:
+            self._invalidate(source, target)
+
+    @override
+    def get_metadata(self, path: str) -> Optional[Metadata]:
+        return self._storage_driver.get_metadata(path)
+
+    @override
+    def stat(self, path: str) -> Stat:
+        return self._storage_driver.stat(path)
+
+    @override
+    def checksum(self, file: str) -> Optional[Checksum]:
+        return self._storage_driver.checksum(file)
+
+    @override
+    def list_with_metadata(
+            self,
+            directory: str,
+            recursive: bool = False
+    ) -> list[tuple[str, Metadata]]:
+        return self._storage_driver.list_with_metadata(directory, recursive)
+
+    @override
+    def exists_many(self, files: list[str]) -> list[BulkResult[bool]]:
+        return self._storage_driver.exists_many(files)
+
+    @override
+    def get_many(self, files: list[str]) -> list[BulkResult[Optional[bytes]]]:
+        return self._storage_driver.get_many(files)
+
+    @override
+    def put_many(self, sources: dict[str, bytes | str | BufferedReader]) -> list[BulkResult[bool]]:
+        try:
+            return self._storage_driver.put_many(sources)
+        finally:
+            self._invalidate(*sources.keys())
+
+    @override
+    def delete_many(self, files: list[str]) -> list[BulkResult[bool]]:
+        try:
+            return self._storage_driver.delete_many(files)
+        finally:
+            self._invalidate(*files)
+
+    @override
+    def get_metadata_many(self, paths: list[str]) -> list[BulkResult[Optional[Metadata]]]:
+        return self._storage_driver.get_metadata_many(paths)
+
+    @override
+    def get_root(self) -> str:
+        return self._storage_driver.get_root()
+
+    @override
+    def get_separator(self) -> DirectorySeparator:
+        return self._storage_driver.get_separator()
+
+    def clear_cache(self) -> None:
+        """
+        Removes all the copies of the instance, the copies of other instances
+        sharing the cache directory are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+            if not os.path.isdir(self._cache_directory):
+                return
+
+            for entry in os.scandir(self._cache_directory):
+                if entry.name.startswith(self._prefix) and \
+                   entry.name.endswith(DiskCacheStorageDriverDecorator.CACHE_FILE_SUFFIX):
+                    self._remove_file(entry.path)
+
+    def _open_copy(self, file: str, fill: bool = True) -> Optional[BufferedReader]:
+        """
+        Opens the copy of `file`, it's downloaded if it isn't in the cache or
+        it's outdated and `fill` is True.
+
+        The copy is opened while the cache is locked, so it can be read even if
+        it's evicted after that.
+
+        Args:
+            file (str): Full file path.
+            fill (bool): Whether to download the file if there isn't a valid copy.
+                         Defaults to True.
+
+        Returns:
+            Optional[BufferedReader]: The copy or None if `file` doesn't exist,
+                                      it can't be cached or it isn't cached
+                                      and `fill` is False.
+        """
+        if self._storage_driver.get_local_path(file) is not None:  # file is already local
+            return None
+
+        key: str = self._sanitizer.sanitize(file, True)
+        checksum: Optional[Checksum] = self._storage_driver.checksum(file)
+
+        if checksum is None:  # file doesn't exist
+            self._invalidate(file)
+            return None
+
+        if checksum.md5 is None and checksum.crc32c is None:  # copy can't be validated
+            return None
+
+        if checksum.size > self._max_bytes:  # file is too big
+            return None
+
+        cached_file: Optional[BufferedReader] = self._open_valid_copy(key, checksum)
+
+        if cached_file is not None or not fill:
+            return cached_file
+
+        # only a thread downloads the file, the rest of them wait and use
+        # the copy downloaded by that thread
+        with self._lock:
+            fill_lock: threading.Lock = self._fill_locks.setdefault(key, threading.Lock())
+
+        with fill_lock:
+            cached_file = self._open_valid_copy(key, checksum)
+
+            if cached_file is None:
+                self._fill(key, file, checksum)
+                cached_file = self._open_valid_copy(key, checksum)
+
+        with self._lock:
+            self._fill_locks.pop(key, None)
+
+        return cached_file
+
+    def _open_valid_copy(self, key: str, checksum: Checksum) -> Optional[BufferedReader]:
+        """
+        Opens the copy of `key` if it's in the cache and its checksum matches
+        `checksum`, an outdated copy is removed.
+
+        Args:
+            key (str): The sanitized file path.
+            checksum (Checksum): The current checksum of the file.
+
+        Returns:
+            Optional[BufferedReader]: The copy or None.
+        """
+        with self._lock:
+            entry: Optional[DiskCacheEntry] = self._entries.get(key)
+
+            if entry is None:  # file is not cached
+                return None
+
+            if not entry.checksum.matches(checksum):  # copy is outdated
+                self._remove_entry(key)
+                return None
+
+            try:
+                cached_file: BufferedReader = open(entry.path, "rb")  # pylint: disable=consider-using-with
+            except FileNotFoundError:  # copy was removed outside the decorator
+                self._remove_entry(key)
+                return None
+
+            self._entries.move_to_end(key)
+            return cached_file
+
+    def _fill(self, key: str, file: str, checksum: Checksum) -> None:
+        """
+        Downloads `file` to a temporary file of the cache directory and moves it
+        to its final name, after that the least recently used copies are
+        removed until the size of the cache is under the limit.
+
+        The download is discarded if its size or its MD5 hash (when `checksum`
+        has it) doesn't match `checksum`, because the file changed while
+        downloading it.
+
+        Args:
+            key (str): The sanitized file path.
+            file (str): Full file path.
+            checksum (Checksum): The checksum of the file before downloading it.
+        """
+        input_stream: Optional[BufferedReader] = self._storage_driver.get_as_input_stream(file)
+
+        if input_stream is None:  # file was deleted
+            return
+
+        path: str = os.path.join(
+            self._cache_directory,
+            f"{self._prefix}{hashlib.sha256(key.encode('UTF-8')).hexdigest()}"
+            f"{DiskCacheStorageDriverDecorator.CACHE_FILE_SUFFIX}"
+        )
+
+        # the temporary file has the prefix and the suffix of the copies, so
+        # `clear_cache` removes it if the download is interrupted
+        temp_path: Optional[str] = None
+        md5 = hashlib.md5(usedforsecurity=False)
+        chunk_size: int = DiskCacheStorageDriverDecorator.CHUNK_SIZE
+        size: int = 0
+
+        try:
+            with input_stream, tempfile.NamedTemporaryFile(
+                dir=self._cache_directory,
+                prefix=self._prefix,
+                suffix=f".tmp{DiskCacheStorageDriverDecorator.CACHE_FILE_SUFFIX}",
+                delete=False
+            ) as temp_file:
+                temp_path = temp_file.name
+
+                for chunk in iter(lambda: input_stream.read(chunk_size), b""):
+                    md5.update(chunk)
+                    temp_file.write(chunk)
+                    size += len(chunk)
+
+            if size != checksum.size or (  # file changed while downloading it
+                checksum.md5 is not None and
+                checksum.md5 != base64.b64encode(md5.digest()).decode("utf-8")
+            ):
+                return
+
+            os.replace(temp_path, path)
+            temp_path = None  # moved to its final name
+        finally:
+            if temp_path is not None:
+                self._remove_file(temp_path)
+
+        with self._lock:
+            self._remove_entry(key, False)
+            self._entries[key] = DiskCacheEntry(path, checksum)
+            self._size += size
+
+            while self._size > self._max_bytes:
+                self._remove_entry(next(iter(self._entries)))
+
+    def _invalidate(self, *paths: str) -> None:
+        """
+        Removes the copies of each path in `paths` and its sub-paths.
+
+        Args:
+            paths (str): The written paths.
+        """
+        separator: str = self._storage_driver.get_separator().value
+        prefixes: list[str] = [self._sanitizer.sanitize(path, True) for path in paths]
+
+        with self._lock:
+            keys: list[str] = [
+                key
+                for key in self._entries
+                if any(
+                    key == prefix or not prefix or key.startswith(f"{prefix}{separator}")
+                    for prefix in prefixes
+                )
+            ]
+
+            for key in keys:
+                self._remove_entry(key)
+
+    def _remove_entry(self, key: str, remove_file: bool = True) -> None:
+        """
+        Removes the entry of `key` and its copy, the cache must be locked.
+
+        Args:
+            key (str): The sanitized file path.
+            remove_file (bool): Whether to remove the copy. Defaults to True.
+        """
+        entry: Optional[DiskCacheEntry] = self._entries.pop(key, None)
+
+        if entry is None:
+            return
+
+        self._size -= entry.size
+
+        if remove_file:
+            self._remove_file(entry.path)
+
+    @staticmethod
+    def _remove_file(path: str) -> None:
+        """
+        Removes the file `path`, ignoring the errors, a copy opened by a reader
+        can't be removed in some platforms (Windows).
+
+        Args:
+            path (str): The full path.
+        """
+        try:
+            os.remove(path)
+        except OSError:
+            pass
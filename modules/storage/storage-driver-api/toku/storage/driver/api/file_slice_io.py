@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: file_slice_io.py
+Author: Toku
+"""
+from io import BufferedReader, RawIOBase
+import os
+from typing import Optional, final
+
+
+@final
+class FileSliceIO(RawIOBase):
+    """
+    Provides a raw stream to read `length` bytes of a seekable binary file from
+    `offset` as if they were a whole file, the position 0 of the stream is the
+    byte at `offset` and the end of the stream is the end of the slice, so a
+    part of a file is read without copying it (e.g. a resumable upload
+    requires a stream at its beginning). Closing the stream closes the file.
+    """
+
+    def __init__(self, file: BufferedReader, offset: int, length: Optional[int] = None) -> None:
+        """
+        Initializes a new FileSliceIO.
+
+        Args:
+            file (BufferedReader): The seekable binary file.
+            offset (int): The position of the first byte of the slice in the file.
+            length (Optional[int]): The number of bytes of the slice.
+                                    Defaults to None (until the end of the file).
+        """
+        super().__init__()
+        self._file: BufferedReader = file
+        self._offset: int = offset
+        self._length: int = length if length is not None else \
+            max(0, file.seek(0, os.SEEK_END) - offset)
+        self._position: int = 0  # the position in the slice
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        size: int = min(len(buffer), self._length - self._position)
+
+        if size <= 0:  # end of the slice
+            return 0
+
+        self._file.seek(self._offset + self._position)
+        read: int = self._file.readinto(memoryview(buffer)[:size])
+        self._position += read
+        return read
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_SET:
+            position: int = offset
+        elif whence == os.SEEK_CUR:
+            position = self._position + offset
+        elif whence == os.SEEK_END:
+            position = self._length + offset
+        else:
+            raise ValueError(f"invalid whence ({whence})")
+
+        if position < 0:
+            raise ValueError(f"negative seek position {position}")
+
+        self._position = position
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+    def close(self) -> None:
+        if not self.closed:
+            self._file.close()
+        super().close()
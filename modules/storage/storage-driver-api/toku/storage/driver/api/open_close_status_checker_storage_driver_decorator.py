@@ -14,10 +14,15 @@ Author: Toku
 """
 from abc import ABC, abstractmethod
 from io import BufferedReader
-from typing import Optional, final
+from typing import Iterator, Optional, final
 from overrides import override
 from toku.storage.driver.api import Status
 from toku.storage.driver.api import Metadata
+from toku.storage.driver.api import Stat
+from toku.storage.driver.api import Checksum
+from toku.storage.driver.api import TransferResult
+from toku.storage.driver.api import BulkResult
+from toku.storage.driver.api import Page
 from toku.storage.driver.api import DirectorySeparator
 from toku.storage.driver.api import StorageDriver
 from toku.storage.driver.api import StorageDriverException
@@ -148,6 +153,11 @@ class OpenCloseStatusCheckerStorageDriverDecorator(StorageDriverDecorator):
         finally:
             self.status_handler.handle_request()
 
+    @override
+    def flush(self) -> None:
+        self.status_handler.check_status(self.opened_status_handler)
+        self._storage_driver.flush()
+
     @override
     def get(self, file: str) -> Optional[bytes]:
         self.status_handler.check_status(self.opened_status_handler)
@@ -158,6 +168,26 @@ class OpenCloseStatusCheckerStorageDriverDecorator(StorageDriverDecorator):
         self.status_handler.check_status(self.opened_status_handler)
         return self._storage_driver.get_as_input_stream(file)
 
+    @override
+    def get_range(self, file: str, offset: int, length: Optional[int] = None) -> Optional[bytes]:
+        self.status_handler.check_status(self.opened_status_handler)
+        return self._storage_driver.get_range(file, offset, length)
+
+    @override
+    def get_range_as_input_stream(
+        self,
+        file: str,
+        offset: int,
+        length: Optional[int] = None
+    ) -> Optional[BufferedReader]:
+        self.status_handler.check_status(self.opened_status_handler)
+        return self._storage_driver.get_range_as_input_stream(file, offset, length)
+
+    @override
+    def get_local_path(self, file: str) -> Optional[str]:
+        self.status_handler.check_status(self.opened_status_handler)
+        return self._storage_driver.get_local_path(file)
+
     @override
     def exists(self, file: str) -> bool:
         self.status_handler.check_status(self.opened_status_handler)
@@ -183,14 +213,21 @@ class OpenCloseStatusCheckerStorageDriverDecorator(StorageDriverDecorator):
         self,
         source: str,
         target: str,
-        target_storage_driver: Optional['StorageDriver'] = None
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
     ) -> bool:
         self.status_handler.check_status(self.opened_status_handler)
 
         if not target_storage_driver:
-            return self._storage_driver.copy(source, target)
+            return self._storage_driver.copy(source, target, skip_unchanged=skip_unchanged)
 
-        return self._storage_driver.copy(source, target, target_storage_driver)
+        return self._storage_driver.copy(
+                source,
+                target,
+                target_storage_driver,
+                skip_unchanged=skip_unchanged
+            )
 
     @override
     def move(
@@ -236,6 +273,46 @@ class OpenCloseStatusCheckerStorageDriverDecorator(StorageDriverDecorator):
         self.status_handler.check_status(self.opened_status_handler)
         return self._storage_driver.all_directories(directory)
 
+    @override
+    def iter_files(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        self.status_handler.check_status(self.opened_status_handler)
+        return self._storage_driver.iter_files(directory, page_size, page_token)
+
+    @override
+    def iter_all_files(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        self.status_handler.check_status(self.opened_status_handler)
+        return self._storage_driver.iter_all_files(directory, page_size, page_token)
+
+    @override
+    def iter_directories(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        self.status_handler.check_status(self.opened_status_handler)
+        return self._storage_driver.iter_directories(directory, page_size, page_token)
+
+    @override
+    def iter_all_directories(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        self.status_handler.check_status(self.opened_status_handler)
+        return self._storage_driver.iter_all_directories(directory, page_size, page_token)
+
     @override
     def exists_directory(self, directory: str) -> bool:
         self.status_handler.check_status(self.opened_status_handler)
@@ -246,26 +323,67 @@ class OpenCloseStatusCheckerStorageDriverDecorator(StorageDriverDecorator):
         self,
         source: str,
         target: str,
-        target_storage_driver: Optional['StorageDriver'] = None
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
     ) -> bool:
         self.status_handler.check_status(self.opened_status_handler)
 
         if not target_storage_driver:
-            return self._storage_driver.copy_directory(source, target)
+            return self._storage_driver.copy_directory(
+                source,
+                target,
+                skip_unchanged=skip_unchanged
+            )
 
-        return self._storage_driver.copy_directory(source, target, target_storage_driver)
+        return self._storage_driver.copy_directory(
+                source,
+                target,
+                target_storage_driver,
+                skip_unchanged=skip_unchanged
+            )
 
     @override
     def move_directory(
         self,
         source: str,
         target: str,
-        target_storage_driver: Optional['StorageDriver'] = None
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
     ) -> bool:
         if not target_storage_driver:
-            return self._storage_driver.move_directory(source, target)
+            return self._storage_driver.move_directory(
+                source,
+                target,
+                skip_unchanged=skip_unchanged
+            )
 
-        return self._storage_driver.move_directory(source, target, target_storage_driver)
+        return self._storage_driver.move_directory(
+                source,
+                target,
+                target_storage_driver,
+                skip_unchanged=skip_unchanged
+            )
+
+    @override
+    def transfer_directory(
+        self,
+        source: str,
+        target: str,
+        remove_source: bool = False,
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
+    ) -> Optional[TransferResult]:
+        self.status_handler.check_status(self.opened_status_handler)
+        return self._storage_driver.transfer_directory(
+            source,
+            target,
+            remove_source,
+            target_storage_driver,
+            skip_unchanged=skip_unchanged
+        )
 
     @override
     def make_directory(self, directory: str) -> bool:
@@ -287,6 +405,50 @@ class OpenCloseStatusCheckerStorageDriverDecorator(StorageDriverDecorator):
         self.status_handler.check_status(self.opened_status_handler)
         return self._storage_driver.get_metadata(path)
 
+    @override
+    def stat(self, path: str) -> Stat:
+        self.status_handler.check_status(self.opened_status_handler)
+        return self._storage_driver.stat(path)
+
+    @override
+    def checksum(self, file: str) -> Optional[Checksum]:
+        self.status_handler.check_status(self.opened_status_handler)
+        return self._storage_driver.checksum(file)
+
+    @override
+    def list_with_metadata(
+            self,
+            directory: str,
+            recursive: bool = False
+    ) -> list[tuple[str, Metadata]]:
+        self.status_handler.check_status(self.opened_status_handler)
+        return self._storage_driver.list_with_metadata(directory, recursive)
+
+    @override
+    def exists_many(self, files: list[str]) -> list[BulkResult[bool]]:
+        self.status_handler.check_status(self.opened_status_handler)
+        return self._storage_driver.exists_many(files)
+
+    @override
+    def get_many(self, files: list[str]) -> list[BulkResult[Optional[bytes]]]:
+        self.status_handler.check_status(self.opened_status_handler)
+        return self._storage_driver.get_many(files)
+
+    @override
+    def put_many(self, sources: dict[str, bytes | str | BufferedReader]) -> list[BulkResult[bool]]:
+        self.status_handler.check_status(self.opened_status_handler)
+        return self._storage_driver.put_many(sources)
+
+    @override
+    def delete_many(self, files: list[str]) -> list[BulkResult[bool]]:
+        self.status_handler.check_status(self.opened_status_handler)
+        return self._storage_driver.delete_many(files)
+
+    @override
+    def get_metadata_many(self, paths: list[str]) -> list[BulkResult[Optional[Metadata]]]:
+        self.status_handler.check_status(self.opened_status_handler)
+        return self._storage_driver.get_metadata_many(paths)
+
     @override
     def get_root(self) -> str:
         return self._storage_driver.get_root()
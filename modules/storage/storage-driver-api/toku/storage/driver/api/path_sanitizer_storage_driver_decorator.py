@@ -13,11 +13,16 @@ Module: path_sanitizer_storage_driver_decorator.py
 Author: Toku
 """
 from io import BufferedReader
-from typing import Optional, final
+from typing import Iterator, Optional, final
 from overrides import override
 from toku.storage.driver.api import PathSanitizer
 from toku.storage.driver.api import DirectorySeparator
 from toku.storage.driver.api import Metadata
+from toku.storage.driver.api import Stat
+from toku.storage.driver.api import Checksum
+from toku.storage.driver.api import TransferResult
+from toku.storage.driver.api import BulkResult
+from toku.storage.driver.api import Page
 from toku.storage.driver.api import StorageDriver
 from toku.storage.driver.api import StorageDriverDecorator
 
@@ -46,6 +51,10 @@ class PathSanitizerStorageDriverDecorator(StorageDriverDecorator):
     def close(self) -> None:
         self._storage_driver.close()
 
+    @override
+    def flush(self) -> None:
+        self._storage_driver.flush()
+
     @override
     def get(self, file: str) -> Optional[bytes]:
         return self._storage_driver.get(self._sanitizer.sanitize(file, True))
@@ -54,6 +63,25 @@ class PathSanitizerStorageDriverDecorator(StorageDriverDecorator):
     def get_as_input_stream(self, file: str) -> Optional[BufferedReader]:
         return self._storage_driver.get_as_input_stream(self._sanitizer.sanitize(file, True))
 
+    @override
+    def get_range(self, file: str, offset: int, length: Optional[int] = None) -> Optional[bytes]:
+        return self._storage_driver.get_range(self._sanitizer.sanitize(file, True), offset, length)
+
+    @override
+    def get_range_as_input_stream(
+        self,
+        file: str,
+        offset: int,
+        length: Optional[int] = None
+    ) -> Optional[BufferedReader]:
+        return self._storage_driver.get_range_as_input_stream(
+            self._sanitizer.sanitize(file, True), offset, length
+        )
+
+    @override
+    def get_local_path(self, file: str) -> Optional[str]:
+        return self._storage_driver.get_local_path(self._sanitizer.sanitize(file, True))
+
     @override
     def exists(self, file: str) -> bool:
         return self._storage_driver.exists(self._sanitizer.sanitize(file, True))
@@ -85,18 +113,22 @@ class PathSanitizerStorageDriverDecorator(StorageDriverDecorator):
         self,
         source: str,
         target: str,
-        target_storage_driver: Optional['StorageDriver'] = None
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
     ) -> bool:
         if not target_storage_driver:
             return self._storage_driver.copy(
                 self._sanitizer.sanitize(source, True),
-                self._sanitizer.sanitize(target, True)
+                self._sanitizer.sanitize(target, True),
+                skip_unchanged=skip_unchanged
             )
 
         return self._storage_driver.copy(
             self._sanitizer.sanitize(source, True),
             self._sanitizer.sanitize(target, True),
-            target_storage_driver
+            target_storage_driver,
+            skip_unchanged=skip_unchanged
         )
 
     @override
@@ -153,6 +185,66 @@ class PathSanitizerStorageDriverDecorator(StorageDriverDecorator):
         directories: list[str] = self._storage_driver.all_directories(sanitized_directory)
         return [self._sanitizer.sanitize(directory, True) for directory in directories]
 
+    @override
+    def iter_files(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        sanitized_directory: str = self._sanitizer.sanitize(directory, True)
+        pages: Iterator[Page] = self._storage_driver.iter_files(
+            sanitized_directory,
+            page_size,
+            page_token
+        )
+        return self._sanitize_pages(pages)
+
+    @override
+    def iter_all_files(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        sanitized_directory: str = self._sanitizer.sanitize(directory, True)
+        pages: Iterator[Page] = self._storage_driver.iter_all_files(
+            sanitized_directory,
+            page_size,
+            page_token
+        )
+        return self._sanitize_pages(pages)
+
+    @override
+    def iter_directories(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        sanitized_directory: str = self._sanitizer.sanitize(directory, True)
+        pages: Iterator[Page] = self._storage_driver.iter_directories(
+            sanitized_directory,
+            page_size,
+            page_token
+        )
+        return self._sanitize_pages(pages)
+
+    @override
+    def iter_all_directories(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        sanitized_directory: str = self._sanitizer.sanitize(directory, True)
+        pages: Iterator[Page] = self._storage_driver.iter_all_directories(
+            sanitized_directory,
+            page_size,
+            page_token
+        )
+        return self._sanitize_pages(pages)
+
     @override
     def exists_directory(self, directory: str) -> bool:
         return self._storage_driver.exists_directory(self._sanitizer.sanitize(directory, True))
@@ -162,18 +254,22 @@ class PathSanitizerStorageDriverDecorator(StorageDriverDecorator):
         self,
         source: str,
         target: str,
-        target_storage_driver: Optional['StorageDriver'] = None
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
     ) -> bool:
         if not target_storage_driver:
             return self._storage_driver.copy_directory(
                 self._sanitizer.sanitize(source, True),
-                self._sanitizer.sanitize(target, True)
+                self._sanitizer.sanitize(target, True),
+                skip_unchanged=skip_unchanged
             )
 
         return self._storage_driver.copy_directory(
             self._sanitizer.sanitize(source, True),
             self._sanitizer.sanitize(target, True),
-            target_storage_driver
+            target_storage_driver,
+            skip_unchanged=skip_unchanged
         )
 
     @override
@@ -181,18 +277,40 @@ class PathSanitizerStorageDriverDecorator(StorageDriverDecorator):
         self,
         source: str,
         target: str,
-        target_storage_driver: Optional['StorageDriver'] = None
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
     ) -> bool:
         if not target_storage_driver:
             return self._storage_driver.move_directory(
                 self._sanitizer.sanitize(source, True),
-                self._sanitizer.sanitize(target, True)
+                self._sanitizer.sanitize(target, True),
+                skip_unchanged=skip_unchanged
             )
 
         return self._storage_driver.move_directory(
             self._sanitizer.sanitize(source, True),
             self._sanitizer.sanitize(target, True),
-            target_storage_driver
+            target_storage_driver,
+            skip_unchanged=skip_unchanged
+        )
+
+    @override
+    def transfer_directory(
+        self,
+        source: str,
+        target: str,
+        remove_source: bool = False,
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
+    ) -> Optional[TransferResult]:
+        return self._storage_driver.transfer_directory(
+            self._sanitizer.sanitize(source, True),
+            self._sanitizer.sanitize(target, True),
+            remove_source,
+            target_storage_driver,
+            skip_unchanged=skip_unchanged
         )
 
     @override
@@ -213,6 +331,59 @@ class PathSanitizerStorageDriverDecorator(StorageDriverDecorator):
     def get_metadata(self, path: str) -> Optional[Metadata]:
         return self._storage_driver.get_metadata(self._sanitizer.sanitize(path, True))
 
+    @override
+    def stat(self, path: str) -> Stat:
+        return self._storage_driver.stat(self._sanitizer.sanitize(path, True))
+
+    @override
+    def checksum(self, file: str) -> Optional[Checksum]:
+        return self._storage_driver.checksum(self._sanitizer.sanitize(file, True))
+
+    @override
+    def list_with_metadata(
+            self,
+            directory: str,
+            recursive: bool = False
+    ) -> list[tuple[str, Metadata]]:
+        sanitized_directory: str = self._sanitizer.sanitize(directory, True)
+        files: list[tuple[str, Metadata]] = self._storage_driver.list_with_metadata(
+            sanitized_directory,
+            recursive
+        )
+        return [(self._sanitizer.sanitize(file, True), metadata) for file, metadata in files]
+
+    @override
+    def exists_many(self, files: list[str]) -> list[BulkResult[bool]]:
+        return self._storage_driver.exists_many(
+            [self._sanitizer.sanitize(file, True) for file in files]
+        )
+
+    @override
+    def get_many(self, files: list[str]) -> list[BulkResult[Optional[bytes]]]:
+        return self._storage_driver.get_many(
+            [self._sanitizer.sanitize(file, True) for file in files]
+        )
+
+    @override
+    def put_many(self, sources: dict[str, bytes | str | BufferedReader]) -> list[BulkResult[bool]]:
+        return self._storage_driver.put_many({
+            self._sanitizer.sanitize(file, True):
+            self._sanitizer.sanitize(source, True) if isinstance(source, str) else source
+            for file, source in sources.items()
+        })
+
+    @override
+    def delete_many(self, files: list[str]) -> list[BulkResult[bool]]:
+        return self._storage_driver.delete_many(
+            [self._sanitizer.sanitize(file, True) for file in files]
+        )
+
+    @override
+    def get_metadata_many(self, paths: list[str]) -> list[BulkResult[Optional[Metadata]]]:
+        return self._storage_driver.get_metadata_many(
+            [self._sanitizer.sanitize(path, True) for path in paths]
+        )
+
     @override
     def get_root(self) -> str:
         return self._storage_driver.get_root()
@@ -220,3 +391,21 @@ class PathSanitizerStorageDriverDecorator(StorageDriverDecorator):
     @override
     def get_separator(self) -> DirectorySeparator:
         return self._storage_driver.get_separator()
+
+    def _sanitize_pages(self, pages: Iterator[Page]) -> Iterator[Page]:
+        """
+        Sanitizes the paths of each page when it's obtained.
+
+        Args:
+            pages (Iterator[Page]): The pages.
+
+        Returns:
+            Iterator[Page]: The pages with the paths sanitized.
+        """
+        return (
+            Page(
+                [self._sanitizer.sanitize(path, True) for path in page.items],
+                page.next_page_token
+            )
+            for page in pages
+        )
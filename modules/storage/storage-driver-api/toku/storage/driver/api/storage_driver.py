@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+# pylint: disable=too-many-lines
 """
 Private License - For Internal Use Only
 
@@ -14,13 +15,15 @@ Author: Toku
 """
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Any, Literal, Optional, Self, final, overload
+from typing import Any, Generic, Iterator, Literal, Optional, Self, TypeVar, final, overload
 from io import BufferedReader
 from dataclasses import dataclass
 import mimetypes
 from overrides import EnforceOverrides
 import humanize
 
+V = TypeVar("V")
+
 
 class Status(Enum):
     """
@@ -90,6 +93,133 @@ class Metadata:
         return "" if not media_type else media_type
 
 
+@dataclass
+class BulkResult(Generic[V]):
+    """
+    Provides the result of a path processed by a bulk operation, a failure
+    for a path doesn't fail the rest of them, instead `error` has the cause.
+    """
+
+    path: str  # the processed path
+    value: Optional[V] = None  # the result of the operation, None if it failed
+    error: Optional[Exception] = None  # the cause of the failure, None if it succeeded
+
+    @property
+    def succeeded(self) -> bool:
+        """
+        Indicates if the operation succeeded for the path.
+
+        Returns:
+            bool: True if there is no error, False otherwise.
+        """
+        return self.error is None
+
+
+@dataclass
+class Page:
+    """
+    Provides a page of paths obtained by a listing, `next_page_token` is an
+    opaque value to resume the listing after the page, it's only valid for the
+    same storage driver, method and directory.
+    """
+
+    items: list[str]  # the paths of the page
+    next_page_token: Optional[str] = None  # the token of the next page, None if it's the last one
+
+
+class PathType(Enum):
+    """
+    Provides the possibles types of a path.
+    """
+
+    FILE = "FILE"
+    DIRECTORY = "DIRECTORY"
+    MISSING = "MISSING"
+
+
+@dataclass
+class Stat:
+    """
+    Provides the type of a path obtained by `stat`, with its metadata when the
+    storage driver gets it in the same call.
+    """
+
+    type: PathType  # the type of the path
+    metadata: Optional[Metadata] = None  # the metadata of the path, None if it wasn't obtained
+
+
+@dataclass
+class Checksum:
+    """
+    Provides the checksum of a file content obtained by `checksum`, the hashes
+    are encoded as base64 (like the object storages) and each one is None if
+    the storage driver doesn't have it.
+    """
+
+    size: int  # the length of the content in bytes
+    md5: Optional[str] = None  # the MD5 hash, None if it's not available
+    crc32c: Optional[str] = None  # the CRC32C hash, None if it's not available
+
+    def matches(self, checksum: 'Checksum') -> bool:
+        """
+        Indicates if `checksum` is from the same content, the sizes have to be
+        equal and every hash available in both checksums too, at least one hash
+        has to be available in both of them.
+
+        Args:
+            checksum (Checksum): The other checksum.
+
+        Returns:
+            bool: True if the checksums are from the same content, False otherwise.
+        """
+        if self.size != checksum.size:
+            return False
+
+        hashes: list[tuple[str, str]] = [
+            (hash_value, other_hash_value)
+            for hash_value, other_hash_value in (
+                (self.md5, checksum.md5),
+                (self.crc32c, checksum.crc32c)
+            )
+            if hash_value is not None and other_hash_value is not None
+        ]
+
+        return bool(hashes) and all(
+            hash_value == other_hash_value for hash_value, other_hash_value in hashes
+        )
+
+
+@dataclass
+class TransferResult:
+    """
+    Provides the summary of a directory transfer, a failure for a file doesn't
+    stop the transfer of the rest of them, instead its result has the cause.
+    """
+
+    results: list[BulkResult[bool]]  # the result of each transferred file (by its source path)
+    transferred_bytes: int = 0  # the number of bytes of the files transferred successfully
+
+    @property
+    def succeeded(self) -> bool:
+        """
+        Indicates if every file was transferred.
+
+        Returns:
+            bool: True if every result succeeded with True, False otherwise.
+        """
+        return all(result.succeeded and result.value for result in self.results)
+
+    @property
+    def failures(self) -> list[BulkResult[bool]]:
+        """
+        Gets the results of the files that couldn't be transferred.
+
+        Returns:
+            list[BulkResult[bool]]: The results with an error or False.
+        """
+        return [result for result in self.results if not result.succeeded or not result.value]
+
+
 class StorageDriver(ABC, EnforceOverrides):
     """
     Provides the contract to define the abstraction to use the storage driver.
@@ -128,6 +258,18 @@ class StorageDriver(ABC, EnforceOverrides):
         Closes the storage driver and releases its resources.
         """
 
+    @abstractmethod
+    def flush(self) -> None:
+        """
+        Writes the content buffered by the storage driver (e.g. the buffered
+        appends) into the storage, a storage driver without buffers does nothing.
+
+        `close` flushes the buffered content before releasing the resources.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs.
+        """
+
     @abstractmethod
     def get(self, file: str) -> Optional[bytes]:
         """
@@ -162,6 +304,70 @@ class StorageDriver(ABC, EnforceOverrides):
             StorageDriverException: If a storage driver exception occurs.
         """
 
+    @abstractmethod
+    def get_range(self, file: str, offset: int, length: Optional[int] = None) -> Optional[bytes]:
+        """
+        Gets `length` bytes of `file` starting from `offset` as a byte array.
+
+        If `file` doesn't exist, or `offset` or `length` are negative, return None.
+        If `length` is None, the content is read until the end of `file`.
+        If the range exceeds the end of `file`, only the existing bytes are returned.
+
+        Args:
+            file (str): Full file path.
+            offset (int): The position of the first byte.
+            length (Optional[int]): The number of bytes. Defaults to None.
+
+        Returns:
+            Optional[bytes]: Byte array or None.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs.
+        """
+
+    @abstractmethod
+    def get_range_as_input_stream(
+        self,
+        file: str,
+        offset: int,
+        length: Optional[int] = None
+    ) -> Optional[BufferedReader]:
+        """
+        Gets `length` bytes of `file` starting from `offset` as an input stream.
+
+        It follows the same rules as `get_range`.
+
+        Args:
+            file (str): Full file path.
+            offset (int): The position of the first byte.
+            length (Optional[int]): The number of bytes. Defaults to None.
+
+        Returns:
+            Optional[BufferedReader]: Input stream or None.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs.
+        """
+
+    @abstractmethod
+    def get_local_path(self, file: str) -> Optional[str]:
+        """
+        Gets the path of `file` in the local file system, so the content can be
+        read directly from there (e.g. to send it with `os.sendfile`).
+
+        If `file` doesn't exist or the storage driver doesn't keep its files in
+        the local file system, return None.
+
+        Args:
+            file (str): Full file path.
+
+        Returns:
+            Optional[str]: The path in the local file system or None.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs.
+        """
+
     @abstractmethod
     def exists(self, file: str) -> bool:
         """
@@ -373,7 +579,7 @@ class StorageDriver(ABC, EnforceOverrides):
         """
 
     @overload
-    def copy(self, source: str, target: str) -> bool:
+    def copy(self, source: str, target: str, *, skip_unchanged: bool = False) -> bool:
         """
         Copies the `source` into `target` using the current storage driver.
 
@@ -381,10 +587,12 @@ class StorageDriver(ABC, EnforceOverrides):
         If `source` exists and `target` is the same, return False.
         If `target` is empty or a directory, return False.
         If `target` already exists, it'll be replaced.
+        If `skip_unchanged` is True and `target` has the same checksum, it's not copied.
 
         Args:
             source (str): Full file path.
             target (str): Full file path.
+            skip_unchanged (bool): Whether to skip an unchanged `target`. Defaults to False.
 
         Returns:
             bool: True if the action could be executed, False otherwise.
@@ -394,7 +602,14 @@ class StorageDriver(ABC, EnforceOverrides):
         """
 
     @overload
-    def copy(self, source: str, target: str, target_storage_driver: 'StorageDriver') -> bool:
+    def copy(
+        self,
+        source: str,
+        target: str,
+        target_storage_driver: 'StorageDriver',
+        *,
+        skip_unchanged: bool = False
+    ) -> bool:
         """
         Copies the `source` into `target` using the `target_storage_driver` in the target.
 
@@ -402,11 +617,13 @@ class StorageDriver(ABC, EnforceOverrides):
         If `source` exists and `target` is the same, return False.
         If `target` is empty or a directory, return False.
         If `target` already exists, it'll be replaced.
+        If `skip_unchanged` is True and `target` has the same checksum, it's not copied.
 
         Args:
             source (str): Full file path.
             target (str): Full file path.
             target_storage_driver (StoragaDriver): Storage driver to use in the target.
+            skip_unchanged (bool): Whether to skip an unchanged `target`. Defaults to False.
 
         Returns:
             bool: True if the action could be executed, False otherwise.
@@ -420,7 +637,9 @@ class StorageDriver(ABC, EnforceOverrides):
         self,
         source: str,
         target: str,
-        target_storage_driver: Optional['StorageDriver'] = None
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
     ) -> bool:
         """
         Copies the `source` into `target` using the `target_storage_driver` in the target.
@@ -429,11 +648,14 @@ class StorageDriver(ABC, EnforceOverrides):
         If `source` exists and `target` is the same, return False.
         If `target` is empty or a directory, return False.
         If `target` already exists, it'll be replaced.
+        If `skip_unchanged` is True and `target` has the same checksum, it's not copied
+        (see `Checksum.matches`).
 
         Args:
             source (str): Full file path.
             target (str): Full file path.
             target_storage_driver (Optional[StorageDriver]): Storage driver to use in the target.
+            skip_unchanged (bool): Whether to skip an unchanged `target`. Defaults to False.
 
         Returns:
             bool: True if the action could be executed, False otherwise.
@@ -630,6 +852,136 @@ class StorageDriver(ABC, EnforceOverrides):
             StorageDriverException: If a storage driver exception occurs.
         """
 
+    @abstractmethod
+    def iter_files(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        """
+        Returns the pages of the files inside the root of the `directory`.
+
+        The pages are obtained lazily, so the first paths are available before
+        the listing is completed. To resume the listing use the `next_page_token`
+        of the last processed page as `page_token`.
+
+        If `directory` doesn't exist or is a file, return an empty iterator.
+        If `directory` is empty or None, use the root as a directory.
+        If `page_size` isn't positive, return an empty iterator.
+
+        Args:
+            directory (str): Directory to use to get the files.
+            page_size (Optional[int]): The maximum number of paths of a page.
+                                       Defaults to None (storage driver default).
+            page_token (Optional[str]): The token to resume the listing.
+                                        Defaults to None (first page).
+
+        Returns:
+            Iterator[Page]: The pages of files.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs.
+        """
+
+    @abstractmethod
+    def iter_all_files(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        """
+        Returns the pages of the files inside the root and sub-directories of
+        the `directory`, where each file has the full path without the root.
+
+        The pages are obtained lazily, so the first paths are available before
+        the listing is completed. To resume the listing use the `next_page_token`
+        of the last processed page as `page_token`.
+
+        If `directory` doesn't exist or is a file, return an empty iterator.
+        If `directory` is empty or None, use the root as a directory.
+        If `page_size` isn't positive, return an empty iterator.
+
+        Args:
+            directory (str): Directory to use to get the files.
+            page_size (Optional[int]): The maximum number of paths of a page.
+                                       Defaults to None (storage driver default).
+            page_token (Optional[str]): The token to resume the listing.
+                                        Defaults to None (first page).
+
+        Returns:
+            Iterator[Page]: The pages of files.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs.
+        """
+
+    @abstractmethod
+    def iter_directories(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        """
+        Returns the pages of the directories inside the root of the `directory`.
+
+        The pages are obtained lazily, so the first paths are available before
+        the listing is completed. To resume the listing use the `next_page_token`
+        of the last processed page as `page_token`.
+
+        If `directory` doesn't exist or is a file, return an empty iterator.
+        If `directory` is empty or None, use the root as a directory.
+        If `page_size` isn't positive, return an empty iterator.
+
+        Args:
+            directory (str): Directory to use to get the directories.
+            page_size (Optional[int]): The maximum number of paths of a page.
+                                       Defaults to None (storage driver default).
+            page_token (Optional[str]): The token to resume the listing.
+                                        Defaults to None (first page).
+
+        Returns:
+            Iterator[Page]: The pages of directories.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs.
+        """
+
+    @abstractmethod
+    def iter_all_directories(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        """
+        Returns the pages of the directories inside the root and sub-directories
+        of the `directory`, where each directory has the full path without the root.
+
+        The pages are obtained lazily, so the first paths are available before
+        the listing is completed. To resume the listing use the `next_page_token`
+        of the last processed page as `page_token`.
+
+        If `directory` doesn't exist or is a file, return an empty iterator.
+        If `directory` is empty or None, use the root as a directory.
+        If `page_size` isn't positive, return an empty iterator.
+
+        Args:
+            directory (str): Directory to use to get the directories.
+            page_size (Optional[int]): The maximum number of paths of a page.
+                                       Defaults to None (storage driver default).
+            page_token (Optional[str]): The token to resume the listing.
+                                        Defaults to None (first page).
+
+        Returns:
+            Iterator[Page]: The pages of directories.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs.
+        """
+
     @abstractmethod
     def exists_directory(self, directory: str) -> bool:
         """
@@ -646,13 +998,17 @@ class StorageDriver(ABC, EnforceOverrides):
         """
 
     @overload
-    def copy_directory(self, source: str, target: str) -> bool:
+    def copy_directory(self, source: str, target: str, *, skip_unchanged: bool = False) -> bool:
         """
         Copy the 'source' into 'target' using the current storage driver.
 
+        If `skip_unchanged` is True, the files with the same checksum in the
+        target are not copied.
+
         Args:
             source (str): Full directory path.
             target (str): Full directory path.
+            skip_unchanged (bool): Whether to skip the unchanged files. Defaults to False.
 
         Returns:
             bool: True if the action could be executed.
@@ -666,15 +1022,21 @@ class StorageDriver(ABC, EnforceOverrides):
         self,
         source: str,
         target: str,
-        target_storage_driver: 'StorageDriver'
+        target_storage_driver: 'StorageDriver',
+        *,
+        skip_unchanged: bool = False
     ) -> bool:
         """
         Copy the 'source' into 'target' using the 'target_storage_driver' in the target.
 
+        If `skip_unchanged` is True, the files with the same checksum in the
+        target are not copied.
+
         Args:
             source (str): Full directory path.
             target (str): Full directory path.
             target_storage_driver (StoragaDriver): Storage driver to use in the target.
+            skip_unchanged (bool): Whether to skip the unchanged files. Defaults to False.
 
         Returns:
             bool: True if the action could be executed.
@@ -688,15 +1050,21 @@ class StorageDriver(ABC, EnforceOverrides):
         self,
         source: str,
         target: str,
-        target_storage_driver: Optional['StorageDriver'] = None
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
     ) -> bool:
         """
         Copy the 'source' into 'target' using the 'target_storage_driver' in the target.
 
+        If `skip_unchanged` is True, the files with the same checksum in the
+        target are not copied (see `Checksum.matches`).
+
         Args:
             source (str): Full directory path.
             target (str): Full directory path.
             target_storage_driver (Optional[StorageDriver]): Storage driver to use in the target.
+            skip_unchanged (bool): Whether to skip the unchanged files. Defaults to False.
 
         Returns:
             bool: True if the action could be executed.
@@ -706,13 +1074,17 @@ class StorageDriver(ABC, EnforceOverrides):
         """
 
     @overload
-    def move_directory(self, source: str, target: str) -> bool:
+    def move_directory(self, source: str, target: str, *, skip_unchanged: bool = False) -> bool:
         """
         Move the 'source' into 'target' using the current storage driver.
 
+        If `skip_unchanged` is True, the files with the same checksum in the
+        target are not copied.
+
         Args:
             source (str): Full directory path.
             target (str): Full directory path.
+            skip_unchanged (bool): Whether to skip the unchanged files. Defaults to False.
 
         Returns:
             bool: True if the action could be executed.
@@ -726,15 +1098,21 @@ class StorageDriver(ABC, EnforceOverrides):
         self,
         source: str,
         target: str,
-        target_storage_driver: 'StorageDriver'
+        target_storage_driver: 'StorageDriver',
+        *,
+        skip_unchanged: bool = False
     ) -> bool:
         """
         Move the 'source' into 'target' using the 'target_storage_driver' in the target.
 
+        If `skip_unchanged` is True, the files with the same checksum in the
+        target are not copied.
+
         Args:
             source (str): Full directory path.
             target (str): Full directory path.
             target_storage_driver: Storage driver to use in the target.
+            skip_unchanged (bool): Whether to skip the unchanged files. Defaults to False.
 
         Returns:
             bool: True if the action could be executed.
@@ -748,15 +1126,21 @@ class StorageDriver(ABC, EnforceOverrides):
         self,
         source: str,
         target: str,
-        target_storage_driver: Optional['StorageDriver'] = None
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
     ) -> bool:
         """
         Move the 'source' into 'target' using the 'target_storage_driver' in the target.
 
+        If `skip_unchanged` is True, the files with the same checksum in the
+        target are not copied (see `Checksum.matches`).
+
         Args:
             source (str): Full directory path.
             target (str): Full directory path.
             target_storage_driver (Optional[StorageDriver]): Storage driver to use in the target.
+            skip_unchanged (bool): Whether to skip the unchanged files. Defaults to False.
 
         Returns:
             bool: True if the action could be executed.
@@ -765,6 +1149,44 @@ class StorageDriver(ABC, EnforceOverrides):
             StorageDriverException: If there's an issue with the storage driver.
         """
 
+    @abstractmethod
+    def transfer_directory(
+        self,
+        source: str,
+        target: str,
+        remove_source: bool = False,
+        target_storage_driver: Optional['StorageDriver'] = None,
+        *,
+        skip_unchanged: bool = False
+    ) -> Optional[TransferResult]:
+        """
+        Copies the 'source' into 'target' (or moves it if `remove_source` is True)
+        using the 'target_storage_driver' in the target, like `copy_directory` and
+        `move_directory`, but returning the result of each file.
+
+        The files are transferred concurrently, a failure for a file doesn't stop
+        the transfer of the rest of them, and the 'source' is removed only if
+        every file was transferred. If `skip_unchanged` is True, a file with the
+        same checksum in the target is not copied, but it's transferred anyway.
+
+        If the 'source' or the 'target' are not valid (the same validations of
+        `copy_directory`), return None.
+
+        Args:
+            source (str): Full directory path.
+            target (str): Full directory path.
+            remove_source (bool): Whether to remove the source. Defaults to False.
+            target_storage_driver (Optional[StorageDriver]): Storage driver to use in the target.
+                                                             Defaults to None (the same driver).
+            skip_unchanged (bool): Whether to skip the unchanged files. Defaults to False.
+
+        Returns:
+            Optional[TransferResult]: The summary of the transfer or None.
+
+        Raises:
+            StorageDriverException: If there's an issue with the storage driver.
+        """
+
     @abstractmethod
     def make_directory(self, directory: str) -> bool:
         """
@@ -837,6 +1259,156 @@ class StorageDriver(ABC, EnforceOverrides):
             StorageDriverException: If a storage driver exception occurs.
         """
 
+    @abstractmethod
+    def stat(self, path: str) -> Stat:
+        """
+        Gets the type of `path` (a file, a directory or missing) with a single
+        request to the storage when it's possible, it replaces the use of `exists`
+        and `exists_directory` to know the type of a path.
+
+        The metadata of the result is optional, a storage driver includes it
+        only if it's obtained by the same request, it's always None if `path`
+        doesn't exist.
+
+        A path that is a file and a directory at the same time (possible in
+        some storages) is a file.
+
+        Args:
+            path (str): Full file or directory path.
+
+        Returns:
+            Stat: The type of the path and its optional metadata.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs.
+        """
+
+    @abstractmethod
+    def checksum(self, file: str) -> Optional[Checksum]:
+        """
+        Gets the checksum of the content of `file` without downloading it when
+        the storage has it, it's used to know if two files have the same
+        content (see `Checksum.matches`).
+
+        If `file` doesn't exist or is a directory, return None.
+
+        Args:
+            file (str): Full file path.
+
+        Returns:
+            Optional[Checksum]: Checksum or None.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs.
+        """
+
+    @abstractmethod
+    def list_with_metadata(
+            self,
+            directory: str,
+            recursive: bool = False
+    ) -> list[tuple[str, Metadata]]:
+        """
+        Returns a collection with all the files inside the root of the `directory`
+        (and its sub-directories if `recursive` is True) with their metadata,
+        where each file has the full path without the root.
+
+        The metadata is the same as `get_metadata(file)`, but it's obtained with
+        the listing instead of a request per file when the storage allows it.
+
+        If `directory` doesn't exist or is a file, return an empty list.
+        If `directory` is empty or None, use the root as a directory.
+
+        Args:
+            directory (str): Directory to use to get the files.
+            recursive (bool): Whether to include the files of the sub-directories.
+                              Defaults to False.
+
+        Returns:
+            list[tuple[str, Metadata]]: The path and the metadata of each file.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs.
+        """
+
+    @abstractmethod
+    def exists_many(self, files: list[str]) -> list[BulkResult[bool]]:
+        """
+        Checks if each file in `files` exists.
+
+        The result has the same order as `files`, where `value` is the same as
+        `exists(file)` or `error` the cause if the check failed for the file.
+
+        Args:
+            files (list[str]): Full file paths.
+
+        Returns:
+            list[BulkResult[bool]]: The result for each file.
+        """
+
+    @abstractmethod
+    def get_many(self, files: list[str]) -> list[BulkResult[Optional[bytes]]]:
+        """
+        Gets each file in `files` as a byte array.
+
+        The result has the same order as `files`, where `value` is the same as
+        `get(file)` or `error` the cause if the process failed for the file.
+
+        Args:
+            files (list[str]): Full file paths.
+
+        Returns:
+            list[BulkResult[Optional[bytes]]]: The result for each file.
+        """
+
+    @abstractmethod
+    def put_many(self, sources: dict[str, bytes | str | BufferedReader]) -> list[BulkResult[bool]]:
+        """
+        Stores each source of `sources` into its file (the key).
+
+        The result has the same order as `sources`, where `value` is the same as
+        `put_file_as(source, file)` or `error` the cause if the process failed
+        for the file.
+
+        Args:
+            sources (dict[str, bytes | str | BufferedReader]): The content for each
+                                                               full file path.
+
+        Returns:
+            list[BulkResult[bool]]: The result for each file.
+        """
+
+    @abstractmethod
+    def delete_many(self, files: list[str]) -> list[BulkResult[bool]]:
+        """
+        Deletes each file in `files`.
+
+        The result has the same order as `files`, where `value` is the same as
+        `delete(file)` or `error` the cause if the process failed for the file.
+
+        Args:
+            files (list[str]): Full file paths.
+
+        Returns:
+            list[BulkResult[bool]]: The result for each file.
+        """
+
+    @abstractmethod
+    def get_metadata_many(self, paths: list[str]) -> list[BulkResult[Optional[Metadata]]]:
+        """
+        Gets the metadata of each path in `paths`.
+
+        The result has the same order as `paths`, where `value` is the same as
+        `get_metadata(path)` or `error` the cause if the process failed for
+        the path.
+
+        Args:
+            paths (list[str]): Full file or directory paths.
+
+        Returns:
+            list[BulkResult[Optional[Metadata]]]: The result for each path.
+        """
+
     @abstractmethod
     def get_root(self) -> str:
         """
@@ -0,0 +1,574 @@
+# -*- coding: utf-8 -*-
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: storage_driver_synchronizer.py
+Author: Toku
+"""
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import json
+import os
+import threading
+import time
+from typing import Any, Optional, TextIO, final
+from toku.storage.driver.api import Metadata
+from toku.storage.driver.api import BulkResult
+from toku.storage.driver.api import PathType
+from toku.storage.driver.api import Checksum
+from toku.storage.driver.api import TransferResult
+from toku.storage.driver.api import PathSanitizer
+from toku.storage.driver.api import StorageDriverException
+from toku.storage.driver.api import TransferEngine
+from toku.storage.driver.api import StorageDriver
+
+
+@dataclass
+class SyncPlan:
+    """
+    Provides the files to transfer and to delete by a sync, obtained by the
+    listing of both sides or by the manifest of an interrupted sync.
+    """
+
+    transfers: dict[str, int] = field(default_factory=dict)  # the relative path and size of files
+    deletes: list[str] = field(default_factory=list)  # the full path of each extraneous target file
+    transferred: set[str] = field(default_factory=set)  # the relative paths already transferred
+    deleted: set[str] = field(default_factory=set)  # the target paths already deleted
+    unchanged: int = 0  # the number of files unchanged in the target
+    planned_at: float = field(default_factory=time.time)  # when the listings were compared
+
+
+@dataclass
+class SyncResult:
+    """
+    Provides the summary of a sync, a failure for a file doesn't stop the sync
+    of the rest of them, instead its result has the cause.
+    """
+
+    transfer: TransferResult  # the result of each file transferred by this execution
+    deleted: list[BulkResult[bool]] = field(default_factory=list)  # the result of each deletion
+    unchanged: int = 0  # the number of files that were already in the target
+    resumed: bool = False  # whether the sync resumed an interrupted one
+
+    @property
+    def succeeded(self) -> bool:
+        """
+        Indicates if every file was transferred and deleted.
+
+        Returns:
+            bool: True if every result succeeded with True, False otherwise.
+        """
+        return self.transfer.succeeded and \
+            all(result.succeeded and result.value for result in self.deleted)
+
+
+@final
+class StorageDriverSynchronizer:  # pylint: disable=too-few-public-methods
+    """
+    Provides the incremental sync of a directory of `storage_driver` into a
+    directory of another storage driver (or the same one), the files of the
+    source directory are transferred into the target directory keeping their
+    relative paths (like `rsync source/ target`).
+
+    The files are compared with a listing with metadata of each side: a file
+    is transferred if it doesn't exist in the target, has another size or was
+    modified after the target, or with `compare_checksums` if its checksum
+    doesn't match (see `Checksum.matches`). A target file that doesn't exist
+    in the source is deleted only if `delete_extraneous` is True.
+
+    The files are transferred with a `TransferEngine` and each one is copied
+    with `copy`, so the storage drivers transfer them in the best way they can.
+
+    If `manifest` is a local file path, the plan of the sync and the progress
+    are checkpointed in it as JSON lines, so an interrupted sync is resumed
+    without listing again and without transferring the completed files
+    again. The manifest is removed when every file is synchronized, and it's
+    kept if a file failed, so the next sync retries only the failed ones.
+
+    A kept manifest freezes the files of the sync: the files created or
+    changed after the plan aren't synchronized while it's resumed. A planned
+    file deleted from the source, or an extraneous one already deleted from
+    the target, is considered completed, a plan older than `manifest_max_age`
+    seconds is replaced by a new one, and `sync` with `resume` as False
+    always plans again.
+    """
+
+    DEFAULT_MANIFEST_MAX_AGE: float = 24 * 60 * 60  # 1 day
+
+    def __init__(  # pylint: disable=too-many-arguments
+            self,
+            storage_driver: StorageDriver,
+            manifest: Optional[str] = None,
+            compare_checksums: bool = False,
+            max_workers: int = TransferEngine.DEFAULT_MAX_WORKERS,
+            max_in_flight_bytes: int = TransferEngine.DEFAULT_MAX_IN_FLIGHT_BYTES,
+            manifest_max_age: Optional[float] = DEFAULT_MANIFEST_MAX_AGE
+    ) -> None:
+        """
+        Initializes a new StorageDriverSynchronizer.
+
+        Args:
+            storage_driver (StorageDriver): The storage driver of the source.
+            manifest (Optional[str]): The local file path of the manifest.
+                                      Defaults to None (a sync isn't resumable).
+            compare_checksums (bool): Whether to compare the checksums of the files
+                                      with the same size instead of the last modification.
+                                      Defaults to False.
+            max_workers (int): The maximum number of threads.
+                               Defaults to TransferEngine.DEFAULT_MAX_WORKERS.
+            max_in_flight_bytes (int): The maximum number of bytes being transferred
+                                       at the same time.
+                                       Defaults to TransferEngine.DEFAULT_MAX_IN_FLIGHT_BYTES.
+            manifest_max_age (Optional[float]): The seconds that the plan of a manifest
+                                                can be resumed, None to resume it always.
+                                                Defaults to DEFAULT_MANIFEST_MAX_AGE.
+        """
+        self._storage_driver: StorageDriver = storage_driver
+        self._manifest: Optional[str] = manifest
+        self._compare_checksums: bool = compare_checksums
+        self._max_workers: int = max_workers
+        self._transfer_engine: TransferEngine = TransferEngine(max_workers, max_in_flight_bytes)
+        self._manifest_max_age: Optional[float] = manifest_max_age
+        self._manifest_lock: threading.Lock = threading.Lock()
+
+    def sync(  # pylint: disable=too-many-arguments
+            self,
+            source: str,
+            target: str,
+            target_storage_driver: Optional[StorageDriver] = None,
+            delete_extraneous: bool = False,
+            resume: bool = True
+    ) -> Optional[SyncResult]:
+        """
+        Synchronizes the files of the directory `source` into the directory
+        `target` of `target_storage_driver`, the `target` is created if it
+        doesn't exist.
+
+        If `source` doesn't exist or is a file, return None.
+        If `target` is a file, return None.
+        If `source` and `target` are the same or one of them is inside the
+        other one in the same storage driver, return None.
+
+        Args:
+            source (str): Full directory path.
+            target (str): Full directory path.
+            target_storage_driver (Optional[StorageDriver]): Storage driver to use in the target.
+                                                             Defaults to None (the same driver).
+            delete_extraneous (bool): Whether to delete the target files that don't exist
+                                      in the source. Defaults to False.
+            resume (bool): Whether to resume the plan of the manifest, otherwise the
+                           listings are compared again. Defaults to True.
+
+        Returns:
+            Optional[SyncResult]: The summary of the sync or None.
+
+        Raises:
+            StorageDriverException: If a storage driver exception occurs or the
+                                    manifest belongs to another sync.
+        """
+        target_storage_driver = \
+            self._storage_driver if not target_storage_driver else target_storage_driver
+        source_sanitizer: PathSanitizer = PathSanitizer(self._storage_driver.get_separator())
+        target_sanitizer: PathSanitizer = PathSanitizer(target_storage_driver.get_separator())
+        source = source_sanitizer.sanitize(source, True)
+        target = target_sanitizer.sanitize(target, True)
+
+        if self._storage_driver == target_storage_driver and \
+           self._overlaps(source_sanitizer, source, target):  # source and target overlap
+            return None
+
+        if self._storage_driver.stat(source).type != PathType.DIRECTORY:  # source missing or file
+            return None
+
+        target_type: PathType = target_storage_driver.stat(target).type
+
+        if target_type == PathType.FILE:  # target is file
+            return None
+
+        header: dict[str, Any] = {
+            "source": source,
+            "target": target,
+            "delete_extraneous": delete_extraneous
+        }
+        plan: Optional[SyncPlan] = self._read_manifest(header) if resume else None
+        resumed: bool = plan is not None
+
+        if plan is None:
+            if target_type == PathType.MISSING:
+                target_storage_driver.make_directory(target)
+
+            plan = self._plan(source, target, target_storage_driver, delete_extraneous)
+
+        self._write_manifest(header, plan)
+
+        result: SyncResult = self._execute(plan, source, target, target_storage_driver)
+        result.resumed = resumed
+
+        if result.succeeded and self._manifest is not None and os.path.exists(self._manifest):
+            os.remove(self._manifest)  # every file is synchronized
+
+        return result
+
+    def _plan(
+            self,
+            source: str,
+            target: str,
+            target_storage_driver: StorageDriver,
+            delete_extraneous: bool
+    ) -> SyncPlan:
+        """
+        Compares the listing with metadata of `source` and `target` to get the
+        files to transfer and the extraneous ones to delete.
+
+        Args:
+            source (str): Full directory path.
+            target (str): Full directory path.
+            target_storage_driver (StorageDriver): Storage driver to use in the target.
+            delete_extraneous (bool): Whether to delete the extraneous target files.
+
+        Returns:
+            SyncPlan: The plan of the sync.
+        """
+        source_files: dict[str, Metadata] = self._list(self._storage_driver, source)
+        target_files: dict[str, Metadata] = self._list(target_storage_driver, target)
+        plan: SyncPlan = SyncPlan()
+        candidates: list[str] = []
+
+        for path, metadata in source_files.items():
+            target_metadata: Optional[Metadata] = target_files.get(path)
+
+            if target_metadata is None or \
+               metadata.size.length != target_metadata.size.length:  # new or changed file
+                plan.transfers[path] = metadata.size.length
+            elif self._compare_checksums:
+                candidates.append(path)
+            elif metadata.last_modified > target_metadata.last_modified:  # modified after target
+                plan.transfers[path] = metadata.size.length
+            else:
+                plan.unchanged += 1
+
+        # the checksums are obtained concurrently, only the files with the
+        # same size in both sides are compared
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self._max_workers, len(candidates)))
+        ) as executor:
+            matches: list[bool] = list(executor.map(
+                lambda path: self._matches(
+                    self._storage_driver.checksum(self._to_path(source, path)),
+                    target_storage_driver.checksum(
+                        self._to_path(target, path, target_storage_driver)
+                    )
+                ),
+                candidates
+            ))
+
+        for path, match in zip(candidates, matches):
+            if match:
+                plan.unchanged += 1
+            else:
+                plan.transfers[path] = source_files[path].size.length
+
+        if delete_extraneous:
+            plan.deletes = [
+                self._to_path(target, path, target_storage_driver)
+                for path in target_files
+                if path not in source_files
+            ]
+
+        return plan
+
+    def _execute(
+            self,
+            plan: SyncPlan,
+            source: str,
+            target: str,
+            target_storage_driver: StorageDriver
+    ) -> SyncResult:
+        """
+        Transfers and deletes the files of `plan` that aren't completed yet,
+        each completed file is checkpointed in the manifest.
+
+        Args:
+            plan (SyncPlan): The plan of the sync.
+            source (str): Full directory path.
+            target (str): Full directory path.
+            target_storage_driver (StorageDriver): Storage driver to use in the target.
+
+        Returns:
+            SyncResult: The summary of the sync.
+        """
+        relative_paths: dict[str, str] = {
+            self._to_path(source, path): path
+            for path in plan.transfers
+            if path not in plan.transferred
+        }
+        files: list[tuple[str, str, int]] = [
+            (
+                source_file,
+                self._to_path(target, path, target_storage_driver),
+                plan.transfers[path]
+            )
+            for source_file, path in relative_paths.items()
+        ]
+        TransferEngine.make_parent_directories(
+            target_storage_driver,
+            (file for _, file, _ in files)
+        )
+
+        def transfer_file(source_file: str, target_file: str) -> bool:
+            # a planned file deleted from the source is completed, otherwise
+            # a resumed plan would fail on every sync
+            if not self._storage_driver.copy(source_file, target_file, target_storage_driver) and \
+               self._storage_driver.exists(source_file):
+                return False
+
+            self._checkpoint({"transferred": relative_paths[source_file]})
+            return True
+
+        transfer_result: TransferResult = self._transfer_engine.transfer(files, transfer_file)
+        deletes: list[str] = [path for path in plan.deletes if path not in plan.deleted]
+        deleted: list[BulkResult[bool]] = []
+
+        for result in target_storage_driver.delete_many(deletes) if deletes else []:
+            # an extraneous file already deleted from the target is completed
+            if result.succeeded and not result.value and \
+               not target_storage_driver.exists(result.path):
+                result = BulkResult(result.path, True)
+
+            if result.succeeded and result.value:
+                self._checkpoint({"deleted": result.path})
+
+            deleted.append(result)
+
+        return SyncResult(transfer_result, deleted, plan.unchanged)
+
+    def _list(self, storage_driver: StorageDriver, directory: str) -> dict[str, Metadata]:
+        """
+        Lists the files of `directory` (and its sub-directories) with their
+        metadata by their path relative to `directory`, with the slash as the
+        separator to compare the paths of any storage driver.
+
+        Args:
+            storage_driver (StorageDriver): The storage driver.
+            directory (str): Full directory path.
+
+        Returns:
+            dict[str, Metadata]: The metadata of each file by its relative path.
+        """
+        sanitizer: PathSanitizer = PathSanitizer(storage_driver.get_separator())
+        prefix: str = sanitizer.add_directory_separator(directory) if directory else ""
+        files: dict[str, Metadata] = {}
+
+        for file, metadata in storage_driver.list_with_metadata(directory, True):
+            path: str = sanitizer.sanitize(file, True)[len(prefix):]
+            files[path.replace(storage_driver.get_separator().value, "/")] = metadata
+
+        return files
+
+    def _to_path(
+            self,
+            directory: str,
+            path: str,
+            storage_driver: Optional[StorageDriver] = None
+    ) -> str:
+        """
+        Gets the full path of the relative `path` in `directory` of
+        `storage_driver`.
+
+        Args:
+            directory (str): Full directory path.
+            path (str): The path relative to `directory`.
+            storage_driver (Optional[StorageDriver]): The storage driver.
+                                                      Defaults to None (the source).
+
+        Returns:
+            str: The full path.
+        """
+        storage_driver = self._storage_driver if not storage_driver else storage_driver
+        sanitizer: PathSanitizer = PathSanitizer(storage_driver.get_separator())
+        if not directory:
+            return sanitizer.sanitize(path, True)
+
+        return sanitizer.concat(directory, path)
+
+    @staticmethod
+    def _overlaps(sanitizer: PathSanitizer, source: str, target: str) -> bool:
+        """
+        Checks if `source` and `target` of the same storage driver are the
+        same directory or one of them is inside the other one, the root
+        contains any directory.
+
+        Args:
+            sanitizer (PathSanitizer): The path sanitizer of the storage driver.
+            source (str): Full directory path.
+            target (str): Full directory path.
+
+        Returns:
+            bool: True if the directories overlap, False otherwise.
+        """
+        return not source or \
+            not target or \
+            source == target or \
+            target.startswith(sanitizer.add_directory_separator(source)) or \
+            source.startswith(sanitizer.add_directory_separator(target))
+
+    @staticmethod
+    def _matches(source_checksum: Optional[Checksum], target_checksum: Optional[Checksum]) -> bool:
+        """
+        Checks if both checksums exist and match.
+
+        Args:
+            source_checksum (Optional[Checksum]): The checksum of the source file.
+            target_checksum (Optional[Checksum]): The checksum of the target file.
+
+        Returns:
+            bool: True if the checksums match, False otherwise.
+        """
+        return source_checksum is not None and \
+            target_checksum is not None and \
+            source_checksum.matches(target_checksum)
+
+    def _read_manifest(self, header: dict[str, Any]) -> Optional[SyncPlan]:
+        """
+        Reads the plan and the progress of an interrupted sync from the
+        manifest, a manifest without the whole plan (interrupted while it was
+        written) or with a plan older than `manifest_max_age` is ignored, as
+        well as a line interrupted while it was written.
+
+        Args:
+            header (dict[str, Any]): The source, target and options of the sync.
+
+        Returns:
+            Optional[SyncPlan]: The plan with the progress or None.
+
+        Raises:
+            StorageDriverException: If the manifest belongs to another sync.
+        """
+        if self._manifest is None or not os.path.exists(self._manifest):
+            return None
+
+        with open(self._manifest, "r", encoding="utf-8") as manifest:
+            records: list[dict[str, Any]] = []
+
+            for line in manifest:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue  # interrupted while it was written
+
+        if not records:  # interrupted before writing the header
+            return None
+
+        if records[0] != header:
+            raise StorageDriverException(
+                f"manifest {self._manifest} belongs to the sync of {records[0]}"
+            )
+
+        if {"planned": True} not in records:  # interrupted while the plan was written
+            return None
+
+        plan: SyncPlan = SyncPlan()
+
+        for record in records[1:]:
+            self._read_record(plan, record)
+
+        if self._manifest_max_age is not None and \
+           time.time() - plan.planned_at > self._manifest_max_age:  # expired plan
+            return None
+
+        return plan
+
+    @staticmethod
+    def _read_record(plan: SyncPlan, record: dict[str, Any]) -> None:
+        """
+        Adds a record of the manifest to `plan`.
+
+        Args:
+            plan (SyncPlan): The plan of the sync.
+            record (dict[str, Any]): The record.
+        """
+        if "transfer" in record:
+            plan.transfers[record["transfer"]] = record["size"]
+        elif "delete" in record:
+            plan.deletes.append(record["delete"])
+        elif "transferred" in record:
+            plan.transferred.add(record["transferred"])
+        elif "deleted" in record:
+            plan.deleted.add(record["deleted"])
+        elif "unchanged" in record:
+            plan.unchanged = record["unchanged"]
+        elif "planned_at" in record:
+            plan.planned_at = record["planned_at"]
+
+    def _write_manifest(self, header: dict[str, Any], plan: SyncPlan) -> None:
+        """
+        Writes the plan and the progress of the sync in the manifest, replacing
+        the previous one (so a line interrupted while it was written is
+        discarded before appending new checkpoints), the line after the plan
+        marks that the whole plan was written.
+
+        Args:
+            header (dict[str, Any]): The source, target and options of the sync.
+            plan (SyncPlan): The plan of the sync.
+        """
+        if self._manifest is None:
+            return
+
+        temp_manifest: str = f"{self._manifest}.tmp"
+
+        with open(temp_manifest, "w", encoding="utf-8") as manifest:
+            self._write_record(manifest, header)
+
+            for path, size in plan.transfers.items():
+                self._write_record(manifest, {"transfer": path, "size": size})
+
+            for path in plan.deletes:
+                self._write_record(manifest, {"delete": path})
+
+            self._write_record(manifest, {"unchanged": plan.unchanged})
+            self._write_record(manifest, {"planned_at": plan.planned_at})
+            self._write_record(manifest, {"planned": True})
+
+            for path in plan.transferred:
+                self._write_record(manifest, {"transferred": path})
+
+            for path in plan.deleted:
+                self._write_record(manifest, {"deleted": path})
+
+            manifest.flush()
+            os.fsync(manifest.fileno())
+
+        os.replace(temp_manifest, self._manifest)  # an interrupted write keeps the previous one
+
+    def _checkpoint(self, record: dict[str, Any]) -> None:
+        """
+        Appends a completed file to the manifest.
+
+        Args:
+            record (dict[str, Any]): The record of the completed file.
+        """
+        if self._manifest is None:
+            return
+
+        with self._manifest_lock:
+            with open(self._manifest, "a", encoding="utf-8") as manifest:
+                self._write_record(manifest, record)
+
+    @staticmethod
+    def _write_record(manifest: TextIO, record: dict[str, Any]) -> None:
+        """
+        Writes `record` as a JSON line.
+
+        Args:
+            manifest (TextIO): The manifest file.
+            record (dict[str, Any]): The record.
+        """
+        manifest.write(json.dumps(record))
+        manifest.write("\n")
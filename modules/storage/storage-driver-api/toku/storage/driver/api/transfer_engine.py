@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: transfer_engine.py
+Author: Toku
+"""
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+from typing import Callable, Iterable, Optional, final
+from toku.storage.driver.api import BulkResult
+from toku.storage.driver.api import TransferResult
+from toku.storage.driver.api import PathSanitizer
+from toku.storage.driver.api import StorageDriver
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@final
+class TransferEngine:  # pylint: disable=too-few-public-methods
+    """
+    Provides the engine to transfer files concurrently, each file is transferred
+    in a thread pool with up to `max_workers` threads, and the sum of the sizes
+    of the files being transferred at the same time is limited by
+    `max_in_flight_bytes` (a bigger file is transferred alone).
+
+    The engine doesn't know how to transfer a file, it's provided by the caller,
+    so it works for any pair of storage drivers.
+    """
+
+    DEFAULT_MAX_WORKERS: int = 16  # the default number of threads
+    DEFAULT_MAX_IN_FLIGHT_BYTES: int = 256 * 1024 * 1024  # 256 MB
+
+    def __init__(
+            self,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            max_in_flight_bytes: int = DEFAULT_MAX_IN_FLIGHT_BYTES
+    ) -> None:
+        """
+        Initializes a new TransferEngine.
+
+        Args:
+            max_workers (int): The maximum number of threads.
+                               Defaults to DEFAULT_MAX_WORKERS.
+            max_in_flight_bytes (int): The maximum number of bytes being transferred
+                                       at the same time.
+                                       Defaults to DEFAULT_MAX_IN_FLIGHT_BYTES.
+        """
+        self._max_workers: int = max_workers
+        self._max_in_flight_bytes: int = max_in_flight_bytes
+
+    @staticmethod
+    def make_parent_directories(storage_driver: StorageDriver, files: Iterable[str]) -> None:
+        """
+        Creates the missing parent directories of `files` in `storage_driver`
+        before transferring them, each parent once, otherwise two files with
+        the same parent could try to create it at the same time.
+
+        A parent that can't be created is logged and skipped, the error is
+        reported by each file of the directory when it's transferred.
+
+        Args:
+            storage_driver (StorageDriver): The storage driver of the files.
+            files (Iterable[str]): The full path of each file.
+        """
+        sanitizer: PathSanitizer = PathSanitizer(storage_driver.get_separator())
+
+        for parent in dict.fromkeys(sanitizer.get_parent(file) for file in files):
+            if not parent or not parent.strip():  # parent is root
+                continue
+
+            try:
+                storage_driver.make_directory(parent)  # an existing parent is skipped
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("failed to create the parent directory %s", parent)
+
+    def transfer(
+            self,
+            files: list[tuple[str, str, int]],
+            transfer_file: Callable[[str, str], bool],
+            delete_source: Optional[Callable[[str], bool]] = None
+    ) -> TransferResult:
+        """
+        Transfers each file in `files` with `transfer_file`, deleting its source
+        with `delete_source` after transferring it if it's not None.
+
+        An exception raised for a file is kept in its result instead of being
+        propagated.
+
+        Args:
+            files (list[tuple[str, str, int]]): The source path, the target path
+                                                and the size of each file.
+            transfer_file (Callable[[str, str], bool]): The process to transfer a file
+                                                        from the source to the target.
+            delete_source (Optional[Callable[[str], bool]]): The process to delete the
+                                                             source of a file. Defaults to None.
+
+        Returns:
+            TransferResult: The result of each file with the same order as `files`.
+        """
+        if not files:
+            return TransferResult([])
+
+        condition: threading.Condition = threading.Condition()
+        in_flight_bytes: list[int] = [0]  # a list to be modified by the threads
+
+        def acquire(size: int) -> None:
+            with condition:
+                condition.wait_for(
+                    lambda: in_flight_bytes[0] == 0 or
+                    in_flight_bytes[0] + size <= self._max_in_flight_bytes
+                )
+                in_flight_bytes[0] += size
+
+        def release(size: int) -> None:
+            with condition:
+                in_flight_bytes[0] -= size
+                condition.notify_all()
+
+        def execute(file: tuple[str, str, int]) -> BulkResult[bool]:
+            source, target, size = file
+            acquire(size)
+
+            try:
+                if not transfer_file(source, target):
+                    return BulkResult(source, False)
+
+                if delete_source is not None and not delete_source(source):
+                    return BulkResult(source, False)
+
+                return BulkResult(source, True)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                return BulkResult(source, error=e)
+            finally:
+                release(size)
+
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(files))) as executor:
+            results: list[BulkResult[bool]] = list(executor.map(execute, files))
+
+        return TransferResult(
+            results,
+            sum(
+                size
+                for (_, _, size), result in zip(files, results)
+                if result.succeeded and result.value
+            )
+        )
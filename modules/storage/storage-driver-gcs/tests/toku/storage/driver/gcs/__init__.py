@@ -8,7 +8,19 @@ Classes:
     - AbstractGcsStorageDriverTest (abstract_gcs_storage_driver_test.py): Provides the abstract GCS storage driver tests
     - ReportedCredentialsGcsStorageDriverTests (reported_crendentials_gcs_storage_driver_tests.py): Provides the reported service account GCS storage driver tests
     - EnvironmentCredentialsGcsStorageDriverTests (environment_crendentials_gcs_storage_driver_tests.py): Provides the environment service account GCS storage driver tests
+    - AsyncGcsStorageDriverTests (async_gcs_storage_driver_tests.py): Provides the asynchronous GCS storage driver tests
+    - BlobChunkIOTests (blob_chunk_io_tests.py): Provides the BlobChunkIO tests
+    - CompositeUploadTests (composite_upload_tests.py): Provides the composite upload tests
+    - VirtualDirectoriesTests (virtual_directories_tests.py): Provides the virtual directories tests
+    - AppendBufferTests (append_buffer_tests.py): Provides the buffered appends tests
+    - BatchTests (batch_tests.py): Provides the batch requests tests
 """
 from .abstract_gcs_storage_driver_test import AbstractGcsStorageDriverTest as AbstractGcsStorageDriverTest
 from .reported_crendentials_gcs_storage_driver_tests import ReportedCredentialsGcsStorageDriverTests as ReportedCredentialsGcsStorageDriverTests
 from .environment_crendentials_gcs_storage_driver_tests import EnvironmentCredentialsGcsStorageDriverTests as EnvironmentCredentialsGcsStorageDriverTests
+from .async_gcs_storage_driver_tests import AsyncGcsStorageDriverTests as AsyncGcsStorageDriverTests
+from .blob_chunk_io_tests import BlobChunkIOTests as BlobChunkIOTests
+from .composite_upload_tests import CompositeUploadTests as CompositeUploadTests
+from .virtual_directories_tests import VirtualDirectoriesTests as VirtualDirectoriesTests
+from .append_buffer_tests import AppendBufferTests as AppendBufferTests
+from .batch_tests import BatchTests as BatchTests
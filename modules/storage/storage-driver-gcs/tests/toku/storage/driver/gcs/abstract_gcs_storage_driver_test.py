@@ -21,6 +21,7 @@ Author: Toku
 """
 from abc import ABC
 import os
+import tempfile
 from typing import Any, Generator
 import uuid
 from google.oauth2 import service_account  # type:ignore[import-untyped]
@@ -28,6 +29,7 @@ from google.cloud import storage  # type:ignore[import-untyped]
 from overrides import override
 import pytest
 from tests.toku.storage.driver.api import AbstractStorageDriverTest
+from toku.storage.driver.api import PathType
 from toku.storage.driver.gcs import GcsStorageDriver
 
 
@@ -149,3 +151,146 @@ class AbstractGcsStorageDriverTest(AbstractStorageDriverTest[GcsStorageDriver],
         )
         storage_driver.open()
         storage_driver.close()
+
+    def test_put_file_as__path_as_string__file_bigger_than_composite_threshold__then_return_true(self) -> None:
+        storage_driver = GcsStorageDriver(
+            self._working_directory_primary_storage_driver,
+            AbstractGcsStorageDriverTest.GCP_PROJECT_ID,
+            AbstractGcsStorageDriverTest.GCP_BUCKET_NAME,
+            AbstractGcsStorageDriverTest.GCP_CREDENTIALS,
+            composite_threshold=10,
+            composite_part_size=4
+        )
+        storage_driver.open()
+        content: bytes = bytes(range(50))
+
+        with tempfile.TemporaryDirectory() as directory:
+            source: str = os.path.join(directory, "file.txt")
+
+            with open(source, "wb") as f:
+                f.write(content)
+
+            assert storage_driver.put_file_as(source, "directory/file.txt")
+
+        assert storage_driver.get("directory/file.txt") == content
+        assert storage_driver.files("directory") == ["directory/file.txt"]
+        storage_driver.close()
+
+    def test_put_file_as__path_as_string__composite_parts_bigger_than_resumable_threshold__then_return_true(self) -> None:
+        part_size: int = 9 * 1024 * 1024  # a part bigger than 8 MB is uploaded with a resumable upload
+        storage_driver = GcsStorageDriver(
+            self._working_directory_primary_storage_driver,
+            AbstractGcsStorageDriverTest.GCP_PROJECT_ID,
+            AbstractGcsStorageDriverTest.GCP_BUCKET_NAME,
+            AbstractGcsStorageDriverTest.GCP_CREDENTIALS,
+            composite_threshold=part_size,
+            composite_part_size=part_size
+        )
+        storage_driver.open()
+        content: bytes = os.urandom(2 * part_size + 10)
+
+        with tempfile.TemporaryDirectory() as directory:
+            source: str = os.path.join(directory, "file.txt")
+
+            with open(source, "wb") as f:
+                f.write(content)
+
+            assert storage_driver.put_file_as(source, "directory/file.txt")
+
+        assert storage_driver.get("directory/file.txt") == content
+        storage_driver.close()
+
+    def test_append__append_buffer_size__then_flush_buffered_appends(self) -> None:
+        storage_driver = GcsStorageDriver(
+            self._working_directory_primary_storage_driver,
+            AbstractGcsStorageDriverTest.GCP_PROJECT_ID,
+            AbstractGcsStorageDriverTest.GCP_BUCKET_NAME,
+            AbstractGcsStorageDriverTest.GCP_CREDENTIALS,
+            append_buffer_size=10
+        )
+        storage_driver.open()
+        assert AbstractGcsStorageDriverTest.BUCKET is not None
+        blob = AbstractGcsStorageDriverTest.BUCKET.blob(f"{self._working_directory_primary_storage_driver}file.txt")
+
+        assert storage_driver.put_file_as(b"content", "file.txt")
+        assert storage_driver.append(b"-1234", "file.txt")
+        assert blob.download_as_bytes() == b"content"  # buffered
+        assert storage_driver.append(b"-5678", "file.txt")
+        assert blob.download_as_bytes() == b"content-1234-5678"  # flushed by size
+        assert storage_driver.append(b"-9", "file.txt")
+        assert storage_driver.get("file.txt") == b"content-1234-5678-9"  # flushed before reading
+        assert storage_driver.append(b"-0", "file.txt")
+        storage_driver.close()
+        assert blob.download_as_bytes() == b"content-1234-5678-9-0"  # flushed when closing
+
+    def test_put_file_as__virtual_directories__then_not_create_placeholders(self) -> None:
+        storage_driver = GcsStorageDriver(
+            self._working_directory_primary_storage_driver,
+            AbstractGcsStorageDriverTest.GCP_PROJECT_ID,
+            AbstractGcsStorageDriverTest.GCP_BUCKET_NAME,
+            AbstractGcsStorageDriverTest.GCP_CREDENTIALS,
+            virtual_directories=True
+        )
+        storage_driver.open()
+        assert AbstractGcsStorageDriverTest.BUCKET is not None
+
+        assert storage_driver.put_file_as(b"content", "directory1/directory2/file.txt")
+        assert not AbstractGcsStorageDriverTest.BUCKET.blob(f"{self._working_directory_primary_storage_driver}directory1/").exists()
+        assert storage_driver.exists_directory("directory1")
+        assert storage_driver.exists_directory("directory1/directory2")
+        assert storage_driver.all_directories("") == ["directory1", "directory1/directory2"]
+        assert storage_driver.delete("directory1/directory2/file.txt")
+        assert not storage_driver.exists_directory("directory1")
+        storage_driver.close()
+
+    def test_get_metadata__directory__then_return_timestamps_of_files(self) -> None:
+        assert self._storage_driver.put_file_as(b"content", "directory/file1.txt")
+        assert self._storage_driver.put_file_as(b"content", "directory/directory/file2.txt")
+        file1 = self._storage_driver.get_metadata("directory/file1.txt")
+        file2 = self._storage_driver.get_metadata("directory/directory/file2.txt")
+        directory = self._storage_driver.get_metadata("directory")
+
+        assert file1 is not None and file2 is not None and directory is not None
+        assert directory.creation_time == min(file1.creation_time, file2.creation_time)
+        assert directory.last_modified == max(file1.last_modified, file2.last_modified)
+        assert isinstance(directory.last_modified, int) and isinstance(file1.last_modified, int)
+
+    def test_copy_directory__virtual_directories_and_made_target__then_return_true(self) -> None:
+        storage_driver = GcsStorageDriver(
+            self._working_directory_primary_storage_driver,
+            AbstractGcsStorageDriverTest.GCP_PROJECT_ID,
+            AbstractGcsStorageDriverTest.GCP_BUCKET_NAME,
+            AbstractGcsStorageDriverTest.GCP_CREDENTIALS,
+            virtual_directories=True
+        )
+        storage_driver.open()
+
+        assert storage_driver.put_file_as(b"content", "source/file.txt")
+        assert storage_driver.make_directory("target")
+        assert storage_driver.stat("target").type == PathType.DIRECTORY
+        assert storage_driver.copy_directory("source", "target")
+        assert storage_driver.get("target/source/file.txt") == b"content"
+        assert storage_driver.make_directory("moved")
+        assert storage_driver.move_directory("target/source", "moved")
+        assert storage_driver.get("moved/source/file.txt") == b"content"
+        storage_driver.close()
+
+    def test_remove_directory_placeholders__placeholders__then_keep_only_empty_directories(self) -> None:
+        assert self._storage_driver.put_file_as(b"content", "directory1/directory2/file.txt")
+        assert self._storage_driver.make_directory("directory3")
+
+        results = self._storage_driver.remove_directory_placeholders()
+
+        assert sorted(result.path for result in results if result.value) == ["", "directory1", "directory1/directory2"]
+        assert self._storage_driver.exists_directory("directory3")
+        storage_driver = GcsStorageDriver(
+            self._working_directory_primary_storage_driver,
+            AbstractGcsStorageDriverTest.GCP_PROJECT_ID,
+            AbstractGcsStorageDriverTest.GCP_BUCKET_NAME,
+            AbstractGcsStorageDriverTest.GCP_CREDENTIALS,
+            virtual_directories=True
+        )
+        storage_driver.open()
+        assert storage_driver.all_directories("") == ["directory1", "directory1/directory2", "directory3"]
+        assert storage_driver.get("directory1/directory2/file.txt") == b"content"
+        storage_driver.close()
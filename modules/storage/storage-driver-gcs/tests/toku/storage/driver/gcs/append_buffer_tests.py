@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa: E501
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=empty-docstring
+# pylint: disable=line-too-long
+# pylint: disable=attribute-defined-outside-init
+# pylint: disable=protected-access
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: append_buffer_tests.py
+Author: Toku
+"""
+import threading
+import time
+from typing import Generator
+from flexmock import flexmock
+import pytest
+from toku.storage.driver.api import Metadata
+from toku.storage.driver.api import PathType
+from toku.storage.driver.api import Stat
+from toku.storage.driver.api import StorageDriverException
+from toku.storage.driver.gcs import GcsStorageDriver
+
+
+class AppendBufferTests:
+    """
+    Provides test cases for the buffered appends of GcsStorageDriver class.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup_test(self) -> Generator[None, None, None]:
+        # setup
+        self._composed: list[tuple[bytes, str]] = []
+        self._failures: int = 0
+        self._attempted: threading.Event = threading.Event()
+        self._storage_driver = GcsStorageDriver(
+            "root",
+            "project",
+            "bucket",
+            append_buffer_size=1024,
+            append_flush_interval=0.01
+        )
+        flexmock(self._storage_driver).should_receive("_compose_append").replace_with(self._compose_append)
+
+        # return control to the test
+        yield
+
+    def _compose_append(self, source: bytes, file: str) -> None:
+        try:
+            if self._failures > 0:
+                self._failures -= 1
+                raise ConnectionError("connection reset")
+
+            self._composed.append((source, file))
+        finally:
+            self._attempted.set()
+
+    def _wait_flush_by_time(self) -> None:
+        assert self._attempted.wait(5)
+
+        # the error is kept after the compose fails
+        for _ in range(500):
+            with self._storage_driver._append_buffers_lock:
+                if self._storage_driver._append_errors:
+                    return
+
+            time.sleep(0.01)
+
+    def test_append__failed_flush_by_time__then_raise_exception_in_next_append(self) -> None:
+        self._failures = 1
+
+        assert self._storage_driver._append(b"content", "file.txt")
+        self._wait_flush_by_time()
+
+        with pytest.raises(StorageDriverException):
+            self._storage_driver._append(b"-1234", "file.txt")
+
+        self._storage_driver.flush()
+        assert self._composed == [(b"content", "file.txt")]
+
+    def test_flush__failed_flush_by_time__then_write_appends_and_raise_exception(self) -> None:
+        self._failures = 1
+
+        assert self._storage_driver._append(b"content", "file.txt")
+        self._wait_flush_by_time()
+
+        with pytest.raises(StorageDriverException):
+            self._storage_driver.flush()
+
+        assert self._composed == [(b"content", "file.txt")]
+        self._storage_driver.flush()
+
+    def test_transfer_file__gcs_target_with_buffered_appends__then_discard_appends_before_rewrite(self) -> None:
+        target_storage_driver = GcsStorageDriver("root", "project", "bucket", append_buffer_size=1024)
+        flexmock(target_storage_driver).should_receive("_compose_append").never()
+        flexmock(target_storage_driver).should_receive("_prepare_put_file").and_return(True)
+        flexmock(target_storage_driver).should_receive("_create_blob").and_return(None)
+        flexmock(self._storage_driver).should_receive("_create_blob").and_return(None)
+        flexmock(self._storage_driver).should_receive("_rewrite_blob").replace_with(
+            lambda source, target: self._composed.append((b"rewrite", "target.txt"))
+        ).once()
+
+        assert target_storage_driver._append(b"content", "target.txt")
+        assert self._storage_driver._transfer_file("source.txt", "target.txt", target_storage_driver)
+        assert not target_storage_driver._append_buffers
+        target_storage_driver.flush()
+        assert self._composed == [(b"rewrite", "target.txt")]
+
+    def test_delete__buffered_appends__then_discard_them_without_flushing(self) -> None:
+        deleted: list[bool] = []
+        flexmock(self._storage_driver).should_receive("_create_blob").and_return(flexmock(delete=lambda: deleted.append(True)))
+        flexmock(self._storage_driver).should_receive("_check_parent_directory_and_create")
+        self._storage_driver._append_flush_interval = None  # only flushed by the test
+
+        assert self._storage_driver._append(b"content", "file.txt")
+        assert self._storage_driver.stat("file.txt") == Stat(PathType.FILE)
+        assert self._storage_driver.delete("file.txt")
+        assert deleted == [True]
+        assert not self._storage_driver._append_buffers
+        assert self._composed == []
+
+    def test_get_metadata__buffered_appends__then_flush_them_before_getting_metadata(self) -> None:
+        metadata: Metadata = flexmock()  # type: ignore[assignment]
+        flexmock(self._storage_driver).should_receive("stat").and_return(Stat(PathType.FILE, metadata))
+        self._storage_driver._append_flush_interval = None  # only flushed by the test
+
+        assert self._storage_driver._append(b"content", "file.txt")
+        assert self._storage_driver.get_metadata("file.txt") is metadata
+        assert self._composed == [(b"content", "file.txt")]
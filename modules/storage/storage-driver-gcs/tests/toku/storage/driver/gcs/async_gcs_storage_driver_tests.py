@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa: E501
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=empty-docstring
+# pylint: disable=line-too-long
+# pylint: disable=attribute-defined-outside-init
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: async_gcs_storage_driver_tests.py
+Author: Toku
+"""
+import os
+from typing import Any, AsyncIterator, Generator, Optional, final
+import uuid
+from google.oauth2 import service_account  # type:ignore[import-untyped]
+from google.cloud import storage  # type:ignore[import-untyped]
+from overrides import override
+import pytest
+from tests.toku.storage.driver.api import AbstractAsyncStorageDriverTest
+from toku.storage.driver.api import StorageDriverException
+from toku.storage.driver.gcs import AsyncGcsStorageDriver
+
+
+@final
+class AsyncGcsStorageDriverTests(AbstractAsyncStorageDriverTest[AsyncGcsStorageDriver]):
+    """
+    Provides the asynchronous google cloud storage driver tests.
+
+    To run the tests is required to set the same environment variables
+    of `AbstractGcsStorageDriverTest`.
+    """
+
+    GCP_PROJECT_ID: str = ""
+    GCP_BUCKET_NAME: str = ""
+    GCP_CREDENTIALS: str = ""
+    BUCKET: Any | None = None
+    WD: str = ""
+
+    @override
+    def _initialize_test(self) -> None:
+        self._working_directory: str = f"{AsyncGcsStorageDriverTests.WD}{str(uuid.uuid4())}/"
+
+        if AsyncGcsStorageDriverTests.BUCKET:
+            AsyncGcsStorageDriverTests.BUCKET.blob(self._working_directory).upload_from_string(b"")
+
+    @override
+    def _teardown_test(self) -> None:
+        pass  # not needed
+
+    @override
+    def _create_storage_driver(self) -> AsyncGcsStorageDriver:
+        return AsyncGcsStorageDriver(
+            self._working_directory,
+            AsyncGcsStorageDriverTests.GCP_PROJECT_ID,
+            AsyncGcsStorageDriverTests.GCP_BUCKET_NAME,
+            AsyncGcsStorageDriverTests.GCP_CREDENTIALS
+        )
+
+    @pytest.fixture(scope="class", autouse=True)
+    def setup_tests(self) -> Generator[None, None, None]:
+        # setup
+        AsyncGcsStorageDriverTests.GCP_PROJECT_ID = os.environ.get("GCP_PROJECT_ID", "")
+        AsyncGcsStorageDriverTests.GCP_BUCKET_NAME = os.environ.get("GCP_BUCKET_NAME", "")
+        AsyncGcsStorageDriverTests.GCP_CREDENTIALS = os.environ.get("GCP_CREDENTIALS_FILE", "")
+        AsyncGcsStorageDriverTests.WD = f"{str(uuid.uuid4())}/"
+
+        credentials = service_account.Credentials.from_service_account_file(AsyncGcsStorageDriverTests.GCP_CREDENTIALS)
+        self._storage = storage.Client(
+            project=AsyncGcsStorageDriverTests.GCP_PROJECT_ID,
+            credentials=credentials
+        )
+        AsyncGcsStorageDriverTests.BUCKET = self._storage.bucket(AsyncGcsStorageDriverTests.GCP_BUCKET_NAME)
+        AsyncGcsStorageDriverTests.BUCKET.blob(AsyncGcsStorageDriverTests.WD).upload_from_string(b"")
+
+        # return control to the test
+        yield
+
+        # teardown
+        blobs = AsyncGcsStorageDriverTests.BUCKET.list_blobs(prefix=AsyncGcsStorageDriverTests.WD)
+
+        for blob in blobs:
+            blob.delete()
+
+        self._storage.close()
+
+    def test_iter_chunks__file_deleted_before_iterating__then_raise_exception(self) -> None:
+        assert self._run(self._storage_driver.put_file_as(b"content", "file.txt"))
+
+        async def execute() -> Optional[list[bytes]]:
+            chunks: Optional[AsyncIterator[bytes]] = await self._storage_driver.iter_chunks("file.txt")
+            assert chunks is not None
+            assert await self._storage_driver.delete("file.txt")
+            return await self._collect(chunks)
+
+        with pytest.raises(StorageDriverException):
+            self._run(execute())
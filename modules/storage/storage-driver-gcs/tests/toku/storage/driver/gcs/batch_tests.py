@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa: E501
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=empty-docstring
+# pylint: disable=line-too-long
+# pylint: disable=attribute-defined-outside-init
+# pylint: disable=protected-access
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: batch_tests.py
+Author: Toku
+"""
+from typing import Any, Generator
+from flexmock import flexmock
+from google.cloud import storage  # type:ignore[import-untyped]
+from google.cloud.storage.batch import Batch  # type:ignore[import-untyped]
+import pytest
+from toku.storage.driver.api import PathType
+from toku.storage.driver.gcs import GcsStorageDriver
+
+
+class FakeResponse:
+    """
+    Fake response of a request of a batch.
+    """
+
+    def __init__(self, status_code: int) -> None:
+        self.status_code: int = status_code
+        self.text: str = ""
+
+
+class BatchTests:
+    """
+    Provides test cases for the batch requests of GcsStorageDriver class.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup_test(self) -> Generator[None, None, None]:
+        # setup
+        self._requests: list[str] = []
+        self._responses: list[FakeResponse] = []
+        self._storage_driver = GcsStorageDriver("root", "project", "bucket")
+        self._storage_driver._storage = storage.Client.create_anonymous_client()
+        flexmock(Batch).should_receive("finish").replace_with(self._finish)
+
+        # return control to the test
+        yield
+
+    def _finish(self, raise_exception: bool = True) -> list[Any]:  # pylint: disable=unused-argument
+        return self._responses
+
+    def _create_blob(self, name: str) -> Any:
+        blob = flexmock(name=name)
+        blob.should_receive("reload").replace_with(lambda: self._requests.append(name))
+        return blob
+
+    def test_execute_batch__blobs__then_return_response_of_each_request(self) -> None:
+        self._responses = [FakeResponse(200), FakeResponse(404)]
+        blobs = [self._create_blob("file-1.txt"), self._create_blob("file-2.txt")]
+
+        responses = self._storage_driver._execute_batch(blobs, lambda blob: blob.reload())
+
+        assert self._requests == ["file-1.txt", "file-2.txt"]
+        assert responses == self._responses
+
+    def test_stat__directory_blob_found__then_return_directory(self) -> None:
+        self._responses = [FakeResponse(404), FakeResponse(200)]
+        flexmock(self._storage_driver).should_receive("_create_blob").replace_with(
+            lambda path, is_directory=False: self._create_blob(f"{path}/" if is_directory else path)
+        )
+
+        assert self._storage_driver.stat("directory").type == PathType.DIRECTORY
+        assert self._requests == ["directory", "directory/"]
+
+    def test_batch__responses_and_errors__then_return_blob_none_or_error(self) -> None:
+        self._responses = [FakeResponse(200), FakeResponse(404), FakeResponse(500)]
+        flexmock(self._storage_driver).should_receive("_create_blob").replace_with(self._create_blob)
+
+        results = self._storage_driver._batch(["file-1.txt", "file-2.txt", "file-3.txt"], lambda blob: blob.reload())
+
+        assert results[0].value is not None and results[0].value.name == "file-1.txt"
+        assert results[1].succeeded and results[1].value is None
+        assert not results[2].succeeded
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa: E501
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=empty-docstring
+# pylint: disable=line-too-long
+# pylint: disable=attribute-defined-outside-init
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: blob_chunk_io_tests.py
+Author: Toku
+"""
+from io import BufferedReader
+from google.api_core.exceptions import RequestRangeNotSatisfiable
+from toku.storage.driver.gcs import BlobChunkIO
+
+
+class FakeBlob:
+    """
+    Fake blob to download ranges of a content in memory.
+    """
+
+    def __init__(self, content: bytes) -> None:
+        self.content: bytes = content
+        self.downloads: list[tuple[int, int]] = []
+
+    def download_as_bytes(self, start: int, end: int) -> bytes:
+        self.downloads.append((start, end))
+        if start >= len(self.content):
+            raise RequestRangeNotSatisfiable("range not satisfiable")
+        return self.content[start:end + 1]
+
+
+class BlobChunkIOTests:
+    """
+    Provides test cases for BlobChunkIO class.
+    """
+
+    def test_read__whole_blob__then_return_bytes_by_chunks(self) -> None:
+        blob = FakeBlob(bytes(range(250)))
+
+        with BufferedReader(BlobChunkIO(blob, 0, None, 100)) as input_stream:
+            assert input_stream.read(10) == bytes(range(10))
+            assert input_stream.read() == bytes(range(10, 250))
+
+        assert blob.downloads == [(0, 99), (100, 199), (200, 299)]
+
+    def test_read__blob_size_multiple_of_chunk_size__then_return_bytes(self) -> None:
+        blob = FakeBlob(bytes(range(200)))
+
+        with BufferedReader(BlobChunkIO(blob, 0, None, 100), buffer_size=16) as input_stream:
+            content: bytes = b""
+            while data := input_stream.read(30):
+                content += data
+
+        assert content == bytes(range(200))
+        assert blob.downloads == [(0, 99), (100, 199), (200, 299)]
+
+    def test_read__range__then_return_bytes_of_range(self) -> None:
+        blob = FakeBlob(bytes(range(250)))
+
+        with BufferedReader(BlobChunkIO(blob, 50, 120, 100)) as input_stream:
+            assert input_stream.read() == bytes(range(50, 170))
+
+        assert blob.downloads == [(50, 149), (150, 169)]
+
+    def test_read__empty_range_or_offset_after_end__then_return_empty_bytes(self) -> None:
+        blob = FakeBlob(bytes(range(10)))
+
+        with BufferedReader(BlobChunkIO(blob, 0, 0, 100)) as input_stream:
+            assert input_stream.read() == b""
+        with BufferedReader(BlobChunkIO(blob, 20, None, 100)) as input_stream:
+            assert input_stream.read() == b""
+
+        assert blob.downloads == [(20, 119)]
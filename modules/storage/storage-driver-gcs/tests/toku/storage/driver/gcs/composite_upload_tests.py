@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa: E501
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=empty-docstring
+# pylint: disable=line-too-long
+# pylint: disable=attribute-defined-outside-init
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: composite_upload_tests.py
+Author: Toku
+"""
+import os
+import tempfile
+from io import RawIOBase
+from typing import Generator
+from flexmock import flexmock
+import pytest
+from toku.storage.driver.gcs import GcsStorageDriver
+
+
+class FakeBlob:
+    """
+    Fake blob to upload a stream in memory, like a resumable upload it
+    requires a stream at its beginning.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+        self.content: bytes = b""
+
+    def upload_from_file(self, stream: RawIOBase, size: int) -> None:
+        if stream.tell() != 0:
+            raise ValueError("Stream must be at beginning.")
+        self.content = stream.read(size) or b""
+
+    def compose(self, blobs: list["FakeBlob"]) -> None:
+        self.content = b"".join(blob.content for blob in blobs)
+
+
+class CompositeUploadTests:
+    """
+    Provides test cases for the composite uploads of GcsStorageDriver class.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup_test(self) -> Generator[None, None, None]:
+        # setup
+        self._tempdir = tempfile.TemporaryDirectory()
+        self._file: str = os.path.join(self._tempdir.name, "file.txt")
+
+        with open(self._file, "wb") as f:
+            f.write(bytes(range(250)))
+
+        # return control to the test
+        yield
+
+        # teardown
+        self._tempdir.cleanup()
+
+    def test_put_file_as_composite__parts_uploaded_from_beginning_of_stream__then_compose_content(self) -> None:
+        storage_driver = GcsStorageDriver("root", "project", "bucket", composite_part_size=64)
+        blobs: dict[str, FakeBlob] = {}
+        flexmock(storage_driver).should_receive("_create_blob").replace_with(
+            lambda name: blobs.setdefault(name, FakeBlob(name))
+        )
+        flexmock(storage_driver).should_receive("_delete_blobs").replace_with(lambda names: [])
+
+        storage_driver._put_file_as_composite(self._file, 250, "directory/file.txt")  # pylint: disable=protected-access
+
+        assert blobs["directory/file.txt"].content == bytes(range(250))
+        assert len(blobs) == 5
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa: E501
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=empty-docstring
+# pylint: disable=line-too-long
+# pylint: disable=attribute-defined-outside-init
+# pylint: disable=protected-access
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: virtual_directories_tests.py
+Author: Toku
+"""
+from typing import Generator, Iterator, Optional
+from flexmock import flexmock
+import pytest
+from toku.storage.driver.api import Page
+from toku.storage.driver.api import PathType
+from toku.storage.driver.api import Stat
+from toku.storage.driver.gcs import GcsStorageDriver
+
+
+class FakeBlob:
+    """
+    Fake blob with only the name of a listing.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+
+
+class FakeBlobs:
+    """
+    Fake listing of blobs, the page token is the index of the first blob
+    of the next page.
+    """
+
+    def __init__(self, names: list[str], page_size: Optional[int], page_token: Optional[str]) -> None:
+        start: int = int(page_token) if page_token is not None else 0
+        size: int = page_size or len(names) or 1
+        self._pages: list[list[FakeBlob]] = [
+            [FakeBlob(name) for name in names[index:index + size]]
+            for index in range(start, len(names), size)
+        ]
+        self._starts: list[int] = list(range(start, len(names), size))
+        self._total: int = len(names)
+        self.next_page_token: Optional[str] = None
+
+    @property
+    def pages(self) -> Iterator[list[FakeBlob]]:
+        for start, page in zip(self._starts, self._pages):
+            end: int = start + len(page)
+            self.next_page_token = str(end) if end < self._total else None
+            yield page
+
+    def __iter__(self) -> Iterator[FakeBlob]:
+        for page in self.pages:
+            yield from page
+
+
+class VirtualDirectoriesTests:
+    """
+    Provides test cases for the virtual directories of GcsStorageDriver class.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup_test(self) -> Generator[None, None, None]:
+        # setup
+        self._names: list[str] = []
+        self._storage_driver = GcsStorageDriver("root", "project", "bucket", virtual_directories=True)
+        flexmock(self._storage_driver).should_receive("_list_blobs").replace_with(self._list_blobs)
+        flexmock(self._storage_driver).should_receive("_flush_appends")
+
+        # return control to the test
+        yield
+
+    def _list_blobs(
+            self,
+            directory: str,
+            use_delimiter: bool,  # pylint: disable=unused-argument
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> FakeBlobs:
+        prefix: str = self._storage_driver._add_root_in_path(directory, True)
+        return FakeBlobs(
+            sorted(name for name in self._names if name.startswith(prefix)),
+            page_size,
+            page_token
+        )
+
+    def test_make_directory__without_blob__then_exists_directory(self) -> None:
+        flexmock(self._storage_driver).should_receive("stat").and_return(Stat(PathType.MISSING)).once()
+
+        assert self._storage_driver.make_directory("directory1/directory2")
+        assert self._storage_driver.exists_directory("directory1/directory2")
+        assert self._storage_driver.exists_directory("directory1")
+        assert not self._storage_driver.exists_directory("directory3")
+
+    def test_make_directory__then_blob_created_and_deleted__then_not_exists_directory(self) -> None:
+        flexmock(self._storage_driver).should_receive("stat").and_return(Stat(PathType.MISSING)).once()
+        self._storage_driver.make_directory("directory1")
+        self._names.append("root/directory1/file.txt")
+
+        assert self._storage_driver.exists_directory("directory1")
+
+        self._names.clear()
+
+        assert not self._storage_driver.exists_directory("directory1")
+
+    def test_make_directory__then_delete_directory__then_not_exists_directory(self) -> None:
+        flexmock(self._storage_driver).should_receive("stat").and_return(Stat(PathType.MISSING)).once()
+        flexmock(self._storage_driver).should_receive("_delete_blobs").and_return([])
+        self._storage_driver.make_directory("directory1/directory2")
+
+        assert self._storage_driver._delete_directory("directory1")
+        assert not self._storage_driver.exists_directory("directory1")
+        assert not self._storage_driver.exists_directory("directory1/directory2")
+
+    def test_iter_all_directories__resumed_from_page_token__then_skip_returned_directories(self) -> None:
+        self._names = [
+            "root/directory1/directory2/file1.txt",
+            "root/directory1/directory2/file2.txt",
+            "root/directory1/directory3/file3.txt",
+            "root/directory4/file4.txt"
+        ]
+
+        pages: list[Page] = list(self._storage_driver._iter_all_directories("", 1, None))
+        paths: list[str] = [path for page in pages for path in page.items]
+        resumed: list[str] = [
+            path
+            for page in self._storage_driver._iter_all_directories("", 1, pages[0].next_page_token)
+            for path in page.items
+        ]
+
+        assert paths == ["directory1", "directory1/directory2", "directory1/directory3", "directory4"]
+        assert resumed == ["directory1/directory3", "directory4"]
+
+    def test_get_returned_virtual_directories__first_blob_of_directory__then_return_only_previous_parents(self) -> None:
+        self._names = [
+            "root/directory1/a.txt",
+            "root/directory1/directory2/file2.txt"
+        ]
+
+        assert self._storage_driver._get_returned_virtual_directories("root/directory1/a.txt", "") == set()
+        assert self._storage_driver._get_returned_virtual_directories("root/directory1/directory2/file2.txt", "") == {"directory1"}
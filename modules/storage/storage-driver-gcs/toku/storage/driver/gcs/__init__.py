@@ -5,6 +5,12 @@
 This package provides the StorageDriver GCS.
 
 Classes:
+    - ReadMode (gcs_storage_driver.py): The modes to read a blob as an input stream
+    - BlobChunkIO (gcs_storage_driver.py): The raw stream to read a blob with chunked range downloads
     - GcsStorageDriver (gcs_storage_driver.py): The GCS storage driver implementation
+    - AsyncGcsStorageDriver (async_gcs_storage_driver.py): The asynchronous GCS storage driver implementation
 """
+from .gcs_storage_driver import ReadMode as ReadMode
+from .gcs_storage_driver import BlobChunkIO as BlobChunkIO
 from .gcs_storage_driver import GcsStorageDriver as GcsStorageDriver
+from .async_gcs_storage_driver import AsyncGcsStorageDriver as AsyncGcsStorageDriver
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=protected-access
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: async_gcs_storage_driver.py
+Author: Toku
+"""
+from concurrent.futures import Executor
+from io import BufferedReader
+from typing import AsyncIterator, Optional, final
+from google.cloud import storage  # type:ignore[import-untyped]
+from overrides import override
+from toku.storage.driver.api import DirectorySeparator
+from toku.storage.driver.api import Metadata
+from toku.storage.driver.api import AbstractAsyncStorageDriver
+from toku.storage.driver.api import StorageDriverException
+from toku.storage.driver.gcs import GcsStorageDriver
+
+
+@final
+class AsyncGcsStorageDriver(AbstractAsyncStorageDriver):
+    """
+    Provides the asynchronous storage driver to work with Google Cloud Storage
+    (a blob storage), it's necessary that the service account has the the access
+    to work within the `bucket` for the `project`.
+
+    The HTTP calls are executed by the internal `GcsStorageDriver` in the executor,
+    on that way a slow request never blocks the event loop, the content of a file
+    is iterated with ranged downloads instead of copying the blob to the local disk.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+            self,
+            root: str,
+            project_id: str,
+            bucket_name: str,
+            credentials_file: Optional[str] = None,
+            executor: Optional[Executor] = None
+    ) -> None:
+        """
+        Initializes a new asynchronous GCS (Google Cloud Storage) storage driver.
+
+        Args:
+            root (str): The working directory (without the bucket name).
+            project_id (str): The GCP (Google Cloud Platform) project ID.
+            bucket_name (str): The name of the bucket.
+            credentials_file (Optional[str], optional): The path to the credential file.
+                                                        It's recommended to use a service account.
+            executor (Optional[Executor]): The executor to run the HTTP calls.
+                                           Defaults to None (event loop executor).
+        """
+        super().__init__(root, DirectorySeparator.SLASH, executor)
+        self._storage_driver: GcsStorageDriver = GcsStorageDriver(
+            root,
+            project_id,
+            bucket_name,
+            credentials_file
+        )
+
+    @override
+    async def open(self) -> None:
+        await self._run(self._storage_driver.open)
+
+    @override
+    async def close(self) -> None:
+        await self._run(self._storage_driver.close)
+
+    @override
+    async def _iter_chunks(  # pylint: disable=invalid-overridden-method
+            self,
+            file: str,
+            chunk_size: int
+    ) -> AsyncIterator[bytes]:
+        # `bucket.get_blob` is used to know the size of the blob and its
+        # generation, on that way every ranged download belongs to the same
+        # version of the blob even if it's replaced while iterating
+        blob = await self._run(
+            self._storage_driver._bucket.get_blob,
+            self._storage_driver._add_root_in_path(file)
+        )
+
+        if blob is None:  # the blob was deleted after checking that it exists
+            raise StorageDriverException(f"file {file} doesn't exist")
+
+        start: int = 0
+
+        while start < blob.size:
+            end: int = min(start + chunk_size, blob.size) - 1
+            yield await self._run(self._download_range, blob, start, end)
+            start = end + 1
+
+    @override
+    async def exists(self, file: str) -> bool:
+        return await self._run(self._storage_driver.exists, file)
+
+    @override
+    async def _put_file_as(self, source: BufferedReader, file: str) -> bool:
+        return await self._run(self._storage_driver._put_file_as, source, file)
+
+    @override
+    async def _delete(self, file: str) -> bool:
+        return await self._run(self._storage_driver._delete, file)
+
+    @override
+    async def _files(self, directory: str) -> list[str]:
+        return await self._run(self._storage_driver._files, directory)
+
+    @override
+    async def _all_files(self, directory: str) -> list[str]:
+        return await self._run(self._storage_driver._all_files, directory)
+
+    @override
+    async def _directories(self, directory: str) -> list[str]:
+        return await self._run(self._storage_driver._directories, directory)
+
+    @override
+    async def _all_directories(self, directory: str) -> list[str]:
+        return await self._run(self._storage_driver._all_directories, directory)
+
+    @override
+    async def exists_directory(self, directory: str) -> bool:
+        return await self._run(self._storage_driver.exists_directory, directory)
+
+    @override
+    async def _make_directory(self, directory: str) -> bool:
+        return await self._run(self._storage_driver._make_directory, directory)
+
+    @override
+    async def _delete_directory(self, directory: str) -> bool:
+        return await self._run(self._storage_driver._delete_directory, directory)
+
+    @override
+    async def _get_metadata_from_file(self, file: str) -> Metadata:
+        return await self._run(self._storage_driver._get_metadata_from_file, file)
+
+    @override
+    async def _get_metadata_from_directory(self, directory: str) -> Metadata:
+        return await self._run(self._storage_driver._get_metadata_from_directory, directory)
+
+    @staticmethod
+    def _download_range(  # type:ignore[no-any-unimported]
+            blob: storage.Blob,
+            start: int,
+            end: int
+    ) -> bytes:
+        """
+        Downloads the bytes between `start` and `end` (both inclusive) of the
+        `blob` for the generation obtained when it was loaded.
+
+        Args:
+            blob (Blob): The blob.
+            start (int): The first byte.
+            end (int): The last byte.
+
+        Returns:
+            bytes: The content of the range.
+        """
+        content: bytes = blob.download_as_bytes(
+            start=start,
+            end=end,
+            if_generation_match=blob.generation
+        )
+
+        return content
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+# pylint: disable=too-many-lines
 """
 Private License - For Internal Use Only
 
@@ -12,17 +13,32 @@ prior written permission from Toku.
 Module: gcs_storage_driver.py
 Author: Toku
 """
-from io import BufferedReader, BytesIO
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from io import BufferedReader, BytesIO, RawIOBase
 import os
 from tempfile import NamedTemporaryFile
+import threading
 import time
-from typing import Optional, final
+from typing import Any, Callable, Iterable, Iterator, Optional, final
+from google.api_core.exceptions import RequestRangeNotSatisfiable
+from google.api_core.page_iterator import HTTPIterator
+from google.api_core.page_iterator import Page as BlobsPage
 from google.oauth2 import service_account  # type:ignore[import-untyped]
 from google.cloud import storage  # type:ignore[import-untyped]
+from google.cloud.storage.batch import Batch  # type:ignore[import-untyped]
 from overrides import override
 from toku.storage.driver.api import DirectorySeparator
 from toku.storage.driver.api import Size
 from toku.storage.driver.api import Metadata
+from toku.storage.driver.api import BulkResult
+from toku.storage.driver.api import Page
+from toku.storage.driver.api import PathType
+from toku.storage.driver.api import Stat
+from toku.storage.driver.api import Checksum
+from toku.storage.driver.api import FileSliceIO
+from toku.storage.driver.api import StorageDriver
 from toku.storage.driver.api import AbstractStorageDriver
 from toku.storage.driver.api import StorageDriverException
 
@@ -61,20 +77,256 @@ class CustomBufferedReader(BufferedReader):
             os.remove(self._file.name)
 
 
+class ReadMode(Enum):
+    """
+    Provides the modes to read a blob as an input stream.
+    """
+
+    STREAMING = "STREAMING"  # chunked range downloads with read-ahead
+    TEMPORARY_FILE = "TEMPORARY_FILE"  # the whole blob is downloaded to a local temporary file
+
+
+@final
+class BlobChunkIO(RawIOBase):
+    """
+    Helper raw stream to read a blob (or a range of it) with range downloads of
+    `chunk_size` bytes, the next chunk is downloaded in a background thread
+    while the current one is read (read-ahead), so the first bytes are
+    available after the first chunk and nothing is written to the local disk.
+
+    The generation of the blob obtained by the first download is used by the
+    next ones, so a blob replaced while it's read is not mixed with the new one.
+    """
+
+    def __init__(  # type:ignore[no-any-unimported]
+            self,
+            blob: storage.Blob,
+            offset: int,
+            length: Optional[int],
+            chunk_size: int
+    ) -> None:
+        """
+        Starts the download of the first chunk of `length` bytes of `blob` from
+        `offset`, or until the end of the blob if `length` is None.
+
+        Args:
+            blob (Blob): The blob.
+            offset (int): The position of the first byte.
+            length (Optional[int]): The number of bytes.
+            chunk_size (int): The number of bytes of each download.
+        """
+        super().__init__()
+        self._blob = blob
+        self._position: int = offset  # the position of the next chunk to download
+        self._end: Optional[int] = None if length is None else offset + length
+        self._chunk_size: int = chunk_size
+        self._chunk: memoryview = memoryview(b"")  # the unread bytes of the current chunk
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
+        self._next_chunk: Optional[Future[bytes]] = self._download_next_chunk()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        if not self._chunk and not self._take_next_chunk():
+            return 0
+
+        size: int = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+    def readall(self) -> bytes:
+        chunks: list[bytes] = [self._chunk.tobytes()]
+
+        while self._take_next_chunk():
+            chunks.append(self._chunk.tobytes())
+
+        self._chunk = memoryview(b"")
+        return b"".join(chunks)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        super().close()
+
+    def _take_next_chunk(self) -> bool:
+        """
+        Waits for the download of the next chunk, makes it the current one and
+        starts the download of the following chunk.
+
+        Returns:
+            bool: True if there was a chunk with content, False at the end.
+        """
+        if self._next_chunk is None:  # there are no more chunks
+            return False
+
+        chunk: bytes = self._next_chunk.result()
+
+        # a chunk shorter than the chunk size is the last one
+        if len(chunk) < self._chunk_size:
+            self._next_chunk = None
+        else:
+            self._next_chunk = self._download_next_chunk()
+
+        self._chunk = memoryview(chunk)
+        return len(chunk) > 0
+
+    def _download_next_chunk(self) -> Optional[Future[bytes]]:
+        """
+        Starts the download of the chunk after the last requested one.
+
+        Returns:
+            Optional[Future[bytes]]: The future content of the chunk, None at the end.
+        """
+        if self._end is not None and self._position >= self._end:  # range is completed
+            return None
+
+        start: int = self._position
+        end: int = start + self._chunk_size
+
+        if self._end is not None:
+            end = min(end, self._end)
+
+        self._position = end
+        return self._executor.submit(self._download, start, end)
+
+    def _download(self, start: int, end: int) -> bytes:
+        """
+        Downloads the bytes of the blob from `start` to `end` (exclusive).
+
+        Args:
+            start (int): The position of the first byte.
+            end (int): The position after the last byte.
+
+        Returns:
+            bytes: The content, it's shorter at the end of the blob.
+        """
+        try:
+            content: bytes = self._blob.download_as_bytes(start=start, end=end - 1)
+            return content
+        except RequestRangeNotSatisfiable:  # start is after the end of the blob
+            return b""
+
+
+@final
+class ResponsesBatch(Batch):  # type:ignore[no-any-unimported]
+    """
+    Provides a batch request that keeps the responses returned by `finish`,
+    which is called when the batch context is exited, so the response of each
+    request is known without the private attributes of the batch.
+    """
+
+    def __init__(self, client: Any, raise_exception: bool = True) -> None:
+        """
+        Initializes a new ResponsesBatch.
+
+        Args:
+            client (Client): The client of the batch.
+            raise_exception (bool): Whether to raise the last failed response.
+                                    Defaults to True.
+        """
+        super().__init__(client, raise_exception)
+        self.responses: list[Any] = []  # the response of each request
+
+    @override
+    def finish(self, raise_exception: bool = True) -> list[Any]:
+        self.responses = super().finish(raise_exception)
+        return self.responses
+
+
+@final
+@dataclass
+class AppendBuffer:
+    """
+    Provides the appends of a file kept in memory until they are flushed.
+    """
+
+    lock: threading.RLock = field(default_factory=threading.RLock)  # guards the buffer
+    chunks: list[bytes] = field(default_factory=list)  # the appended content
+    size: int = 0  # the size of the appended content in bytes
+    timer: Optional[threading.Timer] = None  # the timer to flush by time
+
+
 @final
 class GcsStorageDriver(AbstractStorageDriver):
     """
     Provides the storage driver to work with Google Cloud Storage (a blob storage),
     it's necessary that the service account has the the access to work within
     the `bucket` for the `project`.
+
+    A blob is read as an input stream with chunked range downloads by default
+    (see `BlobChunkIO`), or downloaded to a temporary file with
+    `ReadMode.TEMPORARY_FILE`.
+
+    An input stream is uploaded with a resumable upload in chunks of
+    `upload_chunk_size` bytes, a local file is uploaded from its path and,
+    if it's bigger than `composite_threshold`, it's split in parts of
+    `composite_part_size` bytes uploaded concurrently and composed into the
+    blob (a composite object has a CRC32C checksum but not a MD5 hash).
+
+    Every append uploads a temporal blob and composes it into the file, with
+    `append_buffer_size` the appends of a file are kept in memory and written
+    with a single compose when they reach that size, `append_flush_interval`
+    seconds after the first one, with `flush` or with `close`. The buffered
+    appends of a file are flushed before it's read, renamed, copied or its
+    metadata is obtained, and discarded if it's replaced or deleted. A failed
+    flush by time keeps the appends buffered and its error is raised by the
+    next `append` to the file, `flush` or `close`.
+
+    The bulk operations to check, delete and get the metadata of files use
+    batch requests, so a single HTTP request processes up to `BATCH_SIZE` files,
+    and `stat` loads the blobs of a file and a directory with the same path in
+    a single batch request.
+
+    A file copied or moved to a gcs storage driver (in the same bucket or
+    another one) is rewritten by the server instead of being downloaded and
+    uploaded again.
+
+    The checksum of a file is the MD5 and CRC32C hashes stored in the
+    metadata of its blob, so it's obtained without downloading the content.
+
+    A directory is deleted or renamed from a single listing of its blobs, the
+    blobs are deleted with concurrent batch requests.
+
+    The listings only request the fields that they use, the directories in a
+    directory are the prefixes of a listing with delimiter and the metadata of
+    a directory is built from a single listing of its blobs.
+
+    A directory is a placeholder blob (an empty blob ending with '/') created
+    for every directory of a path, with `virtual_directories` the directories
+    are inferred from the names of the blobs instead, so a directory exists
+    while it contains a blob, `make_directory` doesn't create anything (the
+    directory is kept in memory as existing until a blob is created inside
+    it) and `exists_directory` is a listing of a single blob. The placeholders of a
+    bucket created without it are still recognized, and the ones not needed
+    anymore are deleted with `remove_directory_placeholders`.
     """
 
-    def __init__(
+    BATCH_SIZE: int = 100  # the maximum number of requests in a batch request
+    LIST_FIELDS_PATHS: str = "items(name),prefixes,nextPageToken"  # the fields to list paths
+    LIST_FIELDS_METADATA: str = \
+        "items(name,size,timeCreated,updated),nextPageToken"  # the fields to list metadata
+    DEFAULT_CHUNK_SIZE: int = 8 * 1024 * 1024  # 8 MB, the size of each download in streaming mode
+    DEFAULT_COMPOSITE_THRESHOLD: int = 256 * 1024 * 1024  # 256 MB
+    DEFAULT_COMPOSITE_PART_SIZE: int = 64 * 1024 * 1024  # 64 MB
+    MAX_COMPOSE_COMPONENTS: int = 32  # the maximum number of blobs in a compose request
+
+    def __init__(  # pylint: disable=too-many-arguments
             self,
             root: str,
             project_id: str,
             bucket_name: str,
-            credentials_file: Optional[str] = None
+            credentials_file: Optional[str] = None,
+            max_workers: int = AbstractStorageDriver.DEFAULT_MAX_WORKERS,
+            read_mode: ReadMode = ReadMode.STREAMING,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            upload_chunk_size: Optional[int] = None,
+            composite_threshold: Optional[int] = DEFAULT_COMPOSITE_THRESHOLD,
+            composite_part_size: int = DEFAULT_COMPOSITE_PART_SIZE,
+            append_buffer_size: Optional[int] = None,
+            append_flush_interval: Optional[float] = None,
+            virtual_directories: bool = False
     ) -> None:
         """
         Initializes a new GCS (Google Cloud Storage) storage driver.
@@ -85,8 +337,48 @@ class GcsStorageDriver(AbstractStorageDriver):
             bucket_name (str): The name of the bucket.
             credentials_file (Optional[str], optional): The path to the credential file.
                                                         It's recommended to use a service account.
+            max_workers (int): The maximum number of threads for bulk operations.
+                               Defaults to AbstractStorageDriver.DEFAULT_MAX_WORKERS.
+            read_mode (ReadMode): The mode to read a blob as an input stream, use
+                                  ReadMode.TEMPORARY_FILE to read a seekable local copy.
+                                  Defaults to ReadMode.STREAMING.
+            chunk_size (int): The size of each download in streaming mode.
+                              Defaults to DEFAULT_CHUNK_SIZE.
+            upload_chunk_size (Optional[int]): The size of each chunk of a resumable
+                                               upload, a multiple of 256 KB, None to
+                                               use the default of the library.
+                                               Defaults to None.
+            composite_threshold (Optional[int]): The size from which a local file is
+                                                 uploaded in parts, None to disable
+                                                 the composite uploads.
+                                                 Defaults to DEFAULT_COMPOSITE_THRESHOLD.
+            composite_part_size (int): The size of each part of a composite upload.
+                                       Defaults to DEFAULT_COMPOSITE_PART_SIZE.
+            append_buffer_size (Optional[int]): The size of the buffered appends of a
+                                                file to flush them, None to disable
+                                                the buffer. Defaults to None.
+            append_flush_interval (Optional[float]): The seconds from the first buffered
+                                                     append of a file to flush it, None
+                                                     to flush only by size.
+                                                     Defaults to None.
+            virtual_directories (bool): Whether to infer the directories from the
+                                        names of the blobs instead of creating
+                                        placeholders. Defaults to False.
         """
-        super().__init__(root, DirectorySeparator.SLASH)
+        super().__init__(root, DirectorySeparator.SLASH, max_workers)
+        self._read_mode: ReadMode = read_mode
+        self._chunk_size: int = chunk_size
+        self._upload_chunk_size: Optional[int] = upload_chunk_size
+        self._composite_threshold: Optional[int] = composite_threshold
+        self._composite_part_size: int = composite_part_size
+        self._append_buffer_size: Optional[int] = append_buffer_size
+        self._append_flush_interval: Optional[float] = append_flush_interval
+        self._append_buffers: dict[str, AppendBuffer] = {}
+        self._append_buffers_lock: threading.Lock = threading.Lock()
+        self._append_errors: dict[str, Exception] = {}  # the failed flushes by time
+        self._virtual_directories: bool = virtual_directories
+        self._made_virtual_directories: set[str] = set()  # made without a blob inside yet
+        self._made_virtual_directories_lock: threading.Lock = threading.Lock()
         self._project_id: str = project_id
         self._bucket_name: str = bucket_name
         self._credentials_file: Optional[str] = credentials_file
@@ -119,10 +411,36 @@ class GcsStorageDriver(AbstractStorageDriver):
 
     @override
     def close(self) -> None:
-        self._storage.close()
+        try:
+            self.flush()
+        finally:
+            self._storage.close()
+
+    @override
+    def flush(self) -> None:
+        self._flush_appends("", True)
+
+        # the appends of a failed flush by time are written above, but the
+        # failure is raised anyway because it happened after `append` returned
+        with self._append_buffers_lock:
+            errors: list[tuple[str, Exception]] = list(self._append_errors.items())
+            self._append_errors.clear()
+
+        if errors:
+            file, error = errors[0]
+            raise StorageDriverException(
+                f"flush of the appends of {file} failed: {error}"
+            ) from error
 
     @override
     def _get_as_input_stream(self, file: str) -> BufferedReader:
+        self._flush_appends(file)
+
+        if self._read_mode == ReadMode.STREAMING:
+            return BufferedReader(
+                BlobChunkIO(self._create_blob(file), 0, None, self._chunk_size)
+            )
+
         # the process copies the blob to a local file to avoid loading the
         # whole content in memory (poor perfomance), on that way it can return
         # a buffered reader from a temporal file in the local disk and delete
@@ -136,6 +454,52 @@ class GcsStorageDriver(AbstractStorageDriver):
 
         return CustomBufferedReader(temp_file)
 
+    @override
+    def _get_range(self, file: str, offset: int, length: Optional[int]) -> bytes:
+        if length == 0:
+            return b""
+
+        self._flush_appends(file)
+
+        blob = self._create_blob(file)
+
+        try:
+            content: bytes = blob.download_as_bytes(
+                start=offset,
+                end=None if length is None else offset + length - 1
+            )
+            return content
+        except RequestRangeNotSatisfiable:  # offset is after the end of the blob
+            return b""
+
+    @override
+    def _get_range_as_input_stream(
+        self,
+        file: str,
+        offset: int,
+        length: Optional[int]
+    ) -> BufferedReader:
+        self._flush_appends(file)
+        blob = self._create_blob(file)
+
+        if self._read_mode == ReadMode.STREAMING:
+            return BufferedReader(BlobChunkIO(blob, offset, length, self._chunk_size))
+
+        # only the range is copied to the temporal file, see _get_as_input_stream
+
+        with NamedTemporaryFile(delete=False) as temp_file:
+            if length != 0:
+                try:
+                    blob.download_to_file(
+                        temp_file,
+                        start=offset,
+                        end=None if length is None else offset + length - 1
+                    )
+                except RequestRangeNotSatisfiable:  # offset is after the end of the blob
+                    pass
+
+        return CustomBufferedReader(temp_file)
+
     @override
     def exists(self, file: str) -> bool:
         blob = self._create_blob(file)
@@ -143,26 +507,155 @@ class GcsStorageDriver(AbstractStorageDriver):
 
     @override
     def _put_file_as(self, source: BufferedReader, file: str) -> bool:
+        self._flush_appends(file, discard=True)
         blob = self._create_blob(file)
+        blob.chunk_size = self._upload_chunk_size
         blob.upload_from_file(source)
         return True
 
+    @override
+    def _put_file_as_from_path(self, source: str, file: str) -> bool:
+        self._flush_appends(file, discard=True)
+        size: int = os.path.getsize(source)
+
+        if self._composite_threshold is not None and \
+           size > self._composite_threshold:
+            self._put_file_as_composite(source, size, file)
+            return True
+
+        blob = self._create_blob(file)
+        blob.chunk_size = self._upload_chunk_size
+        blob.upload_from_filename(source)
+        return True
+
     @override
     def _append(self, source: bytes, file: str) -> bool:
+        if self._append_buffer_size is None:
+            self._compose_append(source, file)
+            return True
+
+        while True:
+            with self._append_buffers_lock:
+                error: Optional[Exception] = self._append_errors.pop(file, None)
+                buffer: AppendBuffer = self._append_buffers.setdefault(file, AppendBuffer())
+
+            if error is not None:  # the previous appends are still buffered
+                raise StorageDriverException(
+                    f"flush of the appends of {file} failed: {error}"
+                ) from error
+
+            with buffer.lock:
+                # the buffer could be flushed and removed before taking its lock
+                if self._append_buffers.get(file) is not buffer:
+                    continue
+
+                buffer.chunks.append(source)
+                buffer.size += len(source)
+
+                if buffer.size >= self._append_buffer_size:
+                    self._flush_append_buffer(file, buffer)
+                elif buffer.timer is None and self._append_flush_interval is not None:
+                    buffer.timer = threading.Timer(
+                        self._append_flush_interval, self._flush_appends_by_time, (file,)
+                    )
+                    buffer.timer.daemon = True
+                    buffer.timer.start()
+
+                return True
+
+    def _compose_append(self, source: bytes, file: str) -> None:
+        """
+        Appends `source` to `file` uploading it as a temporal blob, composing
+        it into the blob of `file` and deleting it.
+
+        Args:
+            source (bytes): Content as byte arrays.
+            file (str): Full file path.
+        """
         append_blob_path = f"{file}.append{str(int(time.time() * 1000))}"
-        self._put_file_as(
-            BufferedReader(BytesIO(source)), append_blob_path  # type: ignore[arg-type]
-        )
+        blob = self._create_blob(append_blob_path)
+        blob.upload_from_file(BytesIO(source))
         try:
             target_blob = self._create_blob(file)
-            append_blob = self._create_blob(append_blob_path)
-            target_blob.compose([target_blob, append_blob])
-            return True
+            target_blob.compose([target_blob, blob])
         finally:
             self._delete(append_blob_path)
 
+    def _flush_appends(
+            self,
+            path: str,
+            is_directory: bool = False,
+            discard: bool = False
+    ) -> None:
+        """
+        Flushes the buffered appends of the file `path`, or of every file in the
+        directory `path` if `is_directory` is True, they are discarded instead
+        if `discard` is True.
+
+        Args:
+            path (str): Full file or directory path.
+            is_directory (bool): Whether `path` is a directory. Defaults to False.
+            discard (bool): Whether to discard the appends. Defaults to False.
+        """
+        prefix: str = f"{path}{self._separator.value}" if path else ""
+
+        with self._append_buffers_lock:
+            buffers: list[tuple[str, AppendBuffer]] = [
+                (file, buffer)
+                for file, buffer in self._append_buffers.items()
+                if (file.startswith(prefix) if is_directory else file == path)
+            ]
+
+        for file, buffer in buffers:
+            self._flush_append_buffer(file, buffer, discard)
+
+    def _flush_appends_by_time(self, file: str) -> None:
+        """
+        Flushes the buffered appends of `file` from the timer thread, the error
+        of a failed flush is kept to raise it in the next `append` or `flush`.
+
+        Args:
+            file (str): Full file path.
+        """
+        try:
+            self._flush_appends(file)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            with self._append_buffers_lock:
+                self._append_errors.setdefault(file, e)
+
+    def _flush_append_buffer(
+            self,
+            file: str,
+            buffer: AppendBuffer,
+            discard: bool = False
+    ) -> None:
+        """
+        Writes the content of `buffer` into `file` with a single compose and
+        removes the buffer, the content is kept in the buffer if it fails.
+
+        Args:
+            file (str): Full file path.
+            buffer (AppendBuffer): The buffered appends of the file.
+            discard (bool): Whether to discard the content. Defaults to False.
+        """
+        with buffer.lock:
+            if buffer.timer is not None:
+                buffer.timer.cancel()
+                buffer.timer = None
+
+            if buffer.chunks and not discard:
+                self._compose_append(b"".join(buffer.chunks), file)
+
+            buffer.chunks = []
+            buffer.size = 0
+
+            with self._append_buffers_lock:
+                if self._append_buffers.get(file) is buffer:
+                    del self._append_buffers[file]
+
     @override
     def _delete(self, file: str) -> bool:
+        self._flush_appends(file, discard=True)
         blob = self._create_blob(file)
         blob.delete()
         self._check_parent_directory_and_create(file)
@@ -170,73 +663,186 @@ class GcsStorageDriver(AbstractStorageDriver):
 
     @override
     def _rename(self, source: str, target: str) -> bool:
+        self._flush_appends(source)
         blob = self._create_blob(source)
         self._bucket.rename_blob(blob, self._add_root_in_path(target))
         return self.exists(target)
 
+    @override
+    def _transfer_file(
+        self,
+        source: str,
+        target: str,
+        target_storage_driver: StorageDriver
+    ) -> bool:
+        self._flush_appends(source)
+
+        # a transfer to a gcs storage driver (the same or another bucket) is
+        # a server-side rewrite, so the content is never downloaded, a
+        # decorated storage driver is not known as gcs and uses the default
+        if not isinstance(target_storage_driver, GcsStorageDriver):
+            return super()._transfer_file(source, target, target_storage_driver)
+
+        # pylint: disable=protected-access
+        if not target_storage_driver._prepare_put_file(target):
+            return False
+
+        # the rewrite replaces the target, so its buffered appends are discarded
+        target_storage_driver._flush_appends(target, discard=True)
+        self._rewrite_blob(
+            self._create_blob(source),
+            target_storage_driver._create_blob(target)
+        )
+        # pylint: enable=protected-access
+        return True
+
     @override
     def _files(self, directory: str) -> list[str]:
         # `delimiter` is used to get only the files in the `directory`
-        blobs = self._bucket.list_blobs(
-            prefix=self._add_root_in_path(directory, True),
-            delimiter=self._separator.value
-        )
-        return [
-            self._remove_root_in_path(blob.name)
-            for blob in blobs
-            if not blob.name.endswith("/") and
-            self._sanitizer.sanitize(directory) !=
-            self._sanitizer.sanitize(self._remove_root_in_path(blob.name))
-        ]
+        blobs: HTTPIterator = self._list_blobs(directory, True)
+        return self._get_paths_from_blobs(blobs, directory, False)
 
     @override
     def _all_files(self, directory: str) -> list[str]:
-        blobs = self._bucket.list_blobs(
-            prefix=self._add_root_in_path(directory, True)
-        )
-        return [
-            self._remove_root_in_path(blob.name)
-            for blob in blobs
-            if not blob.name.endswith("/") and
-            self._sanitizer.sanitize(directory) !=
-            self._sanitizer.sanitize(self._remove_root_in_path(blob.name))
-        ]
+        blobs: HTTPIterator = self._list_blobs(directory, False)
+        return self._get_paths_from_blobs(blobs, directory, False)
 
     @override
     def _directories(self, directory: str) -> list[str]:
-        # `match_glob` is used to get only the directories in the `directory`
-        blobs = self._bucket.list_blobs(
-            prefix=self._add_root_in_path(directory, True),
-            match_glob=f"{self._add_root_in_path(directory, True)}*{self._separator.value}"
-        )
+        # `delimiter` is used to get only the directories in the `directory`
+        # as prefixes, so the blobs inside them aren't listed
+        blobs: HTTPIterator = self._list_blobs(directory, True)
         return [
-            self._remove_root_in_path(blob.name)
-            for blob in blobs
-            if blob.name.endswith("/") and
-            self._sanitizer.sanitize(directory) !=
-            self._sanitizer.sanitize(self._remove_root_in_path(blob.name))
+            path
+            for blobs_page in blobs.pages
+            for path in self._get_paths_from_prefixes(blobs_page, directory)
         ]
 
     @override
     def _all_directories(self, directory: str) -> list[str]:
-        blobs = self._bucket.list_blobs(
-            prefix=self._add_root_in_path(directory, True)
+        blobs: HTTPIterator = self._list_blobs(directory, False)
+
+        if self._virtual_directories:
+            return self._get_virtual_directories_from_blobs(blobs, directory, set())
+
+        return self._get_paths_from_blobs(blobs, directory, True)
+
+    @override
+    def _iter_files(
+            self,
+            directory: str,
+            page_size: int,
+            page_token: Optional[str]
+    ) -> Iterator[Page]:
+        # `delimiter` is used to get only the files in the `directory`
+        return self._get_pages_from_blobs(
+            self._list_blobs(directory, True, page_size, page_token),
+            lambda blobs_page: self._get_paths_from_blobs(blobs_page, directory, False)
+        )
+
+    @override
+    def _iter_all_files(
+            self,
+            directory: str,
+            page_size: int,
+            page_token: Optional[str]
+    ) -> Iterator[Page]:
+        return self._get_pages_from_blobs(
+            self._list_blobs(directory, False, page_size, page_token),
+            lambda blobs_page: self._get_paths_from_blobs(blobs_page, directory, False)
+        )
+
+    @override
+    def _iter_directories(
+            self,
+            directory: str,
+            page_size: int,
+            page_token: Optional[str]
+    ) -> Iterator[Page]:
+        # `delimiter` is used to get only the directories in the `directory`
+        # as prefixes, so the blobs inside them aren't listed
+        return self._get_pages_from_blobs(
+            self._list_blobs(directory, True, page_size, page_token),
+            lambda blobs_page: self._get_paths_from_prefixes(blobs_page, directory)
+        )
+
+    @override
+    def _iter_all_directories(
+            self,
+            directory: str,
+            page_size: int,
+            page_token: Optional[str]
+    ) -> Iterator[Page]:
+        if self._virtual_directories:
+            # the directories already returned are skipped in the next pages,
+            # and a resumed listing skips the ones returned by the previous pages
+            returned: set[str] = set()
+
+            def get_paths(blobs_page: BlobsPage) -> list[str]:
+                blobs: list[storage.Blob] = list(blobs_page)  # type:ignore[no-any-unimported]
+
+                if page_token is not None and not returned and blobs:
+                    returned.update(
+                        self._get_returned_virtual_directories(blobs[0].name, directory)
+                    )
+
+                return self._get_virtual_directories_from_blobs(blobs, directory, returned)
+
+            return self._get_pages_from_blobs(
+                self._list_blobs(directory, False, page_size, page_token),
+                get_paths
+            )
+
+        return self._get_pages_from_blobs(
+            self._list_blobs(directory, False, page_size, page_token),
+            lambda blobs_page: self._get_paths_from_blobs(blobs_page, directory, True)
         )
-        return [
-            self._remove_root_in_path(blob.name)
-            for blob in blobs
-            if blob.name.endswith("/") and
-            self._sanitizer.sanitize(directory) !=
-            self._sanitizer.sanitize(self._remove_root_in_path(blob.name))
-        ]
 
     @override
     def exists_directory(self, directory: str) -> bool:
+        if self._virtual_directories:
+            # a single blob with the prefix of the directory (a placeholder
+            # included) is enough, and the root always exists
+            if not directory or not directory.strip():
+                return True
+
+            blobs: HTTPIterator = self._list_blobs(directory, False, 1)
+
+            found: bool = next(iter(blobs), None) is not None
+            path: str = self._sanitizer.sanitize(directory, True)
+
+            with self._made_virtual_directories_lock:
+                if found:
+                    self._made_virtual_directories.discard(path)  # a blob makes it exist
+                    return True
+
+                return path in self._made_virtual_directories
+
         blob = self._create_blob(directory, True)
         return blob.exists() and blob.name.endswith("/") is True
 
+    @override
+    def make_directory(self, directory: str) -> bool:
+        if not super().make_directory(directory):
+            return False
+
+        if self._virtual_directories:
+            # the directory and its parents exist in memory until a blob is
+            # created inside them, so it can be used as a target right after
+            path: str = self._sanitizer.sanitize(directory, True)
+
+            with self._made_virtual_directories_lock:
+                while path:
+                    self._made_virtual_directories.add(path)
+                    path = self._sanitizer.get_parent(path)
+
+        return True
+
     @override
     def _make_directory(self, directory: str) -> bool:
+        if self._virtual_directories:
+            return True  # a directory exists when a blob is created inside it
+
         # the directory concept doesn't exists in cloud storage, so to
         # emulate the behavior it's possible to use a '/' with a empty
         # content, if the '/' doesn't have an empty content the API
@@ -258,48 +864,139 @@ class GcsStorageDriver(AbstractStorageDriver):
 
     @override
     def _delete_directory(self, directory: str) -> bool:
-        # delete all files
-        # the list need to return only a True or empty to continue processing
-        deleted_files_result: list[bool] = list(set(
-            self._delete(file)
-            for file in self._all_files(directory)
-        ))
-
-        if deleted_files_result and \
-           (len(deleted_files_result) > 1 or not deleted_files_result[0]):
-            return False
+        self._flush_appends(directory, True, True)
+        self._forget_made_virtual_directories(directory)
 
-        # delete all directories
-        # the list need to return only a True or empty to continue processing
-        deleted_directories_result: list[bool] = list(set(
-            self._delete_directory(d)
-            for d in self._all_directories(directory)
-        ))
+        # every blob in `directory` (files, sub-directories and itself) is
+        # obtained with a single listing and deleted with batch requests,
+        # the parent directory is checked only once at the end
+        results: list[BulkResult[bool]] = self._delete_blobs([
+            blob.name for blob in self._list_blobs(directory, False)
+        ])
+        failures: list[BulkResult[bool]] = [result for result in results if not result.succeeded]
 
-        if deleted_directories_result and \
-           (len(deleted_directories_result) > 1 or not deleted_directories_result[0]):
-            return False
+        if failures:
+            raise StorageDriverException(
+                f"could not delete {len(failures)} objects of {directory}: " +
+                ", ".join(f"{result.path} ({result.error})" for result in failures)
+            )
 
-        # delete itself
-        if self.exists_directory(directory):
-            blob = self._create_blob(directory, True)
-            blob.delete()
-            self._check_parent_directory_and_create(directory)
+        self._check_parent_directory_and_create(directory)
         return True
 
     @override
     def _rename_directory(self, source: str, target: str) -> bool:
-        if self._make_directory(target):
-            for file in self._all_files(source):
-                target_path: str = self._sanitizer.concat(
-                    target,
-                    file.replace(self._sanitizer.add_directory_separator(source), "")
+        # every blob in `source` (files and directories) is obtained with a
+        # single listing, rewritten in parallel to `target` and, once it's
+        # rewritten, deleted with batch requests
+        if not self._make_directory(target):
+            return False
+
+        self._flush_appends(source, True)
+        self._forget_made_virtual_directories(source)
+        source_prefix: str = self._add_root_in_path(source, True)
+        target_prefix: str = self._add_root_in_path(target, True)
+        names: list[str] = [blob.name for blob in self._list_blobs(source, False)]
+
+        def rewrite(name: str) -> bool:
+            self._rewrite_blob(
+                self._bucket.blob(name),
+                self._bucket.blob(f"{target_prefix}{name[len(source_prefix):]}")
+            )
+            return True
+
+        rewrite_results: list[BulkResult[bool]] = self._bulk(names, rewrite)
+        delete_results: list[BulkResult[bool]] = self._delete_blobs([
+            result.path for result in rewrite_results if result.succeeded
+        ])
+        failures: list[BulkResult[bool]] = [
+            result
+            for result in rewrite_results + delete_results
+            if not result.succeeded
+        ]
+
+        # the blobs not renamed are kept in the source
+        if failures:
+            raise StorageDriverException(
+                f"could not rename {len(failures)} objects of {source}: " +
+                ", ".join(f"{result.path} ({result.error})" for result in failures)
+            )
+
+        self._check_parent_directory_and_create(source)
+        return True
+
+    @override
+    def stat(self, path: str) -> Stat:
+        if not path or not path.strip():  # root only exists as a directory
+            return super().stat(path)
+
+        # a file with buffered appends exists, they aren't flushed because
+        # `stat` is called before deleting or replacing the file, which
+        # discards them, so its metadata is obtained by `get_metadata`
+        with self._append_buffers_lock:
+            if path in self._append_buffers:
+                return Stat(PathType.FILE)
+
+        # the blob of the file and the blob of the directory are loaded with
+        # a single batch request, the file has precedence and its metadata is
+        # obtained by the same request
+        file_blob = self._create_blob(path)
+        directory_blob = self._create_blob(path, True)
+        responses: list[Any] = self._execute_batch(
+            [file_blob, directory_blob],
+            lambda blob: blob.reload()
+        )
+
+        for response in responses:
+            if not 200 <= response.status_code < 300 and response.status_code != 404:
+                raise StorageDriverException(
+                    f"request for {path} failed with status "
+                    f"{response.status_code}: {response.text}"
                 )
 
-                if not self._rename(file, target_path):
-                    return False
-            return self._delete_directory(source)
-        return False
+        if 200 <= responses[0].status_code < 300:
+            return Stat(PathType.FILE, self._get_metadata_from_blob(file_blob, path))
+
+        if 200 <= responses[1].status_code < 300:
+            return Stat(PathType.DIRECTORY)
+
+        # a virtual directory hasn't a placeholder
+        if self._virtual_directories and self.exists_directory(path):
+            return Stat(PathType.DIRECTORY)
+
+        return Stat(PathType.MISSING)
+
+    @override
+    def get_metadata(self, path: str) -> Optional[Metadata]:
+        self._flush_appends(path)
+        return super().get_metadata(path)
+
+    @override
+    def checksum(self, file: str) -> Optional[Checksum]:
+        if not file or not file.strip():  # root only exists as a directory
+            return None
+
+        self._flush_appends(file)
+
+        # the hashes are part of the metadata of the blob, so the checksum is
+        # obtained with a single request without downloading the content, a
+        # missing blob means that the file doesn't exist or is a directory
+        blob = self._bucket.get_blob(self._add_root_in_path(file))
+
+        if blob is None:
+            return None
+
+        # a composite blob (an append or a composite upload) has only crc32c
+        return Checksum(blob.size, md5=blob.md5_hash, crc32c=blob.crc32c)
+
+    @override
+    def _checksum(self, file: str) -> Checksum:
+        checksum: Optional[Checksum] = self.checksum(file)
+
+        if checksum is None:
+            raise StorageDriverException(f"file {file} doesn't exist")
+
+        return checksum
 
     @override
     def _get_metadata_from_file(self, file: str) -> Metadata:
@@ -307,31 +1004,590 @@ class GcsStorageDriver(AbstractStorageDriver):
         # the metadata at the same moment because `blob` method only
         # create a reference to the blob and it's lazy
         blob = self._bucket.get_blob(self._add_root_in_path(file))
-        return Metadata(
-            size=Size(blob.size),
-            creation_time=blob.time_created.timestamp(),
-            last_modified=blob.updated.timestamp(),
-            last_access_time=blob.updated.timestamp(),
-            is_file=True,
-            is_directory=False,
-            is_symbolic_link=False,
-            media_type=Metadata.detect_media_type(file)
-        )
+        return self._get_metadata_from_blob(blob, file)
 
     @override
     def _get_metadata_from_directory(self, directory: str) -> Metadata:
-        metadatas = [self._get_metadata_from_file(f) for f in self._all_files(directory)]
+        # the metadata is built from the listing of every blob inside the
+        # `directory` (including the directories), so there is a request per
+        # page of blobs instead of one per file
+        blobs: HTTPIterator = self._list_blobs(
+            directory,
+            False,
+            fields=GcsStorageDriver.LIST_FIELDS_METADATA
+        )
+        size: int = 0
+        creation_time: Optional[int] = None
+        last_modified: Optional[int] = None
+
+        for blob in blobs:
+            # the timestamps are the ones of the files, like the metadata of
+            # each file, so the placeholders of the directories are skipped
+            if blob.name.endswith(self._separator.value):
+                continue
+
+            size += blob.size or 0
+            blob_creation_time: int = int(blob.time_created.timestamp())
+            blob_last_modified: int = int(blob.updated.timestamp())
+            creation_time = blob_creation_time \
+                if creation_time is None \
+                else min(creation_time, blob_creation_time)
+            last_modified = blob_last_modified \
+                if last_modified is None \
+                else max(last_modified, blob_last_modified)
+
         return Metadata(
-            size=Size(sum(m.size.length for m in metadatas)),
-            creation_time=min(m.creation_time for m in metadatas),
-            last_modified=max(m.last_modified for m in metadatas),
-            last_access_time=max(m.last_access_time for m in metadatas),
+            size=Size(size),
+            creation_time=creation_time or 0,
+            last_modified=last_modified or 0,
+            last_access_time=last_modified or 0,
             is_file=False,
             is_directory=True,
             is_symbolic_link=False,
             media_type=""
         )
 
+    @override
+    def _list_with_metadata(self, directory: str, recursive: bool) -> list[tuple[str, Metadata]]:
+        self._flush_appends(directory, True)
+
+        # the listing has the properties of each blob, so it isn't necessary
+        # to get every blob, `delimiter` is used to get only the files in the
+        # `directory` if it's not recursive
+        blobs: HTTPIterator = self._list_blobs(
+            directory,
+            not recursive,
+            fields=GcsStorageDriver.LIST_FIELDS_METADATA
+        )
+        files = [
+            (self._remove_root_in_path(blob.name), blob)
+            for blob in blobs
+            if not blob.name.endswith("/")
+        ]
+        return [(file, self._get_metadata_from_blob(blob, file)) for file, blob in files]
+
+    @override
+    def exists_many(self, files: list[str]) -> list[BulkResult[bool]]:
+        # a directory is never found because its blob has the directory
+        # separator at the end, so a found blob is always a file
+        return [
+            BulkResult(result.path, result.value is not None)
+            if result.succeeded
+            else BulkResult(result.path, error=result.error)
+            for result in self._batch(files, lambda blob: blob.reload())
+        ]
+
+    @override
+    def delete_many(self, files: list[str]) -> list[BulkResult[bool]]:
+        for file in files:
+            self._flush_appends(file, discard=True)
+
+        results: list[BulkResult[bool]] = [
+            BulkResult(result.path, result.value is not None)
+            if result.succeeded
+            else BulkResult(result.path, error=result.error)
+            for result in self._batch(files, lambda blob: blob.delete())
+        ]
+
+        # the parent directory of each deleted file is checked only once
+        deleted_files_by_parent: dict[str, str] = {
+            self._sanitizer.get_parent(result.path): result.path
+            for result in results
+            if result.value
+        }
+
+        for parent, file in deleted_files_by_parent.items():
+            try:
+                self._check_parent_directory_and_create(file)
+            except StorageDriverException as e:
+                results = [
+                    BulkResult(result.path, error=e)
+                    if result.value and self._sanitizer.get_parent(result.path) == parent
+                    else result
+                    for result in results
+                ]
+
+        return results
+
+    @override
+    def get_metadata_many(self, paths: list[str]) -> list[BulkResult[Optional[Metadata]]]:
+        for path in paths:
+            self._flush_appends(path)
+
+        results = self._batch(paths, lambda blob: blob.reload())
+
+        # the paths not found as files can be directories, for them the
+        # standard process is used
+        directories: dict[str, BulkResult[Optional[Metadata]]] = {
+            result.path: result
+            for result in self._bulk(
+                [result.path for result in results if result.succeeded and result.value is None],
+                self.get_metadata
+            )
+        }
+
+        return [
+            BulkResult(result.path, error=result.error)
+            if not result.succeeded
+            else BulkResult(result.path, self._get_metadata_from_blob(result.value, result.path))
+            if result.value is not None
+            else directories[result.path]
+            for result in results
+        ]
+
+    def _batch(  # type:ignore[no-any-unimported]
+            self,
+            paths: list[str],
+            action: Callable[[storage.Blob], None],
+            create_blob: Optional[Callable[[str], storage.Blob]] = None
+    ) -> list[BulkResult[storage.Blob]]:
+        """
+        Executes `action` for the blob of each path in `paths` using batch
+        requests of up to `BATCH_SIZE` requests.
+
+        The `value` of each result is the blob if the request succeeded, or None
+        if the blob was not found (or the path is empty), otherwise the `error`
+        has the cause, if the whole batch request fails then every path in the
+        batch has the error.
+
+        Args:
+            paths (list[str]): The paths.
+            action (Callable[[Blob], None]): The action to execute for each blob.
+            create_blob (Optional[Callable[[str], Blob]]): The process to create the
+                                                           blob of a path. Defaults to
+                                                           None (`_create_blob`).
+
+        Returns:
+            list[BulkResult[Blob]]: The result for each path with the same order as `paths`.
+        """
+        create_blob = self._create_blob if create_blob is None else create_blob
+        results: list[BulkResult[storage.Blob]] = [  # type:ignore[no-any-unimported]
+            BulkResult(path) for path in paths
+        ]
+        indexes: list[int] = [i for i, path in enumerate(paths) if path and path.strip()]
+
+        for start in range(0, len(indexes), self.BATCH_SIZE):
+            batch_indexes: list[int] = indexes[start:start + self.BATCH_SIZE]
+            blobs = [create_blob(paths[i]) for i in batch_indexes]
+
+            try:
+                responses: list[Any] = self._execute_batch(blobs, action)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                for i in batch_indexes:
+                    results[i] = BulkResult(paths[i], error=e)
+                continue
+
+            # the responses of the batch are in the same order as the requests
+            for i, blob, response in zip(batch_indexes, blobs, responses):
+                if 200 <= response.status_code < 300:
+                    results[i] = BulkResult(paths[i], blob)
+                elif response.status_code != 404:
+                    results[i] = BulkResult(paths[i], error=StorageDriverException(
+                        f"request for {paths[i]} failed with status "
+                        f"{response.status_code}: {response.text}"
+                    ))
+
+        return results
+
+    def _execute_batch(  # type:ignore[no-any-unimported]
+            self,
+            blobs: list[storage.Blob],
+            action: Callable[[storage.Blob], None]
+    ) -> list[Any]:
+        """
+        Executes `action` for each blob in `blobs` with a single batch request,
+        a failed request doesn't raise an exception, instead its response has
+        the status.
+
+        Args:
+            blobs (list[Blob]): The blobs.
+            action (Callable[[Blob], None]): The action to execute for each blob.
+
+        Returns:
+            list[Response]: The response of each request with the same order as `blobs`.
+        """
+        batch: ResponsesBatch = ResponsesBatch(self._storage, raise_exception=False)
+
+        with batch:
+            for blob in blobs:
+                action(blob)
+
+        return batch.responses
+
+    def _delete_blobs(self, names: list[str]) -> list[BulkResult[bool]]:
+        """
+        Deletes the blobs with the full `names` (including the root) using batch
+        requests of up to `BATCH_SIZE` requests, executed in a thread pool with
+        up to `max_workers` threads.
+
+        A blob not found is considered deleted.
+
+        Args:
+            names (list[str]): The full names of the blobs.
+
+        Returns:
+            list[BulkResult[bool]]: The result for each name with the same order as `names`.
+        """
+        chunks: list[list[str]] = [
+            names[start:start + self.BATCH_SIZE]
+            for start in range(0, len(names), self.BATCH_SIZE)
+        ]
+
+        if not chunks:
+            return []
+
+        def delete(chunk: list[str]) -> list[BulkResult[bool]]:
+            return [
+                BulkResult(result.path, True)
+                if result.succeeded
+                else BulkResult(result.path, error=result.error)
+                for result in self._batch(chunk, lambda blob: blob.delete(), self._bucket.blob)
+            ]
+
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(chunks))) as executor:
+            return [result for results in executor.map(delete, chunks) for result in results]
+
+    def remove_directory_placeholders(self, directory: str = "") -> list[BulkResult[bool]]:
+        """
+        Deletes the placeholders of the directories inside `directory` (itself
+        included) that contain another blob, to migrate a bucket to virtual
+        directories, the placeholders of the empty directories are kept, so
+        every directory still exists.
+
+        Args:
+            directory (str): Full directory path. Defaults to "" (root).
+
+        Returns:
+            list[BulkResult[bool]]: The result for each deleted placeholder with
+                                    its directory as path.
+        """
+        names: list[str] = sorted(blob.name for blob in self._list_blobs(directory, False))
+
+        # the names with the prefix of a placeholder are just after it, so a
+        # placeholder is needed only if the next name hasn't its prefix
+        placeholders: list[str] = [
+            name
+            for name, next_name in zip(names, names[1:])
+            if name.endswith("/") and next_name.startswith(name)
+        ]
+
+        return [
+            BulkResult(self._remove_root_in_path(result.path), result.value, result.error)
+            for result in self._delete_blobs(placeholders)
+        ]
+
+    def _put_file_as_composite(self, source: str, size: int, file: str) -> None:
+        """
+        Uploads the local file `source` in parts of `composite_part_size` bytes,
+        each part is uploaded as a temporal blob in a thread pool with up to
+        `max_workers` threads, then the parts are composed into the blob of
+        `file` (up to `MAX_COMPOSE_COMPONENTS` blobs per compose request) and
+        finally deleted, even if the upload fails.
+
+        Args:
+            source (str): The path to the local file.
+            size (int): The size of the local file.
+            file (str): Full file path.
+        """
+        prefix: str = f"{file}.part{str(int(time.time() * 1000))}"
+        parts: list[tuple[str, int, int]] = [
+            (f"{prefix}-{index}", offset, min(self._composite_part_size, size - offset))
+            for index, offset in enumerate(range(0, size, self._composite_part_size))
+        ]
+
+        def upload(part: tuple[str, int, int]) -> storage.Blob:  # type:ignore[no-any-unimported]
+            name, offset, length = part
+            blob = self._create_blob(name)
+
+            # the part is read from a slice starting at position 0, a resumable
+            # upload (a part bigger than 8 MB) fails with a stream not at its beginning
+            with FileSliceIO(open(source, "rb"), offset, length) as f:  # pylint: disable=consider-using-with
+                blob.upload_from_file(f, size=length)
+
+            return blob
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(self._max_workers, len(parts))) as executor:
+                part_blobs: list[storage.Blob] = list(  # type:ignore[no-any-unimported]
+                    executor.map(upload, parts)
+                )
+
+            # the first request composes up to `MAX_COMPOSE_COMPONENTS` parts,
+            # and every next one composes the blob with the following parts
+            step: int = self.MAX_COMPOSE_COMPONENTS - 1
+            blob = self._create_blob(file)
+            blob.compose(part_blobs[:self.MAX_COMPOSE_COMPONENTS])
+
+            for start in range(self.MAX_COMPOSE_COMPONENTS, len(part_blobs), step):
+                blob.compose([blob] + part_blobs[start:start + step])
+        finally:
+            self._delete_blobs([self._add_root_in_path(name) for name, _, _ in parts])
+
+    def _rewrite_blob(  # type:ignore[no-any-unimported]
+            self,
+            source_blob: storage.Blob,
+            target_blob: storage.Blob
+    ) -> None:
+        """
+        Rewrites `source_blob` into `target_blob` in the server, a big object can
+        need several requests, each one continues the rewrite of the previous one
+        with its token.
+
+        Args:
+            source_blob (Blob): The source blob.
+            target_blob (Blob): The target blob.
+        """
+        token: Optional[str] = None
+
+        while True:
+            token, _, _ = target_blob.rewrite(source_blob, token=token)
+
+            if token is None:
+                return
+
+    def _get_paths_from_blobs(  # type:ignore[no-any-unimported]
+            self,
+            blobs: Iterable[storage.Blob],
+            directory: str,
+            is_directory: bool
+    ) -> list[str]:
+        """
+        Gets the paths without the root of the `blobs` listed from `directory`.
+
+        The blobs are filtered by kind, a blob ending with the directory
+        separator is a directory, and the `directory` itself is excluded.
+
+        Args:
+            blobs (Iterable[Blob]): The blobs.
+            directory (str): The listed directory.
+            is_directory (bool): Whether to get the directories instead of the files.
+
+        Returns:
+            list[str]: The paths.
+        """
+        return [
+            self._remove_root_in_path(blob.name)
+            for blob in blobs
+            if blob.name.endswith("/") is is_directory and
+            self._sanitizer.sanitize(directory) !=
+            self._sanitizer.sanitize(self._remove_root_in_path(blob.name))
+        ]
+
+    def _get_virtual_directories_from_blobs(  # type:ignore[no-any-unimported]
+            self,
+            blobs: Iterable[storage.Blob],
+            directory: str,
+            returned: set[str]
+    ) -> list[str]:
+        """
+        Gets the paths without the root of the directories inferred from the
+        `blobs` listed from `directory`, which are the parents of every blob
+        inside `directory` and the placeholders, the `directory` itself and the
+        paths in `returned` are excluded, and the new paths are added to it.
+
+        Args:
+            blobs (Iterable[Blob]): The blobs.
+            directory (str): The listed directory.
+            returned (set[str]): The paths already returned.
+
+        Returns:
+            list[str]: The paths.
+        """
+        directory_path: str = self._sanitizer.sanitize(directory)
+        paths: list[str] = []
+
+        for blob in blobs:
+            path: str = self._remove_root_in_path(blob.name)
+            parent: str = path if blob.name.endswith("/") else self._sanitizer.get_parent(path)
+            parents: list[str] = []
+
+            # the parents are added from the outermost one to keep the order
+            # of the listing, a returned parent has its parents returned too
+            while parent and \
+                    self._sanitizer.sanitize(parent) != directory_path and \
+                    parent not in returned:
+                parents.append(parent)
+                parent = self._sanitizer.get_parent(parent)
+
+            returned.update(parents)
+            paths.extend(reversed(parents))
+
+        return paths
+
+    def _get_returned_virtual_directories(self, name: str, directory: str) -> set[str]:
+        """
+        Gets the directories inferred from the blobs listed from `directory`
+        before the blob `name` (the first blob of a resumed listing), which are
+        the parents of `name` with a blob listed before it. The blobs with the
+        prefix of a directory are consecutive in a listing, so only the parents
+        of the first blob can be returned by the previous pages.
+
+        Args:
+            name (str): The full name of the first blob of the resumed listing.
+            directory (str): The listed directory.
+
+        Returns:
+            set[str]: The paths already returned.
+        """
+        directory_path: str = self._sanitizer.sanitize(directory)
+        path: str = self._remove_root_in_path(name)
+        parent: str = path if name.endswith("/") else self._sanitizer.get_parent(path)
+        returned: set[str] = set()
+
+        # a parent with a blob before `name` was returned, as well as its parents
+        while parent and self._sanitizer.sanitize(parent) != directory_path:
+            if returned:
+                returned.add(parent)
+            else:
+                first_blob = next(iter(self._list_blobs(parent, False, 1)), None)
+
+                if first_blob is not None and first_blob.name < name:
+                    returned.add(parent)
+
+            parent = self._sanitizer.get_parent(parent)
+
+        return returned
+
+    def _forget_made_virtual_directories(self, directory: str) -> None:
+        """
+        Removes `directory` and its sub-directories from the virtual directories
+        made without a blob inside, the directory is deleted or renamed.
+
+        Args:
+            directory (str): Full directory path.
+        """
+        if not self._made_virtual_directories:
+            return
+
+        path: str = self._sanitizer.sanitize(directory, True)
+        prefix: str = self._sanitizer.add_directory_separator(path)
+
+        with self._made_virtual_directories_lock:
+            self._made_virtual_directories = {
+                made_directory
+                for made_directory in self._made_virtual_directories
+                if path and made_directory != path and not made_directory.startswith(prefix)
+            }
+
+    def _get_paths_from_prefixes(self, blobs_page: BlobsPage, directory: str) -> list[str]:
+        """
+        Gets the paths without the root of the prefixes of a page listed with
+        delimiter from `directory`, which are its directories.
+
+        Args:
+            blobs_page (BlobsPage): The page of the listing.
+            directory (str): The listed directory.
+
+        Returns:
+            list[str]: The paths.
+        """
+        return [
+            self._remove_root_in_path(prefix)
+            for prefix in blobs_page.prefixes  # type: ignore[attr-defined]
+            if self._sanitizer.sanitize(directory) !=
+            self._sanitizer.sanitize(self._remove_root_in_path(prefix))
+        ]
+
+    def _get_pages_from_blobs(
+            self,
+            blobs: HTTPIterator,
+            get_paths: Callable[[BlobsPage], list[str]]
+    ) -> Iterator[Page]:
+        """
+        Gets the pages of paths from the pages of the `blobs` iterator, the
+        token of a page is the native token of the listing.
+
+        A page without paths after filtering them isn't returned, so the
+        previous page is kept until the next one with paths is obtained to
+        ensure that the last page returned hasn't a next page token.
+
+        Args:
+            blobs (HTTPIterator): The iterator of the listing.
+            get_paths (Callable[[BlobsPage], list[str]]): The process to get the
+                                                          paths of a page.
+
+        Yields:
+            Iterator[Page]: The pages.
+        """
+        previous_page: Optional[Page] = None
+
+        for blobs_page in blobs.pages:
+            paths: list[str] = get_paths(blobs_page)
+
+            if not paths:  # page without paths after filtering them
+                continue
+
+            if previous_page is not None:
+                yield previous_page
+
+            previous_page = Page(paths, blobs.next_page_token)
+
+        if previous_page is not None:
+            previous_page.next_page_token = None
+            yield previous_page
+
+    def _list_blobs(  # pylint: disable=too-many-arguments
+            self,
+            directory: str,
+            use_delimiter: bool,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None,
+            fields: str = LIST_FIELDS_PATHS
+    ) -> HTTPIterator:
+        """
+        Lists the blobs inside `directory`, only the `fields` are requested.
+
+        Args:
+            directory (str): The directory.
+            use_delimiter (bool): Whether to use the directory separator as
+                                  delimiter, so the blobs inside sub-directories
+                                  are listed as prefixes.
+            page_size (Optional[int]): The maximum number of blobs of a page.
+                                       Defaults to None (API default).
+            page_token (Optional[str]): The token to resume the listing.
+                                        Defaults to None (first page).
+            fields (str): The fields of the listing.
+                          Defaults to LIST_FIELDS_PATHS.
+
+        Returns:
+            HTTPIterator: The iterator of the listing.
+        """
+        blobs: HTTPIterator = self._storage.list_blobs(
+            self._bucket,
+            prefix=self._add_root_in_path(directory, True),
+            delimiter=self._separator.value if use_delimiter else None,
+            page_size=page_size,
+            page_token=page_token,
+            fields=fields
+        )
+        return blobs
+
+    def _get_metadata_from_blob(  # type:ignore[no-any-unimported]
+            self,
+            blob: storage.Blob,
+            file: str
+    ) -> Metadata:
+        """
+        Get metadata from a loaded blob.
+
+        Args:
+            blob (Blob): The blob with its properties loaded.
+            file (str): The full file path.
+
+        Returns:
+            Metadata: The metadata for the file.
+        """
+        return Metadata(
+            size=Size(blob.size),
+            creation_time=int(blob.time_created.timestamp()),
+            last_modified=int(blob.updated.timestamp()),
+            last_access_time=int(blob.updated.timestamp()),
+            is_file=True,
+            is_directory=False,
+            is_symbolic_link=False,
+            media_type=Metadata.detect_media_type(file)
+        )
+
     def _add_root_in_path(
             self,
             path: str,
@@ -413,6 +1669,17 @@ class GcsStorageDriver(AbstractStorageDriver):
         Args:
             path (str): The path.
         """
+        if self._virtual_directories:  # the directories aren't created
+            if self._made_virtual_directories:  # a blob was in the parents
+                with self._made_virtual_directories_lock:
+                    parent: str = self._sanitizer.get_parent(self._sanitizer.sanitize(path, True))
+
+                    while parent:
+                        self._made_virtual_directories.discard(parent)
+                        parent = self._sanitizer.get_parent(parent)
+
+            return
+
         if path and path.strip() != self._separator.value:
             directory: str = self._sanitizer.get_parent(path)
 
@@ -6,5 +6,11 @@ This package provides the StorageDriver API for testing purpose.
 
 Classes:
     - LocalStorageDriverTests (local_storage_driver_tests.py): Provides the local storage driver tests
+    - AsyncLocalStorageDriverTests (async_local_storage_driver_tests.py): Provides the asynchronous local storage driver tests
+    - AppendHandlesLocalStorageDriverTests (append_handles_local_storage_driver_tests.py): Provides the local storage driver tests with append handles
+    - StorageDriverSynchronizerTests (storage_driver_synchronizer_tests.py): Provides the storage driver synchronizer tests with local storage drivers
 """
 from .local_storage_driver_tests import LocalStorageDriverTests as LocalStorageDriverTests
+from .async_local_storage_driver_tests import AsyncLocalStorageDriverTests as AsyncLocalStorageDriverTests
+from .append_handles_local_storage_driver_tests import AppendHandlesLocalStorageDriverTests as AppendHandlesLocalStorageDriverTests
+from .storage_driver_synchronizer_tests import StorageDriverSynchronizerTests as StorageDriverSynchronizerTests
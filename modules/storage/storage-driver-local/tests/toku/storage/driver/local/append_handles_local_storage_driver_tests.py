@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa: E501
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=empty-docstring
+# pylint: disable=line-too-long
+# pylint: disable=attribute-defined-outside-init
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: append_handles_local_storage_driver_tests.py
+Author: Toku
+"""
+from concurrent.futures import ThreadPoolExecutor
+import os
+import time
+from typing import final
+import uuid
+from overrides import override
+import pytest
+from tests.toku.storage.driver.api import AbstractStorageDriverTest
+from toku.storage.driver.local import AppendDurability
+from toku.storage.driver.local import LocalStorageDriver
+
+
+@final
+class AppendHandlesLocalStorageDriverTests(AbstractStorageDriverTest[LocalStorageDriver]):
+    """
+    Provides the local storage driver tests with append handles and the
+    synchronization of the appends by interval.
+    """
+
+    @override
+    def _initialize_test(self) -> None:
+        self._working_directory_primary_storage_driver: str = self._create_working_directory()
+        self._working_directory_secondary_storage_driver: str = self._create_working_directory()
+
+    @override
+    def _teardown_test(self) -> None:
+        pass  # not needed
+
+    @override
+    def _create_storage_driver(self) -> LocalStorageDriver:
+        return self._create_append_storage_driver(AppendDurability.INTERVAL)
+
+    @override
+    def _create_storage_driver_secondary(self) -> LocalStorageDriver:
+        return LocalStorageDriver(self._working_directory_secondary_storage_driver, max_append_handles=2)
+
+    def _create_working_directory(self) -> str:
+        temp_dir: str = os.path.join(self._tempdir.name, str(uuid.uuid4()))
+        os.mkdir(temp_dir)
+        return temp_dir
+
+    def _create_append_storage_driver(self, append_durability: AppendDurability) -> LocalStorageDriver:
+        return LocalStorageDriver(
+            self._working_directory_primary_storage_driver,
+            max_append_handles=2,
+            append_durability=append_durability,
+            fsync_interval=0.01
+        )
+
+    def _read_local_file(self, file: str) -> bytes:
+        with open(os.path.join(self._working_directory_primary_storage_driver, file), "rb") as f:
+            return f.read()
+
+    @override
+    def test_open__successful_driver_initialization__then_return_void(self) -> None:
+        storage_driver: LocalStorageDriver = self._create_storage_driver()
+        storage_driver.open()
+        storage_driver.close()
+
+    @override
+    def test_open__unsuccessful_driver_initialization__then_raise_exception(self) -> None:
+        storage_driver = LocalStorageDriver(os.path.join("/c", str(uuid.uuid4())), max_append_handles=2)
+        with pytest.raises(Exception):
+            storage_driver.open()
+
+    @override
+    def test_close__successful_driver_completion__then_return_void(self) -> None:
+        storage_driver: LocalStorageDriver = self._create_storage_driver()
+        storage_driver.open()
+        assert storage_driver.put_file_as(b"content", "file.txt")
+        assert storage_driver.append(b"-appended", "file.txt")
+        storage_driver.close()
+        assert self._read_local_file("file.txt") == b"content-appended"
+
+    def test_append__durability_none__then_write_buffered_appends_when_flushing(self) -> None:
+        storage_driver: LocalStorageDriver = self._create_append_storage_driver(AppendDurability.NONE)
+        storage_driver.open()
+        assert storage_driver.put_file_as(b"content", "file.txt")
+        assert storage_driver.append(b"-appended", "file.txt")
+        assert self._read_local_file("file.txt") == b"content"  # buffered
+        storage_driver.flush()
+        assert self._read_local_file("file.txt") == b"content-appended"
+        storage_driver.close()
+
+    def test_append__durability_interval__then_write_appends_periodically(self) -> None:
+        assert self._storage_driver.put_file_as(b"content", "file.txt")
+        assert self._storage_driver.append(b"-appended", "file.txt")
+        time.sleep(0.1)
+        assert self._read_local_file("file.txt") == b"content-appended"
+
+    def test_append__durability_always__then_write_every_append(self) -> None:
+        storage_driver: LocalStorageDriver = self._create_append_storage_driver(AppendDurability.ALWAYS)
+        storage_driver.open()
+        assert storage_driver.put_file_as(b"content", "file.txt")
+        assert storage_driver.append(b"-appended", "file.txt")
+        assert self._read_local_file("file.txt") == b"content-appended"
+        storage_driver.close()
+
+    def test_append__more_files_than_append_handles__then_write_evicted_appends(self) -> None:
+        storage_driver: LocalStorageDriver = self._create_append_storage_driver(AppendDurability.NONE)
+        storage_driver.open()
+
+        for i in range(3):
+            assert storage_driver.put_file_as(b"content", f"{i}.txt")
+            assert storage_driver.append(f"-{i}".encode("utf-8"), f"{i}.txt")
+
+        assert self._read_local_file("0.txt") == b"content-0"  # evicted
+        assert self._read_local_file("2.txt") == b"content"  # buffered
+        assert storage_driver.get("2.txt") == b"content-2"
+        storage_driver.close()
+
+    def test_append__concurrent_appenders__then_keep_every_append(self) -> None:
+        files: list[str] = [f"{i}.txt" for i in range(4)]  # more files than append handles
+        records: list[bytes] = [f"{i:04d}\n".encode("utf-8") for i in range(400)]
+
+        for file in files:
+            assert self._storage_driver.put_file_as(b"content\n", file)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            assert all(executor.map(
+                lambda record: self._storage_driver.append(record, files[int(record) % len(files)]),
+                records
+            ))
+
+        for index, file in enumerate(files):
+            content: bytes | None = self._storage_driver.get(file)
+            assert content is not None
+            lines: list[bytes] = content.splitlines(keepends=True)
+            assert lines[0] == b"content\n"
+            assert sorted(lines[1:]) == records[index::len(files)]
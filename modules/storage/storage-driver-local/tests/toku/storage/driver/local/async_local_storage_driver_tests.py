@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa: E501
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=empty-docstring
+# pylint: disable=line-too-long
+# pylint: disable=attribute-defined-outside-init
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: async_local_storage_driver_tests.py
+Author: Toku
+"""
+import os
+from typing import final
+import uuid
+from overrides import override
+from tests.toku.storage.driver.api import AbstractAsyncStorageDriverTest
+from toku.storage.driver.local import AsyncLocalStorageDriver
+
+
+@final
+class AsyncLocalStorageDriverTests(AbstractAsyncStorageDriverTest[AsyncLocalStorageDriver]):
+    """
+    Provides the asynchronous local storage driver tests.
+    """
+
+    @override
+    def _initialize_test(self) -> None:
+        self._working_directory: str = os.path.join(self._tempdir.name, str(uuid.uuid4()))
+        os.mkdir(self._working_directory)
+
+    @override
+    def _teardown_test(self) -> None:
+        pass  # not needed
+
+    @override
+    def _create_storage_driver(self) -> AsyncLocalStorageDriver:
+        return AsyncLocalStorageDriver(self._working_directory)
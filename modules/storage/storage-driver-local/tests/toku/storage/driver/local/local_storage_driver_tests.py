@@ -20,10 +20,12 @@ Module: local_storage_driver_tests.py
 Author: Toku
 """
 import os
+import threading
 from typing import final
 import uuid
 from overrides import override
 import pytest
+from flexmock import flexmock
 from tests.toku.storage.driver.api import AbstractStorageDriverTest
 from toku.storage.driver.local import LocalStorageDriver
 
@@ -77,3 +79,114 @@ class LocalStorageDriverTests(AbstractStorageDriverTest[LocalStorageDriver]):
         storage_driver = LocalStorageDriver(self._tempdir.name)
         storage_driver.open()
         storage_driver.close()
+
+    def test_files__directory_contains_root__then_return_collection_string(self) -> None:
+        directory: str = self._working_directory_primary_storage_driver.strip(os.sep)
+        assert self._storage_driver.put_file_as(b"content", f"{directory}/file.txt")
+        assert self._storage_driver.files(directory) == [self._sanitizer.concat(directory, "file.txt")]
+        assert self._storage_driver.all_files("") == [self._sanitizer.concat(directory, "file.txt")]
+
+    def test_all_files__hidden_entries__then_return_collection_without_hidden_entries(self) -> None:
+        assert self._storage_driver.put_file_as(b"content", "directory/file.txt")
+        assert self._storage_driver.put_file_as(b"content", "directory/.hidden.txt")
+        assert self._storage_driver.put_file_as(b"content", "directory/.hidden/file.txt")
+        assert self._storage_driver.all_files("directory") == ["directory/file.txt"]
+        assert self._storage_driver.all_directories("directory") == []
+
+    def test_all_files__parallel_scan__then_return_collection_string(self) -> None:
+        paths: list[str] = ["file.txt", "directory-1/file.txt", "directory-1/sub-directory/file.txt", "directory-2/file.txt"]
+        for path in paths:
+            assert self._storage_driver.put_file_as(b"content", path)
+        storage_driver = LocalStorageDriver(self._working_directory_primary_storage_driver, parallel_scan=True)
+        assert sorted(storage_driver.all_files("")) == sorted(paths)
+        assert sorted(storage_driver.all_directories("")) == ["directory-1", "directory-1/sub-directory", "directory-2"]
+
+    def test_get_metadata__directory_with_parallel_scan__then_return_optional_metadata(self) -> None:
+        for path in ["file.txt", "directory/file-1.txt", "directory/sub-directory/file-2.txt"]:
+            assert self._storage_driver.put_file_as(b"content", f"root/{path}")
+        storage_driver = LocalStorageDriver(self._working_directory_primary_storage_driver, parallel_scan=True)
+        metadata = storage_driver.get_metadata("root")
+        assert metadata is not None
+        assert metadata.is_directory
+        assert metadata.size.length == 3 * len(b"content")
+        assert metadata.size == self._storage_driver.get_metadata("root").size  # type: ignore[union-attr]
+
+    def test_list_with_metadata__nested_directories_with_parallel_scan__then_scan_each_directory_in_thread_pool(self) -> None:
+        paths: list[str] = ["a/file-1.txt", "a/b/file-2.txt", "a/b/c/file-3.txt", "a/b/c/d/file-4.txt"]
+        for path in paths:
+            assert self._storage_driver.put_file_as(b"content", path)
+        storage_driver = LocalStorageDriver(self._working_directory_primary_storage_driver, parallel_scan=True)
+        threads: list[str] = []
+        scan_directory = storage_driver._scan_directory  # pylint: disable=protected-access
+
+        def scan_directory_in_thread(path: str, stat_files: bool) -> list[os.DirEntry[str]]:
+            threads.append(threading.current_thread().name)
+            return scan_directory(path, stat_files)
+
+        flexmock(storage_driver).should_receive("_scan_directory").replace_with(scan_directory_in_thread).times(5)  # the root and every nested directory
+        files = storage_driver.list_with_metadata("", True)
+        assert sorted(path for path, _ in files) == sorted(paths)
+        assert all(metadata.size.length == len(b"content") for _, metadata in files)
+        assert threading.current_thread().name not in threads
+
+    def test_get_local_path__file_exists__then_return_optional_string(self) -> None:
+        assert self._storage_driver.put_file_as(b"content", "directory/file.txt")
+        local_path = self._storage_driver.get_local_path("directory/file.txt")
+        assert local_path == os.path.join(self._working_directory_primary_storage_driver, "directory", "file.txt")
+        with open(local_path, "rb") as file:
+            assert file.read() == b"content"
+
+    def test_get_view__file_not_exists__then_return_optional_none(self) -> None:
+        assert self._storage_driver.get_view("file.txt") is None
+        assert self._storage_driver.get_view("") is None
+
+    def test_get_view__file_is_directory__then_return_optional_none(self) -> None:
+        assert self._storage_driver.make_directory("directory")
+        assert self._storage_driver.get_view("directory") is None
+
+    def test_get_view__file_exists__then_return_optional_read_only_memoryview(self) -> None:
+        content: bytes = bytes(self._faker.sentence(100), "utf-8")
+        assert self._storage_driver.put_file_as(content, "directory/file.txt")
+        view = self._storage_driver.get_view("directory/file.txt")
+        assert view is not None
+        with view:
+            assert view.readonly
+            assert view.nbytes == len(content)
+            assert view[10:20] == content[10:20]
+            assert view.tobytes() == content
+
+    def test_get_view__empty_file__then_return_optional_empty_memoryview(self) -> None:
+        with open(os.path.join(self._working_directory_primary_storage_driver, "empty.txt"), "wb"):
+            pass
+        view = self._storage_driver.get_view("empty.txt")
+        assert view is not None
+        assert view.nbytes == 0
+
+    @pytest.mark.skipif(not hasattr(os, "setxattr"), reason="extended attributes are only available on Linux")
+    def test_checksum__stored_checksum__then_return_optional_checksum_without_reading(self) -> None:
+        assert self._storage_driver.put_file_as(b"content", "directory/file.txt")
+        path: str = os.path.join(self._working_directory_primary_storage_driver, "directory", "file.txt")
+        os.utime(path, (0, 0))  # old enough to store the checksum
+        checksum = self._storage_driver.checksum("directory/file.txt")
+        assert checksum is not None
+        flexmock(self._storage_driver).should_call("_get_as_input_stream").never()
+        assert self._storage_driver.checksum("directory/file.txt") == checksum
+
+    @pytest.mark.skipif(not hasattr(os, "setxattr"), reason="extended attributes are only available on Linux")
+    def test_checksum__file_modified__then_return_optional_checksum_calculated_again(self) -> None:
+        assert self._storage_driver.put_file_as(b"content1", "file.txt")
+        path: str = os.path.join(self._working_directory_primary_storage_driver, "file.txt")
+        os.utime(path, (0, 0))
+        checksum = self._storage_driver.checksum("file.txt")
+        with open(path, "wb") as file:
+            file.write(b"content2")
+        os.utime(path, (1, 1))
+        assert checksum is not None
+        assert not checksum.matches(self._storage_driver.checksum("file.txt"))  # type: ignore[arg-type]
+
+    @pytest.mark.skipif(not hasattr(os, "setxattr"), reason="extended attributes are only available on Linux")
+    def test_checksum__file_modified_recently__then_not_store_checksum(self) -> None:
+        assert self._storage_driver.put_file_as(b"content", "file.txt")
+        assert self._storage_driver.checksum("file.txt") is not None
+        with pytest.raises(OSError):
+            os.getxattr(os.path.join(self._working_directory_primary_storage_driver, "file.txt"), LocalStorageDriver.CHECKSUM_ATTRIBUTE)
@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa: E501
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=empty-docstring
+# pylint: disable=line-too-long
+# pylint: disable=attribute-defined-outside-init
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: storage_driver_synchronizer_tests.py
+Author: Toku
+"""
+import json
+import os
+import tempfile
+import time
+from typing import Generator, Optional, final
+import pytest
+from flexmock import flexmock
+from toku.storage.driver.api import StorageDriverException
+from toku.storage.driver.api import StorageDriverSynchronizer
+from toku.storage.driver.api import SyncResult
+from toku.storage.driver.local import LocalStorageDriver
+
+
+@final
+class StorageDriverSynchronizerTests:
+    """
+    Provides test cases for StorageDriverSynchronizer class with local
+    storage drivers.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup_test(self) -> Generator[None, None, None]:
+        # setup
+        self._tempdir = tempfile.TemporaryDirectory()
+        os.mkdir(os.path.join(self._tempdir.name, "source"))
+        os.mkdir(os.path.join(self._tempdir.name, "target"))
+        self._source_storage_driver = LocalStorageDriver(os.path.join(self._tempdir.name, "source"))
+        self._target_storage_driver = LocalStorageDriver(os.path.join(self._tempdir.name, "target"))
+        self._source_storage_driver.open()
+        self._target_storage_driver.open()
+        self._manifest: str = os.path.join(self._tempdir.name, "sync.manifest")
+
+        # return control to the test
+        yield
+
+        # teardown
+        self._source_storage_driver.close()
+        self._target_storage_driver.close()
+        self._tempdir.cleanup()
+
+    def _create_synchronizer(self, compare_checksums: bool = False) -> StorageDriverSynchronizer:
+        return StorageDriverSynchronizer(self._source_storage_driver, self._manifest, compare_checksums, 4)
+
+    def _write(self, root: str, file: str, content: bytes, modified: Optional[int] = None) -> None:
+        path: str = os.path.join(self._tempdir.name, root, file)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, "wb") as f:
+            f.write(content)
+
+        if modified is not None:
+            os.utime(path, (modified, modified))
+
+    def _read(self, root: str, file: str) -> bytes:
+        with open(os.path.join(self._tempdir.name, root, file), "rb") as f:
+            return f.read()
+
+    def test_sync__source_not_directory__then_return_none(self) -> None:
+        self._write("source", "file.txt", b"content")
+        synchronizer: StorageDriverSynchronizer = self._create_synchronizer()
+
+        assert synchronizer.sync("missing", "dir", self._target_storage_driver) is None
+        assert synchronizer.sync("file.txt", "dir", self._target_storage_driver) is None
+
+    def test_sync__target_file__then_return_none(self) -> None:
+        self._write("source", "dir/file.txt", b"content")
+        self._write("target", "dir", b"content")
+
+        assert self._create_synchronizer().sync("dir", "dir", self._target_storage_driver) is None
+
+    def test_sync__same_storage_driver_and_nested_directories__then_return_none(self) -> None:
+        self._write("source", "dir/file.txt", b"content")
+        synchronizer: StorageDriverSynchronizer = self._create_synchronizer()
+
+        assert synchronizer.sync("dir", "dir") is None
+        assert synchronizer.sync("dir", "dir/nested") is None
+        assert synchronizer.sync("dir/nested", "dir") is None
+
+    def test_sync__new_changed_and_unchanged_files__then_transfer_new_and_changed(self) -> None:
+        self._write("source", "dir/new.txt", b"new", 2_000)
+        self._write("source", "dir/sub/resized.txt", b"resized content", 2_000)
+        self._write("source", "dir/sub/modified.txt", b"modified", 3_000)
+        self._write("source", "dir/unchanged.txt", b"unchanged", 1_000)
+        self._write("target", "copy/sub/resized.txt", b"resized", 2_000)
+        self._write("target", "copy/sub/modified.txt", b"original", 2_000)
+        self._write("target", "copy/unchanged.txt", b"unchanged", 2_000)
+        self._write("target", "copy/extraneous.txt", b"extraneous", 2_000)
+
+        result: Optional[SyncResult] = self._create_synchronizer().sync("dir", "copy", self._target_storage_driver)
+
+        assert result is not None and result.succeeded
+        assert sorted(bulk_result.path for bulk_result in result.transfer.results) == [
+            "dir/new.txt",
+            "dir/sub/modified.txt",
+            "dir/sub/resized.txt"
+        ]
+        assert result.transfer.transferred_bytes == 3 + 15 + 8
+        assert result.unchanged == 1
+        assert result.deleted == []
+        assert not result.resumed
+        assert self._read("target", "copy/new.txt") == b"new"
+        assert self._read("target", "copy/sub/resized.txt") == b"resized content"
+        assert self._read("target", "copy/sub/modified.txt") == b"modified"
+        assert self._read("target", "copy/extraneous.txt") == b"extraneous"
+        assert not os.path.exists(self._manifest)
+
+    def test_sync__target_missing__then_create_target_and_transfer_every_file(self) -> None:
+        self._write("source", "dir/file.txt", b"content")
+        self._write("source", "dir/sub/file.txt", b"sub content")
+
+        result: Optional[SyncResult] = self._create_synchronizer().sync("dir", "a/b", self._target_storage_driver)
+
+        assert result is not None and result.succeeded
+        assert len(result.transfer.results) == 2
+        assert self._read("target", "a/b/file.txt") == b"content"
+        assert self._read("target", "a/b/sub/file.txt") == b"sub content"
+
+    def test_sync__same_storage_driver__then_transfer_files(self) -> None:
+        self._write("source", "dir/file.txt", b"content")
+
+        result: Optional[SyncResult] = self._create_synchronizer().sync("dir", "copy")
+
+        assert result is not None and result.succeeded
+        assert self._read("source", "copy/file.txt") == b"content"
+
+    def test_sync__delete_extraneous__then_delete_extraneous_target_files(self) -> None:
+        self._write("source", "dir/file.txt", b"content")
+        self._write("target", "copy/file.txt", b"content", 2_000_000_000)
+        self._write("target", "copy/extraneous.txt", b"extraneous")
+        self._write("target", "copy/sub/extraneous.txt", b"extraneous")
+
+        result: Optional[SyncResult] = self._create_synchronizer().sync("dir", "copy", self._target_storage_driver, True)
+
+        assert result is not None and result.succeeded
+        assert result.transfer.results == []
+        assert result.unchanged == 1
+        assert sorted(bulk_result.path for bulk_result in result.deleted) == [
+            "copy/extraneous.txt",
+            "copy/sub/extraneous.txt"
+        ]
+        assert sorted(os.listdir(os.path.join(self._tempdir.name, "target", "copy"))) == ["file.txt", "sub"]
+
+    def test_sync__compare_checksums__then_transfer_only_different_content(self) -> None:
+        self._write("source", "dir/same.txt", b"same", 3_000)
+        self._write("source", "dir/different.txt", b"aaaa", 1_000)
+        self._write("target", "copy/same.txt", b"same", 2_000)
+        self._write("target", "copy/different.txt", b"bbbb", 2_000)
+
+        result: Optional[SyncResult] = self._create_synchronizer(True).sync("dir", "copy", self._target_storage_driver)
+
+        assert result is not None and result.succeeded
+        assert [bulk_result.path for bulk_result in result.transfer.results] == ["dir/different.txt"]
+        assert result.unchanged == 1
+        assert self._read("target", "copy/different.txt") == b"aaaa"
+
+    def test_sync__failed_file__then_keep_manifest_and_retry_only_failed_file(self) -> None:
+        self._write("source", "dir/file_1.txt", b"content 1")
+        self._write("source", "dir/file_2.txt", b"content 2")
+        synchronizer: StorageDriverSynchronizer = self._create_synchronizer()
+        copy = self._source_storage_driver.copy
+        flexmock(self._source_storage_driver).should_receive("copy").replace_with(
+            lambda source, target, storage_driver: False if source == "dir/file_2.txt" else copy(source, target, storage_driver)
+        )
+
+        result: Optional[SyncResult] = synchronizer.sync("dir", "copy", self._target_storage_driver)
+
+        assert result is not None and not result.succeeded
+        assert os.path.exists(self._manifest)
+        flexmock(self._source_storage_driver).should_receive("copy").replace_with(copy)
+        flexmock(self._source_storage_driver).should_call("list_with_metadata").never()
+        flexmock(self._target_storage_driver).should_call("list_with_metadata").never()
+
+        result = synchronizer.sync("dir", "copy", self._target_storage_driver)
+
+        assert result is not None and result.succeeded and result.resumed
+        assert [bulk_result.path for bulk_result in result.transfer.results] == ["dir/file_2.txt"]
+        assert self._read("target", "copy/file_1.txt") == b"content 1"
+        assert self._read("target", "copy/file_2.txt") == b"content 2"
+        assert not os.path.exists(self._manifest)
+
+    def test_sync__interrupted_manifest__then_resume_from_last_checkpoint(self) -> None:
+        self._write("source", "dir/file_1.txt", b"content 1")
+        self._write("source", "dir/file_2.txt", b"content 2")
+
+        with open(self._manifest, "w", encoding="utf-8") as manifest:
+            manifest.write(json.dumps({"source": "dir", "target": "copy", "delete_extraneous": False}) + "\n")
+            manifest.write(json.dumps({"transfer": "file_1.txt", "size": 9}) + "\n")
+            manifest.write(json.dumps({"transfer": "file_2.txt", "size": 9}) + "\n")
+            manifest.write(json.dumps({"unchanged": 0}) + "\n")
+            manifest.write(json.dumps({"planned": True}) + "\n")
+            manifest.write(json.dumps({"transferred": "file_1.txt"}) + "\n")
+            manifest.write('{"transferred": "fi')  # interrupted while it was written
+
+        result: Optional[SyncResult] = self._create_synchronizer().sync("dir", "copy", self._target_storage_driver)
+
+        assert result is not None and result.succeeded and result.resumed
+        assert [bulk_result.path for bulk_result in result.transfer.results] == ["dir/file_2.txt"]
+        assert not os.path.exists(os.path.join(self._tempdir.name, "target", "copy", "file_1.txt"))
+        assert self._read("target", "copy/file_2.txt") == b"content 2"
+        assert not os.path.exists(self._manifest)
+
+    def test_sync__incomplete_plan_in_manifest__then_plan_again(self) -> None:
+        self._write("source", "dir/file_1.txt", b"content 1")
+        self._write("source", "dir/file_2.txt", b"content 2")
+
+        with open(self._manifest, "w", encoding="utf-8") as manifest:
+            manifest.write(json.dumps({"source": "dir", "target": "copy", "delete_extraneous": False}) + "\n")
+            manifest.write(json.dumps({"transfer": "file_1.txt", "size": 9}) + "\n")
+
+        result: Optional[SyncResult] = self._create_synchronizer().sync("dir", "copy", self._target_storage_driver)
+
+        assert result is not None and result.succeeded and not result.resumed
+        assert len(result.transfer.results) == 2
+
+    def test_sync__manifest_of_another_sync__then_raise_exception(self) -> None:
+        self._write("source", "dir/file.txt", b"content")
+
+        with open(self._manifest, "w", encoding="utf-8") as manifest:
+            manifest.write(json.dumps({"source": "other", "target": "copy", "delete_extraneous": False}) + "\n")
+
+        with pytest.raises(StorageDriverException):
+            self._create_synchronizer().sync("dir", "copy", self._target_storage_driver)
+
+    def test_sync__without_manifest__then_transfer_files(self) -> None:
+        self._write("source", "dir/file.txt", b"content")
+
+        result: Optional[SyncResult] = StorageDriverSynchronizer(self._source_storage_driver).sync(
+            "dir",
+            "copy",
+            self._target_storage_driver
+        )
+
+        assert result is not None and result.succeeded
+        assert self._read("target", "copy/file.txt") == b"content"
+        assert not os.path.exists(self._manifest)
+
+    def _write_interrupted_manifest(self, delete_extraneous: bool = False, planned_at: Optional[float] = None) -> None:
+        with open(self._manifest, "w", encoding="utf-8") as manifest:
+            manifest.write(json.dumps({"source": "dir", "target": "copy", "delete_extraneous": delete_extraneous}) + "\n")
+            manifest.write(json.dumps({"transfer": "a.txt", "size": 1}) + "\n")
+            manifest.write(json.dumps({"transfer": "b.txt", "size": 1}) + "\n")
+
+            if delete_extraneous:
+                manifest.write(json.dumps({"delete": "copy/gone.txt"}) + "\n")
+
+            manifest.write(json.dumps({"unchanged": 0}) + "\n")
+
+            if planned_at is not None:
+                manifest.write(json.dumps({"planned_at": planned_at}) + "\n")
+
+            manifest.write(json.dumps({"planned": True}) + "\n")
+            manifest.write(json.dumps({"transferred": "a.txt"}) + "\n")
+
+    def test_sync__planned_file_deleted_from_source__then_complete_plan_and_plan_again_next_sync(self) -> None:
+        self._write("source", "dir/a.txt", b"a")
+        self._write("source", "dir/c.txt", b"c")
+        self._write_interrupted_manifest()
+        synchronizer: StorageDriverSynchronizer = self._create_synchronizer()
+
+        result: Optional[SyncResult] = synchronizer.sync("dir", "copy", self._target_storage_driver)
+
+        assert result is not None and result.succeeded and result.resumed
+        assert not os.path.exists(self._manifest)
+
+        result = synchronizer.sync("dir", "copy", self._target_storage_driver)
+
+        assert result is not None and result.succeeded and not result.resumed
+        assert self._read("target", "copy/c.txt") == b"c"
+
+    def test_sync__planned_extraneous_file_already_deleted__then_return_succeeded(self) -> None:
+        self._write("source", "dir/a.txt", b"a")
+        self._write("source", "dir/b.txt", b"b")
+        self._write_interrupted_manifest(True)
+
+        result: Optional[SyncResult] = self._create_synchronizer().sync("dir", "copy", self._target_storage_driver, True)
+
+        assert result is not None and result.succeeded and result.resumed
+        assert [bulk_result.path for bulk_result in result.deleted] == ["copy/gone.txt"]
+        assert not os.path.exists(self._manifest)
+
+    def test_sync__without_resume__then_plan_again(self) -> None:
+        self._write("source", "dir/a.txt", b"a")
+        self._write("source", "dir/b.txt", b"b")
+        self._write_interrupted_manifest()
+
+        result: Optional[SyncResult] = self._create_synchronizer().sync("dir", "copy", self._target_storage_driver, resume=False)
+
+        assert result is not None and result.succeeded and not result.resumed
+        assert len(result.transfer.results) == 2
+        assert self._read("target", "copy/a.txt") == b"a"
+
+    def test_sync__expired_manifest__then_plan_again(self) -> None:
+        self._write("source", "dir/a.txt", b"a")
+        self._write("source", "dir/b.txt", b"b")
+        self._write_interrupted_manifest(planned_at=time.time() - StorageDriverSynchronizer.DEFAULT_MANIFEST_MAX_AGE - 1)
+
+        result: Optional[SyncResult] = self._create_synchronizer().sync("dir", "copy", self._target_storage_driver)
+
+        assert result is not None and result.succeeded and not result.resumed
+        assert len(result.transfer.results) == 2
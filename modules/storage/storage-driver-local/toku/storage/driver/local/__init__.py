@@ -5,6 +5,10 @@
 This package provides the StorageDriver Local.
 
 Classes:
+    - AppendDurability (local_storage_driver.py): The policies to synchronize the appends with the disk
     - LocalStorageDriver (local_storage_driver.py): The local storage driver implementation
+    - AsyncLocalStorageDriver (async_local_storage_driver.py): The asynchronous local storage driver implementation
 """
+from .local_storage_driver import AppendDurability as AppendDurability
 from .local_storage_driver import LocalStorageDriver as LocalStorageDriver
+from .async_local_storage_driver import AsyncLocalStorageDriver as AsyncLocalStorageDriver
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=protected-access
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: async_local_storage_driver.py
+Author: Toku
+"""
+from concurrent.futures import Executor
+from io import BufferedReader
+from typing import AsyncIterator, Optional, final
+from overrides import override
+from toku.storage.driver.api import DirectorySeparator
+from toku.storage.driver.api import Metadata
+from toku.storage.driver.api import AbstractAsyncStorageDriver
+from toku.storage.driver.local import LocalStorageDriver
+
+
+@final
+class AsyncLocalStorageDriver(AbstractAsyncStorageDriver):
+    """
+    Provides the asynchronous storage driver to work locally, it's necessary
+    that the running instance application has the access to work within the `root`.
+
+    The file system calls are executed by the internal `LocalStorageDriver` in the
+    executor, on that way the event loop is never blocked by the disk.
+    """
+
+    def __init__(
+            self,
+            root: str,
+            separator: DirectorySeparator = DirectorySeparator.SLASH,
+            executor: Optional[Executor] = None
+    ) -> None:
+        """
+        Initializes a new asynchronous Local storage driver.
+
+        Args:
+            root (str): The working directory.
+            separator (DirectorySeparator): The directory separator.
+                                            Defaults to DirectorySeparator.SLASH.
+            executor (Optional[Executor]): The executor to run the file system calls.
+                                           Defaults to None (event loop executor).
+        """
+        super().__init__(root, separator, executor)
+        self._storage_driver: LocalStorageDriver = LocalStorageDriver(root, separator)
+
+    @override
+    async def open(self) -> None:
+        await self._run(self._storage_driver.open)
+
+    @override
+    async def close(self) -> None:
+        await self._run(self._storage_driver.close)
+
+    @override
+    async def _iter_chunks(  # pylint: disable=invalid-overridden-method
+            self,
+            file: str,
+            chunk_size: int
+    ) -> AsyncIterator[bytes]:
+        input_stream: BufferedReader = await self._run(
+            self._storage_driver._get_as_input_stream,
+            file
+        )
+
+        try:
+            while True:
+                chunk: bytes = await self._run(input_stream.read, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            input_stream.close()
+
+    @override
+    async def exists(self, file: str) -> bool:
+        return await self._run(self._storage_driver.exists, file)
+
+    @override
+    async def _put_file_as(self, source: BufferedReader, file: str) -> bool:
+        return await self._run(self._storage_driver._put_file_as, source, file)
+
+    @override
+    async def _delete(self, file: str) -> bool:
+        return await self._run(self._storage_driver._delete, file)
+
+    @override
+    async def _files(self, directory: str) -> list[str]:
+        return await self._run(self._storage_driver._files, directory)
+
+    @override
+    async def _all_files(self, directory: str) -> list[str]:
+        return await self._run(self._storage_driver._all_files, directory)
+
+    @override
+    async def _directories(self, directory: str) -> list[str]:
+        return await self._run(self._storage_driver._directories, directory)
+
+    @override
+    async def _all_directories(self, directory: str) -> list[str]:
+        return await self._run(self._storage_driver._all_directories, directory)
+
+    @override
+    async def exists_directory(self, directory: str) -> bool:
+        return await self._run(self._storage_driver.exists_directory, directory)
+
+    @override
+    async def _make_directory(self, directory: str) -> bool:
+        return await self._run(self._storage_driver._make_directory, directory)
+
+    @override
+    async def _delete_directory(self, directory: str) -> bool:
+        return await self._run(self._storage_driver._delete_directory, directory)
+
+    @override
+    async def _get_metadata_from_file(self, file: str) -> Metadata:
+        return await self._run(self._storage_driver._get_metadata_from_file, file)
+
+    @override
+    async def _get_metadata_from_directory(self, directory: str) -> Metadata:
+        return await self._run(self._storage_driver._get_metadata_from_directory, directory)
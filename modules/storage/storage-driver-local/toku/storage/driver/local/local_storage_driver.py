@@ -14,31 +14,157 @@ prior written permission from Toku.
 Module: local_storage_driver.py
 Author: Toku
 """
-import glob
-from io import BufferedReader
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from enum import Enum
+from io import BufferedReader, BufferedWriter, RawIOBase
+import mmap
 import os
-import platform
 import shutil
-from typing import final
+import stat
+import threading
+import time
+from typing import Iterator, Optional, final
 from overrides import override
 from toku.storage.driver.api import DirectorySeparator
 from toku.storage.driver.api import Size
 from toku.storage.driver.api import Metadata
+from toku.storage.driver.api import PathType
+from toku.storage.driver.api import Stat
+from toku.storage.driver.api import Checksum
 from toku.storage.driver.api import AbstractStorageDriver
 from toku.storage.driver.api import StorageDriverException
 
 
+@final
+class RangeFileIO(RawIOBase):
+    """
+    Helper raw stream to read only a range of a file, the content is read with
+    `os.pread` (where it's available) so each read is a single system call
+    that doesn't depend on the position of the file descriptor.
+    """
+
+    def __init__(self, path: str, offset: int, length: Optional[int]) -> None:
+        """
+        Opens `path` to read `length` bytes from `offset`, or until the end of
+        the file if `length` is None.
+
+        Args:
+            path (str): The full path in the local machine.
+            offset (int): The position of the first byte.
+            length (Optional[int]): The number of bytes.
+        """
+        super().__init__()
+        self._fd: int = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        size: int = os.fstat(self._fd).st_size
+        self._position: int = min(offset, size)
+        self._end: int = size if length is None else min(offset + length, size)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        data: bytes = self._read(min(len(buffer), self._end - self._position))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def readall(self) -> bytes:
+        chunks: list[bytes] = []
+
+        while self._position < self._end:
+            data: bytes = self._read(self._end - self._position)
+            if not data:
+                break
+            chunks.append(data)
+
+        return b"".join(chunks)
+
+    def close(self) -> None:
+        if not self.closed:
+            os.close(self._fd)
+        super().close()
+
+    def _read(self, size: int) -> bytes:
+        if size <= 0:
+            return b""
+
+        if hasattr(os, "pread"):
+            data: bytes = os.pread(self._fd, size, self._position)
+        else:  # Windows
+            os.lseek(self._fd, self._position, os.SEEK_SET)
+            data = os.read(self._fd, size)
+
+        self._position += len(data)
+        return data
+
+
+@final
+class AppendDurability(Enum):
+    """
+    Provides the policies to synchronize the appended content with the disk.
+    """
+
+    NONE = "none"  # the operating system decides when to write to the disk
+    INTERVAL = "interval"  # the appends are synchronized together periodically
+    ALWAYS = "always"  # every append is synchronized before returning
+
+
+@final
+@dataclass
+class AppendHandle:
+    """
+    Provides a file kept open to append content to it.
+    """
+
+    file: BufferedWriter  # the file opened in append mode
+    lock: threading.Lock = field(default_factory=threading.Lock)  # guards the writes
+    dirty: bool = False  # whether there are writes not synchronized with the disk
+
+
 @final
 class LocalStorageDriver(AbstractStorageDriver):
     """
     Provides the storage driver to work locally, it's necessary that the running
     instance application has the access to work within the `root`.
+
+    The directories are listed with `os.scandir`, so the kind of each entry is
+    known without an extra system call, and the hidden entries (starting with
+    '.') are ignored. If `parallel_scan` is True, every directory of a
+    recursive scan is scanned in a thread pool with up to `max_workers`
+    threads (the files are stated there too when their metadata is needed),
+    which is useful when the latency of each system call is high, like in
+    network file systems (NFS).
+
+    If `max_append_handles` is greater than 0, the files appended are kept
+    open in a LRU of up to `max_append_handles` handles, and the appends are
+    buffered writes to them. The buffered content is written before the file
+    is read or its metadata is obtained, and the handle is closed before the
+    file is replaced, deleted or renamed. `append_durability` defines when the
+    appends are synchronized with the disk (fsync): never, together every
+    `fsync_interval` seconds in a background thread (group commit), or in
+    every append; `flush` and `close` synchronize them too unless it's never.
+
+    The checksum of a file is calculated once and stored in an extended
+    attribute of the file (`CHECKSUM_ATTRIBUTE`) with the inode, size and last
+    modification of the file, so it's calculated again only if the file
+    changes. If the platform or the file system doesn't support extended
+    attributes, the checksum is calculated every time.
     """
 
-    def __init__(
+    DEFAULT_FSYNC_INTERVAL: float = 0.1  # 100 ms
+    CHECKSUM_ATTRIBUTE: str = "user.toku.checksum"  # the extended attribute of the checksum
+    CHECKSUM_MIN_AGE: int = 2_000_000_000  # 2 seconds (in nanoseconds) since the last modification
+
+    def __init__(  # pylint: disable=too-many-arguments
             self,
             root: str,
-            separator: DirectorySeparator = DirectorySeparator.SLASH
+            separator: DirectorySeparator = DirectorySeparator.SLASH,
+            max_workers: int = AbstractStorageDriver.DEFAULT_MAX_WORKERS,
+            parallel_scan: bool = False,
+            max_append_handles: int = 0,
+            append_durability: AppendDurability = AppendDurability.NONE,
+            fsync_interval: float = DEFAULT_FSYNC_INTERVAL
     ) -> None:
         """
         Initializes a new Local storage driver.
@@ -47,84 +173,204 @@ class LocalStorageDriver(AbstractStorageDriver):
             root (str): The working directory.
             separator (DirectorySeparator): The directory separator.
                                             Defaults to DirectorySeparator.SLASH.
+            max_workers (int): The maximum number of threads for bulk operations
+                               and parallel scans.
+                               Defaults to AbstractStorageDriver.DEFAULT_MAX_WORKERS.
+            parallel_scan (bool): Whether to scan the sub-directories in parallel.
+                                  Defaults to False.
+            max_append_handles (int): The maximum number of files kept open to append,
+                                      0 to open and close the file in every append.
+                                      Defaults to 0.
+            append_durability (AppendDurability): The policy to synchronize the appends,
+                                                  without append handles INTERVAL works
+                                                  like ALWAYS.
+                                                  Defaults to AppendDurability.NONE.
+            fsync_interval (float): The seconds between synchronizations with
+                                    AppendDurability.INTERVAL.
+                                    Defaults to DEFAULT_FSYNC_INTERVAL.
         """
-        super().__init__(root, separator)
+        super().__init__(root, separator, max_workers)
+        self._parallel_scan: bool = parallel_scan
+        self._max_append_handles: int = max_append_handles
+        self._append_durability: AppendDurability = append_durability
+        self._fsync_interval: float = fsync_interval
+        self._append_handles: OrderedDict[str, AppendHandle] = OrderedDict()
+        self._append_handles_lock: threading.Lock = threading.Lock()
+        self._sync_stopped: threading.Event = threading.Event()
+        self._sync_thread: Optional[threading.Thread] = None
 
     @override
     def open(self) -> None:
         if not os.path.isdir(self._root):
             raise StorageDriverException(f"root {self._root} is not a directory")
 
+        # the appends of every file are synchronized together (group commit)
+        if self._max_append_handles > 0 and \
+           self._append_durability == AppendDurability.INTERVAL:
+            self._sync_stopped.clear()
+            self._sync_thread = threading.Thread(target=self._sync_periodically, daemon=True)
+            self._sync_thread.start()
+
     @override
     def close(self) -> None:
-        # this process works in a local directory,
-        # it's not needed to do anything to close the driver
-        pass
+        # this process works in a local directory, it's only needed to stop
+        # the synchronization and close the append handles
+        self._sync_stopped.set()
+
+        if self._sync_thread is not None:
+            self._sync_thread.join()
+            self._sync_thread = None
+
+        self._flush_append_handles("", True, close=True)
+
+    @override
+    def flush(self) -> None:
+        self._flush_append_handles("", True, sync=True)
 
     @override
     def _get_as_input_stream(self, file: str) -> BufferedReader:
+        self._flush_append_handles(file)
         return open(self._get_path(file), "rb")
 
+    @override
+    def _get_range(self, file: str, offset: int, length: Optional[int]) -> bytes:
+        self._flush_append_handles(file)
+
+        with RangeFileIO(self._get_path(file), offset, length) as range_file:
+            return range_file.readall()
+
+    @override
+    def _get_range_as_input_stream(
+        self,
+        file: str,
+        offset: int,
+        length: Optional[int]
+    ) -> BufferedReader:
+        self._flush_append_handles(file)
+        return BufferedReader(RangeFileIO(self._get_path(file), offset, length))
+
+    @override
+    def get_local_path(self, file: str) -> Optional[str]:
+        if not self.exists(file):
+            return None
+
+        self._flush_append_handles(file)
+        return self._get_path(file)
+
+    def get_view(self, file: str) -> Optional[memoryview]:
+        """
+        Gets `file` as a read-only memoryview over a memory map of the file, so
+        the content is read on demand by the operating system without copying
+        it into a new byte array, and the pages are shared by every process
+        reading the same file.
+
+        The memory map is released when the memoryview is released (it's
+        possible to use it with `with`) and it isn't referenced anymore.
+
+        If `file` doesn't exist, return None.
+
+        Args:
+            file (str): Full file path.
+
+        Returns:
+            Optional[memoryview]: The read-only memoryview or None.
+        """
+        if not self.exists(file):
+            return None
+
+        self._flush_append_handles(file)
+
+        with open(self._get_path(file), "rb") as input_file:
+            # an empty file can't be mapped
+            if os.fstat(input_file.fileno()).st_size == 0:
+                return memoryview(b"")
+
+            # the memory map duplicates the file descriptor, so the file
+            # can be closed without affecting it
+            return memoryview(mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ))
+
     @override
     def exists(self, file: str) -> bool:
         return os.path.isfile(self._get_path(file))
 
     @override
     def _put_file_as(self, source: BufferedReader, file: str) -> bool:
+        self._flush_append_handles(file, close=True)
+
         with open(self._get_path(file), "wb") as target:
             shutil.copyfileobj(source, target)
             return True
 
     @override
     def _append(self, source: bytes, file: str) -> bool:
-        with open(self._get_path(file), "ab") as target:
-            target.write(source)
-            return True
+        if self._max_append_handles == 0:
+            with open(self._get_path(file), "ab") as target:
+                target.write(source)
+
+                if self._append_durability != AppendDurability.NONE:
+                    target.flush()
+                    os.fsync(target.fileno())
+
+                return True
+
+        while True:
+            handle: AppendHandle = self._get_append_handle(file)
+
+            with handle.lock:
+                # the handle could be evicted before taking its lock
+                if handle.file.closed:
+                    continue
+
+                handle.file.write(source)
+                handle.dirty = True
+
+                if self._append_durability == AppendDurability.ALWAYS:
+                    self._sync_append_handle(handle)
+
+                return True
 
     @override
     def _delete(self, file: str) -> bool:
+        self._flush_append_handles(file, close=True)
         os.remove(self._get_path(file))
         return True
 
     @override
     def _rename(self, source: str, target: str) -> bool:
+        self._flush_append_handles(source, close=True)
         os.rename(self._get_path(source), self._get_path(target))
         return True
 
     @override
     def _files(self, directory: str) -> list[str]:
-        directory_path: str = self._get_path(directory)
         return [
-            self._sanitizer.sanitize(file_path.replace(self._root, ""), True)
-            for file_path in glob.glob(f"{directory_path}/*")
-            if os.path.isfile(file_path)
+            self._get_relative_path(entry.path)
+            for entry in self._scan(self._get_path(directory))
+            if entry.is_file()
         ]
 
     @override
     def _all_files(self, directory: str) -> list[str]:
-        directory_path: str = self._get_path(directory)
         return [
-            self._sanitizer.sanitize(file_path.replace(self._root, ""), True)
-            for file_path in glob.glob(f"{directory_path}/**/*", recursive=True)
-            if os.path.isfile(file_path)
+            self._get_relative_path(entry.path)
+            for entry in self._scan_tree(self._get_path(directory))
+            if entry.is_file()
         ]
 
     @override
     def _directories(self, directory: str) -> list[str]:
-        directory_path: str = self._get_path(directory)
         return [
-            self._sanitizer.sanitize(file_path.replace(self._root, ""), True)
-            for file_path in glob.glob(f"{directory_path}/*")
-            if os.path.isdir(file_path)
+            self._get_relative_path(entry.path)
+            for entry in self._scan(self._get_path(directory))
+            if entry.is_dir()
         ]
 
     @override
     def _all_directories(self, directory: str) -> list[str]:
-        directory_path: str = self._get_path(directory)
         return [
-            self._sanitizer.sanitize(file_path.replace(self._root, ""), True)
-            for file_path in glob.glob(f"{directory_path}/**/*", recursive=True)
-            if os.path.isdir(file_path)
+            self._get_relative_path(entry.path)
+            for entry in self._scan_tree(self._get_path(directory))
+            if entry.is_dir()
         ]
 
     @override
@@ -138,53 +384,442 @@ class LocalStorageDriver(AbstractStorageDriver):
 
     @override
     def _delete_directory(self, directory: str) -> bool:
+        self._flush_append_handles(directory, True, close=True)
         shutil.rmtree(self._get_path(directory), ignore_errors=True)
         return True
 
     @override
     def _rename_directory(self, source: str, target: str) -> bool:
+        self._flush_append_handles(source, True, close=True)
         return self._rename(source, target)
 
+    @override
+    def stat(self, path: str) -> Stat:
+        # a single status of the path gives its type and the metadata of a file,
+        # the status is obtained again only if the path is a symbolic link
+        self._flush_append_handles(path)
+        full_path: str = self._get_path(path)
+
+        try:
+            os_stat: os.stat_result = os.lstat(full_path)
+            is_symbolic_link: bool = stat.S_ISLNK(os_stat.st_mode)
+
+            if is_symbolic_link:
+                os_stat = os.stat(full_path)
+        except OSError:  # path doesn't exist or it's a broken symbolic link
+            return Stat(PathType.MISSING)
+
+        if stat.S_ISDIR(os_stat.st_mode):
+            return Stat(PathType.DIRECTORY)
+
+        if stat.S_ISREG(os_stat.st_mode):
+            return Stat(
+                PathType.FILE,
+                self._create_metadata_from_stat(
+                    os_stat,
+                    is_symbolic_link,
+                    None,
+                    Metadata.detect_media_type(full_path)
+                )
+            )
+
+        return Stat(PathType.MISSING)  # path is a special file (socket, fifo, device)
+
+    @override
+    def _checksum(self, file: str) -> Checksum:
+        self._flush_append_handles(file)
+        path: str = self._get_path(file)
+        os_stat: os.stat_result = os.stat(path)
+        version: str = f"{os_stat.st_ino}:{os_stat.st_size}:{os_stat.st_mtime_ns}"
+        stored_checksum: Optional[tuple[str, str]] = self._get_stored_checksum(path)
+
+        if stored_checksum is not None and stored_checksum[0] == version:
+            return Checksum(os_stat.st_size, md5=stored_checksum[1])
+
+        checksum: Checksum = super()._checksum(file)
+
+        # a file modified recently could be modified again with the same size
+        # in the same modification time (its precision depends on the file
+        # system), so the checksum is stored only if it's old enough and it
+        # wasn't modified while it was read
+        if time.time_ns() - os_stat.st_mtime_ns > LocalStorageDriver.CHECKSUM_MIN_AGE and \
+           os.stat(path).st_mtime_ns == os_stat.st_mtime_ns and \
+           checksum.md5 is not None:
+            self._store_checksum(path, version, checksum.md5)
+
+        return checksum
+
     @override
     def _get_metadata_from_file(self, file: str) -> Metadata:
         file_path: str = self._get_path(file)
-        os_stat = os.stat(file_path)
-        return Metadata(
-            size=Size(os_stat.st_size),
-            creation_time=int(
-                os_stat.st_ctime
-                if platform.system() == 'Windows'
-                else os_stat.st_birthtime
-            ),
-            last_modified=int(os_stat.st_mtime),
-            last_access_time=int(os_stat.st_atime),
-            is_file=os.path.isfile(file_path),
-            is_directory=os.path.isdir(file_path),
-            is_symbolic_link=os.path.islink(file_path),
-            media_type=Metadata.detect_media_type(file_path)
-        )
+        return self._create_metadata(file_path, None, Metadata.detect_media_type(file_path))
 
     @override
     def _get_metadata_from_directory(self, directory: str) -> Metadata:
+        # the size of each file is obtained from the entries of the scan, the
+        # stat of an entry is cached, so every file is stated only once
+        directory_path: str = self._get_path(directory)
+        size: int = sum(
+            entry.stat().st_size
+            for entry in self._scan_tree(directory_path, True)
+            if entry.is_file()
+        )
+        return self._create_metadata(directory_path, size, "")
+
+    @override
+    def _list_with_metadata(self, directory: str, recursive: bool) -> list[tuple[str, Metadata]]:
+        # the status of each entry is cached by the scan, so every file is
+        # stated only once
+        self._flush_append_handles(directory, True)
         directory_path: str = self._get_path(directory)
-        files_metadata: list[Metadata] = [
-            self._get_metadata_from_file(f) for f in self._all_files(directory)
+        entries: Iterator[os.DirEntry[str]] = self._scan_tree(directory_path, True) \
+            if recursive \
+            else self._scan(directory_path)
+        return [
+            (
+                self._get_relative_path(entry.path),
+                self._create_metadata_from_stat(
+                    entry.stat(),
+                    entry.is_symlink(),
+                    None,
+                    Metadata.detect_media_type(entry.path)
+                )
+            )
+            for entry in entries
+            if entry.is_file()
         ]
-        os_stat = os.stat(directory_path)
+
+    def _create_metadata(self, path: str, size: Optional[int], media_type: str) -> Metadata:
+        """
+        Creates the metadata of `path` from its status, the status is obtained
+        without following the symbolic links and only if `path` is a symbolic
+        link it's obtained again following it.
+
+        Args:
+            path (str): The full path in the local machine.
+            size (Optional[int]): The size, None to use the size of the status.
+            media_type (str): The media type.
+
+        Returns:
+            Metadata: The metadata.
+        """
+        os_stat: os.stat_result = os.lstat(path)
+        is_symbolic_link: bool = stat.S_ISLNK(os_stat.st_mode)
+
+        if is_symbolic_link:
+            os_stat = os.stat(path)
+
+        return self._create_metadata_from_stat(os_stat, is_symbolic_link, size, media_type)
+
+    def _create_metadata_from_stat(
+            self,
+            os_stat: os.stat_result,
+            is_symbolic_link: bool,
+            size: Optional[int],
+            media_type: str
+    ) -> Metadata:
+        """
+        Creates the metadata from the status of a path.
+
+        Args:
+            os_stat (os.stat_result): The status following the symbolic links.
+            is_symbolic_link (bool): Whether the path is a symbolic link.
+            size (Optional[int]): The size, None to use the size of the status.
+            media_type (str): The media type.
+
+        Returns:
+            Metadata: The metadata.
+        """
         return Metadata(
-            size=Size(sum(m.size.length for m in files_metadata)),
-            creation_time=int(
-                os_stat.st_ctime
-                if platform.system() == 'Windows'
-                else os_stat.st_birthtime
-            ),
+            size=Size(os_stat.st_size if size is None else size),
+            creation_time=self._get_creation_time(os_stat),
             last_modified=int(os_stat.st_mtime),
             last_access_time=int(os_stat.st_atime),
-            is_file=os.path.isfile(directory_path),
-            is_directory=os.path.isdir(directory_path),
-            is_symbolic_link=os.path.islink(directory_path),
-            media_type=""
+            is_file=stat.S_ISREG(os_stat.st_mode),
+            is_directory=stat.S_ISDIR(os_stat.st_mode),
+            is_symbolic_link=is_symbolic_link,
+            media_type=media_type
         )
 
+    def _scan(self, directory_path: str) -> Iterator[os.DirEntry[str]]:
+        """
+        Scans the entries of `directory_path`, without the hidden ones.
+
+        Args:
+            directory_path (str): The full directory path in the local machine.
+
+        Yields:
+            Iterator[os.DirEntry[str]]: The entries.
+        """
+        with os.scandir(directory_path) as entries:
+            for entry in entries:
+                if not entry.name.startswith("."):  # hidden entry
+                    yield entry
+
+    def _scan_tree(
+            self,
+            directory_path: str,
+            stat_files: bool = False
+    ) -> Iterator[os.DirEntry[str]]:
+        """
+        Scans the entries of `directory_path` and its sub-directories, without
+        the hidden ones.
+
+        If `parallel_scan` is True, each directory is scanned by a task of a
+        thread pool and its sub-directories are submitted as new tasks when
+        its entries are yielded, so the entries are yielded in any order.
+
+        Args:
+            directory_path (str): The full directory path in the local machine.
+            stat_files (bool): Whether to state the files in the thread pool, the
+                               status is cached by each entry. Defaults to False.
+
+        Yields:
+            Iterator[os.DirEntry[str]]: The entries.
+        """
+        if not self._parallel_scan:
+            yield from self._scan_tree_sequentially(directory_path)
+            return
+
+        executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=self._max_workers)
+
+        try:
+            pending: set[Future[list[os.DirEntry[str]]]] = {
+                executor.submit(self._scan_directory, directory_path, stat_files)
+            }
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    for entry in future.result():
+                        if entry.is_dir():
+                            pending.add(
+                                executor.submit(self._scan_directory, entry.path, stat_files)
+                            )
+                        yield entry
+        finally:
+            # a scan stopped before the end doesn't wait for the pending tasks
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _scan_directory(self, directory_path: str, stat_files: bool) -> list[os.DirEntry[str]]:
+        """
+        Scans the entries of `directory_path`, without the hidden ones, stating
+        the files if `stat_files` is True.
+
+        Args:
+            directory_path (str): The full directory path in the local machine.
+            stat_files (bool): Whether to state the files.
+
+        Returns:
+            list[os.DirEntry[str]]: The entries.
+        """
+        entries: list[os.DirEntry[str]] = list(self._scan(directory_path))
+
+        for entry in entries:
+            if stat_files and entry.is_file():
+                entry.stat()  # cached by the entry for the caller
+
+        return entries
+
+    def _scan_tree_sequentially(self, directory_path: str) -> Iterator[os.DirEntry[str]]:
+        """
+        Scans the entries of `directory_path` and its sub-directories one after
+        another, without the hidden ones.
+
+        Args:
+            directory_path (str): The full directory path in the local machine.
+
+        Yields:
+            Iterator[os.DirEntry[str]]: The entries.
+        """
+        pending: list[str] = [directory_path]
+
+        while pending:
+            for entry in self._scan(pending.pop()):
+                if entry.is_dir():
+                    pending.append(entry.path)
+                yield entry
+
+    def _get_append_handle(self, file: str) -> AppendHandle:
+        """
+        Gets the append handle of `file`, it's opened if it doesn't exist and
+        the least recently used handles are closed to keep up to
+        `max_append_handles` handles.
+
+        Args:
+            file (str): Full file path.
+
+        Returns:
+            AppendHandle: The append handle.
+        """
+        with self._append_handles_lock:
+            handle: Optional[AppendHandle] = self._append_handles.get(file)
+
+            if handle is not None:
+                self._append_handles.move_to_end(file)
+                return handle
+
+            handle = AppendHandle(
+                open(self._get_path(file), "ab")  # pylint: disable=consider-using-with
+            )
+            self._append_handles[file] = handle
+
+            # the evicted handles are closed with the lock, so a new handle of
+            # the same file can't write before the content of the evicted one
+            while len(self._append_handles) > self._max_append_handles:
+                self._close_append_handle(self._append_handles.popitem(last=False)[1])
+
+            return handle
+
+    def _flush_append_handles(
+            self,
+            path: str,
+            is_directory: bool = False,
+            sync: bool = False,
+            close: bool = False
+    ) -> None:
+        """
+        Writes the buffered appends of the file `path`, or of every file in the
+        directory `path` if `is_directory` is True.
+
+        If `sync` is True, the appends are synchronized with the disk unless
+        the durability is AppendDurability.NONE. If `close` is True, the
+        handles are also closed and removed.
+
+        Args:
+            path (str): Full file or directory path.
+            is_directory (bool): Whether `path` is a directory. Defaults to False.
+            sync (bool): Whether to synchronize the appends. Defaults to False.
+            close (bool): Whether to close the handles. Defaults to False.
+        """
+        prefix: str = f"{path}{self._separator.value}" if path else ""
+
+        with self._append_handles_lock:
+            files: list[str] = [
+                file
+                for file in self._append_handles
+                if (file.startswith(prefix) if is_directory else file == path)
+            ]
+
+            if close:
+                for file in files:
+                    self._close_append_handle(self._append_handles.pop(file))
+                return
+
+            handles: list[AppendHandle] = [self._append_handles[file] for file in files]
+
+        for handle in handles:
+            with handle.lock:
+                if handle.file.closed:  # evicted, so it's already written
+                    continue
+
+                if sync:
+                    self._sync_append_handle(handle)
+                else:
+                    handle.file.flush()
+
+    def _close_append_handle(self, handle: AppendHandle) -> None:
+        """
+        Synchronizes the appends of `handle` (see `_sync_append_handle`) and
+        closes it.
+
+        Args:
+            handle (AppendHandle): The append handle.
+        """
+        with handle.lock:
+            try:
+                self._sync_append_handle(handle)
+            finally:
+                handle.file.close()
+
+    def _sync_append_handle(self, handle: AppendHandle) -> None:
+        """
+        Writes the buffered appends of `handle` and synchronizes them with the
+        disk unless the durability is AppendDurability.NONE, the lock of the
+        handle must be held.
+
+        Args:
+            handle (AppendHandle): The append handle.
+        """
+        handle.file.flush()
+
+        if handle.dirty and self._append_durability != AppendDurability.NONE:
+            os.fsync(handle.file.fileno())
+
+        handle.dirty = False
+
+    def _sync_periodically(self) -> None:
+        """
+        Synchronizes the appends of every handle every `fsync_interval` seconds
+        until the storage driver is closed.
+        """
+        while not self._sync_stopped.wait(self._fsync_interval):
+            self._flush_append_handles("", True, sync=True)
+
+    def _get_stored_checksum(self, path: str) -> Optional[tuple[str, str]]:
+        """
+        Gets the checksum stored in the extended attribute of `path` with the
+        version of the file when it was calculated.
+
+        Args:
+            path (str): The full path in the local machine.
+
+        Returns:
+            Optional[tuple[str, str]]: The version and the MD5 hash or None.
+        """
+        if not hasattr(os, "getxattr"):  # only available on Linux
+            return None
+
+        try:
+            value: str = os.getxattr(path, LocalStorageDriver.CHECKSUM_ATTRIBUTE).decode("utf-8")
+        except OSError:
+            return None  # it's not stored or the file system doesn't support it
+
+        version, _, md5 = value.rpartition(" ")
+        return (version, md5) if version else None
+
+    def _store_checksum(self, path: str, version: str, md5: str) -> None:
+        """
+        Stores the checksum in the extended attribute of `path` with the
+        version of the file when it was calculated, it's ignored if it can't
+        be stored.
+
+        Args:
+            path (str): The full path in the local machine.
+            version (str): The inode, size and last modification of the file.
+            md5 (str): The MD5 hash of the file.
+        """
+        if not hasattr(os, "setxattr"):  # only available on Linux
+            return
+
+        try:
+            os.setxattr(
+                path,
+                LocalStorageDriver.CHECKSUM_ATTRIBUTE,
+                f"{version} {md5}".encode("utf-8")
+            )
+        except OSError:
+            pass  # the file system doesn't support it or the file is read-only
+
+    def _get_relative_path(self, path: str) -> str:
+        """
+        Gets `path` without the root, the root is always the prefix of a path
+        obtained by a scan, so it's sliced instead of replaced.
+
+        Args:
+            path (str): The full path in the local machine.
+
+        Returns:
+            str: The path without the root.
+        """
+        return self._sanitizer.sanitize(path[len(self._root):], True)
+
     def _get_path(self, path: str) -> str:
         return self._sanitizer.concat(self._root, path)
+
+    @staticmethod
+    def _get_creation_time(os_stat: os.stat_result) -> int:
+        # st_birthtime is only available on some platforms (macOS, BSD), the
+        # rest of them (Windows, Linux) provide st_ctime
+        return int(getattr(os_stat, "st_birthtime", os_stat.st_ctime))
@@ -25,7 +25,7 @@ import os
 from urllib.parse import urlparse
 from io import BufferedReader, BytesIO
 import re
-from typing import Generator, Generic, TypeVar, final
+from typing import Generator, Generic, Optional, TypeVar, final
 from faker import Faker
 from flexmock import flexmock
 from overrides import EnforceOverrides, override
@@ -85,19 +85,20 @@ class AbstractStorageUrlTest(StorageUrlTest[T], ABC, EnforceOverrides, Generic[T
             T: The storage url instance for testing.
         """
 
-    def _get_content_from_input_stream(self, input_stream: BufferedReader) -> tuple[bytes, int]:
+    def _get_content_from_input_stream(self, input_stream: Optional[BufferedReader]) -> tuple[bytes, int]:
         """
         Get the content of an input stream using a low buffer size because
         the idea is to simulate the same behavior that a TCP/IP with HTTP
         protocol does to download an input stream.
 
         Args:
-            input_stream (BufferedReader): The content as input stream
+            input_stream (Optional[BufferedReader]): The content as input stream
 
         Returns:
             tuple[bytes, int]: The content in bytes and the total of interaction
                                that it takes to read the input stream
         """
+        assert input_stream is not None
         buffer_size = 16  # buffer size
         content = b''
         total_interation = 0
@@ -518,3 +519,25 @@ class AbstractStorageUrlTest(StorageUrlTest[T], ABC, EnforceOverrides, Generic[T
             assert url_streaming.name == os.path.basename(AbstractStorageUrlTest.DEFAULT_PATH_WITH_EXTENSION)
             assert url_streaming.content_type == "text/plain"
             assert content_from_input_stream == content
+
+    @final
+    @override
+    def test_streaming__storage_driver_with_local_path__then_return_url_streaming_with_path(self) -> None:
+        path = AbstractStorageUrlTest.DEFAULT_PATH_WITH_EXTENSION
+        local_path = f"/local/{path}"
+        storage_driver = StubStorageDriver()
+        flexmock(storage_driver).should_receive("exists").with_args(path).and_return(True).once()
+        flexmock(storage_driver).should_receive("get_as_input_stream").never()
+        flexmock(storage_driver).should_receive("get_local_path").with_args(path).and_return(local_path).once()
+
+        with self._storage_url.streaming(
+            storage_driver=storage_driver,
+            url_metadata=UrlMetadata \
+                .builder(
+                    path=path,
+                    storage_driver_reference=""
+                ) \
+                .build()
+        ) as url_streaming:
+            assert url_streaming.path == local_path
+            assert url_streaming.data is None
@@ -118,3 +118,8 @@ class StorageUrlTest(ABC, EnforceOverrides, Generic[T]):
     def test_streaming__determined_mimetype_using_file_with_extension__then_return_url_streaming(self) -> None:
         """
         """
+
+    @abstractmethod
+    def test_streaming__storage_driver_with_local_path__then_return_url_streaming_with_path(self) -> None:
+        """
+        """
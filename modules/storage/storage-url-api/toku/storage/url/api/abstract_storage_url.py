@@ -76,7 +76,8 @@ class AbstractStorageUrl(StorageUrl, ABC):
         #   determines if the file exists
         #   apply custom verifications
         #   apply datetome condition verifications
-        # get the inputstream
+        # get the path in the local file system if the storage driver has it
+        # get the inputstream only if there isn't a local path
         # get the mimetype or 'application/octet-strea' by default
         # create the url encoded and return
         FileExistsVerification(storage_driver).verify(url_metadata)
@@ -87,17 +88,22 @@ class AbstractStorageUrl(StorageUrl, ABC):
 
         DateTimeConditionVerification().verify(url_metadata)
 
-        input_stream: Optional[BufferedReader] = storage_driver \
-            .get_as_input_stream(url_metadata.path)
-        mimetype: str = Metadata.detect_media_type(url_metadata.path)
+        path: Optional[str] = storage_driver.get_local_path(url_metadata.path)
+        input_stream: Optional[BufferedReader] = None
+
+        if path is None:
+            input_stream = storage_driver.get_as_input_stream(url_metadata.path)
 
-        if not input_stream:
-            raise StorageUrlException("input stream obtained is none")
+            if not input_stream:
+                raise StorageUrlException("input stream obtained is none")
+
+        mimetype: str = Metadata.detect_media_type(url_metadata.path)
 
         return UrlStreaming(
             name=os.path.basename(url_metadata.path),
             content_type=mimetype if mimetype else "application/octet-stream",
-            data=input_stream
+            data=input_stream,
+            path=path
         )
 
     @abstractmethod
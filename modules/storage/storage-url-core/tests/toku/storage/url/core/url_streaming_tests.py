@@ -48,6 +48,7 @@ class UrlStreamingTests:
         with create_url_streaming as url_streaming:
             assert url_streaming.name == UrlStreamingTests.RESOURCE_NAME
             assert url_streaming.content_type == UrlStreamingTests.RESOURCE_CONTENT_TYPE
+            assert url_streaming.data is not None
             assert url_streaming.data.read() == b"text"
             url_streaming.data.seek(0)
             assert url_streaming.data.read() == b"text"
@@ -60,11 +61,48 @@ class UrlStreamingTests:
         with create_url_streaming as url_streaming:
             assert url_streaming.name == UrlStreamingTests.RESOURCE_NAME
             assert url_streaming.content_type == UrlStreamingTests.RESOURCE_CONTENT_TYPE
+            assert url_streaming.data is not None
             assert url_streaming.data.read() == b"text"
             url_streaming.data.seek(0)
             assert url_streaming.data.read() == b"text"
             assert url_streaming.data.read() == b""
 
         with pytest.raises(Exception) as exc_info:
+            assert url_streaming.data is not None
             url_streaming.data.seek(0)
         assert str(exc_info.value) == "seek of closed file"
+
+    def test_path__not_reported__then_return_none(
+        self,
+        create_url_streaming: UrlStreaming
+    ) -> None:
+        with create_url_streaming as url_streaming:
+            assert url_streaming.path is None
+
+    def test_close__interaction_after_closing__then_raise_exception(self) -> None:
+        url_streaming = UrlStreaming(
+            name=UrlStreamingTests.RESOURCE_NAME,
+            content_type=UrlStreamingTests.RESOURCE_CONTENT_TYPE,
+            data=BufferedReader(BytesIO(b"text")),  # type: ignore[arg-type]
+            path="/local/resource-name.ext"
+        )
+        assert url_streaming.path == "/local/resource-name.ext"
+        assert url_streaming.data is not None
+        url_streaming.close()
+
+        with pytest.raises(Exception) as exc_info:
+            assert url_streaming.data is not None
+            url_streaming.data.seek(0)
+        assert str(exc_info.value) == "seek of closed file"
+
+    def test_close__without_data__then_return_void(self) -> None:
+        url_streaming = UrlStreaming(
+            name=UrlStreamingTests.RESOURCE_NAME,
+            content_type=UrlStreamingTests.RESOURCE_CONTENT_TYPE,
+            data=None,
+            path="/local/resource-name.ext"
+        )
+
+        with url_streaming:
+            assert url_streaming.data is None
+            assert url_streaming.path == "/local/resource-name.ext"
@@ -14,22 +14,33 @@ Author: Toku
 """
 from dataclasses import dataclass
 from io import BufferedReader
-from typing import Any, Literal
+from typing import Any, Literal, Optional
 
 
 @dataclass
 class UrlStreaming:
     """
     Provides the streaming with the `content_type` and the `data` to get a resource.
+
+    If the resource is in the local file system, `path` has its location, so
+    it's sent directly from there and `data` is None.
     """
 
     name: str  # the name of the resource
     content_type: str  # the mimetype of the `data` to use in TCP/IP
-    data: BufferedReader  # the data as input stream
+    data: Optional[BufferedReader]  # the data as input stream, None if `path` is reported
+    path: Optional[str] = None  # the path of the resource in the local file system
+
+    def close(self) -> None:
+        """
+        Closes the `data` and releases its resources.
+        """
+        if self.data is not None:
+            self.data.close()
 
     def __enter__(self) -> 'UrlStreaming':
         return self
 
     def __exit__(self, exc_type_: Any, exc_value_: Any, traceback_: Any) -> Literal[False]:
-        self.data.close()
+        self.close()
         return False  # indicates that exceptions should be propagated
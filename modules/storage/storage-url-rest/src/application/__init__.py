@@ -8,6 +8,7 @@ Packages:
     - mappers: Provides the mappers to convert the application model in domain models.
     - middlewares: Provides the middlewares to support the request and response.
     - models: Provides the application models to interact with the external world.
+    - responses: Provides the responses to send the content to the external world.
     - routers: Provides the controllers that allow to access to the application layer.
 
 Files:
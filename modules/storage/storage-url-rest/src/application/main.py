@@ -12,6 +12,8 @@ prior written permission from Toku.
 Module: main.py
 Author: Toku
 """
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
@@ -22,7 +24,21 @@ from toku.storage.url.api.verifier import ForbiddenStorageUrlVerificationExcepti
 from toku.storage.url.api.verifier import ConflictStorageUrlVerificationException
 from src.application.routers import url_router
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """
+    Opens the storage driver pool at startup and closes it at shutdown.
+    """
+    url_router.storage_driver_pool.open()
+
+    try:
+        yield
+    finally:
+        url_router.storage_driver_pool.close()
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 # middleware
@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=useless-import-alias
+# pylint: disable=line-too-long
+"""
+This package provides the responses for the application layer.
+
+Classes:
+    - ZeroCopyFileResponse (zero_copy_file_response.py): The file response that lets the server send the file without copying it
+"""
+from .zero_copy_file_response import ZeroCopyFileResponse as ZeroCopyFileResponse
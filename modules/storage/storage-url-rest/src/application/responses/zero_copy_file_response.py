@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: zero_copy_file_response.py
+Author: Toku
+"""
+import os
+from typing import Any, Callable, Optional, final
+import anyio
+from fastapi.responses import FileResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.types import Receive, Scope, Send
+
+
+@final
+class ZeroCopyFileResponse(FileResponse):
+    """
+    Provides the response to send a file of the local file system.
+
+    If the ASGI server supports the zero copy send extension
+    (`http.response.zerocopy`), the opened file is handed to the server, so
+    it can send it with `os.sendfile` without reading the content in Python,
+    otherwise it works as a `FileResponse`, which reads the file in chunks
+    in a thread pool.
+
+    `close` is called in the thread pool after sending the file, even if the
+    send fails or the client disconnects, unlike a background task.
+    """
+
+    ZERO_COPY_EXTENSION: str = "http.response.zerocopy"  # the ASGI extension
+
+    def __init__(
+            self,
+            *args: Any,
+            close: Optional[Callable[[], None]] = None,
+            **kwargs: Any
+    ) -> None:
+        """
+        Initialize the ZeroCopyFileResponse.
+
+        Args:
+            *args (Any): The arguments of `FileResponse`.
+            close (Optional[Callable[[], None]]): The function to release the
+                                                  file after sending it.
+                                                  Defaults to None.
+            **kwargs (Any): The keyword arguments of `FileResponse`.
+        """
+        super().__init__(*args, **kwargs)
+        self._close: Optional[Callable[[], None]] = close
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self._send(scope, receive, send)
+        finally:
+            if self._close is not None:
+                await run_in_threadpool(self._close)
+
+    async def _send(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Sends the file with the zero copy send extension if the server supports
+        it, otherwise as a `FileResponse`.
+
+        Args:
+            scope (Scope): The ASGI scope.
+            receive (Receive): The ASGI receive function.
+            send (Send): The ASGI send function.
+        """
+        if self.send_header_only or \
+           ZeroCopyFileResponse.ZERO_COPY_EXTENSION not in scope.get("extensions", {}):
+            await super().__call__(scope, receive, send)
+            return
+
+        if self.stat_result is None:
+            self.set_stat_headers(await anyio.to_thread.run_sync(os.stat, self.path))
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+
+        with open(self.path, "rb") as file:
+            await send(
+                {
+                    "type": ZeroCopyFileResponse.ZERO_COPY_EXTENSION,
+                    "file": file,
+                    "more_body": False,
+                }
+            )
+
+        if self.background is not None:
+            await self.background()
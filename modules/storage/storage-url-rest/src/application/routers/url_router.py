@@ -12,19 +12,23 @@ prior written permission from Toku.
 Module: url_router.py
 Author: Toku
 """
-from typing import AsyncGenerator
+import os
 from fastapi import APIRouter
-from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from toku.storage.url.core import StorageUrlException
 from toku.storage.url.core import UrlStreaming
 from toku.storage.url.api import StorageUrl
 from src.application.models import UrlModel
 from src.application.models import UrlMetadataModel
 from src.application.mappers import UrlModelMapper
 from src.application.mappers import UrlMetadataModelMapper
+from src.application.responses import ZeroCopyFileResponse
+from src.common.streaming import ChunkStreamer
 from src.domain.services import UrlEncodeService
 from src.domain.services import UrlDecodeService
 from src.domain.services import UrlStreamingService
 from src.infrastructure.factories.storage_driver_factory import StorageDriverFactory
+from src.infrastructure.pools import StorageDriverPool
 from src.infrastructure.repository.storage import UrlEncodeRepository
 from src.infrastructure.repository.storage import UrlDecodeRepository
 from src.infrastructure.repository.storage import UrlStreamingRepository
@@ -33,6 +37,25 @@ from src.infrastructure.factories import StorageUrlFactory
 
 STORAGE_URL_BUILTIN = "BUILT-IN"
 
+# the storage drivers are opened once and leased to the requests, the pool
+# is opened and closed by the lifespan of the application
+storage_driver_pool: StorageDriverPool = StorageDriverPool(
+    storage_driver_factory=StorageDriverFactory(),
+    references=StorageDriverFactory.references(),
+    min_idle=int(os.getenv(
+        "STORAGE_URL_STORAGE_DRIVER_POOL_MIN_IDLE",
+        str(StorageDriverPool.DEFAULT_MIN_IDLE)
+    )),
+    max_idle=int(os.getenv(
+        "STORAGE_URL_STORAGE_DRIVER_POOL_MAX_IDLE",
+        str(StorageDriverPool.DEFAULT_MAX_IDLE)
+    )),
+    health_check_interval=float(os.getenv(
+        "STORAGE_URL_STORAGE_DRIVER_POOL_HEALTH_CHECK_INTERVAL",
+        str(StorageDriverPool.DEFAULT_HEALTH_CHECK_INTERVAL)
+    ))
+)
+
 router = APIRouter(
     prefix="/api/v1/storage/url",
     # tags=["items"],
@@ -69,32 +92,52 @@ async def decode(metadata: str) -> UrlMetadataModel:
 
 
 @router.get("/streaming/{metadata}")
-async def streaming(metadata: str) -> StreamingResponse:
+async def streaming(metadata: str) -> Response:
     storage_url: StorageUrl = StorageUrlFactory().create(STORAGE_URL_BUILTIN)
     url_streaming_service: UrlStreamingService = UrlStreamingService(
         UrlDecodeRepository(
             storage_url
         ),
         UrlStreamingRepository(
-            storage_driver_factory=StorageDriverFactory(),
+            storage_driver_factory=storage_driver_pool,
             storage_url=storage_url
         )
     )
     url_streaming: UrlStreaming = url_streaming_service.streaming(metadata)
+    headers: dict[str, str] = {
+        'Content-Disposition': 'attachment; filename="' + url_streaming.name + '"'
+    }
+
+    # the file is in the local file system, so the server can send it
+    # directly from there, the url streaming is closed after sending it,
+    # even if the send fails
+    if url_streaming.path:
+        return ZeroCopyFileResponse(
+            path=url_streaming.path,
+            media_type=url_streaming.content_type,
+            headers=headers,
+            close=url_streaming.close
+        )
 
-    # generator function to yield chunks of data from the BufferedReader
-    async def generate() -> AsyncGenerator[bytes, None]:
-        with url_streaming as input_stream:
-            while True:
-                chunk = input_stream.data.read(1024)  # read data in 1 KB chunks
-                if not chunk:
-                    break
-                yield chunk
+    if url_streaming.data is None:  # neither a local path nor an input stream
+        url_streaming.close()
+        raise StorageUrlException("input stream obtained is none")
 
+    # the chunks are read in the thread pool, the url streaming is closed
+    # after sending the last one
     return StreamingResponse(
-        content=generate(),
+        content=ChunkStreamer(
+            input_stream=url_streaming.data,
+            chunk_size=int(os.getenv(
+                "STORAGE_URL_STREAMING_CHUNK_SIZE",
+                str(ChunkStreamer.DEFAULT_CHUNK_SIZE)
+            )),
+            max_chunk_size=int(os.getenv(
+                "STORAGE_URL_STREAMING_MAX_CHUNK_SIZE",
+                str(ChunkStreamer.DEFAULT_MAX_CHUNK_SIZE)
+            )),
+            close=url_streaming.close
+        ),
         media_type=url_streaming.content_type,
-        headers={
-            'Content-Disposition': 'attachment; filename="' + url_streaming.name + '"'
-        }
+        headers=headers
     )
@@ -8,4 +8,5 @@ Packages:
     - creator: Provides the components to support creation processes.
     - factory: Provides the components to support factory processes.
     - mapper: Provides the components to support mapper processes.
+    - streaming: Provides the components to support streaming processes.
 """
@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=useless-import-alias
+# pylint: disable=line-too-long
+"""
+This package provides the common streaming.
+
+Classes:
+    - ChunkStreamer (chunk_streamer.py): The streamer to read an input stream in chunks without blocking the event loop
+"""
+from .chunk_streamer import ChunkStreamer as ChunkStreamer
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: chunk_streamer.py
+Author: Toku
+"""
+import asyncio
+from io import BufferedReader
+from typing import AsyncIterator, Callable, Optional, final
+from starlette.concurrency import run_in_threadpool
+
+
+@final
+class ChunkStreamer:
+    """
+    Provides the streamer to read an input stream in chunks.
+
+    The reads are executed in the thread pool, so the event loop is never
+    blocked by the input stream, and they are double buffered, the next chunk
+    is read while the current one is being sent. Only one chunk is read ahead,
+    so a slow client slows down the reads (backpressure) instead of buffering
+    the input stream in memory.
+
+    The size of the chunks is adaptive, it starts with `chunk_size` to send
+    the first bytes as soon as possible and it's doubled after every full
+    chunk until `max_chunk_size`.
+    """
+
+    DEFAULT_CHUNK_SIZE: int = 64 * 1024  # 64 KB
+    DEFAULT_MAX_CHUNK_SIZE: int = 1024 * 1024  # 1 MB
+
+    def __init__(
+            self,
+            input_stream: BufferedReader,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE,
+            close: Optional[Callable[[], None]] = None
+    ) -> None:
+        """
+        Initialize the ChunkStreamer.
+
+        Args:
+            input_stream (BufferedReader): The input stream to read.
+            chunk_size (int): The size of the first chunk.
+                              Defaults to DEFAULT_CHUNK_SIZE.
+            max_chunk_size (int): The maximum size of a chunk.
+                                  Defaults to DEFAULT_MAX_CHUNK_SIZE.
+            close (Optional[Callable[[], None]]): The function to release the
+                                                  input stream after the streaming.
+                                                  Defaults to None (closes `input_stream`).
+
+        Raises:
+            ValueError: If `chunk_size` is not positive or `max_chunk_size`
+                        is smaller than `chunk_size`.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk size '{chunk_size}' must be positive")
+
+        if max_chunk_size < chunk_size:
+            raise ValueError(
+                f"max chunk size '{max_chunk_size}' can't be smaller than chunk size '{chunk_size}'"
+            )
+
+        self._input_stream: BufferedReader = input_stream
+        self._chunk_size: int = chunk_size
+        self._max_chunk_size: int = max_chunk_size
+        self._close: Callable[[], None] = close or input_stream.close
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._stream()
+
+    async def _stream(self) -> AsyncIterator[bytes]:
+        """
+        Streams the input stream in chunks, reading the next chunk while the
+        current one is being consumed.
+
+        Yields:
+            AsyncIterator[bytes]: The chunks.
+        """
+        chunk_size: int = self._chunk_size
+        pending: Optional[asyncio.Future[bytes]] = asyncio.ensure_future(
+            run_in_threadpool(self._input_stream.read, chunk_size)
+        )
+
+        try:
+            while pending is not None:
+                chunk: bytes = await pending
+                pending = None
+
+                if not chunk:
+                    break
+
+                # a full chunk means there are probably more bytes, so the
+                # next read is bigger to reduce the number of calls
+                if len(chunk) == chunk_size:
+                    chunk_size = min(chunk_size * 2, self._max_chunk_size)
+
+                pending = asyncio.ensure_future(
+                    run_in_threadpool(self._input_stream.read, chunk_size)
+                )
+
+                yield chunk
+        finally:
+            # the input stream can't be released while it's read in the
+            # thread pool, so it's released when the pending read is done
+            if pending is not None and not pending.done():
+                pending.add_done_callback(lambda _: self._close())
+            else:
+                self._close()
@@ -33,6 +33,16 @@ class StorageDriverFactory(Factory[StorageDriver]):
         "VCC-VOUCHER": VccVoucherStorageDriverCreator()
     }
 
+    @staticmethod
+    def references() -> list[str]:
+        """
+        Gets the references of the storage drivers that can be created.
+
+        Returns:
+            list[str]: The references.
+        """
+        return list(StorageDriverFactory._CREATOR)
+
     @override
     def create(self, reference: str) -> StorageDriver:
         creator: Optional[Creator[StorageDriver]] = StorageDriverFactory._CREATOR.get(reference)
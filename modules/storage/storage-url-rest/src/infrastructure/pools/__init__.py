@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=useless-import-alias
+# pylint: disable=line-too-long
+"""
+This package provides the pools of the infrastructure layer.
+
+Classes:
+    - PooledStorageDriverDecorator (pooled_storage_driver_decorator.py): The decorator to lease a storage driver of a pool
+    - StorageDriverPool (storage_driver_pool.py): The pool of opened storage drivers
+"""
+from .pooled_storage_driver_decorator import PooledStorageDriverDecorator as PooledStorageDriverDecorator
+from .storage_driver_pool import StorageDriverPool as StorageDriverPool
@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: pooled_storage_driver_decorator.py
+Author: Toku
+"""
+from io import BufferedReader
+from typing import Callable, Iterator, Optional, final
+from overrides import override
+from toku.storage.driver.api import DirectorySeparator
+from toku.storage.driver.api import Metadata
+from toku.storage.driver.api import Stat
+from toku.storage.driver.api import Checksum
+from toku.storage.driver.api import TransferResult
+from toku.storage.driver.api import BulkResult
+from toku.storage.driver.api import Page
+from toku.storage.driver.api import StorageDriver
+from toku.storage.driver.api import StorageDriverDecorator
+
+
+@final
+class PooledStorageDriverDecorator(StorageDriverDecorator):
+    """
+    Provides a decorator to lease an opened storage driver of a pool, `open`
+    doesn't open it again and `close` releases it to the pool instead of
+    closing it, the rest of the methods are delegated.
+    """
+
+    def __init__(
+            self,
+            storage_driver: StorageDriver,
+            release: Callable[[StorageDriver], None]
+    ) -> None:
+        """
+        Initialize the PooledStorageDriverDecorator.
+
+        Args:
+            storage_driver (StorageDriver): The opened storage driver.
+            release (Callable[[StorageDriver], None]): The process to release the
+                                                       storage driver to the pool.
+        """
+        super().__init__(storage_driver)
+        self._release: Callable[[StorageDriver], None] = release
+
+    @override
+    def open(self) -> None:
+        pass  # the storage driver is opened by the pool
+
+    @override
+    def close(self) -> None:
+        self._release(self._storage_driver)
+
+    @override
+    def flush(self) -> None:
+        self._storage_driver.flush()
+
+    @override
+    def get(self, file: str) -> Optional[bytes]:
+        return self._storage_driver.get(file)
+
+    @override
+    def get_as_input_stream(self, file: str) -> Optional[BufferedReader]:
+        return self._storage_driver.get_as_input_stream(file)
+
+    @override
+    def get_range(self, file: str, offset: int, length: Optional[int] = None) -> Optional[bytes]:
+        return self._storage_driver.get_range(file, offset, length)
+
+    @override
+    def get_range_as_input_stream(
+            self,
+            file: str,
+            offset: int,
+            length: Optional[int] = None
+    ) -> Optional[BufferedReader]:
+        return self._storage_driver.get_range_as_input_stream(file, offset, length)
+
+    @override
+    def get_local_path(self, file: str) -> Optional[str]:
+        return self._storage_driver.get_local_path(file)
+
+    @override
+    def exists(self, file: str) -> bool:
+        return self._storage_driver.exists(file)
+
+    @override
+    def put_file(self, source: bytes | str | BufferedReader, directory: str) -> Optional[str]:
+        return self._storage_driver.put_file(source, directory)
+
+    @override
+    def put_file_as(self, source: bytes | str | BufferedReader, file: str) -> bool:
+        return self._storage_driver.put_file_as(source, file)
+
+    @override
+    def append(self, source: bytes, file: str) -> bool:
+        return self._storage_driver.append(source, file)
+
+    @override
+    def copy(
+            self,
+            source: str,
+            target: str,
+            target_storage_driver: Optional['StorageDriver'] = None,
+            *,
+            skip_unchanged: bool = False
+    ) -> bool:
+        if not target_storage_driver:
+            return self._storage_driver.copy(source, target, skip_unchanged=skip_unchanged)
+
+        return self._storage_driver.copy(
+            source,
+            target,
+            target_storage_driver,
+            skip_unchanged=skip_unchanged
+        )
+
+    @override
+    def move(
+            self,
+            source: str,
+            target: str,
+            target_storage_driver: Optional['StorageDriver'] = None
+    ) -> bool:
+        if not target_storage_driver:
+            return self._storage_driver.move(source, target)
+
+        return self._storage_driver.move(source, target, target_storage_driver)
+
+    @override
+    def delete(self, file: str) -> bool:
+        return self._storage_driver.delete(file)
+
+    @override
+    def rename(self, source: str, target: str) -> bool:
+        return self._storage_driver.rename(source, target)
+
+    @override
+    def files(self, directory: str) -> list[str]:
+        return self._storage_driver.files(directory)
+
+    @override
+    def all_files(self, directory: str) -> list[str]:
+        return self._storage_driver.all_files(directory)
+
+    @override
+    def directories(self, directory: str) -> list[str]:
+        return self._storage_driver.directories(directory)
+
+    @override
+    def all_directories(self, directory: str) -> list[str]:
+        return self._storage_driver.all_directories(directory)
+
+    @override
+    def iter_files(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        return self._storage_driver.iter_files(directory, page_size, page_token)
+
+    @override
+    def iter_all_files(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        return self._storage_driver.iter_all_files(directory, page_size, page_token)
+
+    @override
+    def iter_directories(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        return self._storage_driver.iter_directories(directory, page_size, page_token)
+
+    @override
+    def iter_all_directories(
+            self,
+            directory: str,
+            page_size: Optional[int] = None,
+            page_token: Optional[str] = None
+    ) -> Iterator[Page]:
+        return self._storage_driver.iter_all_directories(directory, page_size, page_token)
+
+    @override
+    def exists_directory(self, directory: str) -> bool:
+        return self._storage_driver.exists_directory(directory)
+
+    @override
+    def copy_directory(
+            self,
+            source: str,
+            target: str,
+            target_storage_driver: Optional['StorageDriver'] = None,
+            *,
+            skip_unchanged: bool = False
+    ) -> bool:
+        if not target_storage_driver:
+            return self._storage_driver.copy_directory(
+                source,
+                target,
+                skip_unchanged=skip_unchanged
+            )
+
+        return self._storage_driver.copy_directory(
+            source,
+            target,
+            target_storage_driver,
+            skip_unchanged=skip_unchanged
+        )
+
+    @override
+    def move_directory(
+            self,
+            source: str,
+            target: str,
+            target_storage_driver: Optional['StorageDriver'] = None,
+            *,
+            skip_unchanged: bool = False
+    ) -> bool:
+        if not target_storage_driver:
+            return self._storage_driver.move_directory(
+                source,
+                target,
+                skip_unchanged=skip_unchanged
+            )
+
+        return self._storage_driver.move_directory(
+            source,
+            target,
+            target_storage_driver,
+            skip_unchanged=skip_unchanged
+        )
+
+    @override
+    def transfer_directory(
+            self,
+            source: str,
+            target: str,
+            remove_source: bool = False,
+            target_storage_driver: Optional['StorageDriver'] = None,
+            *,
+            skip_unchanged: bool = False
+    ) -> Optional[TransferResult]:
+        return self._storage_driver.transfer_directory(
+            source,
+            target,
+            remove_source,
+            target_storage_driver,
+            skip_unchanged=skip_unchanged
+        )
+
+    @override
+    def make_directory(self, directory: str) -> bool:
+        return self._storage_driver.make_directory(directory)
+
+    @override
+    def delete_directory(self, directory: str) -> bool:
+        return self._storage_driver.delete_directory(directory)
+
+    @override
+    def rename_directory(self, source: str, target: str) -> bool:
+        return self._storage_driver.rename_directory(source, target)
+
+    @override
+    def get_metadata(self, path: str) -> Optional[Metadata]:
+        return self._storage_driver.get_metadata(path)
+
+    @override
+    def stat(self, path: str) -> Stat:
+        return self._storage_driver.stat(path)
+
+    @override
+    def checksum(self, file: str) -> Optional[Checksum]:
+        return self._storage_driver.checksum(file)
+
+    @override
+    def list_with_metadata(
+            self,
+            directory: str,
+            recursive: bool = False
+    ) -> list[tuple[str, Metadata]]:
+        return self._storage_driver.list_with_metadata(directory, recursive)
+
+    @override
+    def exists_many(self, files: list[str]) -> list[BulkResult[bool]]:
+        return self._storage_driver.exists_many(files)
+
+    @override
+    def get_many(self, files: list[str]) -> list[BulkResult[Optional[bytes]]]:
+        return self._storage_driver.get_many(files)
+
+    @override
+    def put_many(self, sources: dict[str, bytes | str | BufferedReader]) -> list[BulkResult[bool]]:
+        return self._storage_driver.put_many(sources)
+
+    @override
+    def delete_many(self, files: list[str]) -> list[BulkResult[bool]]:
+        return self._storage_driver.delete_many(files)
+
+    @override
+    def get_metadata_many(self, paths: list[str]) -> list[BulkResult[Optional[Metadata]]]:
+        return self._storage_driver.get_metadata_many(paths)
+
+    @override
+    def get_root(self) -> str:
+        return self._storage_driver.get_root()
+
+    @override
+    def get_separator(self) -> DirectorySeparator:
+        return self._storage_driver.get_separator()
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: storage_driver_pool.py
+Author: Toku
+"""
+from dataclasses import dataclass, field
+import logging
+import threading
+import time
+from typing import Optional, final
+from overrides import override
+from toku.storage.driver.api import StorageDriver
+from toku.storage.driver.api import OpenCloseStatusCheckerStorageDriverDecorator
+from src.common.factory import Factory
+from src.infrastructure.pools.pooled_storage_driver_decorator import PooledStorageDriverDecorator
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@dataclass
+class IdleStorageDriver:
+    """
+    Provides an opened storage driver kept by the pool until it's leased.
+    """
+
+    storage_driver: StorageDriver  # the opened storage driver
+    released_at: float = field(default_factory=time.monotonic)  # when it was released
+
+
+@final
+class StorageDriverPool(Factory[StorageDriver]):
+    """
+    Provides the pool of opened storage drivers by reference, so the storage
+    drivers (their credentials and HTTP sessions) are reused by the requests
+    instead of being created and opened for each one.
+
+    `create` leases a storage driver wrapped in a
+    `OpenCloseStatusCheckerStorageDriverDecorator`, so a lease must be opened
+    before using it and it can't be used after closing it, closing it flushes
+    the storage driver and releases it to the pool. An idle storage driver is
+    taken if there is one, otherwise a new one is created and opened.
+
+    `open` opens `min_idle` storage drivers for each reference, a reference
+    that fails to open is logged and opened when it's leased, up to
+    `max_idle` storage drivers are kept idle for each reference and the rest
+    of them are closed when they are released. A storage driver idle for
+    more than `health_check_interval` seconds is checked before leasing it,
+    and it's replaced by another one if it's broken.
+    """
+
+    DEFAULT_MIN_IDLE: int = 1  # the storage drivers opened for each reference
+    DEFAULT_MAX_IDLE: int = 8  # the idle storage drivers kept for each reference
+    DEFAULT_HEALTH_CHECK_INTERVAL: float = 60  # 1 minute
+
+    def __init__(  # pylint: disable=too-many-arguments
+            self,
+            storage_driver_factory: Factory[StorageDriver],
+            references: list[str],
+            min_idle: int = DEFAULT_MIN_IDLE,
+            max_idle: int = DEFAULT_MAX_IDLE,
+            health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL
+    ) -> None:
+        """
+        Initialize the StorageDriverPool.
+
+        Args:
+            storage_driver_factory (Factory): The storage driver factory.
+            references (list[str]): The references of the storage drivers opened by `open`.
+            min_idle (int): The storage drivers opened for each reference.
+                            Defaults to DEFAULT_MIN_IDLE.
+            max_idle (int): The maximum idle storage drivers for each reference.
+                            Defaults to DEFAULT_MAX_IDLE.
+            health_check_interval (float): The seconds that a storage driver can be
+                                           idle without checking it.
+                                           Defaults to DEFAULT_HEALTH_CHECK_INTERVAL.
+        """
+        self._storage_driver_factory: Factory[StorageDriver] = storage_driver_factory
+        self._references: list[str] = references
+        self._min_idle: int = min_idle
+        self._max_idle: int = max_idle
+        self._health_check_interval: float = health_check_interval
+        self._idle: dict[str, list[IdleStorageDriver]] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._closed: bool = False
+
+    def open(self) -> None:
+        """
+        Opens `min_idle` storage drivers for each reference, the failure of a
+        reference doesn't stop the rest of them.
+        """
+        with self._lock:
+            self._closed = False
+
+        for reference in self._references:
+            try:
+                for _ in range(self._min_idle):
+                    self._release(reference, self._open_storage_driver(reference), False)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # the storage driver is opened again when it's leased
+                logger.exception("failed to open a storage driver of %s", reference)
+
+    def close(self) -> None:
+        """
+        Closes the idle storage drivers, the leased ones are closed when they
+        are released.
+        """
+        with self._lock:
+            self._closed = True
+            idle: list[IdleStorageDriver] = [
+                idle_storage_driver
+                for idle_storage_drivers in self._idle.values()
+                for idle_storage_driver in idle_storage_drivers
+            ]
+            self._idle.clear()
+
+        for idle_storage_driver in idle:
+            self._close_storage_driver(idle_storage_driver.storage_driver)
+
+    @override
+    def create(self, reference: str) -> StorageDriver:
+        storage_driver: StorageDriver = self._lease(reference)
+        return OpenCloseStatusCheckerStorageDriverDecorator(
+            PooledStorageDriverDecorator(
+                storage_driver,
+                lambda released: self._release(reference, released)
+            )
+        )
+
+    def _lease(self, reference: str) -> StorageDriver:
+        """
+        Takes the most recently released storage driver of `reference`, which
+        is checked if it was idle for more than `health_check_interval` seconds
+        and replaced if it's broken, or opens a new one if there isn't one.
+
+        Args:
+            reference (str): The reference of the storage driver.
+
+        Returns:
+            StorageDriver: The opened storage driver.
+        """
+        while True:
+            with self._lock:
+                idle_storage_drivers: list[IdleStorageDriver] = self._idle.get(reference, [])
+                idle: Optional[IdleStorageDriver] = \
+                    idle_storage_drivers.pop() if idle_storage_drivers else None
+
+            if idle is None:
+                return self._open_storage_driver(reference)
+
+            if time.monotonic() - idle.released_at <= self._health_check_interval or \
+               self._is_healthy(idle.storage_driver):
+                return idle.storage_driver
+
+            self._close_storage_driver(idle.storage_driver)  # broken
+
+    def _release(self, reference: str, storage_driver: StorageDriver, flush: bool = True) -> None:
+        """
+        Releases `storage_driver` to the pool after flushing it, it's closed if
+        the flush fails, the pool is closed or there are `max_idle` idle
+        storage drivers of `reference`.
+
+        Args:
+            reference (str): The reference of the storage driver.
+            storage_driver (StorageDriver): The opened storage driver.
+            flush (bool): Whether to flush the storage driver. Defaults to True.
+        """
+        try:
+            if flush:
+                storage_driver.flush()
+        except Exception:
+            self._close_storage_driver(storage_driver)
+            raise
+
+        with self._lock:
+            idle_storage_drivers: list[IdleStorageDriver] = self._idle.setdefault(reference, [])
+
+            if not self._closed and len(idle_storage_drivers) < self._max_idle:
+                idle_storage_drivers.append(IdleStorageDriver(storage_driver))
+                return
+
+        self._close_storage_driver(storage_driver)
+
+    def _open_storage_driver(self, reference: str) -> StorageDriver:
+        """
+        Creates and opens a storage driver of `reference`.
+
+        Args:
+            reference (str): The reference of the storage driver.
+
+        Returns:
+            StorageDriver: The opened storage driver.
+        """
+        storage_driver: StorageDriver = self._storage_driver_factory.create(reference)
+        storage_driver.open()
+        return storage_driver
+
+    def _is_healthy(self, storage_driver: StorageDriver) -> bool:
+        """
+        Checks that `storage_driver` can still access its storage, a check
+        raising an exception means that it's broken.
+
+        Args:
+            storage_driver (StorageDriver): The storage driver.
+
+        Returns:
+            bool: True if the storage driver is healthy, False otherwise.
+        """
+        try:
+            storage_driver.exists_directory("")
+            return True
+        except Exception:  # pylint: disable=broad-exception-caught
+            return False
+
+    def _close_storage_driver(self, storage_driver: StorageDriver) -> None:
+        """
+        Closes `storage_driver` ignoring the errors, it's not used anymore.
+
+        Args:
+            storage_driver (StorageDriver): The storage driver.
+        """
+        try:
+            storage_driver.close()
+        except Exception:  # pylint: disable=broad-exception-caught
+            pass  # the storage driver is discarded anyway
@@ -13,7 +13,7 @@ Module: url_streaming_repository.py
 Author: Toku
 """
 from dataclasses import dataclass
-from typing import Any, Literal, Self
+from typing import Self
 from overrides import override
 from toku.storage.driver.api import StorageDriver
 from toku.storage.url.api import StorageUrl
@@ -38,19 +38,20 @@ class UrlStreamingWrapper(UrlStreaming):
         super().__init__(
             name=url_streaming.name,
             content_type=url_streaming.content_type,
-            data=url_streaming.data
+            data=url_streaming.data,
+            path=url_streaming.path
         )
         self._storage_driver: StorageDriver = storage_driver
 
     def __enter__(self) -> Self:
         return self
 
-    def __exit__(self, exc_type_: Any, exc_value_: Any, traceback_: Any) -> Literal[False]:
+    @override
+    def close(self) -> None:
         try:
-            super().__exit__(exc_type_, exc_value_, traceback_)
+            super().close()
         finally:
             self._storage_driver.close()
-        return False  # indicates that exceptions should be propagated
 
 
 class UrlStreamingRepository(UrlStreamingPort):
@@ -82,11 +83,18 @@ class UrlStreamingRepository(UrlStreamingPort):
             url_metadata.storage_driver_reference
         )
         storage_drive.open()
-        url_streaming: UrlStreaming = self._storage_url.streaming(
-            storage_drive,
-            url_metadata,
-            verifications=[]
-        )
+
+        # the storage driver is released by `UrlStreamingWrapper`, so it's
+        # closed here if the streaming can't be created
+        try:
+            url_streaming: UrlStreaming = self._storage_url.streaming(
+                storage_drive,
+                url_metadata,
+                verifications=[]
+            )
+        except Exception:
+            storage_drive.close()
+            raise
 
         return UrlStreamingWrapper(
             url_streaming,
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa: E501
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=empty-docstring
+# pylint: disable=line-too-long
+# pylint: disable=attribute-defined-outside-init
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: zero_copy_file_response_tests.py
+Author: Toku
+"""
+import asyncio
+import os
+import tempfile
+from typing import Any, Generator, final
+import pytest
+from starlette.types import Message
+from src.application.responses import ZeroCopyFileResponse
+
+
+@final
+class ZeroCopyFileResponseTests:
+    """
+    Provides the zero copy file response test cases.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup_test(self) -> Generator[None, None, None]:
+        # setup
+        self._tempdir = tempfile.TemporaryDirectory()
+        self._file: str = os.path.join(self._tempdir.name, "file.txt")
+        self._closed: list[bool] = []
+        self._messages: list[Message] = []
+
+        with open(self._file, "wb") as f:
+            f.write(b"content")
+
+        # return control to the test
+        yield
+
+        # teardown
+        self._tempdir.cleanup()
+
+    def _call(self, response: ZeroCopyFileResponse, fail: bool = False) -> None:
+        scope: dict[str, Any] = {
+            "type": "http",
+            "method": "GET",
+            "headers": [],
+            "extensions": {ZeroCopyFileResponse.ZERO_COPY_EXTENSION: {}}
+        }
+
+        async def receive() -> Message:
+            return {"type": "http.disconnect"}
+
+        async def send(message: Message) -> None:
+            if fail:
+                raise ConnectionResetError("client disconnected")
+            self._messages.append(message)
+
+        asyncio.run(response(scope, receive, send))
+
+    def test_call__zero_copy_extension__then_send_file_and_close(self) -> None:
+        self._call(ZeroCopyFileResponse(self._file, close=lambda: self._closed.append(True)))
+
+        assert [message["type"] for message in self._messages] == ["http.response.start", ZeroCopyFileResponse.ZERO_COPY_EXTENSION]
+        assert self._closed == [True]
+
+    def test_call__send_fails__then_close(self) -> None:
+        with pytest.raises(ConnectionResetError):
+            self._call(ZeroCopyFileResponse(self._file, close=lambda: self._closed.append(True)), True)
+
+        assert self._closed == [True]
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa: E501
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=empty-docstring
+# pylint: disable=line-too-long
+# pylint: disable=attribute-defined-outside-init
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: chunk_streamer_tests.py
+Author: Toku
+"""
+import asyncio
+from io import BufferedReader, BytesIO
+from typing import final
+import pytest
+from src.common.streaming import ChunkStreamer
+
+
+@final
+class ChunkStreamerTests:
+    """
+    Provides the chunk streamer test cases.
+    """
+
+    def _collect(self, streamer: ChunkStreamer) -> list[bytes]:
+        async def execute() -> list[bytes]:
+            return [chunk async for chunk in streamer]
+
+        return asyncio.run(execute())
+
+    def test_init__chunk_size_not_positive__then_raise_exception(self) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            ChunkStreamer(BufferedReader(BytesIO(b"content")), chunk_size=0)  # type: ignore[arg-type]
+        assert str(exc_info.value) == "chunk size '0' must be positive"
+
+    def test_init__max_chunk_size_smaller_than_chunk_size__then_raise_exception(self) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            ChunkStreamer(BufferedReader(BytesIO(b"content")), chunk_size=10, max_chunk_size=5)  # type: ignore[arg-type]
+        assert str(exc_info.value) == "max chunk size '5' can't be smaller than chunk size '10'"
+
+    def test_stream__empty_input_stream__then_return_no_chunks_and_close(self) -> None:
+        input_stream = BufferedReader(BytesIO(b""))  # type: ignore[arg-type]
+        assert self._collect(ChunkStreamer(input_stream)) == []
+        assert input_stream.closed
+
+    def test_stream__input_stream_bigger_than_chunk__then_return_adaptive_chunks(self) -> None:
+        content: bytes = bytes(range(256)) * 10
+        input_stream = BufferedReader(BytesIO(content))  # type: ignore[arg-type]
+        chunks: list[bytes] = self._collect(ChunkStreamer(input_stream, chunk_size=100, max_chunk_size=400))
+        assert [len(chunk) for chunk in chunks] == [100, 200, 400, 400, 400, 400, 400, 260]
+        assert b"".join(chunks) == content
+        assert input_stream.closed
+
+    def test_stream__close_function__then_call_it_instead_of_closing_the_input_stream(self) -> None:
+        closed: list[bool] = []
+        input_stream = BufferedReader(BytesIO(b"content"))  # type: ignore[arg-type]
+        chunks: list[bytes] = self._collect(ChunkStreamer(input_stream, close=lambda: closed.append(True)))
+        assert chunks == [b"content"]
+        assert closed == [True]
+        assert not input_stream.closed
+
+    def test_stream__stop_before_the_end__then_close_after_pending_read(self) -> None:
+        input_stream = BufferedReader(BytesIO(b"0123456789"))  # type: ignore[arg-type]
+
+        async def execute() -> bytes:
+            iterator = aiter(ChunkStreamer(input_stream, chunk_size=2, max_chunk_size=2))
+            chunk: bytes = await anext(iterator)
+            await iterator.aclose()  # type: ignore[attr-defined]
+            await asyncio.sleep(0.1)  # waits the pending read
+            return chunk
+
+        assert asyncio.run(execute()) == b"01"
+        assert input_stream.closed
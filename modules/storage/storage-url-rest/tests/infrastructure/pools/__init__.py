@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+"""
+This package provides the pools tests for the infrastructure components.
+"""
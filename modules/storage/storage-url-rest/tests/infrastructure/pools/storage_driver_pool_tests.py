@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa: E501
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=empty-docstring
+# pylint: disable=line-too-long
+# pylint: disable=attribute-defined-outside-init
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: storage_driver_pool_tests.py
+Author: Toku
+"""
+from typing import final
+from flexmock import flexmock
+import pytest
+from overrides import override
+from toku.storage.driver.api import StorageDriver, StorageDriverException
+from toku.storage.driver.gcs import GcsStorageDriver
+from src.common.factory import Factory
+from src.infrastructure.pools import StorageDriverPool
+
+
+@final
+class FakeStorageDriverFactory(Factory[StorageDriver]):
+    """
+    Provides the storage drivers with the opening, closing, flushing and
+    health checking recorded.
+    """
+
+    def __init__(self) -> None:
+        self.created: list[StorageDriver] = []
+        self.events: list[tuple[str, int]] = []
+        self.healthy: bool = True
+        self.unavailable: set[str] = set()
+
+    @override
+    def create(self, reference: str) -> StorageDriver:
+        if reference in self.unavailable:
+            raise ConnectionError("unavailable")
+
+        index: int = len(self.created)
+        storage_driver: StorageDriver = GcsStorageDriver("root", "project", "bucket")
+        flexmock(storage_driver).should_receive("open").replace_with(lambda: self.events.append(("open", index)))
+        flexmock(storage_driver).should_receive("close").replace_with(lambda: self.events.append(("close", index)))
+        flexmock(storage_driver).should_receive("flush").replace_with(lambda: self.events.append(("flush", index)))
+        flexmock(storage_driver).should_receive("exists_directory").replace_with(self._exists_directory)
+        self.created.append(storage_driver)
+        return storage_driver
+
+    def _exists_directory(self, directory: str) -> bool:
+        if not self.healthy:
+            raise ConnectionError("broken")
+        return directory == ""
+
+
+@final
+class StorageDriverPoolTests:
+    """
+    Provides the storage driver pool test cases.
+    """
+
+    def setup_method(self) -> None:
+        self.factory: FakeStorageDriverFactory = FakeStorageDriverFactory()
+
+    def test_open__min_idle__then_open_storage_drivers(self) -> None:
+        pool: StorageDriverPool = StorageDriverPool(self.factory, ["gcs"], min_idle=2)
+        pool.open()
+        assert self.factory.events == [("open", 0), ("open", 1)]
+
+    def test_open__reference_fails_to_open__then_open_rest_of_references_and_lease_it_lazily(self) -> None:
+        pool: StorageDriverPool = StorageDriverPool(self.factory, ["unavailable", "gcs"])
+        self.factory.unavailable.add("unavailable")
+        pool.open()
+
+        assert self.factory.events == [("open", 0)]
+
+        with pytest.raises(ConnectionError):
+            pool.create("unavailable")
+
+        self.factory.unavailable.clear()
+        pool.create("unavailable").open()
+        assert self.factory.events == [("open", 0), ("open", 1)]
+
+    def test_create__released_lease__then_reuse_storage_driver(self) -> None:
+        pool: StorageDriverPool = StorageDriverPool(self.factory, ["gcs"])
+        pool.open()
+
+        for _ in range(3):
+            with pool.create("gcs") as storage_driver:
+                assert storage_driver.exists_directory("")
+
+        assert len(self.factory.created) == 1
+        assert self.factory.events == [("open", 0), ("flush", 0), ("flush", 0), ("flush", 0)]
+
+    def test_create__lease_not_opened__then_raise_exception(self) -> None:
+        pool: StorageDriverPool = StorageDriverPool(self.factory, ["gcs"])
+        storage_driver: StorageDriver = pool.create("gcs")
+
+        with pytest.raises(StorageDriverException):
+            storage_driver.exists_directory("")
+
+    def test_create__lease_closed__then_raise_exception(self) -> None:
+        pool: StorageDriverPool = StorageDriverPool(self.factory, ["gcs"])
+        storage_driver: StorageDriver = pool.create("gcs")
+        storage_driver.open()
+        storage_driver.close()
+
+        with pytest.raises(StorageDriverException):
+            storage_driver.exists_directory("")
+
+    def test_create__concurrent_leases__then_open_new_storage_drivers(self) -> None:
+        pool: StorageDriverPool = StorageDriverPool(self.factory, ["gcs"], min_idle=0, max_idle=1)
+
+        with pool.create("gcs"), pool.create("gcs"):
+            assert len(self.factory.created) == 2
+
+        assert [event for event in self.factory.events if event[0] == "close"] == [("close", 0)]  # exceeds max idle
+
+    def test_create__broken_idle_storage_driver__then_replace_it(self) -> None:
+        pool: StorageDriverPool = StorageDriverPool(self.factory, ["gcs"], health_check_interval=0)
+        pool.open()
+        self.factory.healthy = False
+        storage_driver: StorageDriver = pool.create("gcs")
+        self.factory.healthy = True
+
+        assert len(self.factory.created) == 2
+        assert self.factory.events == [("open", 0), ("close", 0), ("open", 1)]
+        storage_driver.open()
+        storage_driver.close()
+
+    def test_close__idle_and_leased_storage_drivers__then_close_them(self) -> None:
+        pool: StorageDriverPool = StorageDriverPool(self.factory, ["gcs"], min_idle=1)
+        pool.open()
+        leased: StorageDriver = pool.create("gcs")
+        leased.open()
+        pool.create("gcs").open()  # the idle one was leased, so it's a new one
+        pool.close()
+        leased.close()
+
+        assert ("close", 0) in self.factory.events
+        assert ("close", 1) not in self.factory.events  # still leased and never released
@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+"""
+This package provides the storage repository tests for the infrastructure components.
+"""
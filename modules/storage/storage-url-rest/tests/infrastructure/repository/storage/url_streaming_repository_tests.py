@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa: E501
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=empty-docstring
+# pylint: disable=line-too-long
+# pylint: disable=attribute-defined-outside-init
+"""
+Private License - For Internal Use Only
+
+Copyright (c) 2023 Toku
+All rights reserved.
+
+This software is provided for internal use only and may not be
+distributed, reproduced, or disclosed to any third party without
+prior written permission from Toku.
+
+Module: url_streaming_repository_tests.py
+Author: Toku
+"""
+from typing import final
+from flexmock import flexmock
+import pytest
+from src.infrastructure.repository.storage import UrlStreamingRepository
+
+
+@final
+class UrlStreamingRepositoryTests:
+    """
+    Provides the url streaming repository test cases.
+    """
+
+    def setup_method(self) -> None:
+        self.events: list[str] = []
+        self.storage_driver = flexmock(
+            open=lambda: self.events.append("open"),
+            close=lambda: self.events.append("close")
+        )
+        self.storage_driver_factory = flexmock(create=lambda reference: self.storage_driver)
+
+    def test_streaming__streaming_fails__then_close_storage_driver(self) -> None:
+        storage_url = flexmock()
+        storage_url.should_receive("streaming").and_raise(FileNotFoundError, "file.txt")
+        repository = UrlStreamingRepository(self.storage_driver_factory, storage_url)  # type: ignore[arg-type]
+
+        with pytest.raises(FileNotFoundError):
+            repository.streaming(flexmock(storage_driver_reference="gcs"))  # type: ignore[arg-type]
+
+        assert self.events == ["open", "close"]
+
+    def test_streaming__streaming_created__then_close_storage_driver_with_streaming(self) -> None:
+        url_streaming = flexmock(name="file.txt", content_type="text/plain", data=flexmock(close=lambda: self.events.append("data")), path=None)
+        storage_url = flexmock()
+        storage_url.should_receive("streaming").and_return(url_streaming)
+        repository = UrlStreamingRepository(self.storage_driver_factory, storage_url)  # type: ignore[arg-type]
+
+        streaming = repository.streaming(flexmock(storage_driver_reference="gcs"))  # type: ignore[arg-type]
+
+        assert self.events == ["open"]
+        streaming.close()
+        assert self.events == ["open", "data", "close"]